@@ -164,6 +164,14 @@ vaiseshikamsa_planet_position_values = [20,18,15,10,7,5]
     !!!!!!!!!!!!!!!!!!!!!!!!  
 """
 _TROPICAL_MODE = False
+""" Maximum entries of the opt-in sidereal longitude cache - see drik.ephemeris_cache() """
+ephemeris_cache_size = 8192
+""" Maximum (place,year) sunrise/sunset tables kept in memory - see drik.sunrise_table_cache() """
+sunrise_table_cache_size = 64
+""" Maximum (julian day, place) records kept by drik.day_panchanga() """
+day_panchanga_cache_size = 512
+""" Maximum (place, year, month) calendar months kept by calendar_data.CalendarDataService """
+calendar_month_cache_size = 24
 _EPHIMERIDE_DATA_PATH = ROOT_DIR+'/data/ephe/'
 _LANGUAGE_PATH = ROOT_DIR+'/lang/'
 _solar_upagraha_list = ['dhuma','vyatipaata','parivesha','indrachaapa','upaketu']
@@ -1204,5 +1212,9 @@ skip_using_girls_varna_for_minimum_tamil_porutham = True # V4.5.5
 benefic_signs = [TAURUS, GEMINI, CANCER, VIRGO, LIBRA, SAGITTARIUS, PISCES]
 force_saturn_as_owner_of_aquarius = False
 force_mars_as_owner_of_scorpio = False
+#### Event solver (planet/ascendant entry, sankranti, solar return dates)
+event_solver_time_tolerance = 1.0e-6 # days (~0.1 second)
+event_solver_max_iterations = 100 # per root refinement
+event_solver_max_bracket_steps = 10000 # search steps to find the bracket of an event
 if __name__ == "__main__":
     pass
@@ -56,13 +56,8 @@ def get_amsa_resources(language='en'):
         Note: this argument is not required it language was already set using utils.set_language
         @return json strings from the resource file as dictionary 
     """
-    import json
-    json_file = _lang_path + "amsa_rulers_"+language+'.json'
-    #print('opening json file',json_file)
-    f = open(json_file,"r",encoding="utf-8")
-    msgs = json.load(f)
-    return msgs
-def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,years=1,months=1,sixty_hours=1
+    return utils.get_json_resource('amsa',language)
+def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=None,years=1,months=1,sixty_hours=1
                ,calculation_type='drik',pravesha_type=0):
     """
         Get Rasi chart - D1 Chart
@@ -70,7 +65,7 @@ def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MO
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:'Lahiri' - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @param years: Yearly chart. number of years from date of birth
         @param months: Monthly chart. number of months from date of birth
         @param sixty_hours: 60-hour chart. number of 60 hours from date of birth
@@ -107,11 +102,11 @@ def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MO
     #print('planet_positions\n',planet_positions)
     planet_positions = [[ascendant_index,(ascendant_constellation, ascendant_longitude)]] + planet_positions
     return planet_positions
-def bhava_houses(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,bhava_starts_with_ascendant=False):
+def bhava_houses(jd,place,ayanamsa_mode=None,bhava_starts_with_ascendant=False):
     bp = bhava_chart_houses(jd, place, ayanamsa_mode,bhava_starts_with_ascendant=bhava_starts_with_ascendant)
     bp = {p:house.get_relative_house_of_planet(bp[const._ascendant_symbol][0],h) for p,(h,_) in bp.items()}
     return bp
-def bhava_chart(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,bhava_madhya_method=const.bhaava_madhya_method):
+def bhava_chart(jd,place,ayanamsa_mode=None,bhava_madhya_method=const.bhaava_madhya_method):
     """
         @return: [[house1_rasi,(house1_start,house1_cusp,house1_end),[planets_in_house1]],(...),
                 [house12_rasi,(house12_start,house12_cusp,house12_end,[planets_in_house12])]]
@@ -178,7 +173,7 @@ def _bhaava_madhya_new(jd,place,planet_positions,bhava_madhya_method=const.bhaav
             _bhava_start = h1*30; _bhava_mid = _bhava_start + ascendant_longitude; _bhava_end = ((h1+1)%12)*30
             bhava_houses.append((_bhava_start%360,_bhava_mid%360,_bhava_end%360))
         return drik._assign_planets_to_houses(planet_positions, bhava_houses,bhava_madhya_method=bhava_madhya_method)
-def bhava_chart_houses(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,years=1,months=1,sixty_hours=1
+def bhava_chart_houses(jd_at_dob,place_as_tuple,ayanamsa_mode=None,years=1,months=1,sixty_hours=1
                 ,calculation_type='drik',bhava_starts_with_ascendant=False):
     """
         Get Bhava chart from Rasi / D1 Chart
@@ -186,7 +181,7 @@ def bhava_chart_houses(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYA
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:'Lahiri' - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @param years: Yearly chart. number of years from date of birth
         @param months: Monthly chart. number of months from date of birth
         @param sixty_hours: 60-hour chart. number of 60 hours from date of birth
@@ -1082,7 +1077,7 @@ def divisional_positions_from_rasi_positions(planet_positions_in_rasi,divisional
             print('Chart division factor',divisional_chart_factor,'not supported')
             return None
     
-def divisional_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,
+def divisional_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=None,divisional_chart_factor=1,
                      chart_method=1,years=1,months=1,sixty_hours=1,calculation_type='drik',pravesha_type=0,
                      base_rasi=None,count_from_end_of_sign=None):
     """
@@ -1091,7 +1086,7 @@ def divisional_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANA
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @param divisional_chart_factor Default=1 
             1=Raasi, 9=Navamsa. See const.divisional_chart_factors for options
         @param chart_method: See individual chart function for available chart methods 
@@ -1200,14 +1195,14 @@ def planets_in_combustion(planet_positions,use_absolute_longitude=True):
         if p_long >= sun_long-combustion_range[p-2] and p_long <= sun_long+combustion_range[p-2]:
             combustion_planets.append(p)
     return combustion_planets
-def vaiseshikamsa_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vaiseshikamsa_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many dhasa varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Paarijaataamsa – 2, Uttamaamsa – 3, Gopuraamsa– 4, Simhaasanaamsa – 5,
@@ -1215,40 +1210,40 @@ def vaiseshikamsa_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode
             Sreedhaamaamsa – 10.
     """
     return _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.dhasavarga_amsa_vaiseshikamsa)
-def vaiseshikamsa_shadvarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vaiseshikamsa_shadvarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many shad varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Kimsukaamsa – 2, Vyanjanaamsa – 3, Chaamaraamsa – 4, Chatraamsa – 5,  Kundalaamsa – 6.
     """
     return _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.shadvarga_amsa_vaiseshikamsa)
-def vaiseshikamsa_sapthavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vaiseshikamsa_sapthavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many saptha varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Kimsukaamsa – 2, Vyanjanaamsa – 3, Chaamaraamsa – 4, Chatraamsa – 5, Kundalaamsa – 6, Mukutaamsa – 7.
     """
     return _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.sapthavarga_amsa_vaiseshikamsa)
-def vaiseshikamsa_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vaiseshikamsa_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many shodhasa varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Bhedakaamsa – 2, Kusumaamsa – 3, Nagapurushaamsa – 4, Kandukaamsa – 5,
@@ -1257,7 +1252,7 @@ def vaiseshikamsa_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_m
             Vidrumaamsa – 13, Indraasanaamsa – 14, Golokaamsa – 15, Sree Vallabhaamsa – 16.
     """
     return _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.shodhasa_varga_amsa_vaiseshikamsa)
-def _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=None,
                                    amsa_vaiseshikamsa=None):
     p_d = [0 for _ in range(9)]
     p_d_s = [0 for _ in range(9)]
@@ -1277,7 +1272,7 @@ def _vaiseshikamsa_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=const
         p_d_c[p] = p_d_c[p][:-1]
         pdc[p] = [p_d[p],p_d_c[p],p_d_s[p]]
     return pdc
-def _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,amsa_vimsopaka=None):
+def _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=None,amsa_vimsopaka=None):
     p_d = [0 for _ in range(9)]
     p_d_s = [0 for _ in range(9)]
     p_d_c = ['' for _ in range(9)]
@@ -1306,14 +1301,14 @@ def _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode=const._DE
         #print(house.planet_list[p],pdc[p])
     return pdc
     
-def vimsopaka_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vimsopaka_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many dhasa varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Paarijaataamsa – 2, Uttamaamsa – 3, Gopuraamsa– 4, Simhaasanaamsa – 5,
@@ -1321,40 +1316,40 @@ def vimsopaka_dhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=con
             Sreedhaamaamsa – 10.
     """
     return _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.dhasavarga_amsa_vimsopaka)
-def vimsopaka_shadvarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vimsopaka_shadvarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many shad varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Kimsukaamsa – 2, Vyanjanaamsa – 3, Chaamaraamsa – 4, Chatraamsa – 5,  Kundalaamsa – 6.
     """
     return _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.shadvarga_amsa_vimsopaka)
-def vimsopaka_sapthavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vimsopaka_sapthavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many saptha varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Kimsukaamsa – 2, Vyanjanaamsa – 3, Chaamaraamsa – 4, Chatraamsa – 5, Kundalaamsa – 6, Mukutaamsa – 7.
     """
     return _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.sapthavarga_amsa_vimsopaka)
-def vimsopaka_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vimsopaka_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many shodhasa varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Bhedakaamsa – 2, Kusumaamsa – 3, Nagapurushaamsa – 4, Kandukaamsa – 5,
@@ -1363,14 +1358,14 @@ def vimsopaka_shodhasavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=
             Vidrumaamsa – 13, Indraasanaamsa – 14, Golokaamsa – 15, Sree Vallabhaamsa – 16.
     """
     return _vimsopaka_bala_of_planets(jd_at_dob, place_as_tuple,ayanamsa_mode,const.shodhasa_varga_amsa_vimsopaka)
-def vimsamsavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def vimsamsavarga_of_planets(jd_at_dob, place_as_tuple, ayanamsa_mode=None):
     """
         Get the count - in how many vimsamsa varga charts the planets are in their own raasi or exalted
         @param jd_at_dob:Julian day number at the date/time of birth
             Note: It can be obtained from utils.julian_day_number(...)
         @param place_as_tuple - panjanga.place format
                 example drik.place('Chennai,IN',13.0,78.0,+5.5)
-        @param ayanamsa_mode Default:const._DEFAULT_AYANAMSA_MODE - See const.available_ayanamsa_modes for more options
+        @param ayanamsa_mode Default: None (current setting - see drik.get_ayanamsa_mode) - See const.available_ayanamsa_modes for more options
         @return count for each planet - list - Example [3,4,5,6..] Sun in its own house in 3 charts, moon in 4 charts and so on.
             Special names of the count are as follows:
             Bhedakaamsa – 2, Kusumaamsa – 3, Nagapurushaamsa – 4, Kandukaamsa – 5,
@@ -1419,7 +1414,7 @@ def _varnada_lagna_sanjay_rath_mixed_chart(dob,tob, place,house_index=1,varga_fa
     dl = drik.dasavarga_from_long(vl, divisional_chart_factor=1)
     if _debug_: print('return drik dasavarg',dl)
     return dl    
-def _varnada_lagna_sanjay_rath(dob,tob, place,house_index=1, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _varnada_lagna_sanjay_rath(dob,tob, place,house_index=1, ayanamsa_mode=None,
                                divisional_chart_factor=1,chart_method=1,
                                        base_rasi=None,count_from_end_of_sign=None):
     """ TO DO : Still experimenting """
@@ -1478,7 +1473,7 @@ def _varnada_lagna_jha_pandey_mixed_chart(dob,tob, place,house_index=1,varga_fac
     #print(asc_long,hora_long,count_is_odd,vl)
     dl = drik.dasavarga_from_long(vl, divisional_chart_factor=1)
     return dl
-def _varnada_lagna_jha_pandey(dob,tob, place,house_index=1,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _varnada_lagna_jha_pandey(dob,tob, place,house_index=1,ayanamsa_mode=None,
                               divisional_chart_factor=1,chart_method=1,base_rasi=None,
                               count_from_end_of_sign=None):
     """ TO DO : Still experimenting """
@@ -1506,7 +1501,7 @@ def _varnada_lagna_jha_pandey(dob,tob, place,house_index=1,ayanamsa_mode=const._
     #print(asc_long,hora_long,count_is_odd,vl)
     dl = drik.dasavarga_from_long(vl, divisional_chart_factor=1)
     return dl
-def varnada_lagna_mixed_chart(dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,house_index=1,varga_factor_1=1,
+def varnada_lagna_mixed_chart(dob,tob,place,ayanamsa_mode=None,house_index=1,varga_factor_1=1,
                               chart_method_1=1,varga_factor_2=1,chart_method_2=1,varnada_method=1):
     """
         Get Varnada Lagna
@@ -1543,7 +1538,7 @@ def varnada_lagna_mixed_chart(dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMS
         return _varnada_lagna_jha_pandey_mixed_chart(dob, tob, place, house_index=house_index,
                         varga_factor_1=varga_factor_1, chart_method_1=chart_method_2, varga_factor_2=varga_factor_2,
                         chart_method_2=chart_method_2)
-def varnada_lagna(dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,
+def varnada_lagna(dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1,
                   chart_method=1,house_index=1,varnada_method=1,base_rasi=None,count_from_end_of_sign=None):
     """
         Get Varnada Lagna
@@ -1595,7 +1590,7 @@ def _varnada_lagna_bv_raman_mixed_chart(dob,tob, place,house_index=1,varga_facto
     _varnada_lagna = utils.count_rasis(1,count,dir=1) if lagna_is_odd else utils.count_rasis(12,count,dir=-1)
     _varnada_lagna -= 1 ## Keep in 0..11 range instead of 1..12
     return _varnada_lagna, asc_long #hl
-def _varnada_lagna_bv_raman(dob,tob,place,house_index=1,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _varnada_lagna_bv_raman(dob,tob,place,house_index=1,ayanamsa_mode=None,
                             divisional_chart_factor=1,chart_method=1,base_rasi=None,count_from_end_of_sign=None):
     """
         Get Varnada Lagna
@@ -1624,7 +1619,7 @@ def _varnada_lagna_bv_raman(dob,tob,place,house_index=1,ayanamsa_mode=const._DEF
 def _varnada_lagna_santhanam_mixed_chart(dob,tob, place,house_index=1,varga_factor_1=1,chart_method_1=1,
                                            varga_factor_2=1,chart_method_2=1):
     return _varnada_lagna_sharma_mixed_chart(dob, tob, place, house_index, varga_factor_1, chart_method_1, varga_factor_2, chart_method_2)
-def _varnada_lagna_santhanam(dob,tob,place,house_index=1,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _varnada_lagna_santhanam(dob,tob,place,house_index=1,ayanamsa_mode=None,
                              divisional_chart_factor=1,chart_method=1,
                                        base_rasi=None,count_from_end_of_sign=None):
     """
@@ -1653,7 +1648,7 @@ def _varnada_lagna_sharma_mixed_chart(dob,tob, place,house_index=1,varga_factor_
     _varnada_lagna = utils.count_rasis(1,count,dir=1) if count_is_odd else utils.count_rasis(12,count,dir=-1)
     _varnada_lagna -= 1 ## Keep in 0..11 range instead of 1..12
     return _varnada_lagna, asc_long #hl
-def _varnada_lagna_sharma(dob,tob,place,house_index=1,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def _varnada_lagna_sharma(dob,tob,place,house_index=1,ayanamsa_mode=None,
                           divisional_chart_factor=1,chart_method=1,
                                        base_rasi=None,count_from_end_of_sign=None):
     """
@@ -1684,7 +1679,7 @@ def _varnada_lagna_sharma(dob,tob,place,house_index=1,ayanamsa_mode=const._DEFAU
     #print(count1,count2,count,count_is_odd,_varnada_lagna)
     _varnada_lagna -= 1 ## Keep in 0..11 range instead of 1..12
     return _varnada_lagna, asc_long #hl
-def benefics_and_malefics(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,method=2,
+def benefics_and_malefics(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,method=2,
                           exclude_rahu_ketu=False):
     """
         From BV Raman - Hindu Predictive Astrology - METHOD=1
@@ -1741,7 +1736,7 @@ def benefics_and_malefics(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,di
             malefics += [3] 
     benefics = sorted(set(benefics)) ; malefics = sorted(set(malefics))
     return benefics, malefics
-def benefics(jd,place,divisional_chart_factor=1,method=2,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,exclude_rahu_ketu=False):
+def benefics(jd,place,divisional_chart_factor=1,method=2,ayanamsa_mode=None,exclude_rahu_ketu=False):
     """
         From BV Raman - Hindu Predictive Astrology - METHOD=1
         Jupiter. Venus. Full Moon and well-associated Mercury are benefics. 
@@ -1762,7 +1757,7 @@ def benefics(jd,place,divisional_chart_factor=1,method=2,ayanamsa_mode=const._DE
     """
     return benefics_and_malefics(jd, place, method=method,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=divisional_chart_factor,
                                  exclude_rahu_ketu=exclude_rahu_ketu)[0]
-def malefics(jd,place,divisional_chart_factor=1,method=2,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,exclude_rahu_ketu=False):
+def malefics(jd,place,divisional_chart_factor=1,method=2,ayanamsa_mode=None,exclude_rahu_ketu=False):
     """
         From BV Raman - Hindu Predictive Astrology - METHOD=1
         Jupiter. Venus. Full Moon and well-associated Mercury are benefics. 
@@ -1877,7 +1872,7 @@ def solar_upagraha_longitudes(planet_positions,upagraha,divisional_chart_factor=
     """
     solar_longitude = planet_positions[1][1][0]*30+planet_positions[1][1][1]
     return drik.solar_upagraha_longitudes(solar_longitude, upagraha, divisional_chart_factor=divisional_chart_factor)
-def _amsa(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,include_upagrahas=False,
+def _amsa(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,include_upagrahas=False,
           include_special_lagnas=False,include_sphutas=False,chart_method=1,base_rasi=None,count_from_end_of_sign=None):
     "TODO: Still under testing - Exact algorithm not clear"
     y,m,d,fh = utils.jd_to_gregorian(jd); dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -2153,75 +2148,23 @@ def next_conjunction_of_planet_pair_divisional_chart(jd,place:drik.Place,p1,p2,d
         @param panchanga_start_date: Date struct (y,m,d)
         @param direction: 1= next conjunction -1 previous conjunction
         @param separation_angle - angle by which the planets to each other
-        @return: Julian day of conjunction   
+        @param increment_speed_factor: Not used. Kept for backward compatibility (search steps are derived from planet speeds)
+        @return: Julian day of conjunction, planet1 longitude, planet2 longitude in the divisional chart
     """
     import warnings
-    _planet_speeds = [361]+[abs(psi[3]) for p,psi in drik.planets_speed_info(jd, place).items()]
-    p1_speed = _planet_speeds[0] if p1=='L' else _planet_speeds[p1+1]
-    p2_speed = _planet_speeds[0] if p2=='L' else _planet_speeds[p2+1]
-    increment_days = increment_speed_factor/p1_speed if p1_speed > p2_speed else increment_speed_factor/p2_speed
-    _DEBUG_ = False
     if (p1==7 and p2==8) or (p1==8 and p2==7):
         warnings.warn("Rahu and Ketu do not conjoin ever. Program returns error")
         return None
-    pi1 = 0 if p1=='L' else p1+1; pi2 = 0 if p2=='L' else p2+1
-    long_diff_check = 0.5# if p1 in ['L'] or p2 in ['L'] else 1.0
-    max_days_to_search = 1000000
-    cur_jd = jd# utils.julian_day_number(panchanga_start_date, (0,0,0))
-    search_counter = 1
-    while search_counter < max_days_to_search:
-        cur_jd += increment_days
-        sla = divisional_chart(cur_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                    chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi1][1]
-        p1_long = sla[0]*30+sla[1]
-        sla = divisional_chart(cur_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                    chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi2][1]
-        p2_long = sla[0]*30+sla[1]
-        long_diff = (360+p1_long - p2_long - separation_angle)%360
-        if _DEBUG_: print(search_counter,p1,p1_long,p2,p2_long,long_diff,long_diff_check,utils.jd_to_gregorian(cur_jd))
-        if long_diff<long_diff_check:
-            if _DEBUG_: print(long_diff,'<',long_diff_check)
-            #ret = __next_conjunction_of_planet_pair(p1,p2,panchanga_place,cur_jd,direction,separation_angle)
-            jd_list = [cur_jd+t*increment_days for t in range(-10,10)]
-            long_diff_list = []
-            for jdt in jd_list:
-                sla = divisional_chart(jdt, place, divisional_chart_factor=divisional_chart_factor, 
-                            chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi1][1]
-                p1_long = sla[0]*30+sla[1]
-                sla = divisional_chart(jdt, place, divisional_chart_factor=divisional_chart_factor, 
-                            chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi2][1]
-                p2_long = sla[0]*30+sla[1]
-                long_diff = (360+p1_long-p2_long-separation_angle)%360
-                long_diff_list.append(long_diff)
-            """ TODO: For separation Angle > 180 Lagrange may not work """
-            try:
-                if _DEBUG_: print('Lagrange method of fine tuning')
-                if _DEBUG_: print(jd_list,'\n',long_diff_list)
-                conj_jd = utils.inverse_lagrange(jd_list, long_diff_list, 0.0)
-                sla = divisional_chart(conj_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                            chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi1][1]
-                p1_long = sla[0]*30+sla[1]
-                sla = divisional_chart(conj_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                            chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi2][1]
-                p2_long = sla[0]*30+sla[1]
-                if conj_jd is not None:
-                    if _DEBUG_: print(p1,p2,utils.jd_to_gregorian(conj_jd),p1_long,p2_long)
-                    return conj_jd, p1_long, p2_long
-            except:
-                if _DEBUG_: print('Normal method of fine tuning - since Lagrange failed')
-                if _DEBUG_: print(search_counter,p1,p1_long,p2,p2_long,long_diff,long_diff_check,utils.jd_to_gregorian(cur_jd))
-                conj_jd = drik.__next_conjunction_of_planet_pair(cur_jd,place,p1,p2,direction,separation_angle)
-                if conj_jd is not None:
-                    sla = divisional_chart(conj_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                                chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi1][1]
-                    p1_long = sla[0]*30+sla[1]
-                    sla = divisional_chart(conj_jd, place, divisional_chart_factor=divisional_chart_factor, 
-                                chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)[pi2][1]
-                    p2_long = sla[0]*30+sla[1]
-                    return conj_jd, p1_long, p2_long
-        search_counter += 1
-    print('Could not find planetary conjunctions for sep angle',separation_angle,' Try increasing search range')
-    return None
+    pi1 = 0 if p1==const._ascendant_symbol else p1+1; pi2 = 0 if p2==const._ascendant_symbol else p2+1
+    def _planet_longitudes(jd):
+        planet_positions = divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor, 
+                    chart_method=chart_method,base_rasi=base_rasi, count_from_end_of_sign=count_from_end_of_sign)
+        (h1,long1),(h2,long2) = planet_positions[pi1][1],planet_positions[pi2][1]
+        return h1*30+long1, h2*30+long2
+    max_speed = drik._planet_max_daily_speed(p1, place, divisional_chart_factor)+\
+                drik._planet_max_daily_speed(p2, place, divisional_chart_factor)
+    return drik._next_separation_angle_date(_planet_longitudes, jd, separation_angle, direction=direction,
+                                            max_speed=max_speed)
 def lattha_stars_planets(planet_positions,include_abhijith=True):
     """
         returns latta star of the planet based on its positions
@@ -2239,7 +2182,7 @@ def lattha_stars_planets(planet_positions,include_abhijith=True):
         #print(p,p_long,p_star,const.latta_stars_of_planets[p],_latta_star)
         _latta_stars.append((p_star,_latta_star))
     return _latta_stars
-def _amsa_d150(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,include_upagrahas=False,
+def _amsa_d150(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,include_upagrahas=False,
           include_special_lagnas=False,include_sphutas=False,chart_method=1,base_rasi=None,count_from_end_of_sign=None):
     #msgs = get_amsa_resources()
     planet_positions = divisional_chart(jd, place, ayanamsa_mode=ayanamsa_mode, divisional_chart_factor=divisional_chart_factor,
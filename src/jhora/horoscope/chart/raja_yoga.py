@@ -19,7 +19,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import itertools
-import json
 from jhora import const,utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import house, charts
@@ -52,12 +51,7 @@ def get_raja_yoga_resources(language='en'):
         @param language: Two letter language code. en, hi, ka, ta, te
         @return json strings from the resource file as dictionary 
     """
-    json_file = _lang_path + const._DEFAULT_RAJA_YOGA_JSON_FILE_PREFIX+language+'.json'
-    #print('opening json file',json_file)
-    f = open(json_file,"r",encoding="utf-8")
-    msgs = json.load(f)
-    #print('json msgs collected')
-    return msgs
+    return utils.get_json_resource('raja_yoga',language)
 def get_raja_yoga_details_for_all_charts(jd,place,language='en',divisional_chart_factor=None):
     """
         Get all the raja yoga information that are present in the divisional charts for a given julian day and place
@@ -120,8 +114,7 @@ def get_raja_yoga_details(jd,place,divisional_chart_factor=1,language='en'):
                     #details_str += rp_str
             if rp_str != '':
                 details_str += res['raja_yoga_pairs'] + rp_str
-                details.insert(0,details_str)
-                raja_yoga_results[raja_yoga_function] = details
+                raja_yoga_results[raja_yoga_function] = [details_str,*details]
     #print('Found',len(raja_yoga_results),'out of',len(msgs),'raja_yogas in D'+str(divisional_chart_factor),'chart')
     return raja_yoga_results,len(raja_yoga_results),len(msgs)
 def _check_association(h_to_p,lord1,lord2):
@@ -452,7 +445,7 @@ def neecha_bhanga_raja_yoga_from_planet_positions(planet_positions,raja_yoga_pla
     chk3 = chk3_1 or chk3_2
     return chk3
 def check_other_raja_yoga_1(jd,place,divisional_chart_factor=1):
-    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=drik.get_ayanamsa_mode(), divisional_chart_factor=divisional_chart_factor)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_house_dictionary_from_planet_positions(planet_positions)
     chara_karakas = house.chara_karakas(planet_positions)
@@ -469,7 +462,7 @@ def check_other_raja_yoga_1(jd,place,divisional_chart_factor=1):
     chk2 = p_to_h[lagna_lord] == p_to_h[fifth_lord]
     return chk1 and chk2
 def check_other_raja_yoga_2(jd,place,divisional_chart_factor=1):
-    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=drik.get_ayanamsa_mode(), divisional_chart_factor=divisional_chart_factor)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_house_dictionary_from_planet_positions(planet_positions)
     chara_karakas = house.chara_karakas(planet_positions)
@@ -506,7 +499,7 @@ def check_other_raja_yoga_2(jd,place,divisional_chart_factor=1):
     chk4 = chk4_1 and chk4_2 and chk4_3 and chk4_4
     return chk1 and chk2 and (chk3 or chk4)
 def check_other_raja_yoga_3(jd,place,divisional_chart_factor=1):
-    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=drik.get_ayanamsa_mode(), divisional_chart_factor=divisional_chart_factor)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_house_dictionary_from_planet_positions(planet_positions)
     chara_karakas = house.chara_karakas(planet_positions)
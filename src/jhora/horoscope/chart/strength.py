@@ -21,6 +21,7 @@
 """ To Calculate strengths of planets/rasis from chart positions of planets """
 """ Ref: https://www.scribd.com/document/426763000/Shadbala-and-Bhavabala-Calculation-pdf """
 """ Ref: https://medium.com/thoughts-on-jyotish/shadbala-the-6-sources-of-strength-4c5befc0c59a """
+from functools import cached_property
 from jhora import const,utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import charts, house
@@ -128,6 +129,76 @@ ujjain_epoch_table_for_planets = [
 kendras = lambda asc_house:[(asc_house+h-1)%12 for h in [1,4,7,10] ]
 panapharas = lambda asc_house:[(asc_house+h-1)%12 for h in [2,5,8,11] ]
 apoklimas = lambda asc_house:[(asc_house+h-1)%12 for h in [3,6,9,12] ]
+sapthavarga_factors = [1, 2, 3, 7, 9, 12, 30]
+shad_bala_fields = ['sthana','kaala','dig','cheshta','naisargika','drik','total','rupa','strength']
+bhava_bala_fields = ['adhipathi','dig','drik','total','rupa','strength']
+class ShadBalaContext:
+    """
+        Chart inputs shared by the shad bala / bhava bala calculations of a julian day, place and ayanamsa mode
+        (rasi and sapthavarga charts, bhava madhya, benefics/malefics, sunrise/sunset, midnight, declinations)
+        Each input is computed only once - when it is first used - and reused by all the balas
+        Pass it as context to shad_bala, bhava_bala or any of the sub balas
+        @param jd: Julian Day Number of the date/time
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @param ayanamsa_mode: Default None - current setting (see drik.get_ayanamsa_mode)
+    """
+    def __init__(self,jd,place,ayanamsa_mode=None):
+        self.jd = jd; self.place = place
+        self.ayanamsa_mode = drik.get_ayanamsa_mode() if ayanamsa_mode is None else ayanamsa_mode
+        self._ayanamsa_value = drik.get_ayanamsa_setting().value if ayanamsa_mode is None else None
+    def ayanamsa_setting(self):
+        """ @return: context manager that scopes the ayanamsa mode of the context to the current thread """
+        return drik.ayanamsa_setting(self.ayanamsa_mode,self._ayanamsa_value,jd=self.jd)
+    @cached_property
+    def rasi_positions(self):
+        with self.ayanamsa_setting():
+            return charts.rasi_chart(self.jd, self.place, ayanamsa_mode=self.ayanamsa_mode)
+    @cached_property
+    def planet_positions(self):
+        """ Same as drik.dhasavarga(jd,place,1) i.e. rasi positions without the ascendant """
+        return self.rasi_positions[1:]
+    @cached_property
+    def varga_positions(self):
+        """ {dcf:planet_positions} of the sapthavarga charts. NOTE: D2 is the hora chart of chart_method=2 """
+        pp = self.rasi_positions
+        return {dcf:pp if dcf==1 else charts.hora_chart(pp, chart_method=2) if dcf==2 else \
+                    charts.divisional_positions_from_rasi_positions(pp, divisional_chart_factor=dcf)
+                        for dcf in sapthavarga_factors}
+    @cached_property
+    def bhava_chart_houses(self):
+        with self.ayanamsa_setting():
+            return charts.bhava_chart_houses(self.jd, self.place, ayanamsa_mode=self.ayanamsa_mode)
+    @cached_property
+    def bhaava_madhya(self):
+        with self.ayanamsa_setting():
+            return drik.bhaava_madhya(self.jd, self.place)
+    @cached_property
+    def benefics_and_malefics(self):
+        with self.ayanamsa_setting():
+            return charts.benefics_and_malefics(self.jd, self.place,ayanamsa_mode=self.ayanamsa_mode,
+                                                exclude_rahu_ketu=True)
+    @cached_property
+    def declinations(self):
+        with self.ayanamsa_setting():
+            return drik.declination_of_planets(self.jd, self.place)
+    @cached_property
+    def birth_time_hours(self):
+        return utils.jd_to_gregorian(self.jd)[3]
+    @cached_property
+    def sunrise(self):
+        return drik.sunrise(self.jd, self.place)[0]
+    @cached_property
+    def sunset(self):
+        return drik.sunset(self.jd, self.place)[0]
+    @cached_property
+    def day_length(self):
+        return drik.day_length(self.jd, self.place)
+    @cached_property
+    def night_length(self):
+        return drik.night_length(self.jd, self.place)
+    @cached_property
+    def midnight(self):
+        return drik.midnight(self.jd, self.place)
 
 def harsha_bala(dob,tob,place,divisional_factor=1):
     """
@@ -194,16 +265,12 @@ def _sapthavargaja_bala(jd,place):
         svb.append(svbc)
     svb_sum = list(map(sum,zip(*svb)))
     return svb_sum
-def _sapthavargaja_bala1(jd,place,ayanamsa_mode='LAHIRI'):
-    sv = [1, 2, 3, 7, 9, 12, 30]
-    pp_sv = {}
-    planet_positions_in_rasi = charts.rasi_chart(jd, place,ayanamsa_mode=ayanamsa_mode)
-    h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions_in_rasi)
+def _sapthavargaja_bala1(jd,place,ayanamsa_mode='LAHIRI',context=None):
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    sv = sapthavarga_factors
+    pp_sv = context.varga_positions
+    h_to_p = utils.get_house_planet_list_from_planet_positions(context.rasi_positions)
     cr = house._get_compound_relationships_of_planets(h_to_p)
-    for dcf in sv:
-        pp = charts.divisional_chart(jd, place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=dcf) if dcf!=2 \
-                else charts.hora_chart(planet_positions_in_rasi, chart_method=2)
-        pp_sv[dcf] = pp
     svb = []
     for dcf in sv:
         svbc = _sapthavargaja_bala_2(pp_sv[dcf],dcf,cr)
@@ -211,15 +278,12 @@ def _sapthavargaja_bala1(jd,place,ayanamsa_mode='LAHIRI'):
     svb_sum = list(map(sum,zip(*svb)))
     svb_sum = [round(v,2) for v in svb_sum]
     return svb_sum
-def _sthana_bala(jd, place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
-    sv = [1, 2, 3, 7, 9, 12, 30]
-    pp_sv = {}
-    for dcf in sv:
-        pp = charts.divisional_chart(jd, place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=dcf)
-        pp_sv[dcf] = pp
+def _sthana_bala(jd, place,ayanamsa_mode=None,context=None):
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    pp_sv = context.varga_positions
     ub = _uchcha_bala(pp_sv[1])
     #print('uccha bala',ub)
-    svb = _sapthavargaja_bala1(jd, place,ayanamsa_mode=ayanamsa_mode)
+    svb = _sapthavargaja_bala1(jd, place,context=context)
     #print('_sapthavargaja_bala',svb)
     ob = _ojayugama_bala(pp_sv[1], pp_sv[9])
     #print('_ojayugama_bala',ob)
@@ -416,17 +480,18 @@ def dwadhasa_vargeeya_bala(jd,place):
                 dvp[p]+=1
     dvpd = {k:dvp[k] for k in const.SUN_TO_SATURN}
     return dvpd
-def _dig_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
-    planet_positions = charts.rasi_chart(jd, place,ayanamsa_mode=ayanamsa_mode)
+def _dig_bala(jd,place,ayanamsa_mode=None,context=None):
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    planet_positions = context.rasi_positions
     powerless_houses_of_planets = [3,9,3,6,6,9,0]#[4,10,4,7,7,10,1]
-    bm = drik.bhaava_madhya(jd, place)
+    bm = context.bhaava_madhya
     dbf = [bm[p] for p in powerless_houses_of_planets]
     dbp = [0 for _ in const.SUN_TO_SATURN]
     for p,(h,long) in planet_positions[1:const._pp_count_upto_saturn]:
         p_long = h*30+long
         dbp[p] = round(abs(dbf[p]-p_long)/3,2)
     return dbp
-def _dig_bala_another(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def _dig_bala_another(jd, place, ayanamsa_mode=None):
     """ From Abhinav Singh """  
     planet_positions = charts.rasi_chart(jd, place, ayanamsa_mode=ayanamsa_mode)
     
@@ -475,10 +540,11 @@ def _dig_bala_another(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
 
 def _divaratri_bala(jd,place):
     return _nathonnath_bala(jd,place)
-def _nathonnath_bala(jd,place):
+def _nathonnath_bala(jd,place,context=None):
     nbp = [0 for _ in const.SUN_TO_SATURN]
-    _,_,_,tobh = utils.jd_to_gregorian(jd)
-    mnhl = drik.midnight(jd, place)
+    if context is None: context = ShadBalaContext(jd, place)
+    tobh = context.birth_time_hours
+    mnhl = context.midnight
     t_diff = (tobh - mnhl)*60/12 if tobh < 12.0 else (24.0 + mnhl - tobh)*60/12
     for p in [0,4,5]:
         nbp[p] = round(t_diff,2)
@@ -486,13 +552,14 @@ def _nathonnath_bala(jd,place):
         nbp[p] = round(60 - t_diff,2)
     nbp[3] = 60.0
     return nbp
-def _paksha_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
-    planet_positions = drik.dhasavarga(jd, place,divisional_chart_factor=1)
+def _paksha_bala(jd,place,ayanamsa_mode=None,context=None):
+    planet_positions = drik.dhasavarga(jd, place,divisional_chart_factor=1) if context is None else context.planet_positions
     sun_long = planet_positions[0][1][0]*30+planet_positions[0][1][1]
     moon_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
     pb = round(abs(sun_long - moon_long) / 3.0,2)
     pbp = [pb for _ in const.SUN_TO_SATURN]
-    cht_benefics,cht_malefics = charts.benefics_and_malefics(jd, place,ayanamsa_mode=ayanamsa_mode,exclude_rahu_ketu=True)
+    cht_benefics,cht_malefics = charts.benefics_and_malefics(jd, place,ayanamsa_mode=ayanamsa_mode,exclude_rahu_ketu=True) \
+                                    if context is None else context.benefics_and_malefics
     #print(cht_benefics,cht_malefics)
     for p in cht_benefics:# const.natural_benefics:
         pbp[p] = pb
@@ -500,13 +567,14 @@ def _paksha_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
         pbp[p] = round(60.0 - pb,2)
     pbp[1] *=2 
     return pbp
-def _tribhaga_bala(jd,place):
+def _tribhaga_bala(jd,place,context=None):
     tbp = [0 for _ in const.SUN_TO_SATURN]
-    _,_,_,tobh = utils.jd_to_gregorian(jd)
-    srh = drik.sunrise(jd, place)[0]
-    ssh = drik.sunset(jd, place)[0]
-    dl = drik.day_length(jd, place)
-    nl = drik.night_length(jd, place)
+    if context is None: context = ShadBalaContext(jd, place)
+    tobh = context.birth_time_hours
+    srh = context.sunrise
+    ssh = context.sunset
+    dl = context.day_length
+    nl = context.night_length
     dlinc = dl/3 ; nlinc = nl / 3
     tbp[4] = 60 # Guru/Jupiter
     if tobh >= srh and tobh < srh+dlinc:  # 1st part of day
@@ -570,7 +638,7 @@ def _masa_bala(jd,place):
     day = drik.vaara(jd)
     abp[day] = 30
     return abp
-def _vaaradhipathi(jd,place):
+def _vaaradhipathi(jd,place,context=None):
     abp = [0 for _ in const.SUN_TO_SATURN]
     _abda_weekdays = [2,3,4,5,6,0,1]
     ay,am,ad,bth = utils.jd_to_gregorian(jd)
@@ -578,7 +646,8 @@ def _vaaradhipathi(jd,place):
     _ahargana_days = _days_elapsed_since_base(ay-1, base_year=1827, base_days=244)+elpased_days_in_year
     #_ahargana_days = _days_elapsed_since_base(ay-1)+elpased_days_in_year if vaaradhipathi_method==1 \
     #                    else _days_elapsed_since_base(ay-1, base_year=1827, base_days=244)+elpased_days_in_year
-    if bth < drik.sunrise(jd, place)[0]: _ahargana_days -= 1
+    srise = drik.sunrise(jd, place)[0] if context is None else context.sunrise
+    if bth < srise: _ahargana_days -= 1
     day = int(_ahargana_days)%7 # Add 1 get 1st day of the next kali year
     abp[_abda_weekdays[day]] = 45
     return abp
@@ -591,11 +660,12 @@ def _vaara_bala(jd,place):
         day = (day-1)%7
     abp[day] = 45
     return abp
-def _hora_bala(jd,place):
+def _hora_bala(jd,place,context=None):
     abp = [0 for _ in const.SUN_TO_SATURN]
     day = drik.vaara(jd)
-    _,_,_,tobh = utils.jd_to_gregorian(jd)
-    srise = drik.sunrise(jd, place)[0]
+    if context is None: context = ShadBalaContext(jd, place)
+    tobh = context.birth_time_hours
+    srise = context.sunrise
     if tobh < srise:
         day = (day-1)%7
         tobh += 24.0
@@ -603,30 +673,33 @@ def _hora_bala(jd,place):
     hora = (int(tobh-srise)+day+1)%7
     abp[hora_order[hora]] = 60
     return abp
-def _ayana_bala(jd,place):
-    _declinations = drik.declination_of_planets(jd, place)
+def _ayana_bala(jd,place,context=None):
+    _declinations = drik.declination_of_planets(jd, place) if context is None else context.declinations
     ab = [0 for _ in const.SUN_TO_SATURN]
     for p in const.SUN_TO_SATURN:
         ab[p] = round((24.0 + _declinations[p])*1.25,2)
         if p==0:
             ab[p] *= 2
     return ab
-def _yuddha_bala(jd,place):
+def _yuddha_bala(jd,place,context=None):
     yb = [0 for _ in const.SUN_TO_SATURN]
-    pp = drik.dhasavarga(jd, place, divisional_chart_factor=1)[:7]
+    pp = (drik.dhasavarga(jd, place, divisional_chart_factor=1) if context is None else context.planet_positions)[:7]
     p_longs = [h*30+long for _,(h,long) in pp]
     p_longs_copy = p_longs[:]
     ce = sorted(utils.closest_elements(p_longs, p_longs))
     indices = [p_longs.index(v) for v in ce]
     if any([sm==i for sm in [0,1] for i in indices]):
         return yb # All Zero
-    # Find Sum of balas upto hora bala
-    sb = _sthana_bala(jd, place)
-    dgb = _dig_bala(jd,place)
-    nb = _nathonnath_bala(jd, place)
-    pb = _paksha_bala(jd,place)
-    tb = _tribhaga_bala(jd, place)
-    hb = _hora_bala(jd, place)
+    # Find Sum of balas upto hora bala - always with the default ayanamsa mode
+    default_context = ShadBalaContext(jd, place)
+    if context is not None and context.ayanamsa_mode == default_context.ayanamsa_mode:
+        default_context = context
+    sb = _sthana_bala(jd, place,context=default_context)
+    dgb = _dig_bala(jd,place,context=default_context)
+    nb = _nathonnath_bala(jd, place,context=default_context)
+    pb = _paksha_bala(jd,place,context=default_context)
+    tb = _tribhaga_bala(jd, place,context=default_context)
+    hb = _hora_bala(jd, place,context=default_context)
     bala_totals = [0 for _ in const.SUN_TO_SATURN]
     for i in indices:
         bala_totals[i] += sb[i]
@@ -640,17 +713,18 @@ def _yuddha_bala(jd,place):
     y_bala = round(b_diff/dia_diff,2)
     yb[indices[0]] =  y_bala ; yb[indices[1]] =  -y_bala
     return yb
-def _kaala_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def _kaala_bala(jd,place,ayanamsa_mode=None,context=None):
     kb = [0 for _ in const.SUN_TO_SATURN]
-    nb = _nathonnath_bala(jd, place)
-    pb = _paksha_bala(jd, place,ayanamsa_mode=ayanamsa_mode)
-    tb = _tribhaga_bala(jd, place)
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    nb = _nathonnath_bala(jd, place,context=context)
+    pb = _paksha_bala(jd, place,context=context)
+    tb = _tribhaga_bala(jd, place,context=context)
     ab = _abdadhipathi(jd,place)# _abda_bala(jd, place)
     mb = _masadhipathi(jd, place) # _masa_bala(jd, place)
-    vb = _vaaradhipathi(jd, place) # _vaara_bala(jd, place)
-    hb = _hora_bala(jd, place)
-    ayb = _ayana_bala(jd, place)
-    yb = _yuddha_bala(jd, place)
+    vb = _vaaradhipathi(jd, place,context=context) # _vaara_bala(jd, place)
+    hb = _hora_bala(jd, place,context=context)
+    ayb = _ayana_bala(jd, place,context=context)
+    yb = _yuddha_bala(jd, place,context=context)
     for p in const.SUN_TO_SATURN:
         kb[p] += nb[p]
         kb[p] += pb[p]
@@ -799,13 +873,13 @@ def planet_aspect_relationship_table(planet_positions,include_houses=False):
     import numpy as np
     dk = np.array(dk).T
     return dk.tolist()
-def _drik_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
+def _drik_bala(jd,place,ayanamsa_mode=None,context=None):
     dk = [[ 0 for _ in const.SUN_TO_SATURN] for _ in const.SUN_TO_SATURN]
-    pp = charts.rasi_chart(jd, place,ayanamsa_mode=ayanamsa_mode)
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    pp = context.rasi_positions
     #planets_with_mercury = [p for p,(h,_) in pp[1:] if h==pp[4][1][0] and p != 3]
-    _tithi = drik.tithi(jd, place)[0]; waxing_moon = _tithi <= 15
     pp = pp[1:-2]
-    subha_grahas,asubha_grahas = charts.benefics_and_malefics(jd, place,ayanamsa_mode=ayanamsa_mode,exclude_rahu_ketu=True)
+    subha_grahas,asubha_grahas = context.benefics_and_malefics
     for p1 in const.SUN_TO_SATURN: # Aspected Planet
         p1_long = pp[p1][1][0]*30+pp[p1][1][1]
         for p2 in const.SUN_TO_SATURN: # Aspecting Planet
@@ -826,26 +900,36 @@ def _drik_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
             dk_final[col] = round((dkp[col] - dkm[col])/4,2) 
     #print('drik bala values',dk_final)
     return dk_final
-def shad_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
-    sb = []
-    stb = _sthana_bala(jd, place,ayanamsa_mode=ayanamsa_mode)
-    #print('_sthana_bala',stb)
-    sb.append(stb)
-    kb = _kaala_bala(jd, place,ayanamsa_mode=ayanamsa_mode)
-    #print('_kaala_bala',kb)
-    sb.append(kb)
-    dgb = _dig_bala(jd, place,ayanamsa_mode=ayanamsa_mode)
-    #print('_dig_bala',dgb)
-    sb.append(dgb)
-    cb = _cheshta_bala_new(jd, place,use_epoch_table=True)
-    #print('_cheshta_bala',cb)
-    sb.append(cb)
-    nb = _naisargika_bala(jd, place)
-    #print('_naisargika_bala',nb)
-    sb.append(nb)
-    dkb = _drik_bala(jd, place,ayanamsa_mode=ayanamsa_mode)
-    #print('_drik_bala',dkb)
-    sb.append(dkb)
+def shad_bala(jd,place,ayanamsa_mode=None,context=None):
+    """
+        Computes shad bala of the planets Sun to Saturn
+        @param jd: Julian Day Number of the date/time
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @param ayanamsa_mode: Default None - current setting (see drik.get_ayanamsa_mode)
+        @param context: ShadBalaContext to reuse (ayanamsa_mode is ignored if context is provided)
+        @return: [sthana, kaala, dig, cheshta, naisargika, drik, total, rupa, strength] - each a list of 7 values
+    """
+    if context is None: context = ShadBalaContext(jd, place, ayanamsa_mode)
+    with context.ayanamsa_setting():
+        sb = []
+        stb = _sthana_bala(jd, place,context=context)
+        #print('_sthana_bala',stb)
+        sb.append(stb)
+        kb = _kaala_bala(jd, place,context=context)
+        #print('_kaala_bala',kb)
+        sb.append(kb)
+        dgb = _dig_bala(jd, place,context=context)
+        #print('_dig_bala',dgb)
+        sb.append(dgb)
+        cb = _cheshta_bala_new(jd, place,use_epoch_table=True,context=context)
+        #print('_cheshta_bala',cb)
+        sb.append(cb)
+        nb = _naisargika_bala(jd, place)
+        #print('_naisargika_bala',nb)
+        sb.append(nb)
+        dkb = _drik_bala(jd, place,context=context)
+        #print('_drik_bala',dkb)
+        sb.append(dkb)
     import numpy as np
     sbn = np.array(sb).tolist()
     sb_sum = np.around(np.sum(sbn,0),2).tolist()
@@ -853,19 +937,30 @@ def shad_bala(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE):
     sb_req = [5,6,5,7,6.5,5.5,5]
     sb_strength = [round(sb_rupa[p]/sb_req[p],2) for p in const.SUN_TO_SATURN]
     return [stb, kb, dgb, cb, nb, dkb, sb_sum, sb_rupa,sb_strength]
-def _bhava_adhipathi_bala(jd,place):
-    bhava_pp = charts.bhava_chart_houses(jd, place)
+def shad_bala_array(jd,place,ayanamsa_mode=None,context=None):
+    """
+        Same as shad_bala but as numpy record array of the planets Sun to Saturn
+        Fields: see shad_bala_fields. Example: sb = shad_bala_array(jd,place); sb.total, sb['rupa'][0]
+        @param ayanamsa_mode: Default None - current setting (see drik.get_ayanamsa_mode)
+        @param context: ShadBalaContext to reuse (ayanamsa_mode is ignored if context is provided)
+        @return: numpy.recarray of shape (7,)
+    """
+    import numpy as np
+    return np.rec.fromarrays(shad_bala(jd, place, ayanamsa_mode, context=context),names=shad_bala_fields)
+def _bhava_adhipathi_bala(jd,place,context=None,shad_bala_total=None):
+    if context is None: context = ShadBalaContext(jd, place)
+    bhava_pp = context.bhava_chart_houses
     asc_rasi = bhava_pp[const._ascendant_symbol][0]
     bb = []
-    sb_sum = shad_bala(jd, place)[6]
+    sb_sum = shad_bala(jd, place,context=context)[6] if shad_bala_total is None else shad_bala_total
     for h in range(12):
         r = (h+asc_rasi)%12
         owner = const.house_owners[r]
         bb.append(sb_sum[owner])
     return bb
-def _bhava_dig_bala(jd,place):
+def _bhava_dig_bala(jd,place,context=None):
     bdb = [0 for _ in range(12)]
-    bm = drik.bhaava_madhya(jd, place)
+    bm = drik.bhaava_madhya(jd, place) if context is None else context.bhaava_madhya
     brl = {0:const.nara_rasi_longitudes,3:const.jalachara_rasi_longitudes,9:const.chatushpada_rasis,6:const.keeta_rasis}
     chk = []
     for k,v in brl.items():
@@ -908,9 +1003,10 @@ def __bhava_drik_bala_calc_1(dk_p1_p2,p1):
 def bhava_drishti_bala(jd,place):
     """ TODO: Check if Bhava Drishi bala is same as Aspect Relationship Table??? """
     return _bhava_drik_bala(jd, place)
-def _bhava_drik_bala(jd,place):
+def _bhava_drik_bala(jd,place,context=None):
     dk = [[ 0 for _ in const.SUN_TO_SATURN] for _ in range(12)]
-    pp = charts.rasi_chart(jd, place)
+    if context is None: context = ShadBalaContext(jd, place)
+    pp = context.rasi_positions
     house_planet_dict = utils.get_house_planet_list_from_planet_positions(pp)
     pp = pp[1:-2]
     subha_grahas = [1,3,4,5] ; asubha_grahas = [0,2,6]
@@ -931,7 +1027,7 @@ def _bhava_drik_bala(jd,place):
     for planet in const.SUN_TO_SATURN:
         planet_house_aspects[planet] = sorted(list(set(ghp[planet]+rhp[planet])))
         planet_house_aspects[planet] = [int(p) for p in planet_house_aspects[planet] if p not in [const._ascendant_symbol,'7','8']]
-    bm = drik.bhaava_madhya(jd, place)
+    bm = context.bhaava_madhya
     for h in range(12): # Aspected Planet
         h_mid = bm[h]
         for p in const.SUN_TO_SATURN: # Aspecting Planet
@@ -952,19 +1048,33 @@ def _bhava_drik_bala(jd,place):
                 dkm[row] += dk[row][col]
             dk_final[row] = round((dkp[row] - dkm[row])/4,2) 
     return dk_final
-def bhava_bala(jd,place):
-    """
-        Computes bhava bala
-        Returns bhava bala as list of bhava bala followed by list of bhava bala in rupas
-    """
-    bab = _bhava_adhipathi_bala(jd, place)
-    bdb = _bhava_dig_bala(jd, place)
-    bdrb = _bhava_drik_bala(jd, place)
+def _bhava_bala(jd,place,context=None,shad_bala_total=None):
+    if context is None: context = ShadBalaContext(jd, place)
+    bab = _bhava_adhipathi_bala(jd, place,context=context,shad_bala_total=shad_bala_total)
+    bdb = _bhava_dig_bala(jd, place,context=context)
+    bdrb = _bhava_drik_bala(jd, place,context=context)
     bb = list(map(sum,zip(*[bab,bdb,bdrb])))
     bb = [round(b,2) for b in bb]
     bb_rupas = [round(b/60,2) for b in bb]
     bb_strength = [round(b/const.minimum_bhava_bala_rupa,2) for b in bb_rupas]
-    return [bb,bb_rupas,bb_strength]
+    return [bab,bdb,bdrb,bb,bb_rupas,bb_strength]
+def bhava_bala(jd,place,context=None,shad_bala_total=None):
+    """
+        Computes bhava bala
+        Returns bhava bala as list of bhava bala followed by list of bhava bala in rupas
+        @param context: ShadBalaContext to reuse (default ayanamsa mode if not provided)
+        @param shad_bala_total: total shad bala of the planets (shad_bala(...)[6]) if already computed
+    """
+    return _bhava_bala(jd, place, context=context, shad_bala_total=shad_bala_total)[3:]
+def bhava_bala_array(jd,place,context=None,shad_bala_total=None):
+    """
+        Same as bhava_bala but as numpy record array of the 12 bhavas (including the adhipathi, dig and drik balas)
+        Fields: see bhava_bala_fields. Example: bb = bhava_bala_array(jd,place); bb.total, bb['rupa'][0]
+        @return: numpy.recarray of shape (12,)
+    """
+    import numpy as np
+    return np.rec.fromarrays(_bhava_bala(jd, place, context=context, shad_bala_total=shad_bala_total),
+                             names=bhava_bala_fields)
 def get_planet_mean_longitude_using_epoch_table(jd,place,planet_index=0):
     if planet_index == 1: return 0.0
     days_from_epoch = _DAYS_FROM_EPOCH(jd,place); year_jd = utils.jd_to_gregorian(jd)[0]
@@ -1024,8 +1134,8 @@ def get_planet_mean_longitude(jd,place,planet_index=0):
                                     _planet_longitude_correction) % 360
     #print(days_from_epoch,planet_mean_positions_at_epoch_ujjain_1900[planet_index],_planet_longitude_correction,planet_speed_at_epoch,planet_mean_position_at_jd)
     return planet_mean_position_at_jd
-def _cheshta_bala_new(jd,place,use_epoch_table=False):
-    pp = drik.dhasavarga(jd, place, divisional_chart_factor=1)
+def _cheshta_bala_new(jd,place,use_epoch_table=False,context=None):
+    pp = drik.dhasavarga(jd, place, divisional_chart_factor=1) if context is None else context.planet_positions
     cb = [0 for _ in const.SUN_TO_SATURN]
     sun_mean_long = get_planet_mean_longitude(jd, place, const._SUN)
     for p in [const._MARS, const._MERCURY, const._JUPITER, const._VENUS, const._SATURN]: #range(2,7):
@@ -18,7 +18,10 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
-import json
+import warnings
+import contextvars
+from collections import namedtuple as struct
+from contextlib import contextmanager
 from jhora import const,utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import house
@@ -47,10 +50,102 @@ def get_yoga_resources(language='en'):
         @param language: Two letter language code. en, hi, ka, ta, te
         @return json strings from the resource file as dictionary 
     """
-    json_file = _lang_path + const._DEFAULT_YOGA_JSON_FILE_PREFIX+language+'.json'
-    f = open(json_file,"r",encoding="utf-8")
-    msgs = json.load(f)
-    return msgs
+    return utils.get_json_resource('yoga',language)
+class YogaContext(object):
+    """
+        Chart inputs of one (jd, place) shared by all yoga predicates.
+        Rasi positions are computed once at construction. Varga positions and the
+        benefic/malefic/vaiseshikamsa lookups are derived from them on first use and memoized.
+        The context can not be modified once built and every accessor returns a copy,
+        so a predicate can not corrupt the chart seen by the next one.
+        @param jd: Julian day number
+        @param place: struct (place name, latitude, longitude, timezone)
+        @param planet_positions: rasi planet positions [['L',(h,long)],[0,(h,long)],...]
+            If provided, jd/place can be None and no ephemeris calculation is done.
+            Lookups needing birth time (benefics, vaiseshikamsa) are then not available.
+    """
+    __slots__ = ('jd','place','ayanamsa_mode','_rasi_positions','_cache')
+    def __init__(self,jd,place,planet_positions=None):
+        from jhora.horoscope.chart import charts
+        if planet_positions is None:
+            planet_positions = charts.rasi_chart(jd, place)
+        else:
+            planet_positions = [[p,(h,long)] for p,(h,long) in planet_positions]
+        object.__setattr__(self,'jd',jd)
+        object.__setattr__(self,'place',place)
+        object.__setattr__(self,'ayanamsa_mode',drik.get_ayanamsa_mode())
+        object.__setattr__(self,'_rasi_positions',planet_positions)
+        object.__setattr__(self,'_cache',{})
+    def __setattr__(self,name,value):
+        raise AttributeError("YogaContext is immutable")
+    def matches(self,jd,place):
+        """ True if this context was built for the jd, place and the current ayanamsa mode """
+        return self.jd==jd and self.place==place and self.ayanamsa_mode==drik.get_ayanamsa_mode()
+    def _check_birth_time(self):
+        if self.jd is None:
+            raise ValueError("YogaContext built from planet positions has no birth time")
+    def _memoized(self,key,func):
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+    def planet_positions(self,divisional_chart_factor=1):
+        """
+            @return: same as charts.divisional_chart(jd,place,divisional_chart_factor=divisional_chart_factor)
+        """
+        from jhora.horoscope.chart import charts
+        pp = self._memoized(('pp',divisional_chart_factor), lambda:
+                charts.divisional_positions_from_rasi_positions(self._rasi_positions,
+                                                                divisional_chart_factor=divisional_chart_factor))
+        return [[p,(h,long)] for p,(h,long) in pp]
+    def chart_1d(self,divisional_chart_factor=1):
+        """ @return: house to planet list of the divisional chart. Example: ['0/1','','L',...] """
+        return utils.get_house_planet_list_from_planet_positions(self.planet_positions(divisional_chart_factor))
+    def benefics_and_malefics(self,divisional_chart_factor=1):
+        """ @return: same as charts.benefics_and_malefics(jd,place,divisional_chart_factor=divisional_chart_factor) """
+        from jhora.horoscope.chart import charts
+        self._check_birth_time()
+        _benefics,_malefics = self._memoized(('bm',divisional_chart_factor), lambda:
+                charts.benefics_and_malefics(self.jd, self.place, divisional_chart_factor=divisional_chart_factor))
+        return _benefics[:],_malefics[:]
+    def benefics(self,divisional_chart_factor=1):
+        return self.benefics_and_malefics(divisional_chart_factor)[0]
+    def malefics(self,divisional_chart_factor=1):
+        return self.benefics_and_malefics(divisional_chart_factor)[1]
+    def _vaiseshikamsa(self,varga_type):
+        from jhora.horoscope.chart import charts
+        self._check_birth_time()
+        vv = self._memoized(('vv',varga_type), lambda:
+                getattr(charts,'vaiseshikamsa_'+varga_type+'_of_planets')(self.jd, self.place))
+        return {p:v[:] for p,v in vv.items()}
+    def vaiseshikamsa_dhasavarga_of_planets(self):
+        return self._vaiseshikamsa('dhasavarga')
+    def vaiseshikamsa_shadvarga_of_planets(self):
+        return self._vaiseshikamsa('shadvarga')
+    def vaiseshikamsa_shodhasavarga_of_planets(self):
+        return self._vaiseshikamsa('shodhasavarga')
+_active_yoga_context = contextvars.ContextVar('_active_yoga_context',default=None)
+def _yoga_context(jd,place):
+    """
+        @return: YogaContext of the running yoga scan if it was built for (jd, place)
+            otherwise a new YogaContext for (jd, place)
+    """
+    context = _active_yoga_context.get()
+    if context is None or not context.matches(jd, place):
+        context = YogaContext(jd, place)
+    return context
+@contextmanager
+def _yoga_context_scope(jd,place,planet_positions=None):
+    """ Make one YogaContext of (jd,place) visible to all *_from_jd_place predicates called inside the block """
+    context = _active_yoga_context.get()
+    if context is not None and context.matches(jd, place) and planet_positions is None:
+        yield context
+        return
+    context = YogaContext(jd, place, planet_positions=planet_positions)
+    token = _active_yoga_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_yoga_context.reset(token)
 def get_yoga_details_for_all_charts(jd,place,language='en',divisional_chart_factor=None):
     """
         Get all the yoga information that are present in the divisional charts for a given julian day and place
@@ -65,22 +160,16 @@ def get_yoga_details_for_all_charts(jd,place,language='en',divisional_chart_fact
     global p_to_h_navamsa, h_to_p_navamsa, asc_house_navamsa,planet_positions
     msgs = get_yoga_resources(language=language)
     yoga_results_combined = {}
-    ascendant_index = const._ascendant_symbol
-    planet_positions_navamsa = drik.dhasavarga(jd,place,divisional_chart_factor=9)
-    ascendant_longitude = drik.ascendant(jd,place)[1]
-    asc_house_navamsa,asc_long = drik.dasavarga_from_long(ascendant_longitude,divisional_chart_factor=9)
-    planet_positions_navamsa += [[ascendant_index,(asc_house_navamsa,asc_long)]]
-    p_to_h_navamsa = utils.get_planet_house_dictionary_from_planet_positions(planet_positions_navamsa)
-    h_to_p_navamsa = utils.get_house_planet_list_from_planet_positions(planet_positions_navamsa)
-    if divisional_chart_factor==None:
-        for dv in division_chart_factors:
+    with _yoga_context_scope(jd, place) as context:
+        planet_positions_navamsa = context.planet_positions(divisional_chart_factor=9)
+        asc_house_navamsa = planet_positions_navamsa[0][1][0]
+        p_to_h_navamsa = utils.get_planet_house_dictionary_from_planet_positions(planet_positions_navamsa)
+        h_to_p_navamsa = utils.get_house_planet_list_from_planet_positions(planet_positions_navamsa)
+        dcf_list = division_chart_factors if divisional_chart_factor==None else [divisional_chart_factor]
+        for dv in dcf_list:
             yoga_results,_,_ = get_yoga_details(jd,place,divisional_chart_factor=dv,language=language)
             yoga_results.update(yoga_results_combined)
             yoga_results_combined = yoga_results
-    else:
-        yoga_results,_,_ = get_yoga_details(jd,place,divisional_chart_factor=divisional_chart_factor,language=language)
-        yoga_results.update(yoga_results_combined)
-        yoga_results_combined = yoga_results
         
     #print('Found',len(yoga_results_combined),'out of',len(msgs)*len(division_chart_factors),'yogas')
     return yoga_results_combined,len(yoga_results_combined),len(msgs)*len(division_chart_factors)
@@ -97,33 +186,51 @@ def get_yoga_details(jd,place,divisional_chart_factor=1,language='en'):
     """
     global p_to_h, h_to_p, asc_house, planet_positions
     msgs = get_yoga_resources(language=language)
-    ascendant_index = const._ascendant_symbol
-    planet_positions = drik.dhasavarga(jd,place,divisional_chart_factor)
-    ascendant_longitude = drik.ascendant(jd,place)[1]
-    asc_house,asc_long = drik.dasavarga_from_long(ascendant_longitude,divisional_chart_factor)
-    planet_positions = [[ascendant_index,(asc_house,asc_long)]] + planet_positions
-    planet_positions = planet_positions[:const._pp_count_upto_ketu]
-    p_to_h = { p:h for p,(h,_) in planet_positions}
-    h_to_p = ['' for h in range(12)] 
-    for sublist in planet_positions:
-        p = sublist[0]
-        h = sublist[1][0]
-        h_to_p[h] += str(p) + '/'
     yoga_results = {}
-    #print('divisional_chart_factor',divisional_chart_factor)
-    for yoga_function,details in msgs.items():
-        """ TODO: yoga functions have only one argument h_to_p. Here we call 3 args - need to synch"""
-        eval_str = yoga_function+'_from_jd_place'#'_from_planet_positions'
-        #print(eval_str)
-        try:
-            yoga_exists = eval(eval_str)(jd,place,divisional_chart_factor)#(planet_positions) ##(h_to_p)#
-            if yoga_exists:
-                details.insert(0,'D'+str(divisional_chart_factor))
-                yoga_results[yoga_function] = details
-        except Exception as e:
-            print("Error executing",eval_str,"for divisional_chart_factor=",divisional_chart_factor,e)
+    with _yoga_context_scope(jd, place) as context:
+        planet_positions = context.planet_positions(divisional_chart_factor)[:const._pp_count_upto_ketu]
+        asc_house = planet_positions[0][1][0]
+        p_to_h = { p:h for p,(h,_) in planet_positions}
+        h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
+        for yoga_function,details in msgs.items():
+            if _evaluate_yoga_rule(yoga_rules[yoga_function], context, divisional_chart_factor):
+                yoga_results[yoga_function] = ['D'+str(divisional_chart_factor),*details]
     #print('Found',len(yoga_results),'out of',len(msgs),'yogas in D'+str(divisional_chart_factor),'chart')
     return yoga_results,len(yoga_results),len(msgs)
+def get_yoga_details_from_planet_positions(planet_positions,divisional_chart_factor=1,language='en'):
+    """
+        Get the yoga information present in the requested divisional chart when only the rasi chart is known
+        Yogas that need birth time (tithi based benefics, vaiseshikamsa, sunrise etc) are skipped
+        @param planet_positions: rasi planet positions [['L',(h,long)],[0,(h,long)],...]
+        @param divisional_chart_factor: integer of divisional chart 1=Rasi, 2=D2, 9=D9 etc 
+        @param language: two letter language code (en, hi, ka, ta, te)
+        @return: returns a 2D List of yoga_name, yoga_details and number of yogas checked
+            yoga_name in language
+            yoga_details: [chart_ID, yoga_name, yoga_desription, yoga_benfits] 
+    """
+    msgs = get_yoga_resources(language=language)
+    yoga_results = {}; yogas_checked = 0
+    with _yoga_context_scope(None, None, planet_positions=planet_positions) as context:
+        for yoga_function,details in msgs.items():
+            rule = yoga_rules[yoga_function]
+            if not rule.inputs <= _CHART_ONLY_INPUTS:
+                continue
+            yogas_checked += 1
+            if _evaluate_yoga_rule(rule, context, divisional_chart_factor):
+                yoga_results[yoga_function] = ['D'+str(divisional_chart_factor),*details]
+    return yoga_results,len(yoga_results),yogas_checked
+def _evaluate_yoga_rule(rule,context,divisional_chart_factor=1):
+    """
+        Rules that do not read the scanned varga are evaluated once per context
+        A failing rule is reported as a warning and treated as yoga not present
+    """
+    try:
+        if rule.inputs.isdisjoint(_VARGA_INPUTS):
+            return context._memoized(('yoga',rule.name), lambda: rule.predicate(context.jd,context.place))
+        return rule.predicate(context.jd,context.place,divisional_chart_factor)
+    except Exception as e:
+        warnings.warn("Yoga rule "+rule.name+" failed for D"+str(divisional_chart_factor)+": "+repr(e))
+        return False
 """ Sun/Ravi Yogas """
 def vesi_yoga_from_planet_positions(planet_positions):
     """  If there is a planet other than Moon in the 2nd house from Sun, then this yoga is present. """
@@ -131,8 +238,7 @@ def vesi_yoga_from_planet_positions(planet_positions):
     return vesi_yoga(h_to_p)
 def vesi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """  If there is a planet other than Moon in the 2nd house from Sun, then this yoga is present. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return vesi_yoga_from_planet_positions(pp)
 def vesi_yoga(chart_1d):
     """  If there is a planet other than Moon in the 2nd house from Sun, then this yoga is present. """
@@ -157,8 +263,7 @@ def vosi_yoga(chart_1d):
     planet_ids = [int(p) for p in yoga_house_planets if p!='' and p != const._ascendant_symbol]
     return (len(planet_ids) >= 1) and (excluded_planet not in planet_ids)
 def vosi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return vosi_yoga_from_planet_positions(planet_positions)
 def ubhayachara_yoga_from_planet_positions(planet_positions):
     """ Ubhayachara  Yoga - There is a planet other than Moon in the 2nd and 12th house from Sun. """
@@ -170,8 +275,7 @@ def ubhayachara_yoga(chart_1d):
     return yp
 def ubhayachara_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Ubhayachara  Yoga - There is a planet other than Moon in the 2nd and 12th house from Sun. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return ubhayachara_yoga_from_planet_positions(planet_positions)
 def nipuna_yoga_from_planet_positions(planet_positions):
     """
@@ -186,8 +290,7 @@ def nipuna_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
         TODO: Note: If Mercury is too close to Sun, he is combust (asta or astangata). Yogas 
                     formed by combust planets lose some of their power to do good. 
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return nipuna_yoga_from_planet_positions(planet_positions)
 budha_aaditya_yoga_from_planet_positions = lambda planet_positions:nipuna_yoga_from_planet_positions(planet_positions)
 def nipuna_yoga(chart_1d):
@@ -215,8 +318,7 @@ def sunaphaa_yoga(chart_1d):
     return (len(planet_ids) >= 1) and (excluded_planet not in planet_ids)
 def sunaphaa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ If there are planets other than Sun in the 2nd house from Moon, this yoga is present. """ 
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sunaphaa_yoga_from_planet_positions(pp)
 def anaphaa_yoga_from_planet_positions(planet_positions):
     """ If there are planets other than Sun in the 12th house from Moon, this yoga is present. """ 
@@ -232,8 +334,7 @@ def anaphaa_yoga(chart_1d):
     planet_ids = [int(p) for p in yoga_house_planets if p!='' and p != const._ascendant_symbol]
     return (len(planet_ids) >= 1) and (excluded_planet not in planet_ids)
 def anaphaa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return anaphaa_yoga_from_planet_positions(pp)
 def duradhara_yoga(chart_1d):
     """ Sunaphaa/Duradhara/Dhuradhara Yoga - There is a planet other than Sun in the 2nd and 12th house from Moon. """
@@ -256,8 +357,7 @@ def kemadruma_yoga_from_planet_positions(planet_positions):
 def kemadruma_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Kemadruma Yoga - there are no planets other than Sun in the 1st, 2nd and 12th houses from
         Moon and if there are no planets other than Moon in the quadrants from lagna"""
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return kemadruma_yoga_from_planet_positions(planet_positions)
 def kemadruma_yoga(chart_1d):
     """
@@ -290,8 +390,7 @@ def chandra_mangala_yoga_from_planet_positions(planet_positions):
     return p_to_h[const.MARS_ID]==p_to_h[const.MOON_ID]
 def chandra_mangala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Chandra-Mangala Yoga - Moon and Mars are together (in one sign). """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return chandra_mangala_yoga_from_planet_positions(planet_positions)
 def chandra_mangala_yoga(chart_1d):
     """ Chandra-Mangala Yoga - Moon and Mars are together (in one sign). """
@@ -299,9 +398,9 @@ def chandra_mangala_yoga(chart_1d):
     return p_to_h[const.MARS_ID]==p_to_h[const.MOON_ID]
 def adhi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Adhi Yoga - natural benefics occupy 6th, 7th and 8th from Moon, """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
+    p_to_h = utils.get_planet_house_dictionary_from_planet_positions(planet_positions)
     yoga_houses = [const.HOUSE_6,const.HOUSE_7,const.HOUSE_8]
     houses_from_moon = [(p_to_h[const.MOON_ID]+mh)%12 for mh in yoga_houses]
     return all(p_to_h[pid] in houses_from_moon for pid in _natural_benefics)
@@ -334,8 +433,7 @@ def ruchaka_yoga_from_planet_positions(planet_positions):
     return ruchaka_yoga(h_to_p)
 def ruchaka_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """  Ruchaka Yoga - Mars should be in 0 or 7 or 9th rasi and he should be in 1, 4, 7 or 10th from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return ruchaka_yoga_from_planet_positions(planet_positions)
 def ruchaka_yoga(chart_1d):
     """  Ruchaka Yoga - Mars should be in 0 or 7 or 9th rasi and he should be in 1, 4, 7 or 10th from lagna """
@@ -352,8 +450,7 @@ def bhadra_yoga_from_planet_positions(planet_positions):
     return bhadra_yoga(h_to_p)
 def bhadra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Bhadra Yoga - Mercury should be in Ge or Vi and he should be in 1st, 4th, 7th or 10th from lagna. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return bhadra_yoga_from_planet_positions(planet_positions)
 def bhadra_yoga(chart_1d):
     """ Bhadra Yoga - Mercury should be in Ge or Vi and he should be in 1st, 4th, 7th or 10th from lagna. """
@@ -366,8 +463,7 @@ def bhadra_yoga(chart_1d):
     return yoga_planet_zodiac in yoga_zodiacs and yoga_planet_zodiac in yoga_houses
 def sasa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Saturn should be in Cp, Aq or Li and he should be in 1st, 4th, 7th or 10th from lagna. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sasa_yoga_from_planet_positions(planet_positions)
 def sasa_yoga_from_planet_positions(planet_positions):
     """ Saturn should be in Cp, Aq or Li and he should be in 1st, 4th, 7th or 10th from lagna. """
@@ -397,8 +493,7 @@ def maalavya_yoga(chart_1d):
     return yoga_planet_zodiac in yoga_zodiacs and yoga_planet_zodiac in yoga_houses
 def maalavya_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Maalavya Yoga - Venus should be in Ta, Li or Pi and he should be in 1st, 4th, 7th or 10th from lagna. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return maalavya_yoga_from_planet_positions(planet_positions)
 def hamsa_yoga_from_planet_positions(planet_positions):
     """ Hamsa Yoga - Jupiter should be in Sg, Pi or Cn and he should be in 1st, 4th, 7th or 10th from lagna. """
@@ -415,8 +510,7 @@ def hamsa_yoga(chart_1d):
     return yoga_planet_zodiac in yoga_zodiacs and yoga_planet_zodiac in yoga_houses
 def hamsa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Hamsa Yoga - Jupiter should be in Sg, Pi or Cn and he should be in 1st, 4th, 7th or 10th from lagna. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return hamsa_yoga_from_planet_positions(planet_positions)
 """ Naabasa / Aasraya yogas """
 def rajju_yoga_from_planet_positions(planet_positions):
@@ -430,8 +524,7 @@ def rajju_yoga(chart_1d):
     return _rajju_yoga
 def rajju_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Rajju Yoga: all the planets are exclusively in movable signs """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return rajju_yoga_from_planet_positions(planet_positions)
 def musala_yoga_from_planet_positions(planet_positions):
     """ Musala Yoga: all the planets are exclusively in fixed signs """
@@ -444,8 +537,7 @@ def musala_yoga(chart_1d):
     return _musala_yoga
 def musala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Musala Yoga: all the planets are exclusively in fixed signs """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return musala_yoga_from_planet_positions(planet_positions)
 def nala_yoga_from_planet_positions(planet_positions):
     """ Nala Yoga: all the planets are exclusively in dual signs, """
@@ -458,16 +550,14 @@ def nala_yoga(chart_1d):
     return _nala_yoga
 def nala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Nala Yoga: all the planets are exclusively in dual signs, """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return nala_yoga_from_planet_positions(planet_positions)
 """ Naabhasa Dala Yogas """
 def srik_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     return maalaa_yoga_from_jd_place(jd, place, divisional_chart_factor)
 def maalaa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_to_house_dict_from_chart(h_to_p)
     lagna_house = p_to_h[const._ascendant_symbol]
@@ -505,9 +595,8 @@ def maalaa_yoga(chart_1d,natural_benefics=None):
     return occupied_benefic_kendras == 3
 def sarpa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Sarpa Yoga: If three quadrants from lagna are occupied by natural malefics, """
-    from jhora.horoscope.chart import charts
-    _natural_malefics = charts.malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    _natural_malefics = _yoga_context(jd, place).malefics(divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_to_house_dict_from_chart(h_to_p)
     lagna_house = p_to_h[const._ascendant_symbol]
@@ -550,8 +639,7 @@ def gadaa_yoga(chart_1d):
     return gadaa_yoga
 def gadaa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Gadaa Yoga: all the planets occupy two successive quadrants from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return gadaa_yoga_from_planet_positions(planet_positions)
 def sakata_yoga_from_planet_positions(planet_positions):
     """ Sakata Yoga: If all the planets occupy 1st and 7th houses from lagna """
@@ -567,8 +655,7 @@ def sakata_yoga(chart_1d):
     return sakata_yoga
 def sakata_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sakata Yoga: If all the planets occupy 1st and 7th houses from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sakata_yoga_from_planet_positions(planet_positions)
 def vihaga_yoga_from_planet_positions(planet_positions):
     return vihanga_yoga_from_planet_positions(planet_positions)
@@ -578,8 +665,7 @@ def vihanga_yoga_from_planet_positions(planet_positions):
     return vihanga_yoga(chart_1d)
 def vihanga_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Vihanga/Vihaga Yoga: If all the planets occupy 4th and 10th houses from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return vihanga_yoga_from_planet_positions(planet_positions)
 def vihaga_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     """ Vihanga/Vihaga Yoga: If all the planets occupy 4th and 10th houses from lagna """
@@ -609,8 +695,7 @@ def sringaataka_yoga(chart_1d):
     return sringaataka_yoga
 def sringaataka_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sringaataka Yoga: If all the planets occupy trines (1st, 5th and 9th) from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sringaataka_yoga_from_planet_positions(planet_positions)
 def hala_yoga_from_planet_positions(planet_positions):
     """ Hala Yoga: If all the planets occupy mutual trines but not trines from lagna """
@@ -629,8 +714,7 @@ def hala_yoga(chart_1d):
     return hala_yoga
 def hala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Hala Yoga: If all the planets occupy mutual trines but not trines from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return hala_yoga_from_planet_positions(planet_positions)
 def vajra_yoga_from_planet_positions(planet_positions):
     """
@@ -671,8 +755,7 @@ def vajra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     - Lagna and 7th houses have at least one natural benefic present.
     - 4th and 10th houses have at least one natural malefic present.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return vajra_yoga_from_planet_positions(planet_positions)
 def yava_yoga_from_planet_positions(planet_positions):
     """ Yava Yoga: If lagna and the 7th houses are occupied by natural malefics and the 4th
@@ -707,8 +790,7 @@ def yava_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     - Lagna and 7th houses have at least one natural benefic present.
     - 4th and 10th houses have at least one natural malefic present.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return yava_yoga_from_planet_positions(planet_positions)
 def kamala_yoga_from_planet_positions(planet_positions):
     """
@@ -722,8 +804,7 @@ def kamala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     Kamala Yoga: If all the planets are in quadrants (kendras) from lagna, this yoga is formed.
     Subset interpretation: every considered planet lies in one of {1,4,7,10} from Lagna.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return kamala_yoga_from_planet_positions(planet_positions)
 def kamala_yoga(chart_1d):
     """
@@ -751,8 +832,7 @@ def vaapi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """
     Vaapi Yoga: If all the planets are in Panaparas (2,5,8,11) or in Apoklimas (3,6,9,12) from Lagna.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return vaapi_yoga_from_planet_positions(planet_positions)
 def vaapi_yoga(chart_1d):
     """
@@ -778,8 +858,7 @@ def yoopa_yoga_from_planet_positions(planet_positions):
     return yoopa_yoga(chart_1d)
 def yoopa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Yoopa Yoga: all the planets are in 1st, 2nd, 3rd and 4th houses from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return yoopa_yoga_from_planet_positions(planet_positions)
 def yoopa_yoga(chart_1d):
     """ Yoopa Yoga: all the planets are in 1st, 2nd, 3rd and 4th houses from lagna """
@@ -798,8 +877,7 @@ def sara_yoga_from_planet_positions(planet_positions):
     return sara_yoga(chart_1d)
 def sara_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sara Yoga: all the planets are in 4th, 5th, 6th and 7th houses from lagna, """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sara_yoga_from_planet_positions(planet_positions)
 def sara_yoga(chart_1d):
     """ Sara Yoga: all the planets are in 4th, 5th, 6th and 7th houses from lagna, """
@@ -828,8 +906,7 @@ def sakti_yoga_from_planet_positions(planet_positions):
     return sakti_yoga(chart_1d)
 def sakti_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sakti Yoga: If all the planets are in 7th, 8th, 9th and 10th houses from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return sakti_yoga_from_planet_positions(planet_positions)
 def sakti_yoga(chart_1d):
     """ Sakti Yoga: If all the planets are in 7th, 8th, 9th and 10th houses from lagna """
@@ -848,8 +925,7 @@ def danda_yoga_from_planet_positions(planet_positions):
     return danda_yoga(chart_1d)
 def danda_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sakti Yoga: If all the planets are in 7th, 8th, 9th and 10th houses from lagna """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return danda_yoga_from_planet_positions(planet_positions)
 def danda_yoga(chart_1d):
     """ Danda Yoga: If all the planets are in 10th, 11th, 12th and 1st houses from lagna """
@@ -880,8 +956,7 @@ def naukaa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     consecutive houses commencing from Lagna (1st through 7th), with none of those
     houses empty and no visible planet outside this span.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return naukaa_yoga_from_planet_positions(planet_positions)
 def nav_yoga(chart_1d):
     return naukaa_yoga(chart_1d)
@@ -914,8 +989,7 @@ def koota_yoga_from_planet_positions(planet_positions):
     return koota_yoga(chart_1d)
 def koota_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Koota Yoga: If all the planets occupy the 7 signs from the 4th house """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return koota_yoga_from_planet_positions(planet_positions)
 def koota_yoga(chart_1d):
     """ Koota Yoga: If all the planets occupy the 7 signs from the 4th house """
@@ -942,8 +1016,7 @@ def chatra_yoga_from_planet_positions(planet_positions):
     return chatra_yoga(chart_1d)
 def chatra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Chatra Yoga: If all the planets occupy the 7 signs from the 7th house, """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return chatra_yoga_from_planet_positions(planet_positions)
 def chatra_yoga(chart_1d):
     """ Chatra Yoga: If all the planets occupy the 7 signs from the 7th house, """
@@ -970,8 +1043,7 @@ def chaapa_yoga_from_planet_positions(planet_positions): # V4.6.0
     return chaapa_yoga(chart_1d)
 def chaapa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Chaapa Yoga: If all the planets occupy the 7 signs from the 10th house, """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return chaapa_yoga_from_planet_positions(planet_positions)
 def chaapa_yoga(chart_1d): # V4.6.0
     """ Chaapa Yoga: If all the planets occupy the 7 signs from the 10th house, """
@@ -1012,8 +1084,7 @@ def ardha_chandra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     Returns:
       True if Ardha Chandra Yoga is present per strict definition, else False.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return ardha_chandra_yoga_from_planet_positions(planet_positions)
 def ardha_chandra_yoga(chart_1d):
     """
@@ -1058,8 +1129,7 @@ def chakra_yoga_from_planet_positions(planet_positions):
     return chakra_yoga(chart_1d)
 def chakra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Chakra Yoga: If all the planets occupy 1st, 3rd, 5th, 7th, 9th and 11th houses """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return chakra_yoga_from_planet_positions(planet_positions)
 def chakra_yoga(chart_1d):
     """ Chakra Yoga: If all the planets occupy 1st, 3rd, 5th, 7th, 9th and 11th houses """
@@ -1086,8 +1156,7 @@ def samudra_yoga_from_planet_positions(planet_positions):
     return samudra_yoga(chart_1d)
 def samudra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Samudra Yoga: If all the planets occupy 2nd, 4th, 6th, 8th, 10th and 12th houses """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return samudra_yoga_from_planet_positions(planet_positions)
 def samudra_yoga(chart_1d):
     """ Samudra Yoga: If all the planets occupy 2nd, 4th, 6th, 8th, 10th and 12th houses """
@@ -1114,8 +1183,7 @@ def veenaa_yoga_from_planet_positions(planet_positions):
     return veenaa_yoga(chart_1d)
 def veenaa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Veenaa Yoga: If the seven planets occupy exactly 7 distinct signs among them """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return veenaa_yoga_from_planet_positions(planet_positions)
 def veenaa_yoga(chart_1d):
     """ Veenaa Yoga: If the seven planets occupy exactly 7 distinct signs among them """
@@ -1128,8 +1196,7 @@ def daama_yoga_from_planet_positions(planet_positions):
     return daama_yoga(chart_1d)
 def daama_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Daama Yoga: If the seven planets occupy exactly 6 distinct signs among them """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return daama_yoga_from_planet_positions(planet_positions)
 def daama_yoga(chart_1d):
     """ Daama Yoga: If the seven planets occupy exactly 6 distinct signs among them """
@@ -1142,8 +1209,7 @@ def paasa_yoga_from_planet_positions(planet_positions):
     return paasa_yoga(chart_1d)
 def paasa_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Paasa Yoga: If the seven planets occupy exactly 5 distinct signs among them """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return paasa_yoga_from_planet_positions(planet_positions)
 def paasa_yoga(chart_1d):
     """ Paasa Yoga: If the seven planets occupy exactly 5 distinct signs among them """
@@ -1156,8 +1222,7 @@ def kedaara_yoga_from_planet_positions(planet_positions):
     return kedaara_yoga(chart_1d)
 def kedaara_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Kedaara Yoga: If the seven planets occupy exactly 4 distinct signs among them """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return kedaara_yoga_from_planet_positions(planet_positions)
 def kedaara_yoga(chart_1d):
     """ Kedaara Yoga: If the seven planets occupy exactly 4 distinct signs among them """
@@ -1170,8 +1235,7 @@ def soola_yoga_from_planet_positions(planet_positions):
     return soola_yoga(chart_1d)
 def soola_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Soola Yoga: If the seven planets occupy exactly 3 distinct signs among them """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return soola_yoga_from_planet_positions(planet_positions)
 def soola_yoga(chart_1d):
     """ Soola Yoga: If the seven planets occupy exactly 3 distinct signs among them """
@@ -1193,10 +1257,9 @@ def subha_yoga_from_jd_place(jd,place,divisional_chart_factor=1, use_affliction_
     Returns:
       - bool: True if Subha Yoga is present, False otherwise.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     chart_1d = utils.get_house_planet_list_from_planet_positions(planet_positions)
-    _natural_benefics,_natural_malefics = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    _natural_benefics,_natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return __subha_yoga_calculation(chart_1d, _natural_benefics, _natural_malefics, use_affliction_check, include_rahu_ketu_aspecting)
 def __subha_yoga_calculation(chart_1d,_natural_benefics,_natural_malefics,use_affliction_check,include_rahu_ketu_aspecting):
     """
@@ -1408,10 +1471,9 @@ def asubha_yoga_from_jd_place(jd,place,divisional_chart_factor=1, use_affliction
     Returns:
       - bool: True if Subha Yoga is present, False otherwise.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     chart_1d = utils.get_house_planet_list_from_planet_positions(planet_positions)
-    _natural_benefics,_natural_malefics = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    _natural_benefics,_natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _asubha_yoga_calculation(chart_1d, _natural_benefics, _natural_malefics, use_affliction_check=False)
 def gaja_kesari_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ 
@@ -1423,9 +1485,8 @@ def gaja_kesari_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
             3. combustion if Jupiter and Sun in same house.
         
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _gaja_kesari_yoga_calculation(planet_positions=planet_positions,natural_benefics=_natural_benefics)
 def gaja_kesari_yoga(chart_1d):
     """ 
@@ -1502,8 +1563,7 @@ def guru_mangala_yoga_from_planet_positions(planet_positions):
     return guru_mangala_yoga(chart_1d)
 def guru_mangala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Guru-Mangala Yoga: If Jupiter and Mars are together or in the 7th house from each other """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return guru_mangala_yoga_from_planet_positions(planet_positions)
 def guru_mangala_yoga(chart_1d):
     """ Guru-Mangala Yoga: If Jupiter and Mars are together or in the 7th house from each other """
@@ -1535,17 +1595,15 @@ def amala_yoga(chart_1d):
     return _amala_yoga_calculation(chart_1d)
 def amala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Amala Yoga: If there are only natural benefics in the 10th house from lagna or Moon """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return amala_yoga_from_planet_positions(planet_positions, natural_benefics=_natural_benefics)
 def parvata_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Parvata Yoga: If (1) quadrants are occupied only by benefics and (2) the 7th and 8th houses 
         are either vacant or occupied only by benefics """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     chart_1d = utils.get_house_planet_list_from_planet_positions(planet_positions)
-    _natural_benefics = charts.benefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _parvata_yoga_calculation(chart_1d, natural_benefics=_natural_benefics)
 def parvata_yoga_from_planet_positions(planet_positions,natural_benefics=None):
     """ Parvata Yoga: If (1) quadrants are occupied only by benefics and (2) the 7th and 8th houses 
@@ -1614,8 +1672,7 @@ def kaahala_yoga(chart_1d=None,planet_positions=None):
     return ky1 and ky2
 def kaahala_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Kaahala Yoga: If (1) the 4th lord and Jupiter are in mutual quadrants and (2) lagna lord is strong """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return kaahala_yoga(planet_positions=planet_positions)
 def _chaamara_yoga_calculation(chart_1d=None,planet_positions=None,natural_benefics=None):
     """ Chaamara Yoga: If the lagna lord is exalted in a quadrant with Jupiter’s aspect or
@@ -1660,9 +1717,8 @@ def chaamara_yoga_from_planet_positions(planet_positions,natural_benefics=None):
 def chaamara_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Chaamara Yoga: If the lagna lord is exalted in a quadrant with Jupiter’s aspect or
         two benefics join in 7th, 9th or 10th """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _chaamara_yoga_calculation(planet_positions=planet_positions, natural_benefics=_natural_benefics)
 def _sankha_yoga_calculation(chart_1d=None, planet_positions=None):
     """Sankha Yoga:
@@ -1726,8 +1782,7 @@ def sankha_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sankha Yoga: If (1) lagna lord is strong and (2) 5th and 6th lords are in mutual
         quadrants, then this yoga is present. Alternately, this yoga is present if (1) lagna lord
         and 10th lord are together in a movable sign and (2) the 9th lord is strong. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankha_yoga_calculation(planet_positions=planet_positions)
 def _bheri_yoga_calculation(chart_1d=None, planet_positions=None):
     """Bheri Yoga:
@@ -1793,8 +1848,7 @@ def bheri_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
        OR
        Path B: (1) 9th lord is strong AND (2) Jupiter, Venus, and Lagna lord are in mutual quadrants
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _bheri_yoga_calculation(planet_positions=planet_positions)
 def _mridanga_yoga_calculation(chart_1d=None,planet_positions=None):
     """ Mridanga Yoga: If (1) there are planets in own and exaltation signs in quadrants
@@ -1825,8 +1879,7 @@ def mridanga_yoga_from_planet_positions(planet_positions):
 def mridanga_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Mridanga Yoga: If (1) there are planets in own and exaltation signs in quadrants
         and trines and (2) lagna lord is strong. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _mridanga_yoga_calculation(planet_positions=planet_positions)
 def _sreenaatha_yoga_calculation(chart_1d=None,planet_positions=None):
     """ Sreenaatha Yoga: If (1) the 7th lord is exalted in 10th and (2) 10th lord is with 9th lord. """
@@ -1852,8 +1905,7 @@ def sreenaatha_yoga_from_planet_positions(planet_positions):
     return _sreenaatha_yoga_calculation(planet_positions=planet_positions)
 def sreenaatha_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Sreenaatha Yoga: If (1) the 7th lord is exalted in 10th and (2) 10th lord is with 9th lord. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sreenaatha_yoga_calculation(planet_positions=planet_positions)
 def sreenaatha_yoga(chart_1d):
     """ Sreenaatha Yoga: If (1) the 7th lord is exalted in 10th and (2) 10th lord is with 9th lord. """
@@ -1972,9 +2024,8 @@ def matsya_yoga_from_jd_place(jd,place,divisional_chart_factor=1,method=2):
         (2) 5th contains BOTH benefics AND malefics
         (3) 4th AND 8th contain ONLY malefics (and at least one in each)
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics,_natural_malefics = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics,_natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _matsya_yoga_calculation(planet_positions=planet_positions, natural_benefics=_natural_benefics, 
                                      natural_malefics=_natural_malefics, method=method)
 def _koorma_yoga_calculation(chart_1d=None,planet_positions=None,natural_benefics=None,natural_malefics=None,method=1):
@@ -2082,9 +2133,8 @@ def koorma_yoga_from_jd_place(jd,place,divisional_chart_factor=1,method=1):
             BOTH conditions are required and 1st for benefics and 2nd for malefics
             Condition 1 == Friend/exalt/Own and Condition 2 >= exalt/Own (No Friend)
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics,_natural_malefics = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics,_natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _koorma_yoga_calculation(planet_positions=planet_positions, natural_benefics=_natural_benefics,
                                      natural_malefics=_natural_malefics, method=method)
 def _khadga_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -2134,8 +2184,7 @@ def khadga_yoga_from_planet_positions(planet_positions):
 def khadga_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Khadga Yoga: If (1) the 2nd lord is in the 9th house, (2) the 9th lord is in the 2nd
         house, and, (3) lagna lord is in a quadrant or a trine. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _khadga_yoga_calculation(planet_positions=planet_positions)
 def khadga_yoga(chart_1d):
     """ Khadga Yoga: If (1) the 2nd lord is in the 9th house, (2) the 9th lord is in the 2nd
@@ -2196,9 +2245,8 @@ def kusuma_yoga_from_planet_positions(planet_positions):
 def kusuma_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Kusuma Yoga: If (1) lagna is in a fixed sign, (2) Venus is in a quadrant, (3) Moon is
         in a trine with a benefic, and, (4) Saturn is in the 10th house. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics, _natural_malefics = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics, _natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _kusuma_yoga_calculation(planet_positions=planet_positions, natural_benefics=_natural_benefics, natural_malefics=_natural_malefics)
 
 def kalaanidhi_yoga(chart_1d):
@@ -2214,8 +2262,7 @@ def kalaanidhi_yoga_from_planet_positions(planet_positions):
 def kalaanidhi_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Kalaanidhi Yoga: If (1) Jupiter is in the 2nd house or the 5th house and (2) he is
         conjoined or aspected by Mercury and Venus. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kalanidhi_yoga_calculation(planet_positions=planet_positions)
 def _kalpadruma_yoga_calculation(chart_1d_rasi=None, chart_1d_navamsa=None, 
                                  planet_positions_rasi=None,planet_positions_navamsa=None):
@@ -2281,9 +2328,8 @@ def kalpadruma_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Kalpadruma Yoga: Consider (1) lagna lord, (2) his dispositor, (3) the latter’s
         dispositor in rasi and (4) in navamsa. If all the four planets are all in quadrants, trines
         or exaltation signs. """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=1)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(1)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _kalpadruma_yoga_calculation(planet_positions_rasi=pp_rasi, 
                                         planet_positions_navamsa=pp_navamsa)
 def _kalpadruma_yoga_from_planet_positions_old(planet_positions,planet_positions_navamsa):
@@ -2368,9 +2414,8 @@ def lagnaadhi_yoga_from_planet_positions(planet_positions):
         and (2) no malefics conjoin or aspect these planets. """
     return _lagnaadhi_yoga_calculation(planet_positions=planet_positions)
 def lagnaadhi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _lagnaadhi_yoga_calculation(planet_positions=pp, natural_benefics=nb, natural_malefics=nm)
 def _hari_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """ Hari Yoga: If benefics occupy the 2nd, 12th and 8th houses counted from the 2nd lord. """
@@ -2409,9 +2454,8 @@ def hari_yoga_from_planet_positions(planet_positions,natural_benefics=None):
 
 def hari_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Hari Yoga: If benefics occupy the 2nd, 12th and 8th houses counted from the 2nd lord. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _hari_yoga_calculation(planet_positions=planet_positions, natural_benefics=_natural_benefics)
 
 def _hara_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -2448,9 +2492,8 @@ def hara_yoga_from_planet_positions(planet_positions,natural_benefics=None):
     return _hara_yoga_calculation(planet_positions=planet_positions,natural_benefics=natural_benefics)
 def hara_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Hara Yoga: If benefics occupy the 4th, 9th and 8th houses counted from the 7th lord. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _hara_yoga_calculation(planet_positions=planet_positions,natural_benefics=_natural_benefics)
 def _brahma_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None, method=1):
     """ Brahma Yoga: (Based on PVR Narasimha Rao)
@@ -2510,9 +2553,8 @@ def brahma_yoga_from_jd_place(jd,place,divisional_chart_factor=1,method=1):
         Method 2: Jupiter in quadrant from 9th lord, Venus in quadrant from 11th lord, 
                   and Mercury in quadrant from 1st or 10th lord.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _brahma_yoga_calculation(planet_positions=planet_positions,natural_benefics=_natural_benefics,method=method)
     
 def _vishnu_yoga_calculation(chart_1d_rasi=None, chart_1d_navamsa=None, 
@@ -2570,9 +2612,8 @@ def vishnu_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
         2. The lord of the sign occupied by the 9th lord in Navamsa is also in the 2nd house of Rasi.
         both Methods appear the same
     """
-    from jhora.horoscope.chart import charts
-    planet_positions_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=1)
-    planet_positions_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    planet_positions_rasi = _yoga_context(jd, place).planet_positions(1)
+    planet_positions_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _vishnu_yoga_calculation(planet_positions_rasi=planet_positions_rasi, planet_positions_navamsa=planet_positions_navamsa)
 def _vishnu_yoga_from_planet_positions(planet_positions):
     """ 
@@ -2623,8 +2664,7 @@ def siva_yoga_from_planet_positions(planet_positions):
 def siva_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Siva Yoga: If (1) the 5th lord is in the 9th house, (2) the 9th lord is in the 10th house,
         and, (3) the 10th lord is in the 5th house """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _siva_yoga_calculation(planet_positions=planet_positions)
 def _trilochana_yoga_calculation(chart_1d=None, planet_positions=None):
     """ Trilochana Yoga: If Sun, Moon and Mars are in mutual trines. """
@@ -2646,8 +2686,7 @@ def trilochana_yoga_from_planet_positions(planet_positions):
     return _trilochana_yoga_calculation(planet_positions=planet_positions)
 def trilochana_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Trilochana Yoga: If Sun, Moon and Mars are in mutual trines. """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _trilochana_yoga_calculation(planet_positions=planet_positions)
     
 def _gouri_yoga_calculation(chart_1d_rasi=None, chart_1d_navamsa=None, 
@@ -2688,9 +2727,8 @@ def gouri_yoga_from_planet_positions(planet_positions_rasi, planet_positions_nav
 def gouri_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     """ Gouri Yoga: If the lord of the sign occupied in navamsa by the 10th lord is exalted in
         the 10th house and lagna lord joins him """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _gouri_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_navamsa)
 def _chandikaa_yoga_calculation(chart_1d_rasi=None, chart_1d_navamsa=None, 
                                 planet_positions_rasi=None, planet_positions_navamsa=None):
@@ -2738,9 +2776,8 @@ def chandikaa_yoga_from_planet_positions(planet_positions_rasi, planet_positions
 def chandikaa_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     """ Chandikaa Yoga: If (1) lagna is in a fixed sign aspected by 6th lord and (2) Sun
         joins the lords of the signs occupied in navamsa by 6th and 9th lords """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _chandikaa_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_navamsa)
 def _lakshmi_yoga_calculation(chart_1d=None, planet_positions=None, method=1):
     """ 
@@ -2803,8 +2840,7 @@ def lakshmi_yoga_from_jd_place(jd, place, method=1):
     Method 2 (BV Raman): Lagna lord is powerful and 9th lord occupies own or 
     exaltation sign identical with a Kendra or Thrikona.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=1)
+    pp = _yoga_context(jd, place).planet_positions(1)
     return _lakshmi_yoga_calculation(planet_positions=pp, method=method)
 def _saarada_yoga_calculation(chart_1d=None, planet_positions=None):
     """ Saarada Yoga: 
@@ -2864,8 +2900,7 @@ def saarada_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
         (3) Sun strong in Leo, 
         (4) Mercury or Jupiter in a trine from Moon, 
         (5) Mars in 11th. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _saarada_yoga_calculation(planet_positions=pp)
 def _bhaarathi_yoga_calculation(chart_1d_rasi=None, chart_1d_navamsa=None,
                                 planet_positions_rasi=None,planet_positions_navamsa=None):
@@ -2906,9 +2941,8 @@ def bhaarathi_yoga_from_planet_positions(planet_positions_rasi, planet_positions
 def bhaarathi_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     """ Bhaarathi Yoga: If the lord of the sign occupied in navamsa by 2nd, 5th or 11th lord
         exalted and joins the 9th lord """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _bhaarathi_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_navamsa)
 def _saraswathi_yoga_calculation(chart_1d=None, planet_positions=None):
     """ 
@@ -2958,8 +2992,7 @@ def saraswathi_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     (1) Mercury, Jupiter, and Venus each occupy a quadrant, trine, or the 2nd house.
     (2) Jupiter is in an own, friendly, or exaltation sign.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _saraswathi_yoga_calculation(planet_positions=pp)
 
 def _amsaavatara_yoga_calculation(chart_1d=None, planet_positions=None, method=1):
@@ -3018,8 +3051,7 @@ def amsaavatara_yoga_from_jd_place(jd,place,divisional_chart_factor=1, method=1)
     Method 1 (PVR): Jupiter, Venus, and exalted Saturn are in quadrants.
     Method 2 (BVR): Same as Method 1, but Lagna must be in a movable sign.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=1)
+    pp = _yoga_context(jd, place).planet_positions(1)
     return _amsaavatara_yoga_calculation(planet_positions=pp,method=method)
 def _devendra_yoga_calculation(chart_1d=None, planet_positions=None):
     """ 
@@ -3085,8 +3117,7 @@ def devendra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     (2) 2nd and 10th lords have an exchange.
     (3) Lagna and 11th lords have an exchange.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _devendra_yoga_calculation(planet_positions=pp)
 
 def _indra_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -3137,8 +3168,7 @@ def indra_yoga_from_planet_positions(planet_positions):
     """
     return _indra_yoga_calculation(planet_positions=planet_positions)
 def indra_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _indra_yoga_calculation(planet_positions=pp)
 
 def _ravi_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -3182,8 +3212,7 @@ def ravi_yoga_from_planet_positions(planet_positions):
 
 def ravi_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Ravi Yoga: (1) Sun in 10H (2) 10L in 3H with Saturn """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _ravi_yoga_calculation(planet_positions=pp)
 def _bhaaskara_yoga_calculation(chart_1d=None, planet_positions=None,method=1):
     """ Bhaaskara Yoga: 
@@ -3240,8 +3269,7 @@ def bhaaskara_yoga_from_jd_place(jd, place, divisional_chart_factor=1,method=1):
         Method=1 (PVR) (1) Moon 12th from Sun (2) Mercury 2nd from Sun (3) Jupiter 5/9 from Moon 
         Method=2 (BVR) (2) Moon 11th from Mercury (2) Mercury 2nd from Sun (3) Jupiter 5/9 from Moon
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _bhaaskara_yoga_calculation(planet_positions=pp,method=method)
 
 def _kulavardhana_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -3286,8 +3314,7 @@ def kulavardhana_yoga_from_planet_positions(planet_positions):
 
 def kulavardhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Kulavardhana Yoga: All planets in 5th from Lagna, Moon, or Sun """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kulavardhana_yoga_calculation(planet_positions=pp)
 
 def _vasumathi_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -3329,9 +3356,8 @@ def vasumathi_yoga_from_planet_positions(planet_positions):
 
 def vasumathi_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Vasumathi Yoga: Benefics in Upachaya houses (3, 6, 10, 11) """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _vasumathi_yoga_calculation(planet_positions=pp, natural_benefics=_natural_benefics)
 
 def _gandharva_yoga_calculation(chart_1d=None, planet_positions=None, method=1):
@@ -3423,8 +3449,7 @@ def gandharva_yoga_from_jd_place(jd, place, divisional_chart_factor=1, method=1)
         (3) Sun is exalted and strong.
         (4) Moon is in the 9th house.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _gandharva_yoga_calculation(planet_positions=pp, method=method)
 def _go_yoga_calculation(chart_1d=None, planet_positions=None, enforce_trikona_degrees=False):
     """ 
@@ -3469,8 +3494,7 @@ def go_yoga_from_planet_positions(planet_positions, enforce_trikona_degrees=Fals
     return _go_yoga_calculation(planet_positions=planet_positions, enforce_trikona_degrees=enforce_trikona_degrees)
 def go_yoga_from_jd_place(jd, place, divisional_chart_factor=1,enforce_trikona_degrees=False):
     """ Go Yoga: (1) Jup in Moolatrikona (2) L2 with Jup (3) L1 Exalted """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _go_yoga_calculation(planet_positions=pp,enforce_trikona_degrees=enforce_trikona_degrees)
 def _vidyut_yoga_calculation(chart_1d=None, planet_positions=None, enforce_deep_exaltation=True):
     """ 
@@ -3522,8 +3546,7 @@ def vidyut_yoga_from_jd_place(jd, place, divisional_chart_factor=1, enforce_deep
     (2) 11th lord conjoins Venus.
     (3) Both are in a quadrant from the lagna lord.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vidyut_yoga_calculation(planet_positions=pp, enforce_deep_exaltation=enforce_deep_exaltation)
 def _chapa_yoga_calculation(chart_1d=None, planet_positions=None):
     """ 
@@ -3574,8 +3597,7 @@ def chapa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     (1) 4th and 10th lords have an exchange (Parivartana).
     (2) Lagna lord is exalted (Strength >= 4).
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _chapa_yoga_calculation(planet_positions=pp)
 def _pushkala_yoga_calculation(chart_1d=None, planet_positions=None):
     if planet_positions is not None:
@@ -3641,8 +3663,7 @@ def pushkala_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     (2) Dispositor of Moon is in a quadrant (Kendra) or in the house of an Adhimitra.
     (3) Dispositor of Moon aspects Lagna (Sign/Rasi Drishti).
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _pushkala_yoga_calculation(planet_positions=pp)
 
 def makuta_yoga(chart_1d):
@@ -3655,9 +3676,8 @@ def makuta_yoga_from_planet_positions(planet_positions):
 
 def makuta_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Makuta Yoga: Jupiter 9th from 9th lord, benefic 9th from Jupiter, Saturn in 10th """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _makuta_yoga_calculation(planet_positions=pp, natural_benefics=_natural_benefics)
 
 def _makuta_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -3710,8 +3730,7 @@ def jaya_yoga_from_planet_positions(planet_positions, enforce_deep_exaltation=Tr
 
 def jaya_yoga_from_jd_place(jd, place, divisional_chart_factor=1, enforce_deep_exaltation=True):
     """ Jaya Yoga: 10th lord in deep exaltation and 6th lord debilitated. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _jaya_yoga_calculation(planet_positions=pp, enforce_deep_exaltation=enforce_deep_exaltation)
 
 def _jaya_yoga_calculation(chart_1d=None, planet_positions=None, enforce_deep_exaltation=True):
@@ -3774,8 +3793,7 @@ def harsha_yoga_from_planet_positions(planet_positions):
 
 def harsha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Harsha Yoga: 6th lord occupies the 6th house """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vipareeta_yoga_calculation(6, planet_positions=pp)
 
 def sarala_yoga(chart_1d):
@@ -3788,8 +3806,7 @@ def sarala_yoga_from_planet_positions(planet_positions):
 
 def sarala_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Sarala Yoga: 8th lord occupies the 8th house """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vipareeta_yoga_calculation(8, planet_positions=pp)
 
 def vimala_yoga(chart_1d):
@@ -3802,8 +3819,7 @@ def vimala_yoga_from_planet_positions(planet_positions):
 
 def vimala_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Vimala Yoga: 12th lord occupies the 12th house """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vipareeta_yoga_calculation(12, planet_positions=pp)
 def _chatussagara_yoga_calculation(chart_1d=None, planet_positions=None):
     if planet_positions is not None:
@@ -3835,8 +3851,7 @@ def chatussagara_yoga_from_planet_positions(planet_positions):
 
 def chatussagara_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Chatussagara Yoga: All quadrants (1, 4, 7, 10) are occupied by planets. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _chatussagara_yoga_calculation(planet_positions=pp)
 def rajalakshana_yoga(chart_1d):
     """ Rajalakshana Yoga: Jupiter, Venus, Mercury, and Moon are in Kendras from Lagna. """
@@ -3848,8 +3863,7 @@ def rajalakshana_yoga_from_planet_positions(planet_positions):
 
 def rajalakshana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Rajalakshana Yoga: Jupiter, Venus, Mercury, and Moon are in Kendras from Lagna. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _rajalakshana_yoga_calculation(planet_positions=pp)
 
 def _rajalakshana_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -3883,11 +3897,10 @@ def vanchana_chora_bheethi_yoga_from_planet_positions(planet_positions, gulika_h
 
 def vanchana_chora_bheethi_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Vanchana Chora Bheethi: Main API fetching divisional chart and malefics. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     
     # We only need malefics for this yoga
-    _, _natural_malefics = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    _, _natural_malefics = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     y,m,d,fh = utils.jd_to_local(jd, place); dob = drik.Date(y,m,d); tob=(fh,0,0) 
     g_lon_info = drik.gulika_longitude(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -3989,8 +4002,7 @@ def kahala_yoga_from_planet_positions(planet_positions):
 
 def kahala_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """ Kahala Yoga: L4 and L9 in mutual Kendras, and L1 is strong. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kahala_yoga_calculation(planet_positions=pp)
 
 def _kahala_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -4039,7 +4051,6 @@ def mahabhagya_yoga_from_planet_positions(planet_positions, gender=0, day_time_b
 
 def mahabhagya_yoga_from_jd_place(jd, place, gender=0, divisional_chart_factor=1):
     """ Mahabhagya Yoga API: Calculates day/night birth using drik sunrise/sunset. """
-    from jhora.horoscope.chart import charts
     
     # Precise day/night calculation
     sun_rise = drik.sunrise(jd, place)[0] # local_time_in_float_hours
@@ -4049,7 +4060,7 @@ def mahabhagya_yoga_from_jd_place(jd, place, gender=0, divisional_chart_factor=1
     # Birth is day-time if it falls between sunrise and sunset
     day_time_birth = sun_rise <= fh <= sun_set
     
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _mahabhagya_yoga_calculation(planet_positions=pp, gender=gender, day_time_birth=day_time_birth)
 
 def _mahabhagya_yoga_calculation(chart_1d=None, planet_positions=None, gender=0, day_time_birth=True):
@@ -4094,8 +4105,7 @@ def sreenatha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Sreenatha Yoga: The lord of the 7th should be invariably exalted in the 10th, 
     the lord of which, in turn, must be with the 9th lord. 
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sreenatha_yoga_calculation(planet_positions=pp)
 def _sreenatha_yoga_calculation(chart_1d=None, planet_positions=None):
     """ 
@@ -4185,8 +4195,7 @@ def lagna_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Lagna Malika Yoga: Malika Yoga Starting from 1st House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _lagna_malika_yoga_calc(planet_positions=pp)
 
 def _lagna_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4212,8 +4221,7 @@ def dhana_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Dhana Malika Yoga: Malika Yoga Starting from 2nd House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _dhana_malika_yoga_calc(planet_positions=pp)
 
 def _dhana_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4240,8 +4248,7 @@ def vikrama_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Vikram  Malika Yoga: Malika Yoga Starting from 3rd House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vikrama_malika_yoga_calc(planet_positions=pp)
 
 def _vikrama_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4268,8 +4275,7 @@ def sukha_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Sukha Malika Yoga: Malika Yoga Starting from 4th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sukha_malika_yoga_calc(planet_positions=pp)
 
 def _sukha_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4296,8 +4302,7 @@ def putra_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Puthra Malika Yoga: Malika Yoga Starting from 5th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _putra_malika_yoga_calc(planet_positions=pp)
 
 def _putra_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4324,8 +4329,7 @@ def satru_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Sathru Malika Yoga: Malika Yoga Starting from 6th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _satru_malika_yoga_calc(planet_positions=pp)
 
 def _satru_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4352,8 +4356,7 @@ def kalatra_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Kalathra Malika Yoga: Malika Yoga Starting from 7th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kalatra_malika_yoga_calc(planet_positions=pp)
 
 def _kalatra_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4380,8 +4383,7 @@ def randhra_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Randhra Malika Yoga: Malika Yoga Starting from 8th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _randhra_malika_yoga_calc(planet_positions=pp)
 
 def _randhra_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4408,8 +4410,7 @@ def bhagya_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Bhagya Malika Yoga: Malika Yoga Starting from 9th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _bhagya_malika_yoga_calc(planet_positions=pp)
 
 def _bhagya_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4436,8 +4437,7 @@ def karma_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Karma Malika Yoga: Malika Yoga Starting from 10th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _karma_malika_yoga_calc(planet_positions=pp)
 
 def _karma_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4464,8 +4464,7 @@ def laabha_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Laabha Malika Yoga: Malika Yoga Starting from 11th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _laabha_malika_yoga_calc(planet_positions=pp)
 
 def _laabha_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4492,8 +4491,7 @@ def vyaya_malika_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Vyaya Malika Yoga: Malika Yoga Starting from 12th House
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vyaya_malika_yoga_calc(planet_positions=pp)
 
 def _vyaya_malika_yoga_calc(chart_1d=None, planet_positions=None):
@@ -4526,8 +4524,7 @@ def parijatha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         lord, or the lord of Navamsa occupied by the lord of the Rasi in which the Ascendant lord is posited, shall
         join a quadrant, a trine or his own or exaltation places.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vyaya_malika_yoga_calc(planet_positions=pp)
 def _parijatha_yoga_calculation(chart_1d=None, planet_positions=None):
     """ 
@@ -4602,8 +4599,7 @@ def gaja_yoga_from_jd_place(jd, place, method=1, divisional_chart_factor=1):
     in conjunction with the Moon and aspected by the lord of the 11th.
     Method 2 (Standard): 9th lord from Lagna and Moon occupy the 11th with the Moon.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _gaja_yoga_calculation(planet_positions=pp, method=method)
 
 def _gaja_yoga_calculation(chart_1d=None, planet_positions=None, method=1):
@@ -4742,8 +4738,7 @@ def kalanidhi_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     or in the 5th house; Jupiter must occupy the 2nd or 5th identical 
     with the swakshetra (sign) of Mercury or Venus.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kalanidhi_yoga_calculation(planet_positions=pp)
 
 def _kalanidhi_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -4824,7 +4819,6 @@ def garuda_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     The lord of Navamsa occupied by the Moon should be exalted in Rasi.
     Birth should occur during daytime when the Moon is waxing.
     """
-    from jhora.horoscope.chart import charts
     # 1. Determine Shukla Paksha (0-14 is Waxing)
     tithi_val = drik.tithi(jd, place)[0]
     is_shukla = tithi_val < 15
@@ -4836,8 +4830,8 @@ def garuda_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     is_day = (sunrise_time <= fh <= sunset_time)
     
     # 3. Generate Charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     
     chart_1d_rasi = utils.get_house_planet_list_from_planet_positions(pp_rasi)
     chart_1d_navamsa = utils.get_house_planet_list_from_planet_positions(pp_navamsa)
@@ -4883,8 +4877,7 @@ def vallaki_yoga_from_planet_positions(planet_positions):
 
 def vallaki_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Vallaki Yoga: 7 planets in 7 signs (B.V. Raman #82)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=7)
 def dama_yoga(chart_1d):
     """Dama Yoga: 7 planets in 6 signs (B.V. Raman #83)"""
@@ -4896,8 +4889,7 @@ def dama_yoga_from_planet_positions(planet_positions):
 
 def dama_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Dama Yoga: 7 planets in 6 signs (B.V. Raman #83)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=6)
 def kedara_yoga(chart_1d):
     """Kedara Yoga: 7 planets in 4 signs (B.V. Raman #85)"""
@@ -4909,8 +4901,7 @@ def kedara_yoga_from_planet_positions(planet_positions):
 
 def kedara_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Kedara Yoga: 7 planets in 4 signs (B.V. Raman #85)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=4)
 def sula_yoga(chart_1d):
     """Sula Yoga: 7 planets in 3 signs (B.V. Raman #86)"""
@@ -4922,8 +4913,7 @@ def sula_yoga_from_planet_positions(planet_positions):
 
 def sula_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Sula Yoga: 7 planets in 3 signs (B.V. Raman #86)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=3)
 def yuga_yoga(chart_1d):
     """Yuga Yoga: 7 planets in 2 signs (B.V. Raman #87)"""
@@ -4935,8 +4925,7 @@ def yuga_yoga_from_planet_positions(planet_positions):
 
 def yuga_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Yuga Yoga: 7 planets in 2 signs (B.V. Raman #87)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=2)
 def gola_yoga(chart_1d):
     """Gola Yoga: 7 planets in 1 sign (B.V. Raman #88)"""
@@ -4948,8 +4937,7 @@ def gola_yoga_from_planet_positions(planet_positions):
 
 def gola_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Gola Yoga: 7 planets in 1 sign (B.V. Raman #88)"""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sankhya_yoga_calculation(planet_positions=pp, required_count=1)
 def _dhur_yoga_calculation(chart_1d=None,planet_positions=None):
     """ the lord of the 10th is situated in the 6th, 8th or 12th """
@@ -4973,8 +4961,7 @@ def dhur_yoga_from_planet_positions(planet_positions):
     return _dhur_yoga_calculation(planet_positions=planet_positions)
 def dhur_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ the lord of the 10th is situated in the 6th, 8th or 12th """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _dhur_yoga_calculation(planet_positions=pp)
 def _dharidhra_yoga_bv_raman(chart_1d=None,planet_positions=None,method=1):
     d_144 = _daridra_yoga_144_calculation(chart_1d, planet_positions)
@@ -5041,8 +5028,7 @@ def dharidhra_yoga_from_jd_place(jd,place,divisional_chart_factor=1,method=1):
         the lord of 1nd or 11th is situated in the 6th, 8th or 12th
         Method = 3 - Ref: BV Raman Dharidhra Yoga #144 to #152
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _dharidhra_yoga_calculation(planet_positions=pp,method=method)
 def sareera_soukhya_yoga(chart_1d):
     """
@@ -5061,8 +5047,7 @@ def sareera_soukhya_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Sareera Soukhya Yoga (B.V. Raman #114):
     The Lord of Lagna, Jupiter, or Venus should occupy a quadrant.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sareera_soukhya_calculation(planet_positions=pp)
 def _sareera_soukhya_calculation(chart_1d=None, planet_positions=None):
     # Determine the house-to-planet mapping
@@ -5097,8 +5082,7 @@ def dehapushti_yoga_from_jd_place(jd, place, divisional_chart_factor=1, natural_
     Dehapushti Yoga (B.V. Raman #113):
     The Lagna Lord is in a movable sign and is aspected by a benefic.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _dehapushti_calculation(planet_positions=pp, natural_benefics=natural_benefics)
 
 def _dehapushti_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -5145,8 +5129,7 @@ def rogagrastha_yoga_from_jd_place(jd, place, divisional_chart_factor=1, natural
         Condition (a): The Lagna Lord is in the 1st House (Lagna) joined by a Dusthana Lord (6th, 8th, or 12th).
         Condition (b): A weak Lagna Lord is situated in a Kendra (1, 4, 7, 10) or a Trikona (1, 5, 9)
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _rogagrastha_calculation(planet_positions=pp, natural_benefics=natural_benefics)
 
 def _rogagrastha_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -5256,11 +5239,10 @@ def krisanga_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Condition 1: Lagna lord in a dry sign or in a sign owned by a dry planet.
     Condition 2: The Navamsa Lagna is owned by a dry planet AND malefics join the Rasi Lagna.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     # Explicitly calculate D9 (Navamsa) for condition 2 
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    _, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
+    _, nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _krisanga_yoga_calculation(planet_positions_rasi=pp,planet_positions_navamsa=pp_nav, natural_malefics=nm)
 def _dehasthoulya_yoga_calculation(chart_rasi=None, chart_navamsa=None, planet_positions_rasi=None, planet_positions_navamsa=None, natural_benefics=None):
     """
@@ -5339,10 +5321,9 @@ def dehasthoulya_yoga_from_planet_positions(planet_positions_rasi, planet_positi
                                           planet_positions_navamsa=planet_positions_navamsa)
 
 def dehasthoulya_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _dehasthoulya_yoga_calculation(planet_positions_rasi=pp, 
                                           planet_positions_navamsa=pp_nav, 
                                           natural_benefics=nb)
@@ -5383,8 +5364,7 @@ def sada_sanchara_yoga_from_planet_positions(planet_positions_rasi):
 
 def sada_sanchara_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Lagna lord or its dispositor in a movable sign."""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sada_sanchara_yoga_calculation(planet_positions_rasi=pp)
 def _dhana_yoga_calculation(chart_rasi=None, planet_positions_rasi=None):
     """
@@ -5432,8 +5412,7 @@ def dhana_yoga_from_planet_positions(planet_positions_rasi):
 
 def dhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """Specific 5th/11th house combinations for wealth per BVR 118-122."""
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _dhana_yoga_calculation(planet_positions_rasi=pp)
 def _dhana_yogas_123_128_calculation(chart_rasi=None, planet_positions_rasi=None):
     """
@@ -5536,8 +5515,7 @@ def bahudravyarjana_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
         Definition: Lord of the Lagna in the 2nd, lord of the 2nd in the 11th and the lord of the 11th in 
             Lagna will give rise to this Yoga.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _bahudravyarjana_yoga_calculation(planet_positions=pp)
 
 def _swaveeryaddhana_yoga_calculation(chart_rasi=None, chart_navamsa=None, planet_positions_rasi=None, planet_positions_navamsa=None, natural_benefics=None, natural_malefics=None, vaiseshikamsa_scores=None):
@@ -5636,13 +5614,12 @@ def swaveeryaddhana_yoga_from_planet_positions(planet_positions_rasi, planet_pos
     return _swaveeryaddhana_yoga_calculation(planet_positions_rasi=planet_positions_rasi, chart_navamsa=chart_nav)
 
 def swaveeryaddhana_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
     # Using Shodhasavarga for the 13 vargas check
-    v_scores = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    v_scores = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     v_scores = [v[0] for _,v in v_scores.items()]
-    nb, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    nb, nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     return _swaveeryaddhana_yoga_calculation(planet_positions_rasi=pp_rasi, 
                                            chart_navamsa=utils.get_house_planet_list_from_planet_positions(pp_nav),
@@ -5692,9 +5669,8 @@ def madhya_vayasi_dhana_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     Madhya Vayasi Dhana Yoga (BV Raman 133, 134, 135)
     Covers wealth acquired or peaking in middle age.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return _madhya_vayasi_dhana_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _anthya_vayasi_dhana_yoga_calculation(chart_1d=None, planet_positions=None):
     if planet_positions is not None:
@@ -5723,8 +5699,7 @@ def anthya_vayasi_dhana_yoga_from_planet_positions(planet_positions):
     return _anthya_vayasi_dhana_yoga_calculation(planet_positions=planet_positions)
 
 def anthya_vayasi_dhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _anthya_vayasi_dhana_yoga_calculation(planet_positions=pp)
 def _balya_dhana_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     if planet_positions is not None:
@@ -5819,12 +5794,11 @@ def bhratrumooladdhanaprapti_yoga_from_jd_place(jd, place, divisional_chart_fact
     Bhratrumooladdhanaprapti Yoga (BV Raman 136, 137)
     Covers wealth from brothers through specific conjunctions and aspects.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     # Fetch Vaiseshikamsa scores (list) and convert to dict for the calculation function
-    scores_list = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    scores_list = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     scores_dict = {i: score[0] for i, score in scores_list.items()}
     return _bhratrumooladdhanaprapti_yoga_calculation(
         planet_positions=pp, 
@@ -5874,8 +5848,7 @@ def matrumooladdhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Matrumooladdhana Yoga (BV Raman 138)
     Definition: If the lord of the 2nd joins the 4th lord or is aspected by him.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _matrumooladdhana_yoga_calculation(planet_positions=pp)
 def _putramooladdhana_yoga_calculation(chart_1d=None, planet_positions=None, vaiseshikamsa_scores=None):
     """
@@ -5929,11 +5902,10 @@ def putramooladdhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Definition: If the strong lord of the 2nd is in conjunction with the 5th lord 
     or Jupiter and if the lord of Lagna is in Vaiseshikamsa.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     
     # Fetch Vaiseshikamsa scores (list) and convert to dict
-    scores_list = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    scores_list = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     scores_dict = {i: score[0] for i, score in scores_list.items()}
     
     return _putramooladdhana_yoga_calculation(
@@ -5993,11 +5965,10 @@ def shatrumooladdhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Definition: The strong lord of the 2nd should join the lord of the 6th or Mars 
     and the powerful lord of Lagna should be in Vaiseshikamsa.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     
     # Fetch Vaiseshikamsa scores (list) and convert to dict
-    scores_list = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    scores_list = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     scores_dict = {i: score[0] for i, score in scores_list.items()}
     
     return _shatrumooladdhana_yoga_calculation(
@@ -6061,8 +6032,7 @@ def kalatramooladdhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Definition: The strong lord of the 2nd should join or be aspected by 
     the 7th lord and Venus and the lord of Lagna must be powerful.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _kalatramooladdhana_yoga_calculation(planet_positions=pp)
 def _amaranantha_dhana_yoga_calculation(chart_1d=None, planet_positions=None):
     """
@@ -6115,8 +6085,7 @@ def amaranantha_dhana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Definition: If a number of planets occupy the 2nd house and the wealth-giving 
     ones are strong or occupy own or exaltation signs.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _amaranantha_dhana_yoga_calculation(planet_positions=pp)
 def _ayatnadhanalabha_yoga_calculation(chart_1d=None, planet_positions=None):
     """
@@ -6157,8 +6126,7 @@ def ayatnadhanalabha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Ayatnadhanalabha Yoga (BV Raman 143)
     Definition: The lord of the Lagna and the 2nd must exchange their places.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _ayatnadhanalabha_yoga_calculation(planet_positions=pp)
 def are_lords_exchanged(p_to_h,lord1,lord1_house,lord2,lord2_house):
     return lord1_house == p_to_h[lord2] and lord2_house==p_to_h[lord1_house]
@@ -6546,8 +6514,8 @@ def yukthi_samanwithavagmi_yoga_from_jd_place(jd,place,divisional_chart_factor=1
         Definition: L2 in Kendra, at Paramochha and Parvatamsa; 
             Jupiter/Venus in Simhasanamsa.
     """
-    from jhora.horoscope.chart import charts
-    _natural_benefics = charts.benefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _natural_benefics = _yoga_context(jd, place).benefics(divisional_chart_factor)
     if method==1:
         return _yukthi_samanwithavagmi_yoga_154_calculation(planet_positions=planet_positions,
                                         natural_benefics=_natural_benefics)
@@ -6555,8 +6523,7 @@ def yukthi_samanwithavagmi_yoga_from_jd_place(jd,place,divisional_chart_factor=1
         return _yukthi_samanwithavagmi_yoga_155_from_jd_place(jd, place, divisional_chart_factor)
     
 def _yukthi_samanwithavagmi_yoga_155_from_jd_place(jd, place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     chart_1d = utils.get_house_planet_list_from_planet_positions(planet_positions)
     p_to_h = utils.get_planet_to_house_dict_from_chart(chart_1d)
     _asc = const._ascendant_symbol
@@ -6567,7 +6534,7 @@ def _yukthi_samanwithavagmi_yoga_155_from_jd_place(jd, place,divisional_chart_fa
 
     # 2. Get Vaisheshikamsa Scores specifically for Dasavarga
     # Names: Simhaasanaamsa (5), Paaraavataamsa (6)
-    v_scores = charts.vaiseshikamsa_dhasavarga_of_planets(jd, place)
+    v_scores = _yoga_context(jd, place).vaiseshikamsa_dhasavarga_of_planets()
 
     # 3. L2 in Kendra (Quadrants of Lagna)
     if l2_h not in quadrants_of_the_house(asc_h):
@@ -6594,15 +6561,14 @@ def parihasaka_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
     The lord of the Navamsa occupied by the Sun should attain Vaiseshikamsa 
     (score of 13 in Shodhasavarga) and be in the 2nd house of the Rasi chart.
     """
-    from jhora.horoscope.chart import charts
 
     # 1. Get Vaiseshikamsa scores (Shodhasavarga count)
     # Returns list where index = planet_id, value = count of own/exalted vargas
-    v_scores = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    v_scores = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     v_scores = [v[0] for k,v in v_scores.items()]
     # 2. Get Planet Positions for D1 and D9
-    pp_d1 = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_d9 = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_d1 = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_d9 = _yoga_context(jd, place).planet_positions(9)
     
     # 3. Find Sun's sign in D9 and identify its Lord
     chart_d9 = utils.get_house_planet_list_from_planet_positions(pp_d9)
@@ -6688,9 +6654,8 @@ def asatyavadi_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
         Asatyavadi Ycga Definition.*-If the lord of the 2nd occupies the
         house of Saturn or Mars and if malefics join kendras and thrikonas.
     """
-    from jhora.horoscope.chart import charts
-    planet_positions = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _nb = charts.benefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    planet_positions = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _nb = _yoga_context(jd, place).benefics(divisional_chart_factor)
     return asatyavadi_yoga_from_planet_positions(planet_positions, natural_malefics=_nb)
 def _jada_yoga_calculation(chart_1d=None, planet_positions=None, natural_malefics=None, mandi_house=None):
     """
@@ -6758,9 +6723,8 @@ def jada_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         Defnition.-The lord of the 2nd should be posited in the l0th with maleficsor the 2nd must be 
         joined by the Sun and Mandi.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _, nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     # Calculate Mandi per specific user instruction
     y, m, d, fh = utils.jd_to_local(jd, place)
@@ -6815,9 +6779,8 @@ def marud_yoga_from_planet_positions(planet_positions):
     return _marud_yoga_calculation(planet_positions=planet_positions)
 
 def marud_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _marud_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _budha_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -6875,9 +6838,8 @@ def budha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Budha Yoga: Jupiter in Lagna, the Moon in a kendra, 
     Rahu in the 2nd from the Moon and the Sun and Mars in the 3rd from Rahu.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _budha_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _mooka_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -6935,9 +6897,8 @@ def mooka_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Mooka Yoga: The 2nd lord should join the 8th with Jupiter. 
     The yoga does not apply if the 8th house happens to be Jupiter's own or exaltation sign.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _mooka_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _netranasa_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -7007,9 +6968,8 @@ def netranasa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Netranasa Yoga: If the lords of the 10th and 6th occupy Lagna with the 2nd lord, 
     or if they are in Neechamsat (debilitation).
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _netranasa_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _andha_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -7070,9 +7030,8 @@ def andha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Andha Yoga: Mercury and the Moon should be in the 2nd OR the lords of 
     Lagna and the 2nd should join the 2nd with the Sun.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _andha_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _sumukha_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None, method=1, v_score=None):
     """
@@ -7156,11 +7115,10 @@ def sumukha_yoga_from_jd_place(jd, place, divisional_chart_factor=1, method=1):
     Method 1 (166): Lord of 2nd in a kendra aspected by benefics, OR benefics join the 2nd house.
     Method 2 (167): Lord of 2nd in a kendra (Exalted/Own/Friend) AND the kendra lord is in Gopuramsa.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     # Calculate Vaiseshikamsa scores
-    v_score = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place) # Assuming this function exists in library
+    v_score = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets() # Assuming this function exists in library
     v_score = [v[0] for k,v in v_score.items()]
     return _sumukha_yoga_calculation(planet_positions=pp, natural_benefics=nb, method=method, v_score=v_score)
 def _durmukha_yoga_calculation(chart_1d=None, planet_positions=None, natural_malefics=None, method=1, navamsa_chart=None, gulika_house=None):
@@ -7245,11 +7203,11 @@ def durmukha_yoga_from_planet_positions(planet_positions=None, natural_malefics=
                                       method=method, navamsa_chart=navamsa_chart, gulika_house=gulika_house)
 def durmukha_yoga_from_jd_place(jd, place, divisional_chart_factor=1, method=1):
     from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     # Navamsa for method 2
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
     nav = utils.get_house_planet_list_from_planet_positions(pp_nav)
-    _, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    _, nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     # Check if you have a function for Gulika position
     # gulika = charts.get_gulika_position(jd, place) 
@@ -7299,11 +7257,10 @@ def bhojana_soukhya_yoga_from_planet_positions(planet_positions=None, natural_be
     return _bhojana_soukhya_yoga_calculation(planet_positions=planet_positions, natural_benefics=natural_benefics,
                                              v_score=v_score)
 def bhojana_soukhya_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     # Get Vaiseshikamsa scores for the planets
-    v_score = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    v_score = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     v_score = [v[0] for k,v in v_score.items()]
     return _bhojana_soukhya_yoga_calculation(planet_positions=pp, natural_benefics=nb, v_score=v_score)
 def _annadana_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None, v_score=None):
@@ -7359,11 +7316,10 @@ def annadana_yoga_from_planet_position(planet_positions=None, natural_benefics=N
     return _annadana_yoga_calculation(planet_positions=planet_positions, natural_benefics=natural_benefics,
                                       v_score=v_score)
 def annadana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     # Get Vaiseshikamsa scores for the planets
-    v_score_dict = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    v_score_dict = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     v_score = [v[0] for p,v in v_score_dict.items()]
     return _annadana_yoga_calculation(planet_positions=pp, natural_benefics=nb, v_score=v_score)
 def _parannabhojana_yoga_calculation(chart_1d=None, planet_positions=None, navamsa_chart=None):
@@ -7417,9 +7373,8 @@ def parannabhojana_yoga_from_planet_positions(planet_positions,navamsa_chart=Non
     return _parannabhojana_yoga_calculation(planet_positions=planet_positions,navamsa_chart=navamsa_chart)
 
 def parannabhojana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
     nav = utils.get_house_planet_list_from_planet_positions(pp_nav)
     return _parannabhojana_yoga_calculation(planet_positions=pp, navamsa_chart=nav)
 def _sraddhannabhuktha_yoga_calculation(chart_1d=None, planet_positions=None):
@@ -7458,8 +7413,7 @@ def sraddhannabhuktha_yoga(chart_1d):
 def sraddhannabhuktha_yoga_from_planet_positions(planet_positions):
     return _sraddhannabhuktha_yoga_calculation(planet_positions=planet_positions)
 def sraddhannabhuktha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sraddhannabhuktha_yoga_calculation(planet_positions=pp)
 def _sarpaganda_yoga_calculation(chart_1d=None,planet_positions=None,maandi_house=None):
     """ Rahu should join the 2nd house with Mandi. """
@@ -7478,8 +7432,7 @@ def sarpaganda_yoga_from_planet_positions(planet_positions,maand_house):
     return _sarpaganda_yoga_calculation(planet_positions=planet_positions, maandi_house=maand_house)
 def sarpaganda_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """ Rahu should join the 2nd house with Mandi. """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     y, m, d, fh = utils.jd_to_local(jd, place)
     dob = drik.Date(y, m, d)
     tob = (fh, 0, 0)
@@ -7492,11 +7445,10 @@ def vakchalana_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     2. The 2nd lord joins a cruel Navamsa (owned by a malefic).
     3. The 2nd house is devoid of benefic aspect or association.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_9 = charts.divisional_chart(jd, place,divisional_chart_factor=9)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_9 = _yoga_context(jd, place).planet_positions(9)
     navamsa_chart = utils.get_house_planet_list_from_planet_positions(pp_9)
-    nb,nm = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    nb,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _vakchalana_yoga_calculation(planet_positions=pp, navamsa_chart=navamsa_chart,
                                         natural_benefics=nb, natural_malefics=nm)
 def vakchalana_yoga_from_planet_positions(planet_positions,navamsa_chart,natural_benefics=None,natural_malefics=None):
@@ -7618,11 +7570,10 @@ def vishaprayoga_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     2. 2nd lord in a cruel Navamsa (owned by malefic).
     3. 2nd lord (in Rasi) aspected by a malefic.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_9 = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_9 = _yoga_context(jd, place).planet_positions(9)
     navamsa_chart=utils.get_house_planet_list_from_planet_positions(pp_9)
-    _,nm = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    _,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _vishaprayoga_yoga_calculation(planet_positions=pp,navamsa_chart=navamsa_chart, natural_malefics=nm)
 def _bhratruvriddhi_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -7667,9 +7618,8 @@ def bhratruvriddhi_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """
     Bhratruvriddhi Yoga (177): 3rd lord, Mars, or 3rd house joined/aspected by benefics and strong.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place,divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _bhratruvriddhi_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def sodaranasa_yoga_calculation(chart_1d=None, planet_positions=None, natural_malefics=None):
     """
@@ -7730,9 +7680,8 @@ def sodaranasa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     Sodaranasa Yoga: Mars and the 3rd lord should occupy the 8th (3rd, 5th or 7th) 
     house and be aspected by malefics.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _,nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return sodaranasa_yoga_calculation(planet_positions=pp, natural_malefics=nm)
 def _ekabhagini_yoga_calculation(chart_1d=None, planet_positions=None):
     """
@@ -7769,8 +7718,7 @@ def ekabhagini_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
         179. Ekabhagini Yoga Definition.-Mercury, the lord of the 3rd and Mars should join 
         the 3rd house, the Moon and Saturn respectively.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _ekabhagini_yoga_calculation(planet_positions=pp)
 def dwadasa_sahodara_yoga_calculation(chart_1d=None, planet_positions=None):
     """
@@ -7821,8 +7769,7 @@ def dwadasa_sahodara_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     exalted Mars joins Jupiter in a thrikona from the 3rd lord, 
     the above yoga is caused.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return dwadasa_sahodara_yoga_calculation(planet_positions=pp)
 def _sapthasankhya_sahodara_yoga_calculation(chart_1d=None, planet_positions=None):
     """
@@ -7886,8 +7833,7 @@ def sapthasankhya_sahodara_yoga_from_jd_place(jd, place, divisional_chart_factor
     Definition: Lord of the 12th should join Mars and the Moon should be in the 3rd 
     with Jupiter, devoid of association with or aspect of Venus.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _sapthasankhya_sahodara_yoga_calculation(planet_positions=pp)
 def _parakrama_yoga_calculation(chart_rasi=None, chart_navamsa=None, planet_positions_rasi=None, planet_positions_navamsa=None, natural_benefics=None):
     """
@@ -7935,10 +7881,9 @@ def parakrama_yoga_from_planet_positions(planet_positions_rasi=None, planet_posi
     return _parakrama_yoga_calculation(planet_positions_rasi=planet_positions_rasi, planet_positions_navamsa=planet_positions_navamsa)
 
 def parakrama_yoga_from_jd_place(jd, place,divisional_chart_factor=1):
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _parakrama_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_navamsa, natural_benefics=nb)
 def _yuddha_praveena_yoga_calculation(chart_rasi=None, chart_navamsa=None, planet_positions_rasi=None,
                                       planet_positions_navamsa=None,shadvarga_data=None):
@@ -8002,10 +7947,9 @@ def yuddha_praveena_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
         Yuddha praveenayoga - Definition.-If the lord of the navamsa joined by the planet who owns the navamsa 
         in which the 3rd lord is placed, joins his own vargas,
     """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    shadvarga_data = charts.vaiseshikamsa_shadvarga_of_planets(jd, place)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
+    shadvarga_data = _yoga_context(jd, place).vaiseshikamsa_shadvarga_of_planets()
     return _yuddha_praveena_yoga_calculation(planet_positions_rasi=pp_rasi, 
                                              planet_positions_navamsa=pp_navamsa,
                                              shadvarga_data=shadvarga_data)
@@ -8120,9 +8064,8 @@ def yuddhatpaschaddrudha_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     Definition.- The lord of the 3rd should occupy a fixed Rasi, a fixed Navamsa 
     and a cruel Shashtiamsa and the lord of the Rasi so occupied should be in debility.
     """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_navamsa = charts.divisional_chart(jd, place, divisional_chart_factor=9)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_navamsa = _yoga_context(jd, place).planet_positions(9)
     return _yuddhatpaschaddrudha_yoga_calculation(planet_positions_rasi=pp_rasi, 
                                                   planet_positions_navamsa=pp_navamsa)
 def _satkathadisravana_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
@@ -8187,9 +8130,8 @@ def satkathadisravana_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     Definition: The 3rd house should be a benefic sign aspected by benefic planets 
     and the 3rd lord should join a benefic amsa (cojoins with or aspected by a benefic).
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _satkathadisravana_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _utthama_graha_yoga_calculation(chart_1d=None,planet_positions=None, natural_benefics=None):
     """
@@ -8237,9 +8179,8 @@ def utthama_graha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         187. Uttama Griha Yoga Definition.--The lord of the 4th house should join benefics and 
         aspected by benefics in a kendra or thrikona.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _satkathadisravana_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _vichitra_saudha_prakara_yoga_calculation(chart_1d=None,planet_positions=None, natural_benefics=None):
     """
@@ -8289,9 +8230,8 @@ def vichitra_saudha_prakara_yoga_from_jd_place(jd,place,divisional_chart_factor=
         Definition.-If the lords of the 4th and l0th are conjoined together with Saturn and Mars
         the above yoga is given rise to.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _vichitra_saudha_prakara_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def ayatna_griha_prapta_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
     """
@@ -8300,9 +8240,8 @@ def ayatna_griha_prapta_yoga_from_jd_place(jd,place,divisional_chart_factor=1):
             190. The lord of the 9th should be posited in a kendra and the lord of the 4th must be 
             in exaltation, moola-thrikona or own house.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _ayatna_griha_prapta_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def ayatna_griha_prapta_yoga(chart_1d=None,natural_benefics=None):
     """
@@ -8378,10 +8317,9 @@ def grihanasa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     191 - The lord of the 4th should be in the 12th aspected by a malefic.
     192 - The lord of the navamsa occupied by the lord of the 4th should be disposed in the 12th.
     """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    _,nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
+    _,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _grihanasa_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_nav,
                                        natural_malefics=nm)
 def grihanasa_yoga(chart_rasi=None, chart_navamsa=None, natural_malefics=None):
@@ -8459,9 +8397,8 @@ def bandhu_pujya_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
             in Lagna, the aboveyoga is givenrise to-193.
         194 = The 4th house or the 4th lord should have the association or aspect of Jupiter.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb, _ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb, _ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _bandhu_pujya_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def _bandhu_pujya_yoga_calculation(chart_1d=None, planet_positions=None, natural_benefics=None):
     """
@@ -8590,10 +8527,9 @@ def matrunasa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         199 - The planet owning the navamsa, in which the lord of the navamsa occupied by the 4th lord is 
             situated should be disposed in the 6th, 8th or 12th house.
     """
-    from jhora.horoscope.chart import charts
-    pp_rasi = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    pp_nav = charts.divisional_chart(jd, place, divisional_chart_factor=9)
-    _, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=1)
+    pp_rasi = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    pp_nav = _yoga_context(jd, place).planet_positions(9)
+    _, nm = _yoga_context(jd, place).benefics_and_malefics(1)
     return _matrunasa_yoga_calculation(planet_positions_rasi=pp_rasi, planet_positions_navamsa=pp_nav, 
                                      natural_malefics=nm)
 def kapata_yoga(chart_1d, maandi_house=None, natural_malefics=None):
@@ -8623,9 +8559,8 @@ def kapata_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
             be aspected by malefics.
         204 - The 4th lord must join Saturn, Mandi and Rahu and aspected by malefics
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _, nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _, nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     
     # Calculate Mandi per specific user instruction
     y, m, d, fh = utils.jd_to_local(jd, place)
@@ -8685,17 +8620,16 @@ def _kapata_yoga_calculation(chart_1d=None, planet_positions=None, maandi_house=
         lord_of_4th_joins_saturn_mandi_rahu = (p_to_h[const.SATURN_ID]==maandi_house==p_to_h[const.RAHU_ID]==house_of_lord_of_4th)
     yoga_204 = lord_of_4th_joins_saturn_mandi_rahu and lord_of_4th_aspected_by_malefic
     return yoga_202 or yoga_203 or yoga_204
-def nishkapata_yoga_from_jd_place(js, place, divisional_chart_factor=1):
+def nishkapata_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         205 - The 4th house must be occupied by a benefic, or a planet in exaltation, friendly or own 
             house,or the 4th house must be a benefic sign.
         206 - Lord of Lagna should join the 4th in conjunction with or aspected by a benefic 
             or occupy Parvata or Uttamamsa.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
-    v_scores = charts.vaiseshikamsa_shodhasavarga_of_planets(jd, place)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
+    v_scores = _yoga_context(jd, place).vaiseshikamsa_shodhasavarga_of_planets()
     v_scores = [v[0] for _,v in v_scores.items()]
     return _nishkapata_yoga_calculation(planet_positions=pp, natural_benefics=nb, vaiseshikamsa_scores=v_scores)
 def nishkapata_yoga_from_planet_positions(planet_positions,natural_benefics=None, vaiseshikamsa_scores=None):
@@ -8779,9 +8713,8 @@ def matru_satrutwa_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Mercury, being lord of Lagna and the 4th, must join with or be aspected by a malefic.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _,nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _matru_satrutwa_yoga_calculation(planet_positions=pp, natural_malefics=nm)
 def _matru_satrutwa_yoga_calculation(chart_1d=None, planet_positions=None,natural_malefics=None):
     """
@@ -8817,9 +8750,8 @@ def matru_sneha_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         Second Variation - The lords of the 1st and 4th houses are either natural or temporal friends.
         Third Variation - The Lagna lord (1st house ruler) and the 4th house lord are aspected by benefics.
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    nb,_ = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    nb,_ = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _matru_sneha_yoga_calculation(planet_positions=pp, natural_benefics=nb)
 def matru_sneha_yoga(chart_1d,natural_benefics=None):
     """
@@ -8876,8 +8808,7 @@ def vahana_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
         209 - The lord of Lagna must join the 4th, 11th or the 9th.
         210 - The 4th lord must be exalted and the lord of the exaltation sign must occupy a kendra or trikona
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
     return _vahana_yoga_calculation(planet_positions=pp)
 def vahana_yoga_from_planet_positions(planet_positions):
     """
@@ -8937,9 +8868,8 @@ def anapathya_yoga_from_jd_place(jd, place, divisional_chart_factor=1):
     """
         Jupiter and the lords of Lagna, the 7th and the 5th are weak
     """
-    from jhora.horoscope.chart import charts
-    pp = charts.divisional_chart(jd, place, divisional_chart_factor=divisional_chart_factor)
-    _,nm = charts.benefics_and_malefics(jd, place, divisional_chart_factor=divisional_chart_factor)
+    pp = _yoga_context(jd, place).planet_positions(divisional_chart_factor)
+    _,nm = _yoga_context(jd, place).benefics_and_malefics(divisional_chart_factor)
     return _anapathya_yoga_calculation(planet_positions=pp, natural_malefics=nm)
 def anapathya_yoga_from_planet_positions(planet_positions=None,natural_malefics=None):
     """
@@ -8984,6 +8914,83 @@ def _anapathya_yoga_calculation(chart_1d=None, planet_positions=None,natural_mal
                                 natural_malefics=_natural_malefics)
     return is_jupiter_weak and is_lord_of_lagna_weak and is_lord_of_5th_weak and is_lord_of_7th_weak
 
+""" 
+    Yoga rule registry - built once at import.
+    Maps each yoga resource key to its *_from_jd_place predicate and the chart inputs it reads:
+        _CHART: positions of the varga being scanned
+        _RASI, _NAVAMSA: D1 / D9 positions irrespective of the varga being scanned
+        _BENEFICS: tithi based benefics/malefics of the varga being scanned (needs birth time)
+        _VAISESHIKAMSA: vaiseshikamsa counts of the planets (needs birth time)
+        _BIRTH_TIME: other birth time lookups - sunrise, tithi, maandi etc.
+"""
+_CHART = 'chart'; _RASI = 'rasi'; _NAVAMSA = 'navamsa'
+_BENEFICS = 'benefics'; _VAISESHIKAMSA = 'vaiseshikamsa'; _BIRTH_TIME = 'birth_time'
+_CHART_ONLY_INPUTS = frozenset([_CHART,_RASI,_NAVAMSA])
+_VARGA_INPUTS = frozenset([_CHART,_BENEFICS])
+YogaRule = struct('YogaRule',['name','predicate','inputs'])
+_yoga_rule_inputs = {
+    (_CHART,):
+        ['vesi_yoga','vosi_yoga','ubhayachara_yoga','nipuna_yoga','sunaphaa_yoga','anaphaa_yoga','duradhara_yoga',
+         'kemadruma_yoga','chandra_mangala_yoga','ruchaka_yoga','bhadra_yoga','sasa_yoga','maalavya_yoga',
+         'hamsa_yoga','rajju_yoga','musala_yoga','nala_yoga','gadaa_yoga','sakata_yoga','vihanga_yoga',
+         'sringaataka_yoga','hala_yoga','vajra_yoga','yava_yoga','kamala_yoga','vaapi_yoga','yoopa_yoga','sara_yoga',
+         'ishu_yoga','sakti_yoga','danda_yoga','nav_yoga','naukaa_yoga','koota_yoga','chatra_yoga','chaapa_yoga',
+         'ardha_chandra_yoga','chakra_yoga','samudra_yoga','veenaa_yoga','daama_yoga','paasa_yoga','kedaara_yoga',
+         'soola_yoga','guru_mangala_yoga','kaahala_yoga','sankha_yoga','bheri_yoga','mridanga_yoga','sreenaatha_yoga',
+         'khadga_yoga','kalaanidhi_yoga','siva_yoga','trilochana_yoga','saarada_yoga','saraswathi_yoga',
+         'devendra_yoga','indra_yoga','ravi_yoga','bhaaskara_yoga','kulavardhana_yoga','gandharva_yoga','go_yoga',
+         'vidyut_yoga','chapa_yoga','pushkala_yoga','jaya_yoga','harsha_yoga','sarala_yoga','vimala_yoga',
+         'chatussagara_yoga','rajalakshana_yoga','kahala_yoga','sreenatha_yoga','lagna_malika_yoga',
+         'dhana_malika_yoga','vikrama_malika_yoga','sukha_malika_yoga','putra_malika_yoga','satru_malika_yoga',
+         'kalatra_malika_yoga','randhra_malika_yoga','bhagya_malika_yoga','karma_malika_yoga','laabha_malika_yoga',
+         'vyaya_malika_yoga','parijatha_yoga','kalanidhi_yoga','vallaki_yoga','dama_yoga','kedara_yoga','sula_yoga',
+         'yuga_yoga','gola_yoga','dhur_yoga','dharidhra_yoga','sareera_soukhya_yoga','dehapushti_yoga',
+         'rogagrastha_yoga','sada_sanchara_yoga','dhana_yoga','bahudravyarjana_yoga','anthya_vayasi_dhana_yoga',
+         'matrumooladdhana_yoga','kalatramooladdhana_yoga','amaranantha_dhana_yoga','ayatnadhanalabha_yoga',
+         'sraddhannabhuktha_yoga','ekabhagini_yoga','dwadasa_sahodara_yoga','sapthasankhya_sahodara_yoga',
+         'vahana_yoga'],
+    (_CHART,_BENEFICS):
+        ['adhi_yoga','srik_yoga','maalaa_yoga','sarpa_yoga','subha_yoga','asubha_yoga','gaja_kesari_yoga',
+         'amala_yoga','parvata_yoga','chaamara_yoga','matsya_yoga','koorma_yoga','kusuma_yoga','lagnaadhi_yoga',
+         'hari_yoga','hara_yoga','brahma_yoga','vasumathi_yoga','makuta_yoga','harihara_brahma_yoga',
+         'madhya_vayasi_dhana_yoga','asatyavadi_yoga','marud_yoga','budha_yoga','mooka_yoga','netranasa_yoga',
+         'andha_yoga','bhratruvriddhi_yoga','sodaranasa_yoga','satkathadisravana_yoga','utthama_graha_yoga',
+         'vichitra_saudha_prakara_yoga','ayatna_griha_prapta_yoga','bandhu_pujya_yoga','matru_satrutwa_yoga',
+         'matru_sneha_yoga','anapathya_yoga'],
+    (_RASI,_NAVAMSA):
+        ['kalpadruma_yoga','vishnu_yoga'],
+    (_CHART,_NAVAMSA):
+        ['gouri_yoga','chandikaa_yoga','bhaarathi_yoga','parannabhojana_yoga','yuddhatpaschaddrudha_yoga'],
+    (_RASI,):
+        ['lakshmi_yoga','amsaavatara_yoga'],
+    (_CHART,_BENEFICS,_BIRTH_TIME):
+        ['vanchana_chora_bheethi_yoga','jada_yoga','kapata_yoga'],
+    (_CHART,_BIRTH_TIME):
+        ['mahabhagya_yoga','sarpaganda_yoga'],
+    (_CHART,_NAVAMSA,_BIRTH_TIME):
+        ['garuda_yoga'],
+    (_CHART,_NAVAMSA,_BENEFICS):
+        ['krisanga_yoga','dehasthoulya_yoga','durmukha_yoga','vakchalana_yoga','vishaprayoga_yoga','parakrama_yoga',
+         'grihanasa_yoga'],
+    (_CHART,_NAVAMSA,_BENEFICS,_VAISESHIKAMSA):
+        ['swaveeryaddhana_yoga'],
+    (_CHART,_BENEFICS,_VAISESHIKAMSA):
+        ['bhratrumooladdhanaprapti_yoga','yukthi_samanwithavagmi_yoga','sumukha_yoga','bhojana_soukhya_yoga',
+         'annadana_yoga','nishkapata_yoga'],
+    (_CHART,_VAISESHIKAMSA):
+        ['putramooladdhana_yoga','shatrumooladdhana_yoga'],
+    (_CHART,_NAVAMSA,_VAISESHIKAMSA):
+        ['parihasaka_yoga','yuddha_praveena_yoga'],
+    (_CHART,_RASI,_NAVAMSA,_BENEFICS):
+        ['matrunasa_yoga'],
+}
+def _build_yoga_rules():
+    rules = {}
+    for inputs,yoga_names in _yoga_rule_inputs.items():
+        for yoga_name in yoga_names:
+            rules[yoga_name] = YogaRule(yoga_name,globals()[yoga_name+'_from_jd_place'],frozenset(inputs))
+    return rules
+yoga_rules = _build_yoga_rules()
 if __name__ == "__main__":
     lang = 'ta'
     utils.set_language(lang)
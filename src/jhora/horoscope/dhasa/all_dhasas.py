@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Copyright (C) Open Astro Technologies, USA.
+# Modified by Sundar Sundaresan, USA. carnaticmusicguru2015@comcast.net
+# Downloaded from https://github.com/naturalstupid/PyJHora
+
+# This file is part of the "PyJHora" Python library
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+    Compute many dhasa systems of one chart in one call
+    Example: context = all_dhasas.DhasaContext(dob,tob,place)
+             timelines = all_dhasas.compute_all_dhasas(context,types=['vimsottari','yogini','narayana'],depth=2)
+             timelines['yogini'].lords_at(current_jd)  => (dhasa lord, bhukthi lord) running at current_jd
+    Dhasa types are the names used by the Horoscope _get_<type>_dhasa_bhukthi / _get_<type>_dhasa methods
+    (see graha_dhasa_types and rasi_dhasa_types). Annual dhasas depend on the year and are not included
+"""
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from jhora import const, utils
+from jhora.panchanga import drik
+from jhora.horoscope.chart import charts
+from jhora.horoscope.dhasa import timeline
+from jhora.horoscope.dhasa.graha import vimsottari
+class DhasaContext:
+    """
+        Natal data shared by all the dhasa calculations of a chart
+        Ayanamsa setting in effect when the context is created is used for all the dhasa calculations
+        @param dob: Date of birth as drik.Date tuple
+        @param tob: Time of birth as tuple (h,m,s)
+        @param place: Place as tuple (place name, latitude, longitude, timezone)
+        @param divisional_chart_factor: Used by the rasi dhasas (as in Horoscope._get_<type>_dhasa methods). Default=1
+    """
+    def __init__(self,dob,tob,place,divisional_chart_factor=1):
+        self.dob = dob; self.tob = tob; self.place = place
+        self.divisional_chart_factor = divisional_chart_factor
+        self.jd = utils.julian_day_number(dob, tob)
+        self.ayanamsa = drik.get_ayanamsa_setting()
+    def ayanamsa_setting(self):
+        """ @return: context manager that scopes the ayanamsa setting of the context to the current thread """
+        return drik.ayanamsa_setting(self.ayanamsa.mode,self.ayanamsa.value,jd=self.jd,tropical_mode=self.ayanamsa.tropical)
+    @cached_property
+    def planet_positions(self):
+        """ positions in the divisional chart of the context """
+        with self.ayanamsa_setting():
+            return charts.divisional_chart(self.jd, self.place, divisional_chart_factor=self.divisional_chart_factor)
+    @cached_property
+    def sree_lagna(self):
+        with self.ayanamsa_setting():
+            return drik.sree_lagna(self.jd, self.place, divisional_chart_factor=self.divisional_chart_factor)
+"""
+    Each function below returns rows of [dhasa_lord,bhukthi_lord,start,...] - [dhasa_lord,start...] for maha dhasas
+    start is julian day for the dhasas in julian_day_dhasa_types and 'YYYY-MM-DD hh:mm:ss' string for the others
+"""
+def _vimsottari(context,include_antardhasa):
+    return vimsottari.vimsottari_dhasa_timeline(context.jd, context.place)
+def _rasi_bhukthi_vimsottari(context,include_antardhasa):
+    return vimsottari.vimsottari_dhasa_timeline(context.jd, context.place,use_rasi_bhukthi_variation=True)
+def _yoga_vimsottari(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import yoga_vimsottari
+    return yoga_vimsottari.get_dhasa_bhukthi(context.jd, context.place,start_as_julian_day=True)[1]
+def _ashtottari(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import ashtottari
+    return ashtottari.get_ashtottari_dhasa_bhukthi(context.jd, context.place,include_antardhasa=include_antardhasa,
+                                                   start_as_julian_day=True)
+def _tithi_ashtottari(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import tithi_ashtottari
+    return tithi_ashtottari.get_ashtottari_dhasa_bhukthi(context.jd, context.place,include_antardhasa=include_antardhasa,
+                                                         start_as_julian_day=True)
+def _aayu(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import aayu
+    return aayu.get_dhasa_antardhasa(context.jd, context.place,include_antardhasa=include_antardhasa)[1]
+def _kaala(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import kaala
+    return [row for row in kaala.get_dhasa_antardhasa(context.dob,context.tob,context.place,
+                                                      include_antardhasa=include_antardhasa)[1] if row]
+def _tara(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import tara
+    return tara.get_dhasa_bhukthi(context.dob,context.tob,context.place,include_antardasa=include_antardhasa)
+def _karaka(context,include_antardhasa):
+    from jhora.horoscope.dhasa.graha import karaka
+    return karaka.get_dhasa_antardhasa(context.dob,context.tob,context.place,include_antardhasa=include_antardhasa)
+def _graha_dhasa(module_name):
+    """ dhasa modules with get_dhasa_bhukthi(dob,tob,place,include_antardhasa=...,start_as_julian_day=...) """
+    def _dhasa(context,include_antardhasa):
+        import importlib
+        module = importlib.import_module('jhora.horoscope.dhasa.graha.'+module_name)
+        return module.get_dhasa_bhukthi(context.dob,context.tob,context.place,include_antardhasa=include_antardhasa,
+                                        start_as_julian_day=True)
+    return _dhasa
+def _narayana(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import narayana
+    return narayana.narayana_dhasa_for_rasi_chart(context.dob,context.tob,context.place,include_antardhasa=include_antardhasa)
+def _kendraadhi_rasi(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import kendradhi_rasi
+    return kendradhi_rasi.kendradhi_rasi_dhasa(context.dob,context.tob,context.place,
+                        divisional_chart_factor=context.divisional_chart_factor,include_antardhasa=include_antardhasa)
+def _kendraadhi_karaka(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import kendradhi_rasi
+    return kendradhi_rasi.karaka_kendradhi_rasi_dhasa(context.dob,context.tob,context.place,
+                        divisional_chart_factor=context.divisional_chart_factor,karaka_index=1,
+                        include_antardhasa=include_antardhasa)
+def _sudasa(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import sudasa
+    return sudasa.sudasa_dhasa_from_planet_positions(context.planet_positions,context.sree_lagna[0],context.sree_lagna[1],
+                                    context.dob,context.tob,include_antardhasa=include_antardhasa)
+def _drig(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import drig
+    return drig.drig_dhasa(context.planet_positions,context.dob,context.tob,include_antardhasa=include_antardhasa)
+def _nirayana(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import nirayana
+    return nirayana.nirayana_shoola_dhasa(context.planet_positions,context.dob,context.tob,include_antardhasa)
+def _shoola(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import shoola
+    return shoola.shoola_dhasa(context.planet_positions,context.dob,context.tob,include_antardhasa=include_antardhasa)
+def _chara(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import chara
+    return chara.get_dhasa_antardhasa(context.dob,context.tob,context.place,
+                        divisional_chart_factor=context.divisional_chart_factor,chara_method=1,
+                        include_antardhasa=include_antardhasa)
+def _sandhya_panchaka(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import sandhya
+    return sandhya.get_dhasa_antardhasa(context.dob,context.tob,context.place,use_panchaka_variation=True,
+                        divisional_chart_factor=context.divisional_chart_factor,include_antardhasa=include_antardhasa)
+def _kalachakra(context,include_antardhasa):
+    from jhora.horoscope.dhasa.raasi import kalachakra
+    moon_long = context.planet_positions[2][1][0]*30+context.planet_positions[2][1][1]
+    return kalachakra.kalachakra_dhasa(moon_long, context.jd,include_antardhasa=include_antardhasa)
+def _rasi_dhasa(module_name):
+    """ dhasa modules with get_dhasa_antardhasa(dob,tob,place,divisional_chart_factor=...,include_antardhasa=...) """
+    def _dhasa(context,include_antardhasa):
+        import importlib
+        module = importlib.import_module('jhora.horoscope.dhasa.raasi.'+module_name)
+        return module.get_dhasa_antardhasa(context.dob,context.tob,context.place,
+                        divisional_chart_factor=context.divisional_chart_factor,include_antardhasa=include_antardhasa)
+    return _dhasa
+graha_dhasa_types = {'vimsottari':_vimsottari,'yoga_vimsottari':_yoga_vimsottari,
+                     'rasi_bhukthi_vimsottari':_rasi_bhukthi_vimsottari,'ashtottari':_ashtottari,
+                     'tithi_ashtottari':_tithi_ashtottari,'yogini':_graha_dhasa('yogini'),
+                     'tithi_yogini':_graha_dhasa('tithi_yogini'),'shodasottari':_graha_dhasa('shodasottari'),
+                     'dwadasottari':_graha_dhasa('dwadasottari'),'dwisatpathi':_graha_dhasa('dwisatpathi'),
+                     'panchottari':_graha_dhasa('panchottari'),'satabdika':_graha_dhasa('sataatbika'),
+                     'chaturaaseeti_sama':_graha_dhasa('chathuraaseethi_sama'),
+                     'karana_chaturaaseeti_sama':_graha_dhasa('karana_chathuraaseethi_sama'),
+                     'shashtisama':_graha_dhasa('shastihayani'),'shattrimsa_sama':_graha_dhasa('shattrimsa_sama'),
+                     'naisargika':_graha_dhasa('naisargika'),'tara':_tara,'karaka':_karaka,
+                     'buddhi_gathi':_graha_dhasa('buddhi_gathi'),'kaala':_kaala,'aayu':_aayu,
+                     'saptharishi_nakshathra':_graha_dhasa('saptharishi_nakshathra')}
+rasi_dhasa_types = {'narayana':_narayana,'kendraadhi_rasi':_kendraadhi_rasi,'sudasa':_sudasa,'drig':_drig,
+                    'nirayana':_nirayana,'shoola':_shoola,'kendraadhi_karaka':_kendraadhi_karaka,'chara':_chara,
+                    'lagnamsaka':_rasi_dhasa('lagnamsaka'),'padhanadhamsa':_rasi_dhasa('padhanadhamsa'),
+                    'mandooka':_rasi_dhasa('mandooka'),'sthira':_rasi_dhasa('sthira'),
+                    'tara_lagna':_rasi_dhasa('tara_lagna'),'brahma':_rasi_dhasa('brahma'),
+                    'varnada':_rasi_dhasa('varnada'),'yogardha':_rasi_dhasa('yogardha'),
+                    'navamsa':_rasi_dhasa('navamsa'),'paryaaya':_rasi_dhasa('paryaaya'),
+                    'trikona':_rasi_dhasa('trikona'),'kalachakra':_kalachakra,'chakra':_rasi_dhasa('chakra'),
+                    'sandhya_panchaka':_sandhya_panchaka}
+dhasa_types = {**graha_dhasa_types,**rasi_dhasa_types}
+""" dhasa types that give timeline.DhasaTimeline directly """
+timeline_dhasa_types = ['vimsottari','rasi_bhukthi_vimsottari']
+""" dhasa types whose rows give start of the periods as julian day numbers """
+julian_day_dhasa_types = ['yoga_vimsottari','ashtottari','tithi_ashtottari','yogini','tithi_yogini','shodasottari',
+                          'dwadasottari','dwisatpathi','panchottari','satabdika','chaturaaseeti_sama',
+                          'karana_chaturaaseeti_sama','shashtisama','shattrimsa_sama','naisargika','buddhi_gathi',
+                          'saptharishi_nakshathra']
+_date_time_pattern = re.compile(r'(-?\d+)-(\d+)-(\d+)\s+(\d+):(\d+):(\d+)')
+def _date_time_string_to_julian_day(date_time_string):
+    """ julian day of 'YYYY-MM-DD hh:mm:ss' strings of get_*_dhasa_bhukthi functions (seconds resolution) """
+    y,m,d,h,mm,s = map(int,_date_time_pattern.match(date_time_string.strip()).groups())
+    return utils.julian_day_number(drik.Date(y,m,d),(h,mm,s))
+def _dhasa_rows(context,dhasa_type,include_antardhasa):
+    """
+        @return: (lords,start_jds,end_jd) of the dhasa type
+            lords is tuple of (dhasa_lord,) or (dhasa_lord,bhukthi_lord) per row
+            end_jd - end of the last row from its duration (years) if the dhasa gives it else None
+    """
+    lord_count = 2 if include_antardhasa else 1
+    with context.ayanamsa_setting():
+        rows = dhasa_types[dhasa_type](context,include_antardhasa)
+    lords = []; start_jds = []; duration = None
+    for row in rows:
+        if dhasa_type in julian_day_dhasa_types:
+            ds = next(i for i,col in enumerate(row) if isinstance(col,float)); start_jds.append(row[ds])
+        else:
+            ds = next(i for i,col in enumerate(row) if isinstance(col,str) and _date_time_pattern.match(col.strip()))
+            start_jds.append(_date_time_string_to_julian_day(row[ds]))
+        lords.append(tuple(row[:ds])[:lord_count])
+        duration = row[ds+1] if len(row) > ds+1 and isinstance(row[ds+1],(int,float)) else None
+    end_jd = None if duration is None else start_jds[-1] + duration * const.sidereal_year
+    return lords,start_jds,end_jd
+def _rows_to_timeline(lords,start_jds,end_jd=None):
+    """
+        maha dhasa timeline from dhasa/bhukthi rows. Rows are grouped into maha dhasas by change of dhasa lord
+        end_jd: end of the last row. None => last period is open ended
+    """
+    maha_index = [i for i in range(len(lords)) if i==0 or lords[i][0]!=lords[i-1][0]]
+    maha_lords = [lords[i][0] for i in maha_index]; maha_start_jds = [start_jds[i] for i in maha_index]
+    maha_index.append(len(lords))
+    # maha dhasas of zero duration start with the next one - so rows are looked up by (lord,start_jd)
+    maha_rows = {(maha_lords[m],maha_start_jds[m]):range(maha_index[m],maha_index[m+1]) for m in range(len(maha_lords))}
+    def _sub_periods(parent_lords,start_jd,end_jd):
+        if len(parent_lords) > 1 or len(lords[0]) < 2: return None
+        rows = maha_rows[(parent_lords[0],start_jd)]
+        return [lords[r][1] for r in rows],[start_jds[r] for r in rows]
+    return timeline.DhasaTimeline(maha_lords, maha_start_jds, end_jd, sub_periods=_sub_periods)
+def _compute_dhasa(context,dhasa_type,depth):
+    if dhasa_type in timeline_dhasa_types:
+        with context.ayanamsa_setting():
+            return dhasa_types[dhasa_type](context, depth > 1)
+    return _rows_to_timeline(*_dhasa_rows(context, dhasa_type, include_antardhasa=depth > 1))
+def compute_all_dhasas(context,types=None,depth=2,max_workers=None):
+    """
+        Compute dhasa timelines of many dhasa systems for one chart
+        @param context: DhasaContext of the chart
+        @param types: list of dhasa types (keys of dhasa_types). Default: all graha and rasi dhasas
+        @param depth: 1=maha dhasas only, 2=maha dhasas and bhukthis (Default)
+            Deeper levels are available only for vimsottari (see timeline.DhasaTimeline.periods_at)
+            Vimsottari timelines (timeline_dhasa_types) always have sub periods
+        @param max_workers: None (Default) => compute in this process
+            number => compute the dhasa types in a pool of max_workers processes
+            Note: a dhasa type takes only a few milliseconds. Process pool helps only for very many types/charts
+        @return: {dhasa_type: timeline.DhasaTimeline of maha dhasas}
+            Start julian days of dhasas other than timeline_dhasa_types and julian_day_dhasa_types
+            have the one second resolution of their date strings
+            End of the last maha dhasa of dhasas other than vimsottari is from the duration (years) given by the dhasa.
+            The last maha dhasa is open ended (end julian day is inf) if the dhasa does not give it
+    """
+    types = list(dhasa_types.keys()) if types is None else list(types)
+    unknown = [t for t in types if t not in dhasa_types]
+    if unknown:
+        raise ValueError('Unknown dhasa types '+str(unknown)+'. Valid types are '+str(list(dhasa_types.keys())))
+    include_antardhasa = depth > 1
+    if max_workers is None:
+        with drik.ephemeris_cache():
+            return {t:_compute_dhasa(context, t, depth) for t in types}
+    context.planet_positions; context.sree_lagna # compute once before sending the context to the workers
+    row_types = [t for t in types if t not in timeline_dhasa_types]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        rows = executor.map(_dhasa_rows,[context]*len(row_types),row_types,[include_antardhasa]*len(row_types))
+        timelines = {t:_rows_to_timeline(*r) for t,r in zip(row_types,rows)}
+    for t in types:
+        if t in timeline_dhasa_types:
+            timelines[t] = _compute_dhasa(context, t, depth)
+    return {t:timelines[t] for t in types}
+'------ main -----------'
+if __name__ == "__main__":
+    from jhora.tests import pvr_tests
+    pvr_tests._STOP_IF_ANY_TEST_FAILED = False
+    pvr_tests.all_dhasas_tests()
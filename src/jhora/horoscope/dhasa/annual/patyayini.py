@@ -21,13 +21,13 @@
 from jhora import const, utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import charts
-def patyayini_dhasa(jd_years,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1):
+def patyayini_dhasa(jd_years,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1):
     """
         Compute Patyaayini Dhasa
         Should be used for Tajaka Annual charts
         @param jd_years:Julian day number for Tajaka Annual date/time
         @param place: drik.Place struct tuple of ('Place',latitude,longitude,time_zone_offset)
-        @param ayanamsa_mode: Default = const._DEFAULT_AYANAMSA_MODE
+        @param ayanamsa_mode: Default = None - current setting (see drik.get_ayanamsa_mode)
         @param divisional_chart_factor: Default = 1 (Raasi) - See const.division_chart_factors for other possible values
         @param chart_method: default=1, various methods available for each division chart. See charts module 
         @return patyayini dhasa values as a list [planet, dhasa_duration in days]
@@ -24,11 +24,14 @@ Calculates Ashtottari (=108) Dasha-bhukthi-antara-sukshma-prana
 """
 
 from collections import OrderedDict as Dict
+from functools import lru_cache
 from jhora import const,utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import house
+from jhora.horoscope.dhasa import timeline
 year_duration = const.sidereal_year# const.tropical_year  # some say 360 days, others 365.25 or 365.2563 etc
 human_life_span_for_ashtottari_dhasa = 108
+_tribhagi_factor = 1./3.
 """ 
     {ashtottari adhipati:[(starting_star_number,ending_star_number),dasa_length]} 
         ashtottari longitude range: (starting_star_number-1) * 360/27 TO (ending_star_number) * 360/27
@@ -55,8 +58,21 @@ def _get_dhasa_dict(seed_star=6):
         ashtottari_adhipathi_dict[p] = [(nsb,nse),durn]
         nak = (nse+1)%28
     return ashtottari_adhipathi_dict
-def ashtottari_adhipathi(nak):
-    for key,value in ashtottari_adhipathi_dict.items():
+@lru_cache(maxsize=None)
+def _get_dhasa_table(seed_star=6,use_tribhagi_variation=False):
+    """
+        @return: read-only timeline.DhasaTable for the seed star - computed once and shared by all calls (and threads)
+    """
+    ashtottari_adhipathi_dict = _get_dhasa_dict(seed_star)
+    life_span = human_life_span_for_ashtottari_dhasa
+    if use_tribhagi_variation:
+        life_span *= _tribhagi_factor
+        ashtottari_adhipathi_dict = {k:[v1,v2*_tribhagi_factor] for k,(v1,v2) in ashtottari_adhipathi_dict.items()}#[v1,round(v2*_tribhagi_factor,2)]
+    return timeline.dhasa_table(ashtottari_adhipathi_dict, life_span)
+ashtottari_table = _get_dhasa_table()
+ashtottari_adhipathi_dict = ashtottari_table.periods
+def ashtottari_adhipathi(nak,dhasa_table=ashtottari_table):
+    for key,value in dhasa_table.periods.items():
         starting_star = value[0][0]
         ending_star = value[0][1]
         nak1 = nak
@@ -67,7 +83,7 @@ def ashtottari_adhipathi(nak):
         if nak1 >= starting_star and nak1 <= ending_star:
             return key,value
 def ashtottari_dasha_start_date(jd,place,divisional_chart_factor=1,chart_method=1,star_position_from_moon=1,
-                                dhasa_starting_planet=1):
+                                dhasa_starting_planet=1,dhasa_table=ashtottari_table):
     y,m,d,fh = utils.jd_to_gregorian(jd); dob=drik.Date(y,m,d); tob=(fh,0,0)
     one_star = (360 / 27.)        # 27 nakshatras span 360°
     from jhora.horoscope.chart import charts,sphuta
@@ -101,7 +117,7 @@ def ashtottari_dasha_start_date(jd,place,divisional_chart_factor=1,chart_method=
     if dhasa_starting_planet==1:
         planet_long += (star_position_from_moon-1)*one_star
     nak = int(planet_long / one_star)
-    lord,res = ashtottari_adhipathi(nak+1)          # ruler of current nakshatra
+    lord,res = ashtottari_adhipathi(nak+1,dhasa_table=dhasa_table)          # ruler of current nakshatra
     period = res[1]; start_nak = res[0][0]; end_nak = res[0][1]
     period_elapsed = ( planet_long - (start_nak-1)*one_star)/((end_nak-start_nak+1)*one_star)
     period_elapsed *= (period*year_duration)        # days
@@ -115,22 +131,22 @@ def ashtottari_next_adhipati(lord,dirn=1):
     #print(next_index)
     return ashtottari_adhipathi_list[next_index]
 def ashtottari_mahadasa(jd,place,divisional_chart_factor=1,chart_method=1,star_position_from_moon=1,
-                        dhasa_starting_planet=1):
+                        dhasa_starting_planet=1,dhasa_table=ashtottari_table):
     """
         returns a dictionary of all mahadashas and their start dates
         @return {mahadhasa_lord_index, (starting_year,starting_month,starting_day,starting_time_in_hours)}
     """
     lord, start_date = ashtottari_dasha_start_date(jd,place,divisional_chart_factor=divisional_chart_factor,
                                 chart_method=chart_method,star_position_from_moon=star_position_from_moon,
-                                dhasa_starting_planet=dhasa_starting_planet)
+                                dhasa_starting_planet=dhasa_starting_planet,dhasa_table=dhasa_table)
     retval = Dict()
     for _ in range(len(ashtottari_adhipathi_list)):
         retval[lord] = start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
+        lord_duration = dhasa_table.periods[lord][1]
         start_date += lord_duration * year_duration
         lord = ashtottari_next_adhipati(lord)
     return retval
-def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=1):
+def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=1,dhasa_table=ashtottari_table):
     """
         Compute all bhukthis of given nakshatra-lord of Mahadasa and its start date
     """
@@ -142,31 +158,31 @@ def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=1):
     dirn = 1 if antardhasa_option in [1,3,5] else -1
     retval = Dict()
     #lord = dhasa_lord if const.ashtottari_bhukthi_starts_from_dhasa_lord else ashtottari_next_adhipati(dhasa_lord)
-    dhasa_lord_duration = ashtottari_adhipathi_dict[lord][1]
+    dhasa_lord_duration = dhasa_table.periods[lord][1]
     for _ in range(len(ashtottari_adhipathi_list)):
         retval[lord] = start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
-        factor = lord_duration * dhasa_lord_duration / human_life_span_for_ashtottari_dhasa
+        lord_duration = dhasa_table.periods[lord][1]
+        factor = lord_duration * dhasa_lord_duration / dhasa_table.life_span
         start_date += factor * year_duration
         lord = ashtottari_next_adhipati(lord,dirn)
     return retval
-def ashtottari_anthara(dhasa_lord, bhukthi_lord,bhukthi_lord_start_date):
+def ashtottari_anthara(dhasa_lord, bhukthi_lord,bhukthi_lord_start_date,dhasa_table=ashtottari_table):
     """
         Compute all bhukthis of given nakshatra-lord of Mahadasa, its bhukthi lord and bhukthi_lord's start date
     """
-    dhasa_lord_duration = ashtottari_adhipathi_dict[dhasa_lord][1]
+    dhasa_lord_duration = dhasa_table.periods[dhasa_lord][1]
     retval = Dict()
     lord = bhukthi_lord# if const.ashtottari_bhukthi_starts_from_dhasa_lord else ashtottari_next_adhipati(bhukthi_lord)
     for i in range(len(ashtottari_adhipathi_list)):
         retval[lord] = bhukthi_lord_start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
-        factor = lord_duration * dhasa_lord_duration / human_life_span_for_ashtottari_dhasa
+        lord_duration = dhasa_table.periods[lord][1]
+        factor = lord_duration * dhasa_lord_duration / dhasa_table.life_span
         bhukthi_lord_start_date += factor * year_duration
         lord = ashtottari_next_adhipati(lord)
     return retval
 def get_ashtottari_dhasa_bhukthi(jd, place,divisional_chart_factor=1,chart_method=1,star_position_from_moon=1,
                                  use_tribhagi_variation=False,include_antardhasa=True,
-                                 antardhasa_option=1,dhasa_starting_planet=1,seed_star=6):
+                                 antardhasa_option=1,dhasa_starting_planet=1,seed_star=6,start_as_julian_day=False):
     """
         provides Ashtottari dhasa bhukthi for a given date in julian day (includes birth time)
         @param jd: Julian day for birthdate and birth time
@@ -191,40 +207,29 @@ def get_ashtottari_dhasa_bhukthi(jd, place,divisional_chart_factor=1,chart_metho
         @param dhasa_starting_planet 0=Sun 1=Moon(default)...8=Ketu, 'L'=Lagna
                                     M=Maandi, G=Gulika, T=Trisphuta, B=Bhindu, I=Indu, P=Pranapada
         @param seed_star 1..27. Default = 6
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start]
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
-    global human_life_span_for_ashtottari_dhasa, ashtottari_adhipathi_dict
-    ashtottari_adhipathi_dict = _get_dhasa_dict(seed_star)
-    _dhasa_cycles = 1
-    _tribhagi_factor = 1
-    if use_tribhagi_variation:
-        _tribhagi_factor = 1./3.
-        _dhasa_cycles = int(_dhasa_cycles/_tribhagi_factor)
-        human_life_span_for_ashtottari_dhasa *= _tribhagi_factor
-        for k,(v1,v2) in ashtottari_adhipathi_dict.items():
-            ashtottari_adhipathi_dict[k] = [v1,v2*_tribhagi_factor]#[v1,round(v2*_tribhagi_factor,2)]
+    dhasa_table = _get_dhasa_table(seed_star,use_tribhagi_variation)
+    _dhasa_cycles = int(1/_tribhagi_factor) if use_tribhagi_variation else 1
     dashas = ashtottari_mahadasa(jd,place,divisional_chart_factor=divisional_chart_factor,
                                  star_position_from_moon=star_position_from_moon,
-                                 dhasa_starting_planet=dhasa_starting_planet)
+                                 dhasa_starting_planet=dhasa_starting_planet,dhasa_table=dhasa_table)
     dhasa_bhukthi=[]
     for _ in range(_dhasa_cycles):
         for i in dashas:
             dhasa_lord = i
             if include_antardhasa:
-                bhukthis = ashtottari_bhukthi(i, dashas[i],antardhasa_option)
+                bhukthis = ashtottari_bhukthi(i, dashas[i],antardhasa_option,dhasa_table=dhasa_table)
                 for j in bhukthis:
                     bhukthi_lord = j
                     jd1 = bhukthis[j]
-                    y, m, d, h = utils.jd_to_gregorian(jd1)
-                    """ TODO: Need to figure out passing date and time string to UI, main.py and pvr_tests.py """
-                    date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
+                    date_str = jd1 if start_as_julian_day else utils.julian_day_to_date_time_string(jd1)
                     dhasa_bhukthi.append([dhasa_lord,bhukthi_lord,date_str]) 
             else:
                 jd1 = dashas[i]
-                y, m, d, h = utils.jd_to_gregorian(jd1)
-                """ TODO: Need to figure out passing date and time string to UI, main.py and pvr_tests.py """
-                date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
+                date_str = jd1 if start_as_julian_day else utils.julian_day_to_date_time_string(jd1)
                 dhasa_bhukthi.append([dhasa_lord,date_str])                 
     return dhasa_bhukthi
 '------ main -----------'
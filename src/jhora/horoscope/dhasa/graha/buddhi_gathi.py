@@ -22,7 +22,7 @@ from jhora import utils, const
 from jhora.horoscope.chart import charts
 from jhora.panchanga import drik
 def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,years=1,months=1,sixty_hours=1,
-                      include_antardhasa=True):
+                      include_antardhasa=True,start_as_julian_day=False):
     """
         provides Buddhi Gathi dhasa bhukthi for a given date in julian day (includes birth time)
         @param dob: Date Struct (year,month,day)
@@ -35,12 +35,13 @@ def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,yea
         @param months: Monthly chart. number of months from date of birth
         @param sixty_hours: 60-hour chart. number of 60 hours from date of birth
         @param include_antardhasa: True (include) False (exclude) antardhasa (Default=True)
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start] if include_antardhasa=True
         @return: a list of [dhasa_lord,dhasa_start] if include_antardhasa=False
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
     jd_at_dob = utils.julian_day_number(dob, tob)
-    planet_positions = charts.divisional_chart(jd_at_dob, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, 
+    planet_positions = charts.divisional_chart(jd_at_dob, place, ayanamsa_mode=drik.get_ayanamsa_mode(), 
                                                divisional_chart_factor=divisional_chart_factor,chart_method=chart_method,
                                                years=years,months=months, sixty_hours=sixty_hours)
     h_to_p = utils.get_house_planet_list_from_planet_positions(planet_positions[1:])
@@ -69,14 +70,12 @@ def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,yea
             if include_antardhasa:
                 bhukthi_duration = dhasa_duration/dhasa_len
                 for bhukthi in range(dhasa_len):
-                    y,m,d,h = utils.jd_to_gregorian(start_jd)
-                    dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                    dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                     bhukthi_lord = dhasa_progression[(dhasa+bhukthi)%dhasa_len][0]
                     dhasa_bhukthi_info.append((dhasa_lord,bhukthi_lord,dhasa_start,round(bhukthi_duration,2)))
                     start_jd += bhukthi_duration*const.sidereal_year
             else:
-                y,m,d,h = utils.jd_to_gregorian(start_jd)
-                dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                 dhasa_bhukthi_info.append((dhasa_lord,dhasa_start,dhasa_duration))
                 start_jd += dhasa_duration*const.sidereal_year
             if total_dhasa_duration >= const.human_life_span_for_narayana_dhasa:
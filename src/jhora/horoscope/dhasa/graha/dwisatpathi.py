@@ -110,7 +110,7 @@ def _dhasa_start(jd,place,star_position_from_moon=1,divisional_chart_factor=1,ch
     start_date = jd - period_elapsed      # so many days before current day
     return [lord, start_date,res]
 def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,star_position_from_moon=1,use_tribhagi_variation=False,
-                      divisional_chart_factor=1,chart_method=1,seed_star=19,dhasa_starting_planet=1,antardhasa_option=1):
+                      divisional_chart_factor=1,chart_method=1,seed_star=19,dhasa_starting_planet=1,antardhasa_option=1,start_as_julian_day=False):
     """
         returns a dictionary of all mahadashas and their start dates
         @param dob: Date Struct (year,month,day)
@@ -136,6 +136,7 @@ def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,star_position_from_m
             6 => prev dhasa lord - backward
         @param dhasa_starting_planet 0=Sun 1=Moon(default)...8=Ketu, 'L'=Lagna
                                     M=Maandi, G=Gulika, T=Trisphuta, B=Bhindu, I=Indu, P=Pranapada
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start]
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
@@ -155,13 +156,11 @@ def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,star_position_from_m
                 bhukthis = _antardhasa(dhasa_lord,antardhasa_option)
                 _dhasa_duration /= len(bhukthis)
                 for bhukthi_lord in bhukthis:
-                    y,m,d,h = utils.jd_to_gregorian(start_jd)
-                    dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                    dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                     retval.append((dhasa_lord,bhukthi_lord,dhasa_start,_dhasa_duration))
                     start_jd += _dhasa_duration * sidereal_year
             else:
-                y,m,d,h = utils.jd_to_gregorian(start_jd)
-                dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                 retval.append((dhasa_lord,dhasa_start,_dhasa_duration))
                 lord_duration = round(dhasa_adhipathi_list[dhasa_lord]*_tribhagi_factor,2)
                 start_jd += lord_duration * sidereal_year
@@ -59,13 +59,14 @@ def _dhasa_start(jd,place):
     start_date = jd - period_elapsed      # so many days before current day
     return [lord, start_date,res]
 def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,use_tribhagi_variation=False,
-                      divisional_chart_factor=1,chart_method=1,antardhasa_option=1):
+                      divisional_chart_factor=1,chart_method=1,antardhasa_option=1,start_as_julian_day=False):
     """
         provides karana chathuraaseethi sama dhasa bhukthi for a given date in julian day (includes birth time)
         @param dob: Date Struct (year,month,day)
         @param tob: time tuple (h,m,s) 
         @param place: Place as tuple (place name, latitude, longitude, timezone)
         @param use_tribhagi_variation: False (default), True means dhasa bhukthi duration in three phases 
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start] if include_antardhasa=True
         @return: a list of [dhasa_lord,dhasa_start] if include_antardhasa=False
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
@@ -84,13 +85,11 @@ def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,use_tribhagi_variati
                 bhukthis = _antardhasa(dhasa_lord,antardhasa_option)
                 _dhasa_duration /= len(bhukthis)
                 for bhukthi_lord in bhukthis:
-                    y,m,d,h = utils.jd_to_gregorian(start_jd)
-                    dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                    dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                     retval.append((dhasa_lord,bhukthi_lord,dhasa_start,round(_dhasa_duration,2)))
                     start_jd += _dhasa_duration * year_duration
             else:
-                y,m,d,h = utils.jd_to_gregorian(start_jd)
-                dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                 retval.append((dhasa_lord,dhasa_start,_dhasa_duration))
                 lord_duration = round(dhasa_adhipathi_list[dhasa_lord]*_tribhagi_factor,2)
                 start_jd += lord_duration * year_duration
@@ -86,7 +86,7 @@ def _dhasa_progression(jd,place,divisional_chart_factor=1,chart_method=1,star_po
     return _dp
 def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,include_antardhasa=True,
                       star_position_from_moon=1,use_tribhagi_variation=False,
-                      dhasa_starting_planet=1,antardhasa_option=1):
+                      dhasa_starting_planet=1,antardhasa_option=1,start_as_julian_day=False):
     """
         returns a dictionary of all mahadashas and their start dates
         @param dob: Date Struct (year,month,day)
@@ -112,16 +112,15 @@ def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,inc
             5 => prev dhasa lord - forward
             6 => prev dhasa lord - backward
         NOTE: In JHora this option is disabled. JHora has seed_star option enabled, but shows no effect omn dhasa/bhukthi
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start]
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
-    global human_life_span_for_dhasa
     _dhasa_cycles = 1
     _tribhagi_factor = 1
     if use_tribhagi_variation:
         _tribhagi_factor = 1./3.
         _dhasa_cycles = int(_dhasa_cycles/_tribhagi_factor)
-        human_life_span_for_dhasa *= _tribhagi_factor
     jd = utils.julian_day_number(dob, tob)
     retval = []
     dhasa_progression = _dhasa_progression(jd, place, divisional_chart_factor,chart_method,star_position_from_moon, 
@@ -134,13 +133,11 @@ def get_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,chart_method=1,inc
                 bhukthis = _antardhasa(dhasa_lord, antardhasa_option)#[(dhasa_lord-i)%27 for i in range(_dhasa_count)]
                 _bhukthi_duration = _dhasa_duration/len(bhukthis)
                 for bhukthi_lord in bhukthis:
-                    y,m,d,h = utils.jd_to_gregorian(start_jd)
-                    dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                    dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                     retval.append((dhasa_lord,bhukthi_lord,dhasa_start,round(_bhukthi_duration,2)))
                     start_jd += _bhukthi_duration * year_duration
             else:
-                y,m,d,h = utils.jd_to_gregorian(start_jd)
-                dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                 retval.append((dhasa_lord,dhasa_start,dhasa_duration))
                 start_jd += dhasa_duration * year_duration
     return retval
@@ -29,23 +29,32 @@ from collections import OrderedDict as Dict
 from jhora import const,utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import house
+from jhora.horoscope.dhasa import timeline
 year_duration = const.sidereal_year  # some say 360 days, others 365.25 or 365.2563 etc
 human_life_span_for_ashtottari_dhasa = 108
+_tribhagi_factor = 1./3.
 """ 
     {ashtottari adhipati:[(tithis),dasa_length]} 
 """
 ashtottari_adhipathi_list = [0,1,2,3,6,4,7,5]
-ashtottari_adhipathi_dict = {0:[(1,9,16,24),6],1:[(2,10,17,25),15],2:[(3,11,18,26),8],3:[(4,12,19,27),17],
+_ashtottari_adhipathi_dict = {0:[(1,9,16,24),6],1:[(2,10,17,25),15],2:[(3,11,18,26),8],3:[(4,12,19,27),17],
                              6:[(7,15,22),10],4:[(5,13,20,28),19],7:[(8,23,30),12],5:[(6,14,21,29),21]}
-def ashtottari_adhipathi(tithi_index):
-    for key,(tithi_list,durn) in ashtottari_adhipathi_dict.items():
+""" Read-only dhasa tables - shared by all calls (and threads). Choose one with _get_dhasa_table """
+ashtottari_table = timeline.dhasa_table(_ashtottari_adhipathi_dict, human_life_span_for_ashtottari_dhasa)
+tribhagi_ashtottari_table = timeline.dhasa_table({k:[v1,round(v2*_tribhagi_factor,2)] for k,(v1,v2) in _ashtottari_adhipathi_dict.items()},
+                                                 human_life_span_for_ashtottari_dhasa*_tribhagi_factor)
+ashtottari_adhipathi_dict = ashtottari_table.periods
+def _get_dhasa_table(use_tribhagi_variation=False):
+    return tribhagi_ashtottari_table if use_tribhagi_variation else ashtottari_table
+def ashtottari_adhipathi(tithi_index,dhasa_table=ashtottari_table):
+    for key,(tithi_list,durn) in dhasa_table.periods.items():
         if tithi_index in tithi_list:
             return key,durn 
-def ashtottari_dasha_start_date(jd,place,tithi_index=1):
+def ashtottari_dasha_start_date(jd,place,tithi_index=1,dhasa_table=ashtottari_table):
     _,_,_,birth_time_hrs = utils.jd_to_gregorian(jd)
     tit = drik.tithi(jd, place,tithi_index=tithi_index)
     t_frac = utils.get_fraction(tit[1], tit[2], birth_time_hrs)
-    lord,res = ashtottari_adhipathi(tit[0])          # ruler of current nakshatra
+    lord,res = ashtottari_adhipathi(tit[0],dhasa_table=dhasa_table)          # ruler of current nakshatra
     period_elapsed = (1-t_frac)*res*year_duration
     start_jd = jd - period_elapsed      # so many days before current day
     return [lord, start_jd]
@@ -54,20 +63,20 @@ def ashtottari_next_adhipati(lord,dirn=1):
     current = ashtottari_adhipathi_list.index(lord)
     next_index = (current + dirn) % len(ashtottari_adhipathi_list)
     return list(ashtottari_adhipathi_dict.keys())[next_index]
-def ashtottari_mahadasa(jd,place,tithi_index):
+def ashtottari_mahadasa(jd,place,tithi_index,dhasa_table=ashtottari_table):
     """
         returns a dictionary of all mahadashas and their start dates
         @return {mahadhasa_lord_index, (starting_year,starting_month,starting_day,starting_time_in_hours)}
     """
-    lord, start_date = ashtottari_dasha_start_date(jd,place,tithi_index)
+    lord, start_date = ashtottari_dasha_start_date(jd,place,tithi_index,dhasa_table=dhasa_table)
     retval = Dict()
     for _ in range(len(ashtottari_adhipathi_list)):
         retval[lord] = start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
+        lord_duration = dhasa_table.periods[lord][1]
         start_date += lord_duration * year_duration
         lord = ashtottari_next_adhipati(lord)
     return retval
-def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=3):
+def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=3,dhasa_table=ashtottari_table):
     """
         Compute all bhukthis of given nakshatra-lord of Mahadasa and its start date
     """
@@ -77,32 +86,32 @@ def ashtottari_bhukthi(dhasa_lord, start_date,antardhasa_option=3):
     elif antardhasa_option in [5,6]:
         lord = ashtottari_next_adhipati(lord, dirn=-1) 
     dirn = 1 if antardhasa_option in [1,3,5] else -1
-    dhasa_lord_duration = ashtottari_adhipathi_dict[dhasa_lord][1]
+    dhasa_lord_duration = dhasa_table.periods[dhasa_lord][1]
     retval = Dict()
     #lord = ashtottari_next_adhipati(dhasa_lord,dirn) # For Ashtottari first bhukkti starts from dhasa's next lord
     for _ in range(len(ashtottari_adhipathi_list)):
         retval[lord] = start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
-        factor = lord_duration * dhasa_lord_duration / human_life_span_for_ashtottari_dhasa
+        lord_duration = dhasa_table.periods[lord][1]
+        factor = lord_duration * dhasa_lord_duration / dhasa_table.life_span
         start_date += factor * year_duration
         lord = ashtottari_next_adhipati(lord,dirn)
     return retval
-def ashtottari_anthara(dhasa_lord, bhukthi_lord,bhukthi_lord_start_date):
+def ashtottari_anthara(dhasa_lord, bhukthi_lord,bhukthi_lord_start_date,dhasa_table=ashtottari_table):
     """
         Compute all bhukthis of given nakshatra-lord of Mahadasa, its bhukthi lord and bhukthi_lord's start date
     """
-    dhasa_lord_duration = ashtottari_adhipathi_dict[dhasa_lord][1]
+    dhasa_lord_duration = dhasa_table.periods[dhasa_lord][1]
     retval = Dict()
     lord = ashtottari_next_adhipati(bhukthi_lord) # For Ashtottari first bhukkti starts from dhasa's next lord
     for _ in range(len(ashtottari_adhipathi_list)):
         retval[lord] = bhukthi_lord_start_date
-        lord_duration = ashtottari_adhipathi_dict[lord][1]
-        factor = lord_duration * dhasa_lord_duration / human_life_span_for_ashtottari_dhasa
+        lord_duration = dhasa_table.periods[lord][1]
+        factor = lord_duration * dhasa_lord_duration / dhasa_table.life_span
         bhukthi_lord_start_date += factor * year_duration
         lord = ashtottari_next_adhipati(lord)
     return retval
 def get_ashtottari_dhasa_bhukthi(jd, place,use_tribhagi_variation=False,include_antardhasa=True,
-                                 tithi_index=1,antardhasa_option=3): #antardhasa starts from next lord
+                                 tithi_index=1,antardhasa_option=3,start_as_julian_day=False): #antardhasa starts from next lord
     """
         provides Tithi Ashtottari dhasa bhukthi for a given date in julian day (includes birth time)
         This is Ashtottari Dhasa based on tithi instead of nakshathra
@@ -119,34 +128,25 @@ def get_ashtottari_dhasa_bhukthi(jd, place,use_tribhagi_variation=False,include_
             4 => next dhasa lord - backward
             5 => prev dhasa lord - forward
             6 => prev dhasa lord - backward
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start]
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
-    global human_life_span_for_ashtottari_dhasa
-    _dhasa_cycles = 1
-    _tribhagi_factor = 1
-    if use_tribhagi_variation:
-        _tribhagi_factor = 1./3.
-        _dhasa_cycles = int(_dhasa_cycles/_tribhagi_factor)
-        human_life_span_for_ashtottari_dhasa *= _tribhagi_factor
-        for k,(v1,v2) in ashtottari_adhipathi_dict.items():
-            ashtottari_adhipathi_dict[k] = [v1,round(v2*_tribhagi_factor,2)]
-    dashas = ashtottari_mahadasa(jd,place,tithi_index)
+    dhasa_table = _get_dhasa_table(use_tribhagi_variation)
+    dashas = ashtottari_mahadasa(jd,place,tithi_index,dhasa_table=dhasa_table)
     dhasa_bhukthi=[]
     for i in dashas:
         dhasa_lord = i
         if include_antardhasa:
-            bhukthis = ashtottari_bhukthi(i, dashas[i],antardhasa_option)
+            bhukthis = ashtottari_bhukthi(i, dashas[i],antardhasa_option,dhasa_table=dhasa_table)
             for j in bhukthis:
                 bhukthi_lord = j
                 jd1 = bhukthis[j]
-                y, m, d, h = utils.jd_to_gregorian(jd1)
-                date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
+                date_str = jd1 if start_as_julian_day else utils.julian_day_to_date_time_string(jd1)
                 dhasa_bhukthi.append([dhasa_lord,bhukthi_lord,date_str])
         else:
             jd1 = dashas[i]
-            y, m, d, h = utils.jd_to_gregorian(jd1)
-            date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
+            date_str = jd1 if start_as_julian_day else utils.julian_day_to_date_time_string(jd1)
             dhasa_bhukthi.append([dhasa_lord,date_str])
             
     return dhasa_bhukthi
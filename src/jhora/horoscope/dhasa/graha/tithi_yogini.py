@@ -75,7 +75,7 @@ def _dhasa_start(jd,place,tithi_index=1):
     start_jd = jd - period_elapsed      # so many days before current day
     return [lord, start_jd,res]
 def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,use_tribhagi_variation=False,tithi_index=1,
-                      antardhasa_option=1):
+                      antardhasa_option=1,start_as_julian_day=False):
     """
         provides Tithi Yogini dhasa bhukthi for a given date in julian day (includes birth time)
         This is Ashtottari Dhasa based on tithi instead of nakshathra
@@ -92,6 +92,7 @@ def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,use_tribhagi_variati
             4 => next dhasa lord - backward
             5 => prev dhasa lord - forward
             6 => prev dhasa lord - backward
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start]
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
@@ -109,13 +110,11 @@ def get_dhasa_bhukthi(dob,tob,place,include_antardhasa=True,use_tribhagi_variati
                 bhukthis = _antardhasa(dhasa_lord,antardhasa_option=antardhasa_option)
                 _dhasa_duration /= len(bhukthis)
                 for bhukthi_lord in bhukthis:
-                    y,m,d,h = utils.jd_to_gregorian(start_jd)
-                    dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                    dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                     retval.append((dhasa_lord,bhukthi_lord,dhasa_start,_dhasa_duration))
                     start_jd += _dhasa_duration * year_duration
             else:
-                y,m,d,h = utils.jd_to_gregorian(start_jd)
-                dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(h, as_string=True)
+                dhasa_start = start_jd if start_as_julian_day else utils.julian_day_to_date_time_string(start_jd)
                 retval.append((dhasa_lord,dhasa_start,_dhasa_duration))
                 lord_duration = dhasa_adhipathi_list[dhasa_lord]
                 start_jd += lord_duration * year_duration
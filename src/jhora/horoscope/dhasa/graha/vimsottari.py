@@ -22,13 +22,22 @@
 """
 Calculates Vimshottari (=120) Dasha-bhukthi-antara-sukshma-prana
 """
+from functools import partial
 from collections import OrderedDict as Dict
 from jhora import const,utils
 from jhora.panchanga import drik
+from jhora.horoscope.dhasa import timeline
 year_duration = const.sidereal_year #const.tropical_year #  # some say 360 days, others 365.25 or 365.2563 etc
 vimsottari_adhipati = lambda nak,seed_star=3: const.vimsottari_adhipati_list[(nak-seed_star+3) % (len(const.vimsottari_adhipati_list))]
-vimsottari_dict = const.vimsottari_dict
-human_life_span_for_vimsottari_dhasa = const.human_life_span_for_vimsottari_dhasa
+_tribhagi_factor = 1./3.
+""" Read-only dhasa tables - shared by all calls (and threads). Choose one with _get_dhasa_table """
+vimsottari_table = timeline.dhasa_table(const.vimsottari_dict, const.human_life_span_for_vimsottari_dhasa)
+tribhagi_vimsottari_table = timeline.dhasa_table({k:round(v*_tribhagi_factor,2) for k,v in const.vimsottari_dict.items()},
+                                                 const.human_life_span_for_vimsottari_dhasa*_tribhagi_factor)
+vimsottari_dict = vimsottari_table.periods
+human_life_span_for_vimsottari_dhasa = vimsottari_table.life_span
+def _get_dhasa_table(use_tribhagi_variation=False):
+    return tribhagi_vimsottari_table if use_tribhagi_variation else vimsottari_table
 ### --- Vimoshatari functions
 def vimsottari_next_adhipati(lord,dir=1):
     """Returns next guy after `lord` in the adhipati_list"""
@@ -37,7 +46,7 @@ def vimsottari_next_adhipati(lord,dir=1):
     return const.vimsottari_adhipati_list[next_index]
 
 def vimsottari_dasha_start_date(jd,place,divisional_chart_factor=1,chart_method=1,star_position_from_moon=1,seed_star=3,
-                                dhasa_starting_planet=1):
+                                dhasa_starting_planet=1,dhasa_table=vimsottari_table):
     """Returns the start date of the mahadasa which occured on or before `jd`"""
     y,m,d,fh = utils.jd_to_gregorian(jd); dob=drik.Date(y,m,d); tob=(fh,0,0)
     one_star = (360 / 27.)        # 27 nakshatras span 360°
@@ -72,7 +81,7 @@ def vimsottari_dasha_start_date(jd,place,divisional_chart_factor=1,chart_method=
         planet_long += (star_position_from_moon-1)*one_star
     nak = int(planet_long / one_star); rem = (planet_long - nak * one_star)
     lord = vimsottari_adhipati(nak,seed_star)          # ruler of current nakshatra
-    period = vimsottari_dict[lord]       # total years of nakshatra lord
+    period = dhasa_table.periods[lord]       # total years of nakshatra lord
     #print('seed_star,nak,lord,period',seed_star,nak,lord,period)
     period_elapsed = rem / one_star * period # years
     period_elapsed *= year_duration        # days
@@ -80,29 +89,29 @@ def vimsottari_dasha_start_date(jd,place,divisional_chart_factor=1,chart_method=
     return [lord, start_date]
 
 def vimsottari_mahadasa(jd,place,divisional_chart_factor=1,chart_method=1,star_position_from_moon=1,
-                        seed_star=3,dhasa_starting_planet=1):
+                        seed_star=3,dhasa_starting_planet=1,dhasa_table=vimsottari_table):
     """List all mahadashas and their start dates"""
     lord, start_date = vimsottari_dasha_start_date(jd,place,divisional_chart_factor=divisional_chart_factor,
                             chart_method=chart_method,star_position_from_moon=star_position_from_moon,seed_star=seed_star,
-                            dhasa_starting_planet=dhasa_starting_planet)
+                            dhasa_starting_planet=dhasa_starting_planet,dhasa_table=dhasa_table)
     retval = Dict()
     for i in range(9):
         retval[lord] = start_date
-        start_date += vimsottari_dict[lord] * year_duration
+        start_date += dhasa_table.periods[lord] * year_duration
         lord = vimsottari_next_adhipati(lord)
 
     return retval
-def _vimsottari_rasi_bhukthi(maha_lord,maha_lord_rasi,start_date):
+def _vimsottari_rasi_bhukthi(maha_lord,maha_lord_rasi,start_date,dhasa_table=vimsottari_table):
     """Compute all bhuktis of given nakshatra-lord of Mahadasa using rasi bhukthi variation
     and its start date"""
     retval = Dict()
-    bhukthi_duration = vimsottari_dict[maha_lord]/12
+    bhukthi_duration = dhasa_table.periods[maha_lord]/12
     for bhukthi_rasi in [(maha_lord_rasi+h)%12 for h in range(12)]:
         retval[bhukthi_rasi] = start_date
         start_date += bhukthi_duration * year_duration
     return retval
     
-def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
+def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1,dhasa_table=vimsottari_table):
     """Compute all bhuktis of given nakshatra-lord of Mahadasa
     and its start date"""
     lord = maha_lord
@@ -114,7 +123,7 @@ def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
     retval = Dict()
     for i in range(9):
         retval[lord] = start_date
-        factor = vimsottari_dict[lord] * vimsottari_dict[maha_lord] / human_life_span_for_vimsottari_dhasa
+        factor = dhasa_table.periods[lord] * dhasa_table.periods[maha_lord] / dhasa_table.life_span
         start_date += factor * year_duration
         lord = vimsottari_next_adhipati(lord,dir)
 
@@ -122,21 +131,70 @@ def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
 
 # North Indian tradition: dasa-antardasa-pratyantardasa
 # South Indian tradition: dasa-bhukti-antara-sukshma
-def _vimsottari_antara(maha_lord, bhukti_lord, start_date):
+def _vimsottari_antara(maha_lord, bhukti_lord, start_date,dhasa_table=vimsottari_table):
     """Compute all antaradasas from given bhukit's start date.
     The bhukti's lord and its lord (mahadasa lord) must be given"""
     lord = bhukti_lord
     retval = Dict()
     for i in range(9):
         retval[lord] = start_date
-        factor = vimsottari_dict[lord] * (vimsottari_dict[maha_lord] / human_life_span_for_vimsottari_dhasa)
-        factor *= (vimsottari_dict[bhukti_lord] / human_life_span_for_vimsottari_dhasa)
+        factor = dhasa_table.periods[lord] * (dhasa_table.periods[maha_lord] / dhasa_table.life_span)
+        factor *= (dhasa_table.periods[bhukti_lord] / dhasa_table.life_span)
         start_date += factor * year_duration
         lord = vimsottari_next_adhipati(lord)
 
     return retval
 
 
+def _vimsottari_sub_periods(lords,start_jd,end_jd,antardhasa_option=1,rasi_of_planets=None,
+                            dhasa_table=vimsottari_table):
+    """
+        Sub periods of a vimsottari period - used by vimsottari_dhasa_timeline
+        @param lords: (dhasa lord,) for bhukthis, (dhasa lord, bhukthi lord) for antaras and so on
+        @param rasi_of_planets: {planet:rasi} for rasi bhukthi variation (which has no antaras). None otherwise
+        @return: (sub_lords,sub_start_jds) or None if there are no sub periods
+    """
+    if len(lords)==1:
+        bhuktis = _vimsottari_bhukti(lords[0], start_jd,antardhasa_option=antardhasa_option,dhasa_table=dhasa_table) \
+                    if rasi_of_planets is None \
+                    else _vimsottari_rasi_bhukthi(lords[0], rasi_of_planets[lords[0]], start_jd,dhasa_table=dhasa_table)
+        return list(bhuktis.keys()),list(bhuktis.values())
+    if rasi_of_planets is not None: return None
+    if len(lords)==2:
+        antara = _vimsottari_antara(lords[0], lords[1], start_jd,dhasa_table=dhasa_table)
+        return list(antara.keys()),list(antara.values())
+    # sookshma, prana...: period divided in proportion to the dhasa years, starting from its own lord
+    lord = lords[-1]; duration = end_jd - start_jd
+    sub_lords = []; sub_start_jds = []
+    for _ in range(len(const.vimsottari_adhipati_list)):
+        sub_lords.append(lord); sub_start_jds.append(start_jd)
+        start_jd += duration * dhasa_table.periods[lord] / dhasa_table.life_span
+        lord = vimsottari_next_adhipati(lord)
+    return sub_lords,sub_start_jds
+def vimsottari_dhasa_timeline(jd,place,star_position_from_moon=1,use_rasi_bhukthi_variation=False,
+                              divisional_chart_factor=1,chart_method=1,seed_star=3,antardhasa_option=1,
+                              dhasa_starting_planet=1,use_tribhagi_variation=False):
+    """
+        Vimsottari dhasa as numeric timeline. Sub periods of any depth are computed only when asked for
+        Example: vimsottari_dhasa_timeline(jd,place).lords_at(current_jd,depth=3)
+                    => (dhasa lord, bhukthi lord, antara lord) running at current_jd
+        @param: See get_vimsottari_dhasa_bhukthi for the parameters
+        @return: timeline.DhasaTimeline of maha dhasas
+    """
+    dhasa_table = _get_dhasa_table(use_tribhagi_variation)
+    dashas = vimsottari_mahadasa(jd,place,divisional_chart_factor=divisional_chart_factor,chart_method=chart_method,
+                                 star_position_from_moon=star_position_from_moon,seed_star=seed_star,
+                                 dhasa_starting_planet=dhasa_starting_planet,dhasa_table=dhasa_table)
+    lords = list(dashas.keys()); start_jds = list(dashas.values())
+    end_jd = start_jds[-1] + dhasa_table.periods[lords[-1]] * year_duration
+    rasi_of_planets = None
+    if use_rasi_bhukthi_variation:
+        from jhora.horoscope.chart import charts
+        planet_positions = charts.divisional_chart(jd, place,divisional_chart_factor=1)
+        rasi_of_planets = {p:h for p,(h,_) in planet_positions[1:]}
+    sub_periods = partial(_vimsottari_sub_periods,antardhasa_option=antardhasa_option,rasi_of_planets=rasi_of_planets,
+                          dhasa_table=dhasa_table)
+    return timeline.DhasaTimeline(lords, start_jds, end_jd, sub_periods=sub_periods)
 def _where_occurs(jd, some_dict):
     """Returns minimum key such that some_dict[key] < jd"""
     # It is assumed that the dict is sorted in ascending order
@@ -191,49 +249,22 @@ def get_vimsottari_dhasa_bhukthi(jd,place,star_position_from_moon=1,use_tribhagi
         @return: a list of [dhasa_lord,dhasa_start] if include_antardhasa=False
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
-    global human_life_span_for_vimsottari_dhasa
     # jd is julian date with birth time included
-    _dhasa_cycles = 1
-    _tribhagi_factor = 1
-    if use_tribhagi_variation:
-        _tribhagi_factor = 1./3.
-        _dhasa_cycles = int(_dhasa_cycles/_tribhagi_factor)
-        human_life_span_for_vimsottari_dhasa *= _tribhagi_factor
-        for k,v in vimsottari_dict.items():
-            vimsottari_dict[k] = round(v*_tribhagi_factor,2)
-    dashas = vimsottari_mahadasa(jd,place,divisional_chart_factor=divisional_chart_factor,chart_method=chart_method,
-                                 star_position_from_moon=star_position_from_moon,seed_star=seed_star,
-                                 dhasa_starting_planet=dhasa_starting_planet)
-    dl = list(dashas.values()); de = dl[1]
+    _dhasa_cycles = int(1/_tribhagi_factor) if use_tribhagi_variation else 1
+    dhasa_timeline = vimsottari_dhasa_timeline(jd,place,star_position_from_moon=star_position_from_moon,
+                                use_rasi_bhukthi_variation=use_rasi_bhukthi_variation,
+                                divisional_chart_factor=divisional_chart_factor,chart_method=chart_method,
+                                seed_star=seed_star,antardhasa_option=antardhasa_option,
+                                dhasa_starting_planet=dhasa_starting_planet,
+                                use_tribhagi_variation=use_tribhagi_variation)
+    de = float(dhasa_timeline.start_jds[1])
     y,m,h,_ = utils.jd_to_gregorian(jd); p_date1 = drik.Date(y,m,h)
     y,m,h,_ = utils.jd_to_gregorian(de); p_date2 = drik.Date(y,m,h)
     vim_bal = utils.panchanga_date_diff(p_date1, p_date2)
     #print('dasha lords',dashas)
     dhasa_bukthi=[]
     for _ in range(_dhasa_cycles):
-        for i in dashas:
-            dhasa_lord = i
-            if include_antardhasa:
-                if use_rasi_bhukthi_variation:
-                    from jhora.horoscope.chart import charts
-                    planet_positions = charts.divisional_chart(jd, place,divisional_chart_factor=1)
-                    maha_lord_rasi= planet_positions[i+1][1][0]
-                    bhuktis = _vimsottari_rasi_bhukthi(i, maha_lord_rasi, dashas[i])
-                else:
-                    bhuktis = _vimsottari_bhukti(i, dashas[i],antardhasa_option=antardhasa_option)
-                for j in bhuktis:
-                    bhukthi_lord = j
-                    jd1 = bhuktis[j]
-                    y, m, d, h = utils.jd_to_gregorian(jd1)
-                    """ TODO: Need to figure out passing date and time string to UI, main.py and pvr_tests.py """
-                    date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
-                    dhasa_bukthi.append([dhasa_lord,bhukthi_lord,date_str]) 
-                    #dhasa_bukthi[i][j] = [dhasa_lord,bhukthi_lord,bhukthi_start]
-            else:
-                jd1 = dashas[i]
-                y, m, d, h = utils.jd_to_gregorian(jd1)
-                date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
-                dhasa_bukthi.append([dhasa_lord,date_str]) 
+        dhasa_bukthi += dhasa_timeline.to_list(depth=2 if include_antardhasa else 1)
     return vim_bal,dhasa_bukthi
 
 '------ main -----------'
@@ -24,13 +24,22 @@ Calculates Yoga Vimsottari
 from collections import OrderedDict as Dict
 from jhora import const,utils
 from jhora.panchanga import drik
+from jhora.horoscope.dhasa import timeline
 sidereal_year = const.sidereal_year #const.savana_year #  # some say 360 days, others 365.25 or 365.2563 etc
-vimsottari_dict = { 8:[(3,12,21), 7], 5: [(4,13,22),20], 0:[(5,14,23), 6], 1:[(6,15,24), 10], 2:[(7,16,25), 7], 
+_tribhagi_factor = 1./3.
+_vimsottari_dict = { 8:[(3,12,21), 7], 5: [(4,13,22),20], 0:[(5,14,23), 6], 1:[(6,15,24), 10], 2:[(7,16,25), 7], 
                    7:[(8,17,26), 18], 4:[(9,18,27), 16], 6:[(1,10,19), 19], 3:[(2,11,20), 17] }
-human_life_span_for_vimsottari_dhasa = const.human_life_span_for_vimsottari_dhasa
+""" Read-only dhasa tables - shared by all calls (and threads). Choose one with _get_dhasa_table """
+vimsottari_table = timeline.dhasa_table(_vimsottari_dict, const.human_life_span_for_vimsottari_dhasa)
+tribhagi_vimsottari_table = timeline.dhasa_table({k:[v1,round(v2*_tribhagi_factor,2)] for k,(v1,v2) in _vimsottari_dict.items()},
+                                                 const.human_life_span_for_vimsottari_dhasa*_tribhagi_factor)
+vimsottari_dict = vimsottari_table.periods
+human_life_span_for_vimsottari_dhasa = vimsottari_table.life_span
+def _get_dhasa_table(use_tribhagi_variation=False):
+    return tribhagi_vimsottari_table if use_tribhagi_variation else vimsottari_table
 ### --- Vimoshatari functions
-def vimsottari_adhipathi(yoga_index):
-    for key,(yoga_list,durn) in vimsottari_dict.items():
+def vimsottari_adhipathi(yoga_index,dhasa_table=vimsottari_table):
+    for key,(yoga_list,durn) in dhasa_table.periods.items():
         if yoga_index in yoga_list:
             return key,durn 
 def vimsottari_next_adhipati(lord,dirn=1):
@@ -39,29 +48,29 @@ def vimsottari_next_adhipati(lord,dirn=1):
     next_index = (current + dirn) % len(const.vimsottari_adhipati_list)
     return const.vimsottari_adhipati_list[next_index]
 
-def vimsottari_dasha_start_date(jd,place):
+def vimsottari_dasha_start_date(jd,place,dhasa_table=vimsottari_table):
     """Returns the start date of the mahadasa which occured on or before `jd`"""
     _,_,_,birth_time_hrs = utils.jd_to_gregorian(jd)
     _yoga = drik.yogam(jd, place)
     y_frac = utils.get_fraction(_yoga[1], _yoga[2], birth_time_hrs)
     #print('yoga',_yoga,'birth_time_hrs',birth_time_hrs,'yoga_fracion',y_frac)
-    lord,res = vimsottari_adhipathi(_yoga[0])          # ruler of current nakshatra
+    lord,res = vimsottari_adhipathi(_yoga[0],dhasa_table=dhasa_table)          # ruler of current nakshatra
     period_elapsed = (1-y_frac)*res*sidereal_year
     start_jd = jd - period_elapsed      # so many days before current day
     #print('lord,res,period_elapsed,start_date',lord,res,period_elapsed,utils.jd_to_gregorian(start_date))
     return [lord, start_jd]
 
-def vimsottari_mahadasa(jdut1,place):
+def vimsottari_mahadasa(jdut1,place,dhasa_table=vimsottari_table):
     """List all mahadashas and their start dates"""
-    lord, start_date = vimsottari_dasha_start_date(jdut1,place)
+    lord, start_date = vimsottari_dasha_start_date(jdut1,place,dhasa_table=dhasa_table)
     retval = Dict()
     for i in range(9):
-        retval[lord] = start_date; lord_duration = vimsottari_dict[lord][1]
+        retval[lord] = start_date; lord_duration = dhasa_table.periods[lord][1]
         start_date += lord_duration * sidereal_year
         lord = vimsottari_next_adhipati(lord)
     return retval
 
-def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
+def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1,dhasa_table=vimsottari_table):
     """Compute all bhuktis of given nakshatra-lord of Mahadasa
     and its start date"""
     lord = maha_lord
@@ -70,11 +79,11 @@ def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
     elif antardhasa_option in [5,6]:
         lord = vimsottari_next_adhipati(lord, dirn=-1) 
     dirn = 1 if antardhasa_option in [1,3,5] else -1
-    dhasa_lord_duration = vimsottari_dict[maha_lord][1]
+    dhasa_lord_duration = dhasa_table.periods[maha_lord][1]
     retval = Dict()
-    for _ in range(len(vimsottari_dict)):
-        retval[lord] = start_date; bhukthi_duration = vimsottari_dict[lord][1]
-        factor = bhukthi_duration * dhasa_lord_duration / human_life_span_for_vimsottari_dhasa
+    for _ in range(len(dhasa_table.periods)):
+        retval[lord] = start_date; bhukthi_duration = dhasa_table.periods[lord][1]
+        factor = bhukthi_duration * dhasa_lord_duration / dhasa_table.life_span
         start_date += factor * sidereal_year
         lord = vimsottari_next_adhipati(lord,dirn)
 
@@ -82,15 +91,15 @@ def _vimsottari_bhukti(maha_lord, start_date,antardhasa_option=1):
 
 # North Indian tradition: dasa-antardasa-pratyantardasa
 # South Indian tradition: dasa-bhukti-antara-sukshma
-def _vimsottari_antara(maha_lord, bhukti_lord, start_date):
+def _vimsottari_antara(maha_lord, bhukti_lord, start_date,dhasa_table=vimsottari_table):
     """Compute all antaradasas from given bhukit's start date.
     The bhukti's lord and its lord (mahadasa lord) must be given"""
     lord = bhukti_lord
     retval = Dict()
     for _ in range(9):
         retval[lord] = start_date
-        factor = vimsottari_dict[lord] * (vimsottari_dict[maha_lord] / human_life_span_for_vimsottari_dhasa)
-        factor *= (vimsottari_dict[bhukti_lord] / human_life_span_for_vimsottari_dhasa)
+        factor = dhasa_table.periods[lord][1] * (dhasa_table.periods[maha_lord][1] / dhasa_table.life_span)
+        factor *= (dhasa_table.periods[bhukti_lord][1] / dhasa_table.life_span)
         start_date += factor * sidereal_year
         lord = vimsottari_next_adhipati(lord)
 
@@ -118,7 +127,7 @@ def compute_vimsottari_antara_from(jd, mahadashas):
     antara = _vimsottari_antara(i, j, bhuktis[j])
     return (i, j, antara)
 
-def get_dhasa_bhukthi(jd,place,use_tribhagi_variation=False,antardhasa_option=1):
+def get_dhasa_bhukthi(jd,place,use_tribhagi_variation=False,antardhasa_option=1,start_as_julian_day=False):
     """
         provides Yoga Vimsottari dhasa bhukthi for a given date in julian day (includes birth time)
         This is vimsottari but based on yogam instead of nakshathra
@@ -132,21 +141,15 @@ def get_dhasa_bhukthi(jd,place,use_tribhagi_variation=False,antardhasa_option=1)
             4 => next dhasa lord - backward
             5 => prev dhasa lord - forward
             6 => prev dhasa lord - backward
+        @param start_as_julian_day: True => start of the periods as julian day numbers. Default=False (date strings)
         @return: a list of [dhasa_lord,bhukthi_lord,bhukthi_start] if include_antardhasa=True
         @return: a list of [dhasa_lord,dhasa_start] if include_antardhasa=False
           Example: [ [7, 5, '1915-02-09'], [7, 0, '1917-06-10'], [7, 1, '1918-02-08'],...]
     """
-    global human_life_span_for_vimsottari_dhasa
-    _dhasa_cycles = 1
-    _tribhagi_factor = 1
-    if use_tribhagi_variation:
-        _tribhagi_factor = 1./3.
-        _dhasa_cycles = int(_dhasa_cycles/_tribhagi_factor)
-        human_life_span_for_vimsottari_dhasa *= _tribhagi_factor
-        for k,v in vimsottari_dict.items():
-            vimsottari_dict[k] = round(v*_tribhagi_factor,2)
+    _dhasa_cycles = int(1/_tribhagi_factor) if use_tribhagi_variation else 1
+    dhasa_table = _get_dhasa_table(use_tribhagi_variation)
     _,_,_,tz = place
-    dashas = vimsottari_mahadasa(jd,place)#V4.2.9
+    dashas = vimsottari_mahadasa(jd,place,dhasa_table=dhasa_table)#V4.2.9
     dl = list(dashas.values()); de = dl[1]
     y,m,h,_ = utils.jd_to_gregorian(jd); p_date1 = drik.Date(y,m,h)
     y,m,h,_ = utils.jd_to_gregorian(de); p_date2 = drik.Date(y,m,h)
@@ -154,15 +157,12 @@ def get_dhasa_bhukthi(jd,place,use_tribhagi_variation=False,antardhasa_option=1)
     dhasa_bukthi=[]
     for _ in range(_dhasa_cycles):
         for i in dashas:
-            bhuktis = _vimsottari_bhukti(i, dashas[i],antardhasa_option=antardhasa_option)
+            bhuktis = _vimsottari_bhukti(i, dashas[i],antardhasa_option=antardhasa_option,dhasa_table=dhasa_table)
             dhasa_lord = i
             for j in bhuktis:
                 bhukthi_lord = j
                 jd1 = bhuktis[j]
-                y, m, d, h = utils.jd_to_gregorian(jd1)
-                """ TODO: Need to figure out passing date and time string to UI, main.py and pvr_tests.py """
-                date_str = '%04d-%02d-%02d' %(y,m,d)+' '+utils.to_dms(h,as_string=True)
-                bhukthi_start = date_str
+                bhukthi_start = jd1 if start_as_julian_day else utils.julian_day_to_date_time_string(jd1)
                 dhasa_bukthi.append([dhasa_lord,bhukthi_lord,bhukthi_start]) 
     return vim_bal,dhasa_bukthi
 
@@ -67,7 +67,7 @@ def _dhasa_duration(lord):
 def get_dhasa_antardhasa(dob,tob,place,divisional_chart_factor=1,years=1,months=1,sixty_hours=1,include_antardhasa=True):
     method = 2 # KN Rao Method - Working 1=< Sanjay Rath - yet to be implemented
     jd_at_dob = utils.julian_day_number(dob, tob)
-    planet_positions = charts.divisional_chart(jd_at_dob, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, 
+    planet_positions = charts.divisional_chart(jd_at_dob, place, ayanamsa_mode=drik.get_ayanamsa_mode(), 
                                                divisional_chart_factor=divisional_chart_factor, years=years, 
                                                months=months, sixty_hours=sixty_hours)
     asc_house = planet_positions[0][1][0] ; seventh_house = (asc_house+6)%12
@@ -20,10 +20,11 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """ Called Nirayana or Nirayana Shoola Dhasa """
 from jhora import const, utils
+from jhora.panchanga import drik
 from jhora.horoscope.chart import house,charts
 def nirayana_shoola_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,include_antardhasa=True):
     jd = utils.julian_day_number(dob,tob)
-    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=drik.get_ayanamsa_mode(), divisional_chart_factor=divisional_chart_factor)
     return nirayana_shoola_dhasa(planet_positions,dob,tob,include_antardhasa)
 def nirayana_shoola_dhasa(planet_positions,dob,tob,include_antardhasa=True):
     """
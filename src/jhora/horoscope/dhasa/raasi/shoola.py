@@ -19,11 +19,12 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from jhora import const, utils
+from jhora.panchanga import drik
 from jhora.horoscope.chart import house,charts
 """ This is different from Nirayana Shoola Dhasa """
 def shoola_dhasa_bhukthi(dob,tob,place,divisional_chart_factor=1,include_antardhasa=True):
     jd = utils.julian_day_number(dob,tob)
-    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE, divisional_chart_factor=divisional_chart_factor)
+    planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=drik.get_ayanamsa_mode(), divisional_chart_factor=divisional_chart_factor)
     return shoola_dhasa(planet_positions,dob,tob,include_antardhasa=include_antardhasa)
 def shoola_dhasa(planet_positions,dob,tob,include_antardhasa=True):
     """
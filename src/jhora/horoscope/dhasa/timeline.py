@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Copyright (C) Open Astro Technologies, USA.
+# Modified by Sundar Sundaresan, USA. carnaticmusicguru2015@comcast.net
+# Downloaded from https://github.com/naturalstupid/PyJHora
+
+# This file is part of the "PyJHora" Python library
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+    Numeric dhasa timeline - lords and start julian days of the dhasa periods as numpy arrays
+    Sub periods (bhukthi, antara, sookshma, prana...) are generated only for the periods that are asked for
+    Point-in-time lookups are binary searches on the start julian days
+    Date strings are made only by to_list (the presentation format of get_*_dhasa_bhukthi functions)
+    DhasaTable - read-only table of dhasa periods (normal, tribhagi...) shared by all calls of a dhasa module
+"""
+import bisect
+from collections import namedtuple as struct
+from types import MappingProxyType
+import numpy as np
+from jhora import utils
+dhasa_level_names = ['maha','antar','pratyantar','sookshma','prana','deha']
+""" 
+    periods: read-only {dhasa_lord:dhasa_period_info} (period info is module specific - years or [stars,years] etc)
+    life_span: total years of the dhasa cycle (120 for vimsottari, 108 for ashtottari etc)
+"""
+DhasaTable = struct('DhasaTable',['periods','life_span'])
+def dhasa_table(periods,life_span):
+    """
+        @param periods: {dhasa_lord:dhasa_period_info}. list values are stored as tuples 
+        @param life_span: total years of the dhasa cycle
+        @return: DhasaTable with a read-only copy of periods
+    """
+    return DhasaTable(MappingProxyType({k:tuple(v) if isinstance(v,list) else v for k,v in periods.items()}),life_span)
+class DhasaTimeline:
+    """
+        Dhasa periods of one level - maha dhasas or the sub periods of one parent period
+        @param lords: lords of the periods in the order of their start (int or const._ascendant_symbol)
+        @param start_jds: start julian days of the periods (ascending)
+        @param end_jd: end julian day of the last period. None => last period is open ended (end julian day is inf)
+        @param sub_periods: function(lords,start_jd,end_jd) returning (sub_lords,sub_start_jds) of a period
+            lords is the tuple of lords from maha dhasa down to the period. Return None if it has no sub periods
+        @param parent_lords: lords of the parent periods from maha dhasa (empty for maha dhasa timeline)
+    """
+    def __init__(self,lords,start_jds,end_jd,sub_periods=None,parent_lords=()):
+        self._lords = list(lords)
+        self.lords = np.asarray(self._lords) if all(isinstance(l,(int,np.integer)) for l in self._lords) \
+                        else np.array(self._lords,dtype=object)
+        self.start_jds = np.asarray(start_jds,dtype=float)
+        self.end_jds = np.append(self.start_jds[1:],np.inf if end_jd is None else end_jd)
+        self.parent_lords = tuple(parent_lords)
+        self._start_jds = self.start_jds.tolist()
+        self._sub_periods = sub_periods
+        self._sub_timelines = {}
+    @property
+    def level(self):
+        """ 1=maha dhasa, 2=antar (bhukthi), 3=pratyantar (antara), 4=sookshma, 5=prana... See dhasa_level_names """
+        return len(self.parent_lords)+1
+    def __len__(self):
+        return len(self._start_jds)
+    def index_at(self,jd):
+        """ @return: index of the period in which jd falls. -1 if jd is outside the timeline """
+        i = bisect.bisect_right(self._start_jds, jd)-1
+        return i if i >= 0 and jd < self.end_jds[i] else -1
+    def sub_timeline(self,index):
+        """ @return: DhasaTimeline of the sub periods of the period at index (None if it has no sub periods) """
+        if index not in self._sub_timelines:
+            lords = self.parent_lords+(self._lords[index],)
+            start_jd = self._start_jds[index]; end_jd = float(self.end_jds[index])
+            sp = None if self._sub_periods is None else self._sub_periods(lords,start_jd,end_jd)
+            self._sub_timelines[index] = None if sp is None else \
+                                DhasaTimeline(sp[0],sp[1],end_jd,sub_periods=self._sub_periods,parent_lords=lords)
+        return self._sub_timelines[index]
+    def periods_at(self,jd,depth=2):
+        """
+            Running periods at given julian day
+            @param jd: julian day number
+            @param depth: 1=maha dhasa only, 2=upto bhukthi, 3=upto antara and so on
+            @return: [(lord,start_jd,end_jd),...] one per level from maha dhasa. Empty if jd is outside the timeline
+        """
+        periods = []; timeline = self
+        while timeline is not None and len(periods) < depth:
+            i = timeline.index_at(jd)
+            if i < 0: break
+            periods.append((timeline._lords[i],timeline._start_jds[i],float(timeline.end_jds[i])))
+            timeline = timeline.sub_timeline(i) if len(periods) < depth else None
+        return periods
+    def lords_at(self,jd,depth=2):
+        """ @return: tuple of lords (dhasa lord, bhukthi lord...) running at jd - see periods_at """
+        return tuple(lord for lord,_,_ in self.periods_at(jd, depth))
+    def periods(self,depth=1):
+        """ Generates (lords,start_jd) of all periods down to depth. lords is the tuple of lords from maha dhasa """
+        for i in range(len(self)):
+            sub = self.sub_timeline(i) if depth > 1 else None
+            if sub is None:
+                yield self.parent_lords+(self._lords[i],), self._start_jds[i]
+            else:
+                yield from sub.periods(depth-1)
+    def to_arrays(self,depth=1):
+        """ @return: (lords,start_jds) numpy arrays of all periods down to depth. lords has one column per level """
+        rows = list(self.periods(depth))
+        return np.array([lords for lords,_ in rows]), np.array([start_jd for _,start_jd in rows])
+    def to_list(self,depth=1):
+        """
+            @return: [[dhasa_lord,bhukthi_lord,...,'YYYY-MM-DD hh:mm:ss'],...]
+                same format as the get_*_dhasa_bhukthi functions
+        """
+        return [[*lords,utils.julian_day_to_date_time_string(start_jd)] for lords,start_jd in self.periods(depth)]
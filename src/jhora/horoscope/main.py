@@ -29,6 +29,7 @@
 """
 import swisseph as swe
 from datetime import date
+from functools import wraps
 from jhora import const, utils
 from jhora.panchanga import drik, surya_sidhantha
 from jhora.horoscope.chart import house,charts
@@ -37,6 +38,22 @@ _lang_path = const._LANGUAGE_PATH
 chara_karakas = ['atma_karaka','amatya_karaka','bhratri_karaka','maitri_karaka','pitri_karaka','putra_karaka','jnaati_karaka','data_karaka']
 
 dhasavarga_dict = {}
+def _with_ayanamsa_setting(method):
+    """ Run the Horoscope method under the horoscope's own (context local) ayanamsa setting """
+    @wraps(method)
+    def _method(self,*args,**kwargs):
+        with self.ayanamsa_scope():
+            return method(self,*args,**kwargs)
+    return _method
+""" Horoscope sections: name -> (Horoscope method computing it, method arguments, sections it depends on) """
+_horoscope_sections = {'calendar_info':('get_calendar_information',(),()),
+                       'bhava_chart':('_get_bhava_chart_section',(),()),
+                       'planet_positions':('_get_planet_positions_section',(),()),
+                       'retrograde_planets':('_get_retrograde_planets_section',(),()),
+                       'D1':('_get_rasi_information_section',(),('planet_positions','retrograde_planets')),
+                       }
+_horoscope_sections.update({'D'+str(dcf):('_get_varga_information_section',(dcf,),('retrograde_planets',))
+                            for dcf in const.division_chart_factors[1:]})
 class Horoscope():  
     def __init__(self,place_with_country_code:str=None,latitude:float=None,longitude:float=None,timezone_offset:float=None,
                  date_in:drik.Date=None,birth_time:str=None,ayanamsa_mode:str="TRUE_CITRA",ayanamsa_value:float=None,
@@ -96,21 +113,101 @@ class Horoscope():
             calculation_type = 'drik'
         self.calculation_type = calculation_type.lower()
         self.ayanamsa_mode = ayanamsa_mode.upper()
-        """ Force Surya sidhantha ayanamsa for SS calculation type"""
-        if self.calculation_type == 'ss':
-            print('Horoscope:main: Forcing ayanamsa to SURYASIDDHANTA for the SURYA SIDDHANTA calculation type')
-            drik.set_ayanamsa_mode('SURYASIDDHANTA')
-            self.ayanamsa_mode = 'SURYASIDDHANTA'
-        else:
-            drik.set_ayanamsa_mode(ayanamsa_mode,ayanamsa_value,self.julian_day)
-        self.ayanamsa_value = drik.get_ayanamsa_value(self.julian_day)
+        with drik.ayanamsa_setting():
+            """ Force Surya sidhantha ayanamsa for SS calculation type"""
+            if self.calculation_type == 'ss':
+                print('Horoscope:main: Forcing ayanamsa to SURYASIDDHANTA for the SURYA SIDDHANTA calculation type')
+                drik.set_ayanamsa_mode('SURYASIDDHANTA')
+                self.ayanamsa_mode = 'SURYASIDDHANTA'
+            else:
+                drik.set_ayanamsa_mode(ayanamsa_mode,ayanamsa_value,self.julian_day)
+            self.ayanamsa_value = drik.get_ayanamsa_value(self.julian_day)
+            self._ayanamsa_setting = drik.get_ayanamsa_setting()
+        """ Caller's (global or context local) ayanamsa follows the horoscope as before """
+        drik.set_ayanamsa_mode(self._ayanamsa_setting.mode,self._ayanamsa_setting.value,self.julian_day)
         self.years = years; self.months=months; self.sixty_hours=sixty_hours
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
-        self.julian_years = drik.next_solar_date(self.julian_day, place, years, months, sixty_hours)
-        self.julian_years_utc = utils.julian_day_utc(self.julian_day,self.Place)
-        self.calendar_info = self.get_calendar_information()
-        self.bhava_chart,self.bhava_chart_info = self.get_bhava_chart_information(self.julian_years,place,self._bhava_madhya_method)
+        with self.ayanamsa_scope():
+            self.julian_years = drik.next_solar_date(self.julian_day, place, years, months, sixty_hours)
+            self.julian_years_utc = utils.julian_day_utc(self.julian_day,self.Place)
+        self._ascendant_str = self.cal_key_list['ascendant_str']
+        """ Sections (calendar_info, bhava_chart, D1..D144 etc) are computed on first access and cached """
+        self._sections = {}
+        self._arudha_lagna_data = {}
+        self._sphuta_data = {}
+        self._graha_lagna_data = {}
+        self._hora_lagna_data = {}; self._ghati_lagna_data = {}; self._vighati_lagna_data = {}
+        self._pranapada_lagna_data = {}; self._indu_lagna_data = {}; self._bhrigu_bindhu_lagna_data = {}
+        self._bhava_lagna_data = {}; self._sree_lagna_data = {}; self._kunda_lagna_data = {}
+        self._varnada_lagna_data = {}
+        self._maandhi_data = {}
         return
+    @property
+    def sections(self):
+        """ Names of the sections that can be computed with compute() """
+        return list(_horoscope_sections.keys())
+    def _get_section(self,section):
+        """ Compute section (and sections it depends on) once and return the cached value """
+        if section not in self._sections:
+            if section not in _horoscope_sections:
+                raise ValueError('Horoscope section '+str(section)+' not in '+str(list(_horoscope_sections.keys())))
+            method,args,depends_on = _horoscope_sections[section]
+            for dependency in depends_on:
+                self._get_section(dependency)
+            self._sections[section] = getattr(self,method)(*args)
+        return self._sections[section]
+    def compute(self,sections=None):
+        """
+            Compute and cache horoscope sections in advance (warm up)
+            Example: h.compute(['calendar_info','D1','D9'])
+            @param sections: list of section names (see Horoscope.sections). Default=None => all sections
+            @return: self
+        """
+        for section in (self.sections if sections is None else sections):
+            self._get_section(section)
+        return self
+    @property
+    def calendar_info(self):
+        return self._get_section('calendar_info')
+    @property
+    def bhava_chart(self):
+        return self._get_section('bhava_chart')[0]
+    @property
+    def bhava_chart_info(self):
+        return self._get_section('bhava_chart')[1]
+    @property
+    def planet_positions(self):
+        """ Rasi (D1) planet positions of the horoscope """
+        return self._get_section('planet_positions')
+    @property
+    def retrograde_planets(self):
+        return self._get_section('retrograde_planets')
+    def _get_bhava_chart_section(self):
+        return self.get_bhava_chart_information(self.julian_years,self.Place,self._bhava_madhya_method)
+    @_with_ayanamsa_setting
+    def _get_planet_positions_section(self):
+        """ TODO: 
+            Planet Positions return type should match for both Drik and SS
+            SS does not have Lagna/Ascendant in planet positions - should be included
+            retrograde depends on return types of planet positions
+        """
+        if self.calculation_type=='ss':
+            return surya_sidhantha.planet_positions(self.julian_day, self.Place)
+        return charts.rasi_chart(self.julian_day, self.Place, ayanamsa_mode=self.ayanamsa_mode,
+                                 years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                 pravesha_type=self.pravesha_type)
+    @_with_ayanamsa_setting
+    def _get_retrograde_planets_section(self):
+        return drik.planets_in_retrograde(self.julian_day, self.Place)
+    def ayanamsa_scope(self):
+        """
+            Context manager to compute with this horoscope's ayanamsa setting without touching the global setting
+            Public get_* methods of Horoscope already run inside it. So horoscopes with different ayanamsa
+            can be computed concurrently from different threads
+            Example: with h.ayanamsa_scope(): planet_positions = charts.rasi_chart(h.julian_day, h.Place, h.ayanamsa_mode)
+        """
+        setting = self._ayanamsa_setting
+        return drik.ayanamsa_setting(setting.mode,setting.value,self.julian_day,setting.tropical)
     def _get_planet_list(self):
         return utils.PLANET_NAMES,utils.PLANET_SHORT_NAMES
     def _get_raasi_list(self):
@@ -121,6 +218,7 @@ class Horoscope():
         cal_key_list=utils._read_resource_messages_from_file(msg_file) #utils.get_resource_messages(msg_file)
         _ = utils._read_resource_lists_from_file(list_file)#utils.get_resource_lists(list_file)
         return cal_key_list
+    @_with_ayanamsa_setting
     def get_calendar_information(self):#, language='en'):
         jd = self.julian_day # self.julian_day #jd = self.julian_years #
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
@@ -226,11 +324,13 @@ class Horoscope():
         calendar_info[cal_key_list['dhurmuhurtham_str']] = _dhurmuhurtham[0] + ' '+ cal_key_list['starts_at_str']+\
                         ' '+ _dhurmuhurtham[1]+' '+cal_key_list['ends_at_str']
         return calendar_info
+    @_with_ayanamsa_setting
     def get_horoscope_chart_counter(self,chart_key):
         global dhasavarga_dict
         value_list = list(dhasavarga_dict.values())
         counter = [ index for index,value in enumerate(value_list) if chart_key in value][0]
         return counter
+    @_with_ayanamsa_setting
     def get_bhava_chart_information(self, jd,place,bhaava_madhya_method=const.bhaava_madhya_method):
         _bhava_chart_info = []; cal_key_list = self.cal_key_list; _bhava_chart = [ ''  for _ in range(len(utils.RAASI_LIST))]
         #jd = self.julian_day; place = self.Place
@@ -257,6 +357,7 @@ class Horoscope():
             _bhava_chart_info.append((key,bss,bms,bes,ps.strip()))
             h += 1
         return _bhava_chart,_bhava_chart_info
+    @_with_ayanamsa_setting
     def get_horoscope_information_for_chart(self,chart_index=0,chart_method=1,divisional_chart_factor=None,
                                             base_rasi=None,count_from_end_of_sign=None,varnada_method=1):
         horoscope_info = {}
@@ -450,6 +551,7 @@ class Horoscope():
             k = key_dhasa_factor+'-'+cal_key_list[spl+'_sphuta_str']+' '+cal_key_list['sphuta_str']
             horoscope_info[k] = utils.RAASI_LIST[vl[0]] +' '+utils.to_dms(vl[1],is_lat_long='plong') 
         return horoscope_info, horoscope_charts,horoscope_ascendant_house
+    @_with_ayanamsa_setting
     def get_special_planets_for_chart(self,jd,place,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):
         y,m,h,fh = utils.jd_to_gregorian(jd); dob = drik.Date(y,m,h); tob=(fh,0,0)
@@ -463,6 +565,7 @@ class Horoscope():
         for sp,(h,_) in spl:
             _special_planet_chart[h] += cal_key_list[sub_planet_list[sp].replace('_str','_short_str')]+'\n'
         return {cal_key_list['upagraha_str']:_special_planet_chart}
+    @_with_ayanamsa_setting
     def get_special_planets_for_mixed_chart(self,jd,place,varga_factor_1=1,chart_method_1=1,varga_factor_2=1,
                                             chart_method_2=1):
         cal_key_list = self.cal_key_list
@@ -477,6 +580,7 @@ class Horoscope():
         for sp,(h,_) in spl:
             _special_planet_chart[h] += cal_key_list[sub_planet_list[sp].replace('_str','_short_str')]+'\n'
         return {cal_key_list['upagraha_str']:_special_planet_chart}
+    @_with_ayanamsa_setting
     def get_horoscope_information_for_mixed_chart(self,chart_index_1=0,chart_method_1=1,chart_index_2=0,
                                                   chart_method_2=1,varnada_method=1):
         horoscope_info = {}
@@ -631,20 +735,9 @@ class Horoscope():
             k = key_dhasa_factor+'-'+cal_key_list[spl+'_sphuta_str']+' '+cal_key_list['sphuta_str']
             horoscope_info[k] = utils.RAASI_LIST[vl[0]] +' '+utils.to_dms(vl[1],is_lat_long='plong') 
         return horoscope_info, horoscope_charts,horoscope_ascendant_house
-    def get_horoscope_information(self):#,language='en'):
-        horoscope_info = {}
-        self._vimsottari_balance = ();self._yoga_vimsottari_balance = ()
-        self._arudha_lagna_data = {}
-        self._sphuta_data = {}
-        self._graha_lagna_data = {}
-        self._hora_lagna_data = {}; self._ghati_lagna_data = {}; self._vighati_lagna_data = {}
-        self._pranapada_lagna_data = {}; self._indu_lagna_data = {}; self._bhrigu_bindhu_lagna_data = {}
-        self._bhava_lagna_data = {}; self._sree_lagna_data = {}; self._kunda_lagna_data = {}
-        self._varnada_lagna_data = {}
-        self._maandhi_data = {}; self._aayu_dhasa_type = -1; self._kaala_dhasa_type = -1
-        cal_key_list = self.cal_key_list#self._get_calendar_resource_strings(language)
-        global dhasavarga_dict
-        dhasavarga_dict={2:cal_key_list['hora_str'],
+    def _get_dhasavarga_dict(self):
+        cal_key_list = self.cal_key_list
+        _dhasavarga_dict={2:cal_key_list['hora_str'],
                          3:cal_key_list['drekkanam_str'],
                          4:cal_key_list['chaturthamsa_str'],
                          5:cal_key_list['panchamsa_str'],
@@ -667,33 +760,26 @@ class Horoscope():
                          108:cal_key_list['ashtotharamsa_str'],
                          144:cal_key_list['dwadas_dwadasamsa_str'],
         }
-        jd = self.julian_day # V3.1.9 If Julian_Years to be used then years/months arguments should not be used
-        place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
+        return _dhasavarga_dict
+    def _get_sub_planet_lists(self):
+        sub_planet_list_1 = {'kaala_str':'kaala_longitude','mrityu_str':'mrityu_longitude','artha_str':'artha_praharaka_longitude','yama_str':'yama_ghantaka_longitude',
+                           'gulika_str':'gulika_longitude','maandi_str':'maandi_longitude'}
+        sub_planet_list_2 = ['dhuma','vyatipaata','parivesha','indrachaapa','upaketu']
+        return sub_planet_list_1,sub_planet_list_2
+    @_with_ayanamsa_setting
+    def _get_rasi_information_section(self):
+        """ D1 section of get_horoscope_information: (horoscope_info, horoscope_chart, ascendant house) """
+        horoscope_info = {}
+        cal_key_list = self.cal_key_list
+        place = self.Place
         dob = drik.Date(self.Date.year,self.Date.month,self.Date.day)
         tob=self.birth_time
-        tob_in_hrs = tob[0]+tob[1]/60.0+tob[2]/3600.0
-        """ TODO: 
-            Planet Positions return type should match for both Drik and SS
-            SS does not have Lagna/Ascendant in planet positions - should be included
-            retrograde depends on return types of planet positions
-        """
-        if self.calculation_type=='ss':
-            planet_positions = surya_sidhantha.planet_positions(jd, place)
-        else:
-            planet_positions = charts.rasi_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
-                                                 years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                                 pravesha_type=self.pravesha_type)
-        #retrograde_planets = charts.planets_in_retrograde(planet_positions)
-        retrograde_planets = drik.planets_in_retrograde(jd, place)
-        #print('rasi retrograde planets',retrograde_planets)
+        planet_positions = self.planet_positions
+        retrograde_planets = self.retrograde_planets
         _ascendant = planet_positions[0][1] #drik.ascendant(jd,place)
-        horoscope_charts = [[ ''  for _ in range(len(utils.RAASI_LIST))] for _ in range(len(dhasavarga_dict)+1)]
-        horoscope_ascendant_houses = [-1 for _ in range(len(const.division_chart_factors))]
-        chart_counter = 0
+        horoscope_chart = [ ''  for _ in range(len(utils.RAASI_LIST))]
         divisional_chart_factor=1
         jd = self.julian_day#jd = self.julian_years #
-        #"""
-        self._get_sphuta(dob, tob, place, divisional_chart_factor)
         abl = self._get_arudha_padhas(dob, tob, place, divisional_chart_factor=divisional_chart_factor,
                                       years=self.years,months=self.months,sixty_hours=self.sixty_hours,
                                                  pravesha_type=self.pravesha_type)
@@ -703,7 +789,6 @@ class Horoscope():
             #print('arudha padha key',key,'value',abl[key])
             value = abl[key]
             horoscope_info[key] = value
-        #"""
         jd = self.julian_years # V3.1.9 Special Lagna do not take years arguments - so use julian years
         key = cal_key_list['raasi_str']+'-'+cal_key_list['bhava_lagna_str']+' ('+cal_key_list['bhava_lagna_short_str']+')'
         value = drik.bhava_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
@@ -752,8 +837,7 @@ class Horoscope():
         horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
         jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
         asc_house = _ascendant[0]
-        horoscope_ascendant_houses[chart_counter] = asc_house
-        horoscope_charts[chart_counter][asc_house] += cal_key_list['ascendant_str'] +"\n"
+        horoscope_chart[asc_house] += cal_key_list['ascendant_str'] +"\n"
         horoscope_info[cal_key_list['raasi_str']+'-'+cal_key_list['ascendant_str']] = utils.RAASI_LIST[asc_house] +' ' + utils.to_dms(_ascendant[1],is_lat_long='plong')
         chara_karaka_names = [x+'_str' for x in house.chara_karaka_names]
         chara_karaka_dict = house.chara_karakas(planet_positions)
@@ -769,16 +853,13 @@ class Horoscope():
                 ck_str = ' (' + cal_key_list[chara_karaka_names[ck_index]] +')'
             v = utils.RAASI_LIST[h]+' '+ utils.to_dms(long,is_lat_long='plong') + ck_str
             planet_house = h
-            horoscope_charts[chart_counter][planet_house] += planet_name + "\n"
+            horoscope_chart[planet_house] += planet_name + "\n"
             relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
             horoscope_info[k]=v # + str(relative_planet_house)
         # Shadow Sub Planet information
         #k = cal_key_list['raasi_str']+'-'+cal_key_list['upagraha_str']
         #horoscope_info[k]=''
-        sub_planet_list_1 = {'kaala_str':'kaala_longitude','mrityu_str':'mrityu_longitude','artha_str':'artha_praharaka_longitude','yama_str':'yama_ghantaka_longitude',
-                           'gulika_str':'gulika_longitude','maandi_str':'maandi_longitude'}
-        sub_planet_list_2 = ['dhuma','vyatipaata','parivesha','indrachaapa','upaketu']
-        place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
+        sub_planet_list_1,sub_planet_list_2 = self._get_sub_planet_lists()
         sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
         for sp,sp_func in sub_planet_list_1.items():
             k = cal_key_list['raasi_str']+'-'+cal_key_list[sp]+' ('+cal_key_list[sp.replace('_str','_short_str')]+')'
@@ -788,105 +869,141 @@ class Horoscope():
             k = cal_key_list['raasi_str']+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
             v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
             horoscope_info[k]= utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
-        ## Dhasavarga Charts
+        return horoscope_info, horoscope_chart, asc_house
+    @_with_ayanamsa_setting
+    def _get_varga_information_section(self,dhasavarga_factor):
+        """ D-n section of get_horoscope_information: (horoscope_info, horoscope_chart, ascendant house) """
+        horoscope_info = {}
+        cal_key_list = self.cal_key_list
+        dhasavarga_dict = self._get_dhasavarga_dict()
+        place = self.Place
+        dob = drik.Date(self.Date.year,self.Date.month,self.Date.day)
+        tob=self.birth_time
+        retrograde_planets = self.retrograde_planets
+        horoscope_chart = [ ''  for _ in range(len(utils.RAASI_LIST))]
+        divisional_chart_factor=1
+        chara_karaka_names = [x+'_str' for x in house.chara_karaka_names]
+        sub_planet_list_1,sub_planet_list_2 = self._get_sub_planet_lists()
         jd = self.julian_day  #V3.1.9
-        for dhasavarga_factor in dhasavarga_dict.keys():
-            " planet_positions lost: [planet_id, planet_constellation, planet_longitude] " 
-            chart_counter += 1
-            planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
-                                                       divisional_chart_factor=dhasavarga_factor,
-                                                       years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                                       calculation_type=self.calculation_type,pravesha_type=self.pravesha_type)
-            chara_karaka_dict = house.chara_karakas(planet_positions)
-            ascendant_navamsa = planet_positions[0][1]
-            asc_house = ascendant_navamsa[0]
+        planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
+                                                   divisional_chart_factor=dhasavarga_factor,
+                                                   years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                                   calculation_type=self.calculation_type,pravesha_type=self.pravesha_type)
+        chara_karaka_dict = house.chara_karakas(planet_positions)
+        ascendant_navamsa = planet_positions[0][1]
+        asc_house = ascendant_navamsa[0]
+        ascendant_longitude = ascendant_navamsa[1]
+        jd = self.julian_day #V3.1.9
+        horoscope_chart[asc_house] += cal_key_list['ascendant_str'] +"\n"
+        abl = self._get_arudha_padhas(dob, tob, place, divisional_chart_factor=dhasavarga_factor,
+                                  years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                  pravesha_type=self.pravesha_type)
+        for bli,blk in const._arudha_lagnas_included_in_chart.items():
+            key = list(abl)[bli-1]
+            #print('arudha padha key',key,'value',abl[key])
+            value = abl[key]
+            horoscope_info[key] = value
+        jd = self.julian_years # V3.1.9 Special Lagna do not take years arguments - so use julian years
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['bhava_lagna_str']+' ('+cal_key_list['bhava_lagna_short_str']+')'
+        value = drik.bhava_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._bhava_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['hora_lagna_str']+' ('+cal_key_list['hora_lagna_short_str']+')'
+        value = drik.hora_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._hora_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ghati_lagna_str']+' ('+cal_key_list['ghati_lagna_short_str']+')'
+        value = drik.ghati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._ghati_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['vighati_lagna_str']+' ('+cal_key_list['vighati_lagna_short_str']+')'
+        value = drik.vighati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._vighati_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['pranapada_lagna_str']+' ('+cal_key_list['pranapada_lagna_short_str']+')'
+        value = drik.pranapada_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._pranapada_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['indu_lagna_str']+' ('+cal_key_list['indu_lagna_short_str']+')'
+        value = drik.indu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._indu_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['bhrigu_bindhu_lagna_str']+' ('+cal_key_list['bhrigu_bindhu_lagna_short_str']+')'
+        value = drik.bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._bhrigu_bindhu_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['kunda_lagna_str']+' ('+cal_key_list['kunda_lagna_short_str']+')'
+        value = drik.kunda_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._kunda_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['sree_lagna_str']+' ('+cal_key_list['sree_lagna_short_str']+')'
+        jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
+        value = drik.sree_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._sree_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['varnada_lagna_str']
+        value = charts.varnada_lagna(dob, tob, place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._varnada_lagna_data[dhasavarga_factor]=value[0]            
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['maandi_str']+' ('+cal_key_list['maandi_short_str']+')'
+        value = drik.maandi_longitude(dob,tob,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._maandhi_data[dhasavarga_factor]=value[0]            
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        horoscope_info[dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ascendant_str']] = \
+            utils.RAASI_LIST[ascendant_navamsa[0]]+' '+utils.to_dms(ascendant_navamsa[1],True,'plong')
+        for p,(h,long) in planet_positions[1:]:
+            ret_str = ''
+            if p in retrograde_planets:
+                ret_str = const._retrogade_symbol
+            planet_name = utils.PLANET_NAMES[p]+ret_str
+            #print('dhasavarga_factor',dhasavarga_factor,'planet_name',planet_name)
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+planet_name
+            planet_house = h
+            ck_str = ''
+            if p !='L' and p < 8:
+                #print('D'+str(dhasavarga_factor),planet_name,chara_karaka_dict[p])
+                ck_str = ' (' + cal_key_list[chara_karaka_names[chara_karaka_dict[p]]] +')'
+            v = utils.RAASI_LIST[h]+' ' +utils.to_dms(long,is_lat_long='plong') + ck_str
+            horoscope_chart[planet_house] += planet_name +'\n'
+            relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
+            horoscope_info[k]= v #+ [relative_planet_house]
+        sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
+        for sp,sp_func in sub_planet_list_1.items():
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp]+' ('+cal_key_list[sp.replace('_str','_short_str')]+')'
+            v = eval('drik.'+sp_func+'(dob,tob,place,divisional_chart_factor=dhasavarga_factor)')
+            horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong') 
+        for sp in sub_planet_list_2:
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
+            v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
+            horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
+        return horoscope_info, horoscope_chart, asc_house
+    @_with_ayanamsa_setting
+    def get_horoscope_information(self,divisional_chart_factors=None):#,language='en'):
+        """
+            Horoscope information of rasi and dhasavarga charts
+            Each chart is computed on first use and cached (see compute())
+            @param divisional_chart_factors: list of chart factors (e.g. [1,9]) to include.
+                Default=None => all charts of const.division_chart_factors
+            @return: horoscope_info, horoscope_charts,horoscope_ascendant_houses
+                horoscope_charts/horoscope_ascendant_houses have entries for all charts. 
+                Charts not included in divisional_chart_factors are empty/-1
+        """
+        horoscope_info = {}
+        self._vimsottari_balance = ();self._yoga_vimsottari_balance = ()
+        self._aayu_dhasa_type = -1; self._kaala_dhasa_type = -1
+        global dhasavarga_dict
+        dhasavarga_dict = self._get_dhasavarga_dict()
+        horoscope_charts = [[ ''  for _ in range(len(utils.RAASI_LIST))] for _ in range(len(dhasavarga_dict)+1)]
+        horoscope_ascendant_houses = [-1 for _ in range(len(const.division_chart_factors))]
+        for chart_counter,dcf in enumerate([1]+list(dhasavarga_dict.keys())):
+            if divisional_chart_factors is not None and dcf not in divisional_chart_factors:
+                continue
+            _horoscope_info,_horoscope_chart,asc_house = self._get_section('D'+str(dcf))
+            horoscope_info.update(_horoscope_info)
+            horoscope_charts[chart_counter] = _horoscope_chart[:]
             horoscope_ascendant_houses[chart_counter] = asc_house
-            ascendant_longitude = ascendant_navamsa[1]
-            jd = self.julian_day #V3.1.9
-            horoscope_charts[chart_counter][asc_house] += cal_key_list['ascendant_str'] +"\n"
-            self._get_sphuta(dob, tob, place, divisional_chart_factor=dhasavarga_factor)
-            abl = self._get_arudha_padhas(dob, tob, place, divisional_chart_factor=dhasavarga_factor,
-                                      years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                      pravesha_type=self.pravesha_type)
-            for bli,blk in const._arudha_lagnas_included_in_chart.items():
-                key = list(abl)[bli-1]
-                #print('arudha padha key',key,'value',abl[key])
-                value = abl[key]
-                horoscope_info[key] = value
-            jd = self.julian_years # V3.1.9 Special Lagna do not take years arguments - so use julian years
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['bhava_lagna_str']+' ('+cal_key_list['bhava_lagna_short_str']+')'
-            value = drik.bhava_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._bhava_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['hora_lagna_str']+' ('+cal_key_list['hora_lagna_short_str']+')'
-            value = drik.hora_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._hora_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ghati_lagna_str']+' ('+cal_key_list['ghati_lagna_short_str']+')'
-            value = drik.ghati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._ghati_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['vighati_lagna_str']+' ('+cal_key_list['vighati_lagna_short_str']+')'
-            value = drik.vighati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._vighati_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['pranapada_lagna_str']+' ('+cal_key_list['pranapada_lagna_short_str']+')'
-            value = drik.pranapada_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._pranapada_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['indu_lagna_str']+' ('+cal_key_list['indu_lagna_short_str']+')'
-            value = drik.indu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._indu_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['bhrigu_bindhu_lagna_str']+' ('+cal_key_list['bhrigu_bindhu_lagna_short_str']+')'
-            value = drik.bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._bhrigu_bindhu_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['kunda_lagna_str']+' ('+cal_key_list['kunda_lagna_short_str']+')'
-            value = drik.kunda_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._kunda_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['sree_lagna_str']+' ('+cal_key_list['sree_lagna_short_str']+')'
-            jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
-            value = drik.sree_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._sree_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['varnada_lagna_str']
-            value = charts.varnada_lagna(dob, tob, place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._varnada_lagna_data[dhasavarga_factor]=value[0]            
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['maandi_str']+' ('+cal_key_list['maandi_short_str']+')'
-            value = drik.maandi_longitude(dob,tob,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._maandhi_data[dhasavarga_factor]=value[0]            
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            horoscope_info[dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ascendant_str']] = \
-                utils.RAASI_LIST[ascendant_navamsa[0]]+' '+utils.to_dms(ascendant_navamsa[1],True,'plong')
-            for p,(h,long) in planet_positions[1:]:
-                ret_str = ''
-                if p in retrograde_planets:
-                    ret_str = const._retrogade_symbol
-                planet_name = utils.PLANET_NAMES[p]+ret_str
-                #print('dhasavarga_factor',dhasavarga_factor,'planet_name',planet_name)
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+planet_name
-                planet_house = h
-                ck_str = ''
-                if p !='L' and p < 8:
-                    #print('D'+str(dhasavarga_factor),planet_name,chara_karaka_dict[p])
-                    ck_str = ' (' + cal_key_list[chara_karaka_names[chara_karaka_dict[p]]] +')'
-                v = utils.RAASI_LIST[h]+' ' +utils.to_dms(long,is_lat_long='plong') + ck_str
-                horoscope_charts[chart_counter][planet_house] += planet_name +'\n'
-                relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
-                horoscope_info[k]= v #+ [relative_planet_house]
-            sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
-            for sp,sp_func in sub_planet_list_1.items():
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp]+' ('+cal_key_list[sp.replace('_str','_short_str')]+')'
-                v = eval('drik.'+sp_func+'(dob,tob,place,divisional_chart_factor=dhasavarga_factor)')
-                horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong') 
-            for sp in sub_planet_list_2:
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
-                v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
-                horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
         return horoscope_info, horoscope_charts,horoscope_ascendant_houses#, vimsottari_dhasa_bhukti_info,ashtottari_dhasa_bhukti_info,narayana_dhasa_info
+    @_with_ayanamsa_setting
     def get_varnada_lagna_for_chart(self,dob, tob, place, divisional_chart_factor=1, chart_method=None,
                                     varnada_method=1, base_rasi=None, count_from_end_of_sign=None):
         _vl_chart = ['' for _ in range(12)]
@@ -897,6 +1014,7 @@ class Horoscope():
             _vl_chart[vl[0]] += 'V'+str(h+1)+'\n'
         _varnada_chart_dict = {self.cal_key_list['varnada_lagna_str']:_vl_chart}
         return _varnada_chart_dict
+    @_with_ayanamsa_setting
     def get_varnada_lagna_for_mixed_chart(self,dob, tob, place,varga_factor_1=None, chart_method_1=None,
                                           varga_factor_2=None, chart_method_2=None,
                             varnada_method=1):
@@ -1560,6 +1678,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_with_ayanamsa_setting
     def get_chara_karakas_for_chart(self,jd_at_dob, place, divisional_chart_factor=1, chart_method=None,base_rasi=None,
                                     count_from_end_of_sign=None):
         _vl_chart = ['' for _ in range(12)]
@@ -1571,6 +1690,7 @@ class Horoscope():
             _vl_chart[h] = self.cal_key_list[const.chara_karaka_names[ki]+'_short_str']+'\n'+_vl_chart[h]
         _karaka_chart_dict = {self.cal_key_list['karakas_str']:_vl_chart}
         return _karaka_chart_dict
+    @_with_ayanamsa_setting
     def get_chara_karakas_for_mixed_chart(self,jd_at_dob, place,varga_factor_1=None, chart_method_1=None,
                                           varga_factor_2=None, chart_method_2=None):
         _vl_chart = ['' for _ in range(12)]
@@ -1582,6 +1702,7 @@ class Horoscope():
             _vl_chart[h] = self.cal_key_list[const.chara_karaka_names[ki]+'_short_str']+'\n'+_vl_chart[h]
         _karaka_chart_dict = {self.cal_key_list['karakas_str']:_vl_chart}
         return _karaka_chart_dict
+    @_with_ayanamsa_setting
     def get_special_lagnas_for_chart(self,jd_at_dob, place, divisional_chart_factor=1, chart_method=None,base_rasi=None,
                                     count_from_end_of_sign=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1596,6 +1717,7 @@ class Horoscope():
             _vl_chart[vl[0]] += self.cal_key_list[spl+'_short_str'] +'\n'
         _special_lagna_dict = {self.cal_key_list['special_lagnas_str']:_vl_chart}
         return _special_lagna_dict 
+    @_with_ayanamsa_setting
     def get_special_lagnas_for_mixed_chart(self,jd_at_dob, place,varga_factor_1=None, chart_method_1=None,
                                           varga_factor_2=None, chart_method_2=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1610,6 +1732,7 @@ class Horoscope():
             _vl_chart[vl[0]] += self.cal_key_list[spl+'_short_str'] +'\n'
         _special_lagna_dict = {self.cal_key_list['special_lagnas_str']:_vl_chart}
         return _special_lagna_dict
+    @_with_ayanamsa_setting
     def get_sphutas_for_chart(self,jd_at_dob, place, divisional_chart_factor=1, chart_method=None,base_rasi=None,
                                     count_from_end_of_sign=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1622,6 +1745,7 @@ class Horoscope():
             _vl_chart[vl[0]] += self.cal_key_list[spl+'_sphuta_short_str'] +'\n'
         _sphuta_menu_dict = {self.cal_key_list['sphuta_str']:_vl_chart}
         return _sphuta_menu_dict
+    @_with_ayanamsa_setting
     def get_sphutas_for_mixed_chart(self,jd_at_dob, place,varga_factor_1=None, chart_method_1=None,
                                           varga_factor_2=None, chart_method_2=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1634,6 +1758,7 @@ class Horoscope():
             _vl_chart[vl[0]] += self.cal_key_list[spl+'_sphuta_short_str'] +'\n'
         _sphuta_menu_dict = {self.cal_key_list['sphuta_str']:_vl_chart}
         return _sphuta_menu_dict
+    @_with_ayanamsa_setting
     def get_ava_saha_yoga_info_for_chart(self,jd_at_dob, place, divisional_chart_factor=1, chart_method=None,base_rasi=None,
                                     count_from_end_of_sign=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1663,6 +1788,7 @@ class Horoscope():
                 utils.PLANET_NAMES[yogi_planet]
         key = self.cal_key_list['yogi_sphuta_str']+', '+self.cal_key_list['avayogi_sphuta_str']+', '+self.cal_key_list['sahayogi_str']
         return {key:ystr}       
+    @_with_ayanamsa_setting
     def get_ava_saha_yoga_for_mixed_chart(self,jd_at_dob, place,varga_factor_1=None, chart_method_1=None,
                                           varga_factor_2=None, chart_method_2=None):
         y,m,d,fh = utils.jd_to_gregorian(jd_at_dob);dob = drik.Date(y,m,d); tob = (fh,0,0)
@@ -1692,6 +1818,7 @@ class Horoscope():
                 utils.PLANET_NAMES[yogi_planet]
         key = self.cal_key_list['yogi_sphuta_str']+', '+self.cal_key_list['avayogi_sphuta_str']+', '+self.cal_key_list['sahayogi_str']
         return {key:ystr}       
+    @_with_ayanamsa_setting
     def get_sahams(self,planet_positions):
         _saham_info = {}
         from jhora.horoscope.transit import saham
@@ -1706,7 +1833,7 @@ class Horoscope():
             #print(key,value)
         _saham_menu_dict = {self.cal_key_list['saham_str']:_vl_chart}
         return _saham_menu_dict, _saham_info        
-def get_chara_karakas(jd, place, ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,years=1,months=1,sixty_hours=1,
+def get_chara_karakas(jd, place, ayanamsa_mode=None,years=1,months=1,sixty_hours=1,
                                             calculation_type='drik',pravesha_type=0):
     rasi_planet_positions = charts.rasi_chart(jd, place, ayanamsa_mode, years, months, sixty_hours, calculation_type, pravesha_type)
     return house.chara_karakas(rasi_planet_positions)
@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import numpy as np
 import pandas as pd 
 from jhora import const, utils
 # Column IDs in the match database
@@ -592,6 +593,40 @@ def update_compatibility_database(method='North'):
                     #print(results, file=fp)
                     csv_writer.writerow(results)
     fp.close()
+_match_tables = {}
+def _get_match_table(db_file):
+    """
+        Koota table of the match database loaded once per process and shared by all Match instances
+        @param db_file: _DATABASE_FILE or _DATABASE_SOUTH_FILE
+        @return: list of k columns, each a (27,4,27,4) numpy array indexed by
+                [boy_star-1,boy_paadham-1,girl_star-1,girl_paadham-1]. Column dtypes are as in the database file
+    """
+    if db_file not in _match_tables:
+        match_db = pd.read_csv(db_file,header=None,encoding='utf-8')
+        table = [match_db[col].to_numpy().reshape(27,4,27,4) for col in match_db.columns]
+        stars = np.arange(1,28); pads = np.arange(1,5)
+        if not (np.array_equal(table[_BOY_STAR_COL][:,0,0,0],stars) and np.array_equal(table[_BOY_PAD_COL][0,:,0,0],pads) and
+                np.array_equal(table[_GIRL_STAR_COL][0,0,:,0],stars) and np.array_equal(table[_GIRL_PAD_COL][0,0,0,:],pads)):
+            raise ValueError("database file:"+db_file+" is not in boy star/paadham, girl star/paadham order")
+        _match_tables[db_file] = table
+    return _match_tables[db_file]
+def get_compatibility_scores(boy_nakshatra_numbers,boy_paadham_numbers,girl_nakshatra_numbers,girl_paadham_numbers,method="North"):
+    """
+        Compatibility scores for many boy/girl pairs at once (for batch ranking of profiles)
+        Arguments are broadcast against each other like numpy arrays
+        Example: get_compatibility_scores(boy_stars[:,None],boy_pads[:,None],girl_stars[None,:],girl_pads[None,:])
+                 gives boys x girls score matrix
+        @param boy_nakshatra_numbers: boy's nakshatra number(s) 1..27
+        @param boy_paadham_numbers: boy's paadham number(s) 1..4
+        @param girl_nakshatra_numbers: girl's nakshatra number(s) 1..27
+        @param girl_paadham_numbers: girl's paadham number(s) 1..4
+        @param method: "North" or "South"
+        @return: numpy array of compatibility scores
+    """
+    db_file = _DATABASE_SOUTH_FILE if 'south' in method.lower() else _DATABASE_FILE
+    scores = _get_match_table(db_file)[_SCORE_COL]
+    return scores[np.asarray(boy_nakshatra_numbers)-1,np.asarray(boy_paadham_numbers)-1,
+                  np.asarray(girl_nakshatra_numbers)-1,np.asarray(girl_paadham_numbers)-1]
 class Match:    
     def __init__(self,boy_nakshatra_number:int=None,boy_paadham_number:int=None,girl_nakshatra_number:int=None,girl_paadham_number:int=None, \
                  minimum_score:float=const.compatibility_minimum_score_north,check_for_mahendra_porutham:bool=False,check_for_vedha_porutham:bool=False,check_for_rajju_porutham:bool=False,\
@@ -605,7 +640,7 @@ class Match:
             self.data_file = db_file
         else:
             Exception("database file:"+db_file+" not found.")
-        self.match_db=pd.read_csv(db_file,header=None,encoding='utf-8')
+        self._match_table = _get_match_table(db_file)
         self._gender = 'Female'
         self.boy_nakshatra_number = boy_nakshatra_number
         self.boy_paadham_number = boy_paadham_number
@@ -616,6 +651,10 @@ class Match:
         self.check_for_vedha_porutham = check_for_vedha_porutham
         self.check_for_rajju_porutham = check_for_rajju_porutham
         self.check_for_shreedheerga_porutham= check_for_shreedheerga_porutham
+    @property
+    def match_db(self):
+        """ Match database as pandas DataFrame (built on demand - get_matching_partners does not use it) """
+        return pd.DataFrame({col:table.ravel() for col,table in enumerate(self._match_table)})
     def get_matching_partners(self):
         boy_nak_given = self.boy_nakshatra_number is not None and self.boy_nakshatra_number >=1 and self.boy_nakshatra_number <=27
         boy_pad_given = self.boy_paadham_number is not None and self.boy_paadham_number >=1 and self.boy_paadham_number <=4
@@ -623,55 +662,40 @@ class Match:
         girl_nak_given = self.girl_nakshatra_number is not None and self.girl_nakshatra_number >=1 and self.girl_nakshatra_number <=27
         girl_pad_given = self.girl_paadham_number is not None and self.girl_paadham_number >=1 and self.girl_paadham_number<=4
         #girl_info_given = girl_nak_given or girl_pad_given
-        #print(boy_nak_given,boy_pad_given,girl_nak_given,girl_pad_given,self.minimum_score,\
-        #      self.check_for_mahendra_porutham,self.check_for_vedha_porutham,self.check_for_rajju_porutham,self.check_for_shreedheerga_porutham)
-        search_criteria = (self.match_db[_SCORE_COL]>=self.minimum_score)
+        table = self._match_table
+        search_criteria = (table[_SCORE_COL]>=self.minimum_score)
+        # Restrict search to given stars/paadhams by zeroing the criteria outside the slice
+        selection = [slice(None)]*4
         if boy_nak_given:
             self._gender = 'Male'
-            search_criteria = search_criteria & (self.match_db[_BOY_STAR_COL]==self.boy_nakshatra_number)
+            selection[0] = self.boy_nakshatra_number-1
             if boy_pad_given:
-                search_criteria = search_criteria & (self.match_db[_BOY_PAD_COL]==self.boy_paadham_number)
+                selection[1] = self.boy_paadham_number-1
         if girl_nak_given:
             self._gender = 'Female'
-            search_criteria = search_criteria & (self.match_db[_GIRL_STAR_COL]==self.girl_nakshatra_number)
+            selection[2] = self.girl_nakshatra_number-1
             if girl_pad_given:
-                search_criteria = search_criteria & (self.match_db[_GIRL_PAD_COL]==self.girl_paadham_number)
-        #print('search_results',self.match_db.index[search_criteria].tolist())
-        if self.check_for_mahendra_porutham==True:
-            search_criteria  = search_criteria & (self.match_db[_MAHEN_COL]==self.check_for_mahendra_porutham)
-            #print('mahen search_results',self.match_db.index[search_criteria].tolist())
-        if self.check_for_vedha_porutham==True:
-            search_criteria = search_criteria & (self.match_db[_VEDHA_COL]==self.check_for_vedha_porutham)
-            #print('vedha search_results',self.match_db.index[search_criteria].tolist())
-        if self.check_for_rajju_porutham==True:
-            search_criteria = search_criteria & (self.match_db[_RAJJU_COL]==self.check_for_rajju_porutham)
-            #print('rajju search_results',self.match_db.index[search_criteria].tolist())
-        if self.check_for_shreedheerga_porutham==True:
-            search_criteria = search_criteria & (self.match_db[_SHREE_COL]==self.check_for_shreedheerga_porutham)
-        temp_results = self.match_db.index[search_criteria].tolist()
+                selection[3] = self.girl_paadham_number-1
+        in_selection = np.zeros_like(search_criteria)
+        in_selection[tuple(selection)] = True
+        search_criteria = search_criteria & in_selection
+        for check_porutham,col in [(self.check_for_mahendra_porutham,_MAHEN_COL),(self.check_for_vedha_porutham,_VEDHA_COL),
+                                   (self.check_for_rajju_porutham,_RAJJU_COL),(self.check_for_shreedheerga_porutham,_SHREE_COL)]:
+            if check_porutham==True:
+                search_criteria = search_criteria & (table[col]==check_porutham)
+        temp_results = np.flatnonzero(search_criteria)
         #print('after shree dheerga temp_results',temp_results)
-        temp_partners = []
-        for n1 in temp_results:
-            if self._gender.lower()=='male':
-                p1 = self.match_db.iloc[n1][_GIRL_PAD_COL]
-                nak =  self.match_db.iloc[n1][_GIRL_STAR_COL]
-            else:
-                p1 = self.match_db.iloc[n1][_BOY_PAD_COL]
-                nak =  self.match_db.iloc[n1][_BOY_STAR_COL]
-            #if temp_partners and nak==temp_partners[-1][0]:
-            #    temp_partners[-1] = (temp_partners[-1][0],temp_partners[-1][1],p1,temp_partners[-1][3])
-            #else:
-            temp_partners.append((nak,p1,n1)) 
-        #print('temp_partners',temp_partners)
+        columns = [col.ravel() for col in table]
+        if self._gender.lower()=='male':
+            nak_col,pad_col = _GIRL_STAR_COL,_GIRL_PAD_COL
+        else:
+            nak_col,pad_col = _BOY_STAR_COL,_BOY_PAD_COL
         matching_partners = []
-        for nak,p1,idx in temp_partners:
-            ettu_porutham_results = list(self.match_db.iloc[idx][_VARNA_COL:_SCORE_COL])
-            compatibility_score = self.match_db.iloc[idx][_SCORE_COL]
-            naalu_porutham_results = list(self.match_db.iloc[idx][_MAHEN_COL:])
-            #print(nak,p1,naalu_porutham_results)
-            matching_partners.append((nak,p1,ettu_porutham_results,compatibility_score,naalu_porutham_results)) 
-        #print(len(matching_partners),' matching stars found for',self.boy_nakshatra_number,self.boy_paadham_number,self.girl_nakshatra_number,self.girl_paadham_number,\
-        #      self.check_for_mahendra_porutham,self.check_for_vedha_porutham,self.check_for_rajju_porutham,self.check_for_shreedheerga_porutham)
+        for idx in temp_results:
+            ettu_porutham_results = [columns[col][idx] for col in range(_VARNA_COL,_SCORE_COL)]
+            compatibility_score = columns[_SCORE_COL][idx]
+            naalu_porutham_results = [columns[col][idx] for col in range(_MAHEN_COL,len(columns))]
+            matching_partners.append((columns[nak_col][idx],columns[pad_col][idx],ettu_porutham_results,compatibility_score,naalu_porutham_results)) 
         return matching_partners
 if __name__ == "__main__":
     #m = Match(girl_nakshatra_number=15,girl_paadham_number=1,method='South')
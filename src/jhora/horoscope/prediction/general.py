@@ -18,7 +18,6 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
-import json
 from jhora.horoscope.chart import charts, house
 from jhora import utils, const
 from jhora.panchanga import drik
@@ -30,10 +29,7 @@ def get_prediction_resources(language='en'):
         @param language: Two letter language code. en, hi, ka, ta, te
         @return json strings from the resource file as dictionary 
     """
-    json_file = _lang_path + const._DEFAULT_PREDICTION_JSON_FILE_PREFIX+language+'.json'
-    f = open(json_file,"r",encoding="utf-8")
-    msgs = json.load(f)
-    return msgs
+    return utils.get_json_resource('prediction',language)
 
 def _get_general_lagna_rasi_prediction(jd,place,prediction_msgs,language=const._DEFAULT_LANGUAGE):
     janma_rasi = drik.raasi(jd, place)[0]-1
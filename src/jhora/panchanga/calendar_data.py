@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Copyright (C) Open Astro Technologies, USA.
+# Modified by Sundar Sundaresan, USA. carnaticmusicguru2015@comcast.net
+# Downloaded from https://github.com/naturalstupid/PyJHora
+
+# This file is part of the "PyJHora" Python library
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+    Calendar data service - day records of a whole calendar month computed in one batch
+    Records hold only numbers (and festival rows), so one month serves all calendar types (solar/amantha/purnimantha)
+    and languages. Names are resolved when the month is displayed.
+    Months are computed on a worker thread and kept in a bounded LRU cache so that the calendar UI
+    can prefetch adjacent months and page through them without computing panchanga on the GUI thread
+"""
+import threading
+from collections import OrderedDict, namedtuple as struct
+from concurrent.futures import Future, ThreadPoolExecutor
+from jhora import const, utils
+from jhora.panchanga import drik, vratha
+"""
+    jd: julian day at sunrise of the day
+    date: drik.Date of the day
+    day_panchanga: drik.DayPanchanga of jd
+    sunrise, sunset: local time of sunrise/sunset in float hours
+    festivals: festival rows of the day (see vratha.get_festivals_of_the_day)
+"""
+CalendarDay = struct('CalendarDay',['jd','date','day_panchanga','sunrise','sunset','festivals'])
+"""
+    year, month: gregorian year and month
+    place: drik.Place
+    start_vaara: day of week of the first day (0=Sunday..6=Saturday)
+    days: CalendarDay of last day of previous month, days of the month and first day of next month
+"""
+CalendarMonth = struct('CalendarMonth',['year','month','place','start_vaara','days'])
+def calendar_day(jd,place):
+    """
+        @param jd: julian day at sunrise of the day
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @return: CalendarDay
+    """
+    dp = drik.day_panchanga(jd, place)
+    return CalendarDay(jd,dp.date,dp,drik.sunrise(jd, place)[0],drik.sunset(jd, place)[0],
+                       tuple(vratha.get_festivals_of_the_day(jd, place, day_panchanga=dp)))
+def calendar_month(year,month,place):
+    """
+        Day records of a calendar month (with last day of previous month and first day of next month)
+        @param year: gregorian year
+        @param month: gregorian month 1..12
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @return: CalendarMonth
+    """
+    _jd = utils.julian_day_number((year, month, 1), (10, 0, 0))
+    sunrise_hours = drik.sunrise(_jd,place)[0]
+    _jd = utils.julian_day_number((year, month, 1), (sunrise_hours, 0, 0))
+    previous_month_end = utils.previous_panchanga_day(drik.Date(year, month, 1), minus_days=1)
+    if month == 12:
+        next_month_start = drik.Date(year+1,1,1)
+    else:
+        last_day = utils.next_panchanga_day(drik.Date(year,month+1,1), -1)
+        next_month_start = utils.next_panchanga_day(last_day, add_days=1)
+    _jd -= 1; current_date = previous_month_end
+    start_vaara = drik.vaara(_jd)
+    days = []
+    while True:
+        _year,_month,_day,_ = utils.jd_to_gregorian(_jd)
+        sunrise_hours = drik.sunrise(_jd,place)[0]
+        _jd = utils.julian_day_number((_year, _month, _day), (sunrise_hours, 0, 0))
+        days.append(calendar_day(_jd, place)._replace(date=current_date))
+        if current_date == next_month_start:
+            break
+        current_date = utils.next_panchanga_day(current_date, add_days=1)
+        _jd += 1
+    return CalendarMonth(year,month,place,start_vaara,days)
+def adjacent_month(year,month,months=1):
+    """ @return: (year,month) that is given number of months after (before if negative) year/month """
+    y,m = divmod(year*12+month-1+months,12)
+    return y,m+1
+class CalendarDataService:
+    """
+        Bounded LRU cache of CalendarMonth keyed by (place, year, month, ayanamsa setting)
+        Months are computed on worker threads under the ayanamsa setting of the thread that asked for them.
+        A month that is being computed is not computed again when it is asked for again.
+        Prefetched months not yet started are cancelled when another month is asked for,
+        so that the month asked for is not queued behind them
+        @param maxsize: maximum number of months kept in the cache
+        @param max_workers: number of worker threads
+    """
+    def __init__(self,maxsize=const.calendar_month_cache_size,max_workers=1):
+        self._maxsize = maxsize
+        self._months = OrderedDict()
+        self._futures = {}
+        self._prefetch_keys = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,thread_name_prefix='calendar_data')
+    def _key(self,year,month,place):
+        _,lat,lon,tz = place
+        return (round(lat,6),round(lon,6),tz,year,month,tuple(drik.get_ayanamsa_setting()))
+    def _compute(self,key,year,month,place,ayanamsa):
+        try:
+            with drik.ayanamsa_setting(ayanamsa.mode,ayanamsa.value,tropical_mode=ayanamsa.tropical):
+                calendar_month_ = calendar_month(year, month, place)
+            with self._lock:
+                self._months[key] = calendar_month_
+                while len(self._months) > self._maxsize:
+                    self._months.popitem(last=False)
+            return calendar_month_
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+                self._prefetch_keys.discard(key)
+    def _cancel_prefetch(self,keep_keys=()):
+        """ Cancel prefetched months (other than keep_keys) that are not yet started. Call with lock held """
+        for key in self._prefetch_keys.difference(keep_keys):
+            future = self._futures.get(key)
+            if future is None or future.cancel():
+                self._futures.pop(key, None)
+                self._prefetch_keys.discard(key)
+    def month_future(self,year,month,place):
+        """
+            @return: concurrent.futures.Future of CalendarMonth - already done if the month is in the cache
+        """
+        return self._month_future(year, month, place, prefetch=False)
+    def _month_future(self,year,month,place,prefetch):
+        ayanamsa = drik.get_ayanamsa_setting()
+        key = self._key(year, month, place)
+        with self._lock:
+            if not prefetch:
+                self._cancel_prefetch(keep_keys=(key,))
+                self._prefetch_keys.discard(key)
+            calendar_month_ = self._months.get(key)
+            if calendar_month_ is not None:
+                self._months.move_to_end(key)
+                future = Future(); future.set_result(calendar_month_)
+                return future
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(self._compute,key,year,month,place,ayanamsa)
+                self._futures[key] = future
+                if prefetch: self._prefetch_keys.add(key)
+            return future
+    def get_month(self,year,month,place):
+        """ @return: CalendarMonth - computed (on the worker thread) if not in the cache """
+        return self.month_future(year, month, place).result()
+    def cached_month(self,year,month,place):
+        """ @return: CalendarMonth if it is in the cache else None """
+        key = self._key(year, month, place)
+        with self._lock:
+            return self._months.get(key)
+    def prefetch(self,year,month,place,months_around=1):
+        """
+            Start computing months before and after year/month (those not in the cache)
+            Earlier prefetched months not around year/month and not yet started are cancelled
+            @param months_around: number of months to prefetch on each side
+            @return: list of futures of the prefetched months (nearest first)
+        """
+        year_months = [adjacent_month(year, month, months) for m in range(1,months_around+1) for months in (m,-m)]
+        with self._lock:
+            self._cancel_prefetch(keep_keys=[self._key(y, m, place) for y,m in year_months])
+        return [self._month_future(y, m, place, prefetch=True) for y,m in year_months]
+    def cache_info(self):
+        """ @return: (number of months in cache, maxsize, number of months being computed) """
+        with self._lock:
+            return len(self._months), self._maxsize, len(self._futures)
+    def clear(self):
+        with self._lock:
+            self._months.clear()
+    def shutdown(self,wait=False):
+        """ Stop the worker threads. Months not yet started are not computed """
+        with self._lock:
+            for key,future in list(self._futures.items()):
+                if future.cancel():
+                    self._futures.pop(key, None)
+                    self._prefetch_keys.discard(key)
+        self._executor.shutdown(wait=wait)
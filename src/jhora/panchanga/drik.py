@@ -29,11 +29,15 @@
     Uses swiss ephemeris
 """
 from math import ceil
-from collections import namedtuple as struct
+from collections import namedtuple as struct, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+import contextvars, threading
+import numpy as np
 import swisseph as swe
 from _datetime import datetime, timedelta
 from datetime import date
-import math, os, warnings
+import heapq, math, operator, os, warnings
 from jhora import utils, const
 
 """ Since datetime does not accept BC year values Use the following stucture to represent dates """
@@ -62,6 +66,64 @@ def set_sideral_planets():
 #PLANET_NAMES= ['Suriyan', 'Chandran', 'Sevvay','Budhan','Viyaazhan','VeLLi','Sani','Raahu','Kethu','Uranus','Neptune']
 _ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
 _ayanamsa_value = None
+""" 
+    Ayanamsa / tropical setting. Outside of 'with drik.ayanamsa_setting(...)' the process wide
+    module globals (const._DEFAULT_AYANAMSA_MODE, _ayanamsa_value, const._TROPICAL_MODE) are used.
+    Inside it the setting is local to the current thread / async task (contextvars)
+"""
+AyanamsaSetting = struct('AyanamsaSetting',['mode','value','tropical'])
+_ayanamsa_setting = contextvars.ContextVar('ayanamsa_setting',default=None)
+""" 
+    Swiss ephemeris keeps its state (sidereal mode, ephemeris path) per thread.
+    Track the sidereal mode last set in each thread so swe.set_sid_mode is called only when it changes
+"""
+_swe_thread_state = threading.local()
+def _init_swe_thread_state():
+    """ New thread - swiss ephemeris state of this thread is not initialized yet """
+    if not hasattr(_swe_thread_state,'sid_mode'):
+        swe.set_ephe_path(const._ephe_path)
+        _swe_thread_state.sid_mode = None
+def _set_swe_sid_mode(sid_mode,t0=0.0,ayan_t0=0.0):
+    """ Call swe.set_sid_mode only if the requested mode differs from the one last set in this thread """
+    sid_args = (sid_mode,t0,ayan_t0)
+    _init_swe_thread_state()
+    if _swe_thread_state.sid_mode != sid_args:
+        swe.set_sid_mode(sid_mode,t0,ayan_t0)
+        _swe_thread_state.sid_mode = sid_args
+def get_ayanamsa_setting():
+    """
+        @return: current ayanamsa setting as AyanamsaSetting(mode, value, tropical)
+            context local setting if inside 'with drik.ayanamsa_setting(...)' else the global setting
+    """
+    setting = _ayanamsa_setting.get()
+    if setting is None:
+        return AyanamsaSetting(const._DEFAULT_AYANAMSA_MODE,_ayanamsa_value,const._TROPICAL_MODE)
+    return setting
+get_ayanamsa_mode = lambda: get_ayanamsa_setting().mode
+_is_tropical_mode = lambda: get_ayanamsa_setting().tropical
+@contextmanager
+def ayanamsa_setting(ayanamsa_mode=None,ayanamsa_value=None,jd=None,tropical_mode=None):
+    """
+        Scope ayanamsa mode/value and tropical mode to the current thread / async task
+        Calls to set_ayanamsa_mode inside the scope do not change the global setting
+        Example: with drik.ayanamsa_setting('KP'):
+                    h = main.Horoscope(...) ...
+        @param ayanamsa_mode: ayanamsa mode. Default: current setting
+        @param ayanamsa_value: Need to be supplied only in case of 'SIDM_USER'
+        @param jd: Julian day number to be supplied only for ayanamsa modes: SENTHIL and SUNDAR_SS
+        @param tropical_mode: True/False. Default: current setting
+        @return: AyanamsaSetting in effect at the start of the scope
+    """
+    _init_swe_thread_state()
+    current = get_ayanamsa_setting()
+    tropical_mode = current.tropical if tropical_mode is None else tropical_mode
+    token = _ayanamsa_setting.set(current._replace(tropical=tropical_mode))
+    try:
+        if ayanamsa_mode is not None:
+            set_ayanamsa_mode(ayanamsa_mode,ayanamsa_value,jd)
+        yield get_ayanamsa_setting()
+    finally:
+        _ayanamsa_setting.reset(token)
 def _ayanamsa_surya_siddhantha_model(jd):
     maha_yuga_years = 4320000
     completed_maha_yuga_years = 3888000
@@ -104,16 +166,14 @@ def get_ayanamsa_value(jd):
         @param jd: Julian Day Number
         @return: ayanamsa value - ayanamsa for the day based on the model used. 
     """
-    global _ayanamsa_mode,_ayanamsa_value
-    #print('Drik:get_ayanamsa_value',_ayanamsa_mode,_ayanamsa_value)
-    key = _ayanamsa_mode.lower()
+    setting = get_ayanamsa_setting()
+    key = setting.mode.lower()
     if key =='sidm_user' or key =='senthil' or key == 'sundar_ss':
-        #print(key,'returning',_ayanamsa_value)
-        return _ayanamsa_value
-    else:
-        #set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd)
-        _ayanamsa_value = swe.get_ayanamsa(jd)
-        return _ayanamsa_value
+        return setting.value
+    _apply_sid_mode(setting)
+    ayanamsa_value = swe.get_ayanamsa(jd)
+    _update_ayanamsa_setting(setting.mode,ayanamsa_value)
+    return ayanamsa_value
 def set_ayanamsa_mode(ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE,ayanamsa_value=None,jd=None):
     """
         Set Ayanamsa mode
@@ -121,33 +181,59 @@ def set_ayanamsa_mode(ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE,ayanamsa_valu
             Other possible values: 
             FAGAN, KP, RAMAN, USHASHASHI, YUKTESHWAR, SURYASIDDHANTA, SURYASIDDHANTA_MSUN,ARYABHATA,ARYABHATA_MSUN,
             SS_CITRA, TRUE_CITRA, TRUE_REVATI, SS_REVATI, SENTHIL, SUNDAR_SS, SIDM_USER
+            None - keep the current setting (e.g. that of 'with drik.ayanamsa_setting(...)')
         @param ayanamsa_value - Need to be supplied only in case of 'SIDM_USER'
         @param jd: Julian day number to be supplied only for ayanamsa modes: SENTHIL and SUNDAR_SS
         See 'available_ayanamsa_modes' for the list of available models
         @return None
     """
-    global _ayanamsa_mode,_ayanamsa_value
+    if ayanamsa_mode is None:
+        _apply_sid_mode()
+        return
     key = ayanamsa_mode.upper()
+    ayanamsa_value_new = get_ayanamsa_setting().value
     #print('panchanga setting',key,ayanamsa_value,jd)
     if key in [am.upper() for am in const.available_ayanamsa_modes.keys()]:
         if key == "SIDM_USER":
-            _ayanamsa_value = ayanamsa_value
-            swe.set_sid_mode(swe.SIDM_USER,ayanamsa_value)
+            ayanamsa_value_new = ayanamsa_value
+            _set_swe_sid_mode(swe.SIDM_USER,ayanamsa_value)
         elif key == "SENTHIL":
-            _ayanamsa_value = _calculate_ayanamsa_senthil_from_jd(jd)
+            ayanamsa_value_new = _calculate_ayanamsa_senthil_from_jd(jd)
         elif key == "SUNDAR_SS":
-            _ayanamsa_value = _ayanamsa_surya_siddhantha_model(jd)
+            ayanamsa_value_new = _ayanamsa_surya_siddhantha_model(jd)
         else:
-            swe.set_sid_mode(const.available_ayanamsa_modes[key])
+            _set_swe_sid_mode(const.available_ayanamsa_modes[key])
     else:
-        warnings.warn("Unsupported Ayanamsa mode:", ayanamsa_mode,const._DEFAULT_AYANAMSA_MODE+" Assumed")
+        warnings.warn("Unsupported Ayanamsa mode: "+ayanamsa_mode+". "+const._DEFAULT_AYANAMSA_MODE+" Assumed")
         ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
-        swe.set_sid_mode(const.available_ayanamsa_modes[const._DEFAULT_AYANAMSA_MODE] )#swe.SIDM_LAHIRI)
-    _ayanamsa_mode = ayanamsa_mode
-    const._DEFAULT_AYANAMSA_MODE = _ayanamsa_mode
-reset_ayanamsa_mode = lambda: swe.set_sid_mode(const.available_ayanamsa_modes[const._DEFAULT_AYANAMSA_MODE]) \
-                      if const._DEFAULT_AYANAMSA_MODE not in ['SIDM_USER','SENTHIL','SUNDAR_SS','KP-SENTHIL'] else \
-                      swe.set_sid_mode(swe.SIDM_LAHIRI)
+        _set_swe_sid_mode(const.available_ayanamsa_modes[const._DEFAULT_AYANAMSA_MODE] )#swe.SIDM_LAHIRI)
+    _update_ayanamsa_setting(ayanamsa_mode,ayanamsa_value_new)
+def _update_ayanamsa_setting(ayanamsa_mode,ayanamsa_value):
+    """ Update context local setting if inside ayanamsa_setting() scope else the module globals """
+    global _ayanamsa_mode,_ayanamsa_value
+    setting = _ayanamsa_setting.get()
+    if setting is None:
+        _ayanamsa_mode = ayanamsa_mode; _ayanamsa_value = ayanamsa_value
+        const._DEFAULT_AYANAMSA_MODE = _ayanamsa_mode
+    else:
+        _ayanamsa_setting.set(setting._replace(mode=ayanamsa_mode,value=ayanamsa_value))
+def _apply_sid_mode(setting=None):
+    """ Set swiss ephemeris sidereal mode for the ayanamsa setting """
+    setting = get_ayanamsa_setting() if setting is None else setting
+    key = setting.mode.upper()
+    if key == 'SIDM_USER':
+        _set_swe_sid_mode(swe.SIDM_USER,setting.value)
+    elif key in ['SENTHIL','SUNDAR_SS'] or key not in const.available_ayanamsa_modes:
+        _set_swe_sid_mode(swe.SIDM_LAHIRI)
+    else:
+        _set_swe_sid_mode(const.available_ayanamsa_modes[key])
+def reset_ayanamsa_mode():
+    """ Reset swiss ephemeris sidereal mode to that of current ayanamsa mode (Lahiri for user defined modes) """
+    mode = get_ayanamsa_mode()
+    if mode not in ['SIDM_USER','SENTHIL','SUNDAR_SS','KP-SENTHIL']:
+        _set_swe_sid_mode(const.available_ayanamsa_modes[mode])
+    else:
+        _set_swe_sid_mode(swe.SIDM_LAHIRI)
 """ TODO: Need to make panchanga resource independent """
 
 # Ketu is always 180° after Rahu, so same coordinates but different constellations
@@ -200,6 +286,49 @@ def nakshatra_pada(longitude):
     #print(longitude,quotient,reminder,pada)
     return [1 + quotient, 1 + pada,reminder]
 ephemeris_planet_index = lambda planet: planet_list.index(planet)
+""" 
+    Opt-in memoization of sidereal_longitude - keyed on (jd_utc, planet, flags, ayanamsa mode/value).
+    Disabled by default. Use enable_ephemeris_cache() or scope it with 'with drik.ephemeris_cache():'
+"""
+_ephemeris_cache = None
+def _calc_ut_longitudes(jd_utc, planet, flags, ayanamsa_key):
+    """ ayanamsa_key is only part of the cache key. swe sidereal mode is set by the caller """
+    return swe.calc_ut(jd_utc, planet, flags = flags)[0]
+def _ayanamsa_cache_key():
+    setting = get_ayanamsa_setting()
+    key = setting.mode.upper()
+    return (key, setting.value) if key == 'SIDM_USER' else (key, None)
+def enable_ephemeris_cache(maxsize=const.ephemeris_cache_size):
+    """
+        Memoize sidereal_longitude calls with a bounded LRU cache (replaces any existing cache)
+        @param maxsize: maximum number of (jd_utc, planet, flags, ayanamsa) entries
+    """
+    global _ephemeris_cache
+    _ephemeris_cache = lru_cache(maxsize=maxsize)(_calc_ut_longitudes)
+def disable_ephemeris_cache():
+    global _ephemeris_cache
+    _ephemeris_cache = None
+def ephemeris_cache_info():
+    """
+        @return: (hits, misses, maxsize, currsize) of the sidereal longitude cache or None if not enabled
+    """
+    return None if _ephemeris_cache is None else _ephemeris_cache.cache_info()
+@contextmanager
+def ephemeris_cache(maxsize=const.ephemeris_cache_size):
+    """
+        Scope a fresh sidereal longitude cache to one computation. Previous cache state is restored on exit
+        Example: with drik.ephemeris_cache() as cache:
+                    h = main.Horoscope(...) ...
+                    print(cache.cache_info())
+        @param maxsize: maximum number of entries
+    """
+    global _ephemeris_cache
+    previous_cache = _ephemeris_cache
+    enable_ephemeris_cache(maxsize)
+    try:
+        yield _ephemeris_cache
+    finally:
+        _ephemeris_cache = previous_cache
 def sidereal_longitude(jd_utc, planet):
     """
         The sequence number of 0 to 8 for planets is not followed by swiss ephemeris
@@ -216,16 +345,16 @@ def sidereal_longitude(jd_utc, planet):
         @param planet: index of the planet Use const._SUN, const._RAHU etc.
         @return: the sidereal longitude of the planet (0-360 degrees)
     """
-    global _ayanamsa_mode,_ayanamsa_value
-    if const._TROPICAL_MODE:
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
-        #set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd)
-        set_ayanamsa_mode(const._DEFAULT_AYANAMSA_MODE,_ayanamsa_value,jd_utc); _ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
-        #print('drik sidereal long ayanamsa',_ayanamsa_mode, const._DEFAULT_AYANAMSA_MODE)
-        #import inspect; print('called by',inspect.stack()[1].function)
-    longi,_ = swe.calc_ut(jd_utc, planet, flags = flags)
+        set_ayanamsa_mode(setting.mode,setting.value,jd_utc)
+    if _ephemeris_cache is None:
+        longi,_ = swe.calc_ut(jd_utc, planet, flags = flags)
+    else:
+        longi = _ephemeris_cache(jd_utc, planet, flags, _ayanamsa_cache_key())
     reset_ayanamsa_mode()
     return utils.norm360(longi[0]) # degrees
 def planets_in_retrograde(jd,place):
@@ -240,7 +369,8 @@ def planets_in_retrograde(jd,place):
     """
     jd_utc = jd - place.timezone / 24.
     flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
-    set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd)
+    setting = get_ayanamsa_setting()
+    set_ayanamsa_mode(setting.mode,setting.value,jd)
     retro_planets = []
     _planet_list = [p for p in _sideral_planet_list if p not in [const._RAHU, const._KETU]]
     for planet in _planet_list:
@@ -258,6 +388,7 @@ def _planet_speed_info(jd, place,planet):
     round_factors = [3,3,4,3,3,6]
     jd_utc = jd - place.timezone / 24.
     flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
+    reset_ayanamsa_mode()
     longi,_ = swe.calc_ut(jd_utc, planet, flags = flags)
     return [round(l,round_factors[i]) for i,l in enumerate(longi)]
 daily_moon_speed = lambda jd,place: _planet_speed_info(jd,place,const._MOON)[3]
@@ -273,7 +404,8 @@ def planets_speed_info(jd,place):
     round_factors = [3,3,4,3,3,6]
     jd_utc = jd - place.timezone / 24.
     flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
-    set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd)
+    setting = get_ayanamsa_setting()
+    set_ayanamsa_mode(setting.mode,setting.value,jd)
     _planets_speed_info = {}
     for planet in planet_list:
         planet_index = planet_list.index(planet)
@@ -339,6 +471,108 @@ def planets_in_graha_yudh(jd,place):
     return _graha_yudh_pairs
 solar_longitude = lambda jd: sidereal_longitude(jd, const._SUN)
 lunar_longitude = lambda jd: sidereal_longitude(jd, const._MOON)
+""" 
+    Opt-in table of sunrise/sunset julian days (UT) - one table per (place, year), filled in blocks of days when first used.
+    Keyed on (latitude, longitude, timezone, year, rise flags). At most maxsize tables are kept (least recently used dropped)
+    Tables can also be saved to/loaded from a folder (as .npy files) so that they are computed only once.
+    Disabled by default. Use enable_sunrise_table_cache() or scope it with 'with drik.sunrise_table_cache():'
+"""
+_sunrise_table_cache = None
+_sunrise_table_cache_maxsize = const.sunrise_table_cache_size
+_sunrise_table_folder = None
+_sunrise_table_lock = threading.Lock()
+_sunrise_table_block_days = 32
+def _sunrise_table_key(place,year):
+    _,lat,lon,tz = place
+    return (round(lat,6),round(lon,6),tz,year,_rise_flags)
+def _sunrise_table_file(key):
+    return os.path.join(_sunrise_table_folder,'sunrise_table_'+'_'.join(map(str,key))+'.npy')
+def _sunrise_table(place,year):
+    """
+        @return: (numpy array of shape (days in year, 2), julian day of 1st Jan of the year)
+            Each row is (sunrise, sunset) julian days (UT) of a day of the year. Rows not computed yet are NaN
+    """
+    key = _sunrise_table_key(place, year)
+    with _sunrise_table_lock:
+        table = _sunrise_table_cache.get(key)
+        if table is not None:
+            _sunrise_table_cache.move_to_end(key)
+            return table
+    year_start_jd = utils.gregorian_to_jd(Date(year,1,1))
+    table_file = None if _sunrise_table_folder is None else _sunrise_table_file(key)
+    if table_file is not None and os.path.exists(table_file):
+        rise_set_jds = np.load(table_file)
+    else:
+        days_in_year = int(round(utils.gregorian_to_jd(Date(year+1,1,1))-year_start_jd))
+        rise_set_jds = np.full((days_in_year,2),np.nan)
+    table = (rise_set_jds,year_start_jd)
+    with _sunrise_table_lock:
+        _sunrise_table_cache[key] = table
+        while len(_sunrise_table_cache) > _sunrise_table_cache_maxsize:
+            _sunrise_table_cache.popitem(last=False)
+    return table
+def _fill_sunrise_table_block(rise_set_jds,year_start_jd,place,day,table_file=None):
+    """ Compute sunrise/sunset of the block of days containing day (day = index of day in the year) """
+    _,lat,lon,tz = place
+    block_start = (day//_sunrise_table_block_days)*_sunrise_table_block_days
+    for d in range(block_start,min(block_start+_sunrise_table_block_days,len(rise_set_jds))):
+        jd_utc = year_start_jd + d - tz/24
+        rise_set_jds[d] = (swe.rise_trans(jd_utc, swe.SUN, geopos=(lon, lat,0.0), rsmi = _rise_flags + swe.CALC_RISE)[1][0],
+                           swe.rise_trans(jd_utc, swe.SUN, geopos=(lon, lat,0.0), rsmi = _rise_flags + swe.CALC_SET)[1][0])
+    if table_file is not None:
+        np.save(table_file, rise_set_jds)
+def _sun_rise_set_jd(jd_utc,place,rise_or_set):
+    """
+        @param jd_utc: julian day of 00:00 UT of the date (utils.gregorian_to_jd)
+        @param rise_or_set: swe.CALC_RISE or swe.CALC_SET
+        @return: julian day (UT) of sunrise/sunset of the date - from the sunrise table if enabled
+    """
+    if _sunrise_table_cache is None:
+        _,lat,lon,tz = place
+        return swe.rise_trans(jd_utc - tz/24, swe.SUN, geopos=(lon, lat,0.0), rsmi = _rise_flags + rise_or_set)[1][0]
+    year = jd_to_gregorian(jd_utc)[0]
+    rise_set_jds,year_start_jd = _sunrise_table(place, year)
+    day = int(round(jd_utc - year_start_jd))
+    if np.isnan(rise_set_jds[day,0]):
+        table_file = None if _sunrise_table_folder is None else _sunrise_table_file(_sunrise_table_key(place, year))
+        _fill_sunrise_table_block(rise_set_jds, year_start_jd, place, day, table_file)
+    return float(rise_set_jds[day,0 if rise_or_set==swe.CALC_RISE else 1])
+def enable_sunrise_table_cache(maxsize=const.sunrise_table_cache_size,cache_folder=None):
+    """
+        Use per (place,year) sunrise/sunset tables for sunrise/sunset calls (replaces any existing cache)
+        @param maxsize: maximum number of (place,year) tables kept in memory
+        @param cache_folder: folder to save/load the tables. None = tables are not saved
+    """
+    global _sunrise_table_cache, _sunrise_table_cache_maxsize, _sunrise_table_folder
+    if cache_folder is not None:
+        os.makedirs(cache_folder, exist_ok=True)
+    _sunrise_table_cache = OrderedDict(); _sunrise_table_cache_maxsize = maxsize; _sunrise_table_folder = cache_folder
+def disable_sunrise_table_cache():
+    global _sunrise_table_cache, _sunrise_table_folder
+    _sunrise_table_cache = None; _sunrise_table_folder = None
+def sunrise_table_cache_info():
+    """
+        @return: (number of tables in memory, maxsize, cache_folder) or None if not enabled
+    """
+    if _sunrise_table_cache is None:
+        return None
+    return len(_sunrise_table_cache), _sunrise_table_cache_maxsize, _sunrise_table_folder
+@contextmanager
+def sunrise_table_cache(maxsize=const.sunrise_table_cache_size,cache_folder=None):
+    """
+        Scope sunrise/sunset tables to one computation (e.g. a month calendar). Previous cache state is restored on exit
+        Example: with drik.sunrise_table_cache():
+                    for day in range(30): drik.sunrise(jd+day, place) ...
+        @param maxsize: maximum number of (place,year) tables kept in memory
+        @param cache_folder: folder to save/load the tables. None = tables are not saved
+    """
+    global _sunrise_table_cache, _sunrise_table_cache_maxsize, _sunrise_table_folder
+    previous_state = (_sunrise_table_cache, _sunrise_table_cache_maxsize, _sunrise_table_folder)
+    enable_sunrise_table_cache(maxsize, cache_folder)
+    try:
+        yield
+    finally:
+        _sunrise_table_cache, _sunrise_table_cache_maxsize, _sunrise_table_folder = previous_state
 def sunrise(jd, place):
     """
         Sunrise when centre of disc is at horizon for given date and place
@@ -351,9 +585,8 @@ def sunrise(jd, place):
     y, m, d,_  = jd_to_gregorian(jd)
     jd_utc = utils.gregorian_to_jd(Date(y, m, d))
     
-    _,lat, lon, tz = place
-    result = swe.rise_trans(jd_utc - tz/24, swe.SUN, geopos=(lon, lat,0.0), rsmi = _rise_flags + swe.CALC_RISE)
-    rise_jd = result[1][0]  # julian-day number
+    tz = place.timezone
+    rise_jd = _sun_rise_set_jd(jd_utc, place, swe.CALC_RISE)  # julian-day number
     rise_local_time = (rise_jd - jd_utc) * 24 + tz
     """ ADDED THE FOLLOWING IN V2.5.2 TO RECALCULATE RISE_JD"""
     dob = (y,m,d)
@@ -420,9 +653,8 @@ def sunset(jd, place,gauri_choghadiya_setting=False):
     # First convert jd to UTC
     y, m, d,_  = jd_to_gregorian(jd)
     jd_utc = utils.gregorian_to_jd(Date(y, m, d))
-    _,lat, lon, tz = place
-    result = swe.rise_trans(jd_utc - tz/24, swe.SUN, geopos=(lon, lat,0.0), rsmi = _rise_flags + swe.CALC_SET)
-    set_jd = result[1][0]
+    tz = place.timezone
+    set_jd = _sun_rise_set_jd(jd_utc, place, swe.CALC_SET)
     set_local_time = (set_jd - jd_utc) * 24 + tz
     if gauri_choghadiya_setting:
         # Convert to local time
@@ -950,6 +1182,12 @@ def lunar_month_date(jd, place,use_purnimanta_system=False):
             True if adhika lunar_month
         TODO: Purnimanta System Calculations have not been validated yet.
     """
+    return _lunar_month_dates(jd, place)[1 if use_purnimanta_system else 0]
+def _lunar_month_dates(jd,place):
+    """
+        lunar_month_date of both amantha and purnimantha systems - the new moons/month of the day are computed once
+        @return: (amantha lunar_month_date, purnimantha lunar_month_date)
+    """
     critical = sunrise(jd, place)[2] # V2.2.8
     ti = tithi(critical, place)[0]
     last_new_moon = new_moon(critical, ti, -1)
@@ -957,17 +1195,83 @@ def lunar_month_date(jd, place,use_purnimanta_system=False):
     this_solar_month = raasi(last_new_moon,place)[0]-1
     next_solar_month = raasi(next_new_moon,place)[0]-1
     is_leap_month = (this_solar_month == next_solar_month)
-    _lunar_month = (this_solar_month+1)%12
-    lunar_day = utils.cyclic_count_of_numbers(from_number=1,to_number=ti,number_count=30,dir=1)
-    if use_purnimanta_system:
-        if lunar_day > 15: _lunar_month = (_lunar_month+1)%12
-        lunar_day = (lunar_day - 16)%30 + 1
-    is_nija_month = False
-    if not is_leap_month:
-        pm,pa,_ = lunar_month(jd-30, place)
-        is_nija_month = (pm==_lunar_month and pa)
-    _lunar_year = lunar_year_index(jd, _lunar_month+1)
-    return [int(_lunar_month+1),lunar_day,_lunar_year, is_leap_month,is_nija_month]
+    previous_month = None if is_leap_month else lunar_month(jd-30, place)
+    lunar_month_dates = []
+    for use_purnimanta_system in [False,True]:
+        _lunar_month = (this_solar_month+1)%12
+        lunar_day = utils.cyclic_count_of_numbers(from_number=1,to_number=ti,number_count=30,dir=1)
+        if use_purnimanta_system:
+            if lunar_day > 15: _lunar_month = (_lunar_month+1)%12
+            lunar_day = (lunar_day - 16)%30 + 1
+        is_nija_month = False
+        if not is_leap_month:
+            pm,pa,_ = previous_month
+            is_nija_month = (pm==_lunar_month and pa)
+        _lunar_year = lunar_year_index(jd, _lunar_month+1)
+        lunar_month_dates.append([int(_lunar_month+1),lunar_day,_lunar_year, is_leap_month,is_nija_month])
+    return tuple(lunar_month_dates)
+class DayPanchanga:
+    """
+        Core panchanga of a julian day/place - tithi, nakshatra, vaara, solar (tamil) month/day/year and
+        amantha/purnimantha lunar month/day/year - computed once and shared by info, vratha and the calendar UI
+        Only numbers are stored. Names are resolved in the current language when the *_name properties are read
+        Use drik.day_panchanga(jd,place) to get the memoized record
+        tithi, nakshatra: as returned by drik.tithi/drik.nakshatra
+        vaara: 0=Sunday..6=Saturday
+        solar_month: 0..11, solar_day, solar_year: samvatsara index [0..59]
+        lunar_month_dates: (amantha, purnimantha) lunar_month_date results
+    """
+    __slots__ = ('jd','place','date','tithi','nakshatra','vaara','solar_month','solar_day','solar_year','lunar_month_dates')
+    def __init__(self,jd,place):
+        y,m,d,_ = utils.jd_to_gregorian(jd)
+        self.jd = jd; self.place = place; self.date = Date(y,m,d)
+        self.tithi = tuple(tithi(jd, place))
+        self.nakshatra = tuple(nakshatra(jd, place))
+        self.vaara = vaara(jd)
+        self.solar_month,self.solar_day = tamil_solar_month_and_date(self.date, place)
+        self.solar_year = samvatsara(self.date, place, zodiac=0)
+        self.lunar_month_dates = tuple(tuple(lmd) for lmd in _lunar_month_dates(jd, place))
+    def vedic_date(self,calendar_type=0):
+        """
+            Same as drik.vedic_date (with default tamil month method)
+            @param calendar_type: 0=Solar Calendar, 1=Amantha and 2=Purnimatha Lunar Calendar
+            @return: vedic month,day,year,is_adhik_maasa?,is_nija_maaja?
+        """
+        if calendar_type==0:
+            return self.solar_month+1,self.solar_day,self.solar_year,False,False
+        return self.lunar_month_dates[calendar_type-1]
+    @property
+    def paksha(self):
+        """ 0=Sukla Paksha 1=Krishna Paksha """
+        return 0 if self.tithi[0]<=15 else 1
+    @property
+    def tithi_name(self):
+        return utils.TITHI_LIST[self.tithi[0]-1]
+    @property
+    def paksha_name(self):
+        return utils.PAKSHA_LIST[self.paksha]
+    @property
+    def nakshatra_name(self):
+        return utils.NAKSHATRA_LIST[self.nakshatra[0]-1]
+    @property
+    def vaara_name(self):
+        return utils.DAYS_LIST[self.vaara]
+    def __repr__(self):
+        return 'DayPanchanga(date='+str(tuple(self.date))+', tithi='+str(self.tithi[0])+', nakshatra='+\
+                str(self.nakshatra[0])+', vaara='+str(self.vaara)+')'
+@lru_cache(maxsize=const.day_panchanga_cache_size)
+def _day_panchanga(jd,place,ayanamsa_key,use_planet_speed):
+    """ ayanamsa_key and use_planet_speed are only part of the cache key """
+    return DayPanchanga(jd, place)
+def day_panchanga(jd,place):
+    """
+        Memoized DayPanchanga (tithi, nakshatra, vaara, solar/lunar month and day) of given julian day and place
+        Memoized per (julian day, place, ayanamsa setting (mode, value, tropical)) - at most const.day_panchanga_cache_size records are kept
+        @param jd: Julian Day Number of the date/time
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @return: DayPanchanga
+    """
+    return _day_panchanga(jd, Place(*place), tuple(get_ayanamsa_setting()), const.use_planet_speed_for_panchangam_end_timings)
 def lunar_year_index(jd,maasa_index):
     """ 
         TODO: Need to investigate the following patching stuff 
@@ -1309,6 +1613,40 @@ def planetary_positions(jd, place):
         coordinates = nirayana_long-constellation*30
         positions.append([p_id,coordinates, constellation])        
     return positions
+def planetary_positions_batch(jds, place):
+    """
+        Computes sidereal longitudes and speeds of planets for an array of julian day numbers
+        Ayanamsa mode is set once for the whole array. Use this instead of calling planetary_positions
+        in a loop when scanning long time ranges (transits, ephemeris tables etc)
+        @param jds: array of Julian Day Numbers (not UTC)
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @return: (longitudes, speeds) numpy arrays of shape (len(jds), len(planet_list))
+            longitudes - sidereal (or tropical if in tropical mode) longitudes 0-360 degrees
+            speeds - longitude speed in degrees per day
+            Column index is the planet index of planet_list (0=Sun..7=Rahu,8=Ketu)
+            Example: longitudes[:,1] are moon longitudes for each jd
+        NOTE:DOES NOT INCLUDE ASCENDANT POSITION AND LONGITUDE. TO GET ASCENDANT CALL: ascendant_batch()
+    """
+    jds_utc = np.asarray(jds, dtype=float).ravel() - place.timezone / 24.
+    longitudes = np.zeros((jds_utc.size, len(planet_list))); speeds = np.zeros_like(longitudes)
+    if jds_utc.size == 0: return longitudes, speeds
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    else:
+        flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
+        set_ayanamsa_mode(setting.mode,setting.value,jds_utc[0])
+    for p_id, planet in enumerate(planet_list):
+        if planet == const._KETU: continue
+        for i, jd_utc in enumerate(jds_utc):
+            longi,_ = swe.calc_ut(jd_utc, planet, flags = flags)
+            longitudes[i,p_id] = longi[0]; speeds[i,p_id] = longi[3]
+    reset_ayanamsa_mode()
+    if const._KETU in planet_list:
+        ketu_index = planet_list.index(const._KETU); rahu_index = planet_list.index(const._RAHU)
+        longitudes[:,ketu_index] = longitudes[:,rahu_index] + 180
+        speeds[:,ketu_index] = speeds[:,rahu_index]
+    return np.mod(longitudes,360), speeds
 def _assign_planets_to_houses(planet_positions,bhava_houses,bhava_madhya_method=1):
     _bhava_houses = []#bhava_houses[:]
     for _bhava_house in bhava_houses:
@@ -1424,28 +1762,28 @@ def bhaava_madhya_swe(jd,place,house_code='P'):
         warnings.warn(warn_msg)
         house_code = 'P'
     hsys = bytes(house_code,encoding='ascii')
-    global _ayanamsa_mode,_ayanamsa_value
     _, lat, lon, tz = place
     jd_utc = jd - (tz / 24.)
-    if const._TROPICAL_MODE:
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SIDEREAL
-        set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd) # needed for swe.houses_ex()
+        set_ayanamsa_mode(setting.mode,setting.value,jd) # needed for swe.houses_ex()
     return list(swe.houses_ex(jd_utc, lat, lon,hsys, flags = flags)[0])
 def bhaava_madhya_kp(jd,place):
     """
         Compute the mid angle / cusp of each of each house.
         0th element is ascendant, 9th element is mid-heaven (mid coeli) etc 
     """
-    global _ayanamsa_mode,_ayanamsa_value
     _, lat, lon, tz = place
     jd_utc = jd - (tz / 24.)
-    if const._TROPICAL_MODE:
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SIDEREAL
-        set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd) # needed for swe.houses_ex()
+        set_ayanamsa_mode(setting.mode,setting.value,jd) # needed for swe.houses_ex()
     return list(swe.houses_ex(jd_utc, lat, lon, flags = flags)[0])
 def bhaava_madhya_sripathi(jd, place):
     bm = bhaava_madhya_kp(jd, place)
@@ -1472,20 +1810,42 @@ def ascendant(jd, place):
         @param place: Place as struct ('Place',latitude,longitude,timezone)
         @return: [constellation of Lagna, longitude of lagna, Lagna nakshatra number, Lagna paadham number]
     """
-    global _ayanamsa_mode,_ayanamsa_value
     _, lat, lon, tz = place
     jd_utc = jd - (tz / 24.)
-    if const._TROPICAL_MODE:
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SIDEREAL
-        set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd) # needed for swe.houses_ex()
+        set_ayanamsa_mode(setting.mode,setting.value,jd) # needed for swe.houses_ex()
     nirayana_lagna = swe.houses_ex(jd_utc, lat, lon, flags = flags)[1][0]
+    reset_ayanamsa_mode()
     nak_no,paadha_no,_ = nakshatra_pada(nirayana_lagna)
     constellation = int(nirayana_lagna / 30)
     coordinates = nirayana_lagna-constellation*30
-    reset_ayanamsa_mode()
     return [constellation, coordinates, nak_no, paadha_no]    
+def ascendant_batch(jds, place):
+    """
+        Computes Lagna (=ascendant) longitudes for an array of julian day numbers
+        Ayanamsa mode is set once for the whole array
+        @param jds: array of Julian Day Numbers (not UTC)
+        @param place: Place as struct ('Place',latitude,longitude,timezone)
+        @return: numpy array of ascendant longitudes (0-360 degrees) of shape (len(jds),)
+            raasi = (longitudes // 30), longitude within raasi = longitudes % 30
+    """
+    _, lat, lon, tz = place
+    jds_utc = np.asarray(jds, dtype=float).ravel() - (tz / 24.)
+    if jds_utc.size == 0: return np.zeros(0)
+    setting = get_ayanamsa_setting()
+    if setting.tropical:
+        flags = swe.FLG_SWIEPH
+    else:
+        flags = swe.FLG_SIDEREAL
+        set_ayanamsa_mode(setting.mode,setting.value,jds_utc[0]) # needed for swe.houses_ex()
+    ascendants = np.fromiter((swe.houses_ex(jd_utc, lat, lon, flags = flags)[1][0] for jd_utc in jds_utc),
+                             dtype=float, count=jds_utc.size)
+    reset_ayanamsa_mode()
+    return ascendants
 def dasavarga_from_long(longitude, divisional_chart_factor=1):
     """
         Calculates the dasavarga-sign in which given longitude falls
@@ -1618,31 +1978,31 @@ def solar_upagraha_longitudes(solar_longitude,upagraha,divisional_chart_factor=1
   Kaala rises at the middle of Sun’s part. In other words, we find the time at the
   middle of Sun’s part and find lagna rising then. That gives Kaala’s longitude.
 """
-kaala_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+kaala_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=0,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='middle')
 """ Mrityu rises at the middle of Mars’s part."""
-mrityu_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+mrityu_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=2,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='middle')
 """ Artha Praharaka rises at the middle of Mercury’s part."""
-artha_praharaka_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+artha_praharaka_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=3,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='middle')
 """ Yama Ghantaka rises at the middle of Jupiter’s part. """
-yama_ghantaka_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+yama_ghantaka_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=4,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='middle')
 """ Gulika rises at the start of Saturn’s part. (Book says middle) """
-gulika_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+gulika_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=6,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='begin')
 """ Maandi rises at the middle of Saturn’s part. (Book says start) """
-maandi_longitude = lambda dob,tob,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1: \
+maandi_longitude = lambda dob,tob,place,ayanamsa_mode=None,divisional_chart_factor=1: \
     upagraha_longitude(dob,tob,place,planet_index=6,ayanamsa_mode=ayanamsa_mode,
                        divisional_chart_factor=divisional_chart_factor,upagraha_part='middle')
 
-def upagraha_longitude(dob,tob,place,planet_index,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,
+def upagraha_longitude(dob,tob,place,planet_index,ayanamsa_mode=None,
                        divisional_chart_factor=1,upagraha_part='middle'):
     """
       get upagraha longitude from dob,tob, place-lat/long and day/night ruling planet's part
@@ -1713,27 +2073,27 @@ def upagraha_longitude(dob,tob,place,planet_index,ayanamsa_mode=const._DEFAULT_A
     constellation,coordinates = dasavarga_from_long(upagraha_long, divisional_chart_factor) #int(upagraha_long / 30)
     return [constellation,coordinates]
 """ NOTE: Bhava Lagna Calculation in Section 5.2 of PVR Book should have mentioned DIVIDE BY 4 in Step (2) """
-bhava_lagna = lambda jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,\
+bhava_lagna = lambda jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,\
                                             base_rasi=None,count_from_end_of_sign=None: \
         special_ascendant(jd,place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=divisional_chart_factor,\
                           chart_method=chart_method,lagna_rate_factor=0.25,
                           base_rasi=base_rasi,count_from_end_of_sign=count_from_end_of_sign) 
-hora_lagna = lambda jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,\
+hora_lagna = lambda jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,\
                                             base_rasi=None,count_from_end_of_sign=None: \
         special_ascendant(jd,place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=divisional_chart_factor,\
                           chart_method=chart_method,lagna_rate_factor=0.5,
                           base_rasi=base_rasi,count_from_end_of_sign=count_from_end_of_sign) 
-ghati_lagna = lambda jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,\
+ghati_lagna = lambda jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,\
                                             base_rasi=None,count_from_end_of_sign=None: \
         special_ascendant(jd,place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=divisional_chart_factor,\
                           chart_method=chart_method,lagna_rate_factor=1.25,
                           base_rasi=base_rasi,count_from_end_of_sign=count_from_end_of_sign) 
-vighati_lagna = lambda jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,\
+vighati_lagna = lambda jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,\
                                             base_rasi=None,count_from_end_of_sign=None: \
         special_ascendant(jd,place,ayanamsa_mode=ayanamsa_mode,divisional_chart_factor=divisional_chart_factor,\
                           chart_method=chart_method,lagna_rate_factor=15.0,
                           base_rasi=base_rasi,count_from_end_of_sign=count_from_end_of_sign) 
-def special_ascendant(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def special_ascendant(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                       lagna_rate_factor=1.0,base_rasi=None,count_from_end_of_sign=None):
     """
         Get constellation and longitude of special lagnas (Bhava,Hora,Ghati,vighati)
@@ -1827,7 +2187,7 @@ def pranapada_lagna_mixed_chart(jd,place,varga_factor_1=1,chart_method_1=1,varga
     spl_long = pl1 % 360
     da = dasavarga_from_long(spl_long, mixed_dvf)
     return da
-def pranapada_lagna(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def pranapada_lagna(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):
     """
         Get constellation and longitude of pranapada lagna
@@ -1872,7 +2232,7 @@ def indu_lagna_mixed_chart(jd,place,varga_factor_1=1,chart_method_1=1,varga_fact
     if il1==0: il1 = 12
     _indu_rasi = (moon_house+il1-1)%12
     return _indu_rasi,planet_positions[2][1][1]
-def indu_lagna(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def indu_lagna(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):  # BV Raman Method
     """
         Get constellation and longitude of indu lagna
@@ -1905,7 +2265,7 @@ def kunda_lagna_mixed_chart(jd,place,varga_factor_1=1,chart_method_1=1,varga_fac
     asc = planet_positions[0]; al = asc[1][0]*30+asc[1][1]; al1 = (al*81)%360
     spl = dasavarga_from_long(al1,divisional_chart_factor=mixed_dvf)
     return spl
-def kunda_lagna(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def kunda_lagna(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):
     """
         Get constellation and longitude of kunda lagna
@@ -1935,7 +2295,7 @@ def bhrigu_bindhu_lagna_mixed_chart(jd,place,varga_factor_1=1,chart_method_1=1,v
     moon_add = 0 if moon_long > rahu_long else 360
     bb = (0.5*(rahu_long+moon_long+moon_add))%360
     return dasavarga_from_long(bb)
-def bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):
     """
         Get constellation and longitude of bhrigu bindhu lagna
@@ -1966,7 +2326,7 @@ def sree_lagna_mixed_chart(jd,place,varga_factor_1=1,chart_method_1=1,varga_fact
     moon_long = planet_positions[2][1][0]*30+planet_positions[2][1][1]
     sl = sree_lagna_from_moon_asc_longitudes(moon_long, asc_long, divisional_chart_factor=mixed_dvf)
     return sl
-def sree_lagna(jd,place,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,divisional_chart_factor=1,chart_method=1,
+def sree_lagna(jd,place,ayanamsa_mode=None,divisional_chart_factor=1,chart_method=1,
                                             base_rasi=None,count_from_end_of_sign=None):
     """
         Get constellation and longitude of Sree Lagna
@@ -2122,36 +2482,71 @@ def days_in_tamil_month(panchanga_date,place):
     return month_days
 def _previous_sankranti_date_new(panchanga_date,place,zodiac=None):
     prev_day = utils.previous_panchanga_day(panchanga_date, minus_days=1)
-    if zodiac is None:
-        t_month,_ = tamil_solar_month_and_date(prev_day, place)
-        multiple = t_month * 30
-    else:
-        multiple = zodiac * 30
-    #print(prev_day,t_month,t_day)
     jd = utils.gregorian_to_jd(prev_day)
     sunset_jd = sunset(jd, place)[2]
-    sl = solar_longitude(sunset_jd)
-    while True:
-        slq,slr = divmod(sl,30)
-        if slr<1 and slr>0 and zodiac is None:
-            break
-        if slr<1 and slr>0 and zodiac is not None and int(slq)==int(zodiac):
-            break
-        sunset_jd -= 1
-        sl = solar_longitude(sunset_jd)
-    sank_date = jd_to_gregorian(sunset_jd)
-    sank_sunrise = sunrise(sunset_jd,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    solar_longs = [ solar_longitude(sank_sunrise + t) % 360 for t in offsets ]
-    solar_hour = utils.inverse_lagrange(offsets, solar_longs, multiple % 360) # Do not move % 360 above
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    solar_hour1 = (sank_sunrise + solar_hour - sank_jd_utc)*24+place.timezone
-    #print('before tm call sank date',sank_date,solar_hour,solar_hour1)
+    multiple = (solar_longitude(sunset_jd)//30)*30 if zodiac is None else zodiac * 30
+    sank_jd_utc = _longitude_crossing(solar_longitude, sunset_jd, multiple, direction=-1,
+                                      max_speed=_max_daily_speeds[const._SUN])
+    y,m,d,solar_hour1 = jd_to_gregorian(sank_jd_utc+place.timezone/24.0)
+    sank_date = Date(y,m,d)
     sank_date,solar_hour1 = utils._convert_to_tamil_date_and_time(sank_date, solar_hour1,place)
-    #print('after tm call sank date',sank_date)
+    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
     return sank_date, solar_hour1,tamil_month,tamil_day
+""" Upper bounds of daily motion (degrees/day) used to size the search steps of the event solver """
+_max_daily_speeds = {const._SUN:1.2, const._MOON:17.0, const._MARS:0.95, const._MERCURY:2.5, const._JUPITER:0.3,
+                     const._VENUS:1.45, const._SATURN:0.16, const._RAHU:0.075, const._KETU:0.075, swe.TRUE_NODE:0.3,
+                     -swe.TRUE_NODE:0.3, const._URANUS:0.075, const._NEPTUNE:0.05, const._PLUTO:0.05}
+def _ascendant_max_daily_speed(latitude,divisional_chart_factor=1):
+    """ Upper bound of ascendant's daily motion. It grows with latitude and is unbounded near the polar circles """
+    tan_product = abs(math.tan(math.radians(latitude)))*math.tan(math.radians(23.44))
+    speed_factor = 30.0 if tan_product >= 0.95 else min(30.0, 1.5/(1.0-tan_product))
+    return 361.0*speed_factor*divisional_chart_factor
+def _next_longitude_crossing(longitude_func,jd,target_longitude,direction=1,max_speed=17.0,precision=0.0):
+    """
+        Event solver: finds when longitude_func next crosses target_longitude
+        Search steps are sized from max_speed (the longitude cannot reach the target sooner than distance/max_speed days)
+        so a crossing is never stepped over. The bracketed crossing is refined with utils.brent_root
+        @param longitude_func: function of julian day returning longitude in degrees
+        @param jd: Julian day to start the search from
+        @param target_longitude: longitude (degrees) to be crossed
+        @param direction: 1 = next crossing, -1 = previous crossing
+        @param max_speed: upper bound of the speed of longitude_func in degrees/day
+        @param precision: crossings within precision degrees before jd are also returned
+        @return: Julian day of the crossing (accuracy const.event_solver_time_tolerance)
+            None if not crossed within const.event_solver_max_bracket_steps search steps
+            (see _longitude_crossing for callers that need the crossing)
+    """
+    distance = lambda t: (longitude_func(t)-target_longitude+180.0)%360.0-180.0
+    min_step = 0.5/max_speed
+    t0 = jd - direction*precision/max_speed
+    f0 = distance(t0)
+    for _ in range(const.event_solver_max_bracket_steps):
+        if f0 == 0:
+            return t0
+        " Limit step to 90 degrees of motion so that crossing the opposite point (+/-180) is not mistaken for the target "
+        t1 = t0 + direction*(min(abs(f0),90.0)/max_speed + min_step)
+        f1 = distance(t1)
+        if (f0 < 0) != (f1 < 0) and abs(f0)+abs(f1) < 180.0:
+            a,b,fa,fb = (t0,t1,f0,f1) if t0 < t1 else (t1,t0,f1,f0)
+            root = utils.brent_root(distance,a,b,tolerance=const.event_solver_time_tolerance,
+                                    max_iterations=const.event_solver_max_iterations,fa=fa,fb=fb)
+            " A jump in longitude (e.g. sign change in some divisional charts) also changes sign - skip it "
+            if abs(distance(root)) <= max_speed*const.event_solver_time_tolerance:
+                return root
+        t0,f0 = t1,f1
+    warnings.warn('Longitude '+str(target_longitude)+' not crossed within '+
+                  str(const.event_solver_max_bracket_steps)+' search steps')
+    return None
+def _longitude_crossing(longitude_func,jd,target_longitude,**kwargs):
+    """
+        Same as _next_longitude_crossing but raises ValueError if the crossing is not found
+        @param kwargs: direction, max_speed, precision - see _next_longitude_crossing
+    """
+    crossing_jd = _next_longitude_crossing(longitude_func, jd, target_longitude, **kwargs)
+    if crossing_jd is None:
+        raise ValueError('Longitude '+str(target_longitude)+' not crossed within '+
+                         str(const.event_solver_max_bracket_steps)+' search steps from julian day '+str(jd))
+    return crossing_jd
 def previous_sankranti_date(panchanga_date,place):
     """
         Get the previous sankranti date (sun entry to a raasi)
@@ -2160,28 +2555,15 @@ def previous_sankranti_date(panchanga_date,place):
         @return: sankranti_date as Struct(y,m,d), sankranti time as float hours,tamil_month_number, tamil_date_number        
     """
     next_day = utils.previous_panchanga_day(panchanga_date, 1)# Date(panchanga_date[0],panchanga_date[1],panchanga_date[2]-1)
-    t_month,_ = tamil_solar_month_and_date(next_day, place)
-    multiple = t_month * 30
-    #print(next_day,t_month,t_day)
     jd = utils.gregorian_to_jd(next_day)
     sunset_jd = sunset(jd, place)[2]
-    sl = solar_longitude(sunset_jd)
-    while True:
-        #print(sunset_jd,sl,multiple)
-        if sl%30<1 and sl%30>0:
-            break
-        sunset_jd -= 1
-        sl = solar_longitude(sunset_jd)
-    sank_date = jd_to_gregorian(sunset_jd)
-    sank_sunrise = sunrise(sunset_jd,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    solar_longs = [ solar_longitude(sank_sunrise + t) % 360 for t in offsets ]
-    solar_hour = utils.inverse_lagrange(offsets, solar_longs, multiple % 360) # Do not move % 360 above
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    solar_hour1 = (sank_sunrise + solar_hour - sank_jd_utc)*24+place.timezone
+    multiple = (solar_longitude(sunset_jd)//30)*30
+    sank_jd_utc = _longitude_crossing(solar_longitude, sunset_jd, multiple, direction=-1,
+                                      max_speed=_max_daily_speeds[const._SUN])
+    y,m,d,solar_hour1 = jd_to_gregorian(sank_jd_utc+place.timezone/24.0)
+    sank_date = Date(y,m,d)
     sank_date,solar_hour1 = utils._convert_to_tamil_date_and_time(sank_date, solar_hour1,place)
+    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
     return sank_date, solar_hour1,tamil_month,tamil_day
 def next_sankranti_date(panchanga_date,place):
     """
@@ -2191,57 +2573,23 @@ def next_sankranti_date(panchanga_date,place):
         @return: sankranti_date as Struct(y,m,d), sankranti time as float hours,tamil_month_number, tamil_date_number        
     """
     next_day = utils.previous_panchanga_day(panchanga_date, 1)# Date(panchanga_date[0],panchanga_date[1],panchanga_date[2]-1)
-    t_month,_ = tamil_solar_month_and_date(next_day, place)
-    multiple = (t_month+1)%12 * 30
-    #print(next_day,t_month,t_day)
     jd = utils.gregorian_to_jd(next_day)
     sunset_jd = sunset(jd, place)[2]
-    sl = solar_longitude(sunset_jd)
-    while True:
-        #print(sunset_jd,sl,multiple,jd_to_gregorian(sunset_jd))
-        if sl%30<1 and sl%30>0:
-            break
-        sunset_jd += 1
-        sl = solar_longitude(sunset_jd)
-    sank_date = jd_to_gregorian(sunset_jd)
-    sank_sunrise = sunrise(sunset_jd,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    solar_longs = [ solar_longitude(sank_sunrise + t) % 360 for t in offsets ]
-    solar_hour = utils.inverse_lagrange(offsets, solar_longs, multiple % 360) # Do not move % 360 above
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    solar_hour1 = (sank_sunrise + solar_hour - sank_jd_utc)*24+place.timezone
+    multiple = ((solar_longitude(sunset_jd)//30+1)%12)*30
+    sank_jd_utc = _longitude_crossing(solar_longitude, sunset_jd, multiple, direction=1,
+                                      max_speed=_max_daily_speeds[const._SUN])
+    y,m,d,solar_hour1 = jd_to_gregorian(sank_jd_utc+place.timezone/24.0)
+    sank_date = Date(y,m,d)
     sank_date,solar_hour1 = utils._convert_to_tamil_date_and_time(sank_date, solar_hour1,place)
+    tamil_month,tamil_day = tamil_solar_month_and_date(sank_date, place)
     return sank_date, solar_hour1,tamil_month,tamil_day # V2.3.0 date returned as tuple
 def __next_solar_jd(jd,place,sun_long):
     """
-        TODO: Handle While loop if not converging - provide max count to stop
+        Julian day (local time) at which sun's longitude becomes sun_long (searched from about a day before jd)
     """
-    jd_next = jd
-    sl = solar_longitude(jd_next)
-    while True:
-        #print(jd_next,sl,sun_long,jd_to_gregorian(jd_next))
-        sank_date = swe.revjul(jd_next)
-        #print('sank_date',sank_date,sun_long,sl,sun_long+1)
-        if sl<sun_long+1 and sl>sun_long:
-            jd_next -= 1
-            break
-        jd_next += 1
-        sl = solar_longitude(jd_next)
-    sank_date = jd_to_gregorian(jd_next)
-    #print('sank_date',sank_date)
-    sank_sunrise = sunrise(jd_next,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    solar_longs = [ (solar_longitude(sank_sunrise + t)) for t in offsets ]
-    #print(solar_longs,sun_long)
-    solar_hour = utils.inverse_lagrange(offsets, solar_longs, sun_long) # Do not move % 360 above
-    #print('solar_hour',solar_hour)
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    solar_hour1 = (sank_sunrise + solar_hour - sank_jd_utc)*24+place.timezone
-    next_solar_jd = swe.julday(sank_date[0],sank_date[1],sank_date[2],solar_hour1)
-    return next_solar_jd    
+    sun_jd = _longitude_crossing(solar_longitude, jd, sun_long, direction=1,
+                                 max_speed=_max_daily_speeds[const._SUN], precision=1.0)
+    return sun_jd + place.timezone/24.0
 def next_solar_date(jd_at_dob,place,years=1,months=1,sixty_hours=1):
     """
         returns the next date at which sun's longitue is same as at jd_at_dob (at birth say)
@@ -2294,10 +2642,11 @@ def is_solar_eclipse(jd,place):
     y, m, d, h = jd_to_gregorian(jd)
     jd_utc = utils.gregorian_to_jd(Date(y, m, d))
     lon,lat = place.latitude, place.longitude
-    if const._TROPICAL_MODE:
+    if _is_tropical_mode():
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
+    reset_ayanamsa_mode()
     ret,_ = swe.sol_eclipse_how(jd_utc,geopos=(lon, lat,0.0),flags=flags)
     return ret
 def next_solar_eclipse(jd,place):
@@ -2466,32 +2815,40 @@ def _birthtime_rectification_janma_suddhi(jd,place,gender):
     janma_suddhi_dict = {0:[(0,15),(46,90),(151,224)],1:[(16,45),(91,150)]}
     jsc = not any([(ud1d > js_pair[0] and ud1d < js_pair[1]) for js_pair in janma_suddhi_dict[gender]])
     return jsc
-def __next_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,direction=1,separation_angle=0):
-    divisional_chart_factor = 1
-    start_jd = jd
-    cur_jd = start_jd - 1*direction
-    end_jd = start_jd + 1*direction
-    while cur_jd*direction < end_jd*direction:
-        cur_jd_utc = cur_jd - panchanga_place.timezone/24.0
-        if p1==8:
-            p1_long = (ketu(sidereal_longitude(cur_jd_utc, planet_list[7])))
-        elif p1==const._ascendant_symbol:
-            sla = ascendant(cur_jd, panchanga_place); p1_long = (sla[0]*30+sla[1])*divisional_chart_factor%360
-        else:
-            p1_long = (sidereal_longitude(cur_jd_utc, planet_list[p1]))
-        if p2==8:
-            p2_long = (ketu(sidereal_longitude(cur_jd_utc, planet_list[7])))
-        elif p2==const._ascendant_symbol:
-            sla = ascendant(cur_jd, panchanga_place); p2_long = (sla[0]*30+sla[1])*divisional_chart_factor%360
-        else:
-            p2_long = (sidereal_longitude(cur_jd_utc, planet_list[p2]))
-        long_diff = (p1_long - p2_long - separation_angle)%360
-        if abs(long_diff) < const.minimum_separation_longitude:
-            #print('Found closest time:',utils.jd_to_gregorian(cur_jd))
-            return cur_jd,utils.norm360(p1_long),utils.norm360(p2_long)
-        cur_jd += const.conjunction_increment*direction
-    return None
-def next_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,direction=1,separation_angle=0,increment_speed_factor=0.25):
+def _planet_longitude_function(planet,place):
+    """
+        @param planet: planet index (0=Sun..8=Kethu) or const._ascendant_symbol
+        @return: function of julian day (local time) returning sidereal longitude of the planet
+    """
+    if planet==const._ascendant_symbol:
+        def _ascendant_longitude(jd):
+            sla = ascendant(jd, place); return sla[0]*30+sla[1]
+        return _ascendant_longitude
+    if planet==8:
+        return lambda jd: ketu(sidereal_longitude(jd-place.timezone/24.0, planet_list[7]))
+    return lambda jd: sidereal_longitude(jd-place.timezone/24.0, planet_list[planet])
+def _planet_max_daily_speed(planet,place,divisional_chart_factor=1):
+    """ Upper bound of daily motion of the planet (0=Sun..8=Kethu) or ascendant (const._ascendant_symbol) """
+    if planet==const._ascendant_symbol:
+        return _ascendant_max_daily_speed(place.latitude, divisional_chart_factor)
+    return _max_daily_speeds[planet_list[planet]]*divisional_chart_factor
+def _next_separation_angle_date(planet_longitudes_func,jd,separation_angle=0,direction=1,max_speed=17.0):
+    """
+        Event solver for conjunctions/aspects: finds when longitude difference of two planets becomes separation_angle
+        @param planet_longitudes_func: function of julian day returning (planet1_longitude, planet2_longitude)
+        @param jd: Julian day to start the search from
+        @param separation_angle: required (planet1_longitude - planet2_longitude) in degrees
+        @param direction: 1= next, -1 = previous
+        @param max_speed: upper bound of the speed of longitude difference in degrees/day 
+        @return: (julian day, planet1_longitude, planet2_longitude) or None if not found
+    """
+    separation = lambda jd: operator.sub(*planet_longitudes_func(jd))
+    conj_jd = _next_longitude_crossing(separation, jd, separation_angle, direction=direction, max_speed=max_speed)
+    if conj_jd is None:
+        return None
+    p1_long,p2_long = planet_longitudes_func(conj_jd)
+    return conj_jd, p1_long, p2_long
+def next_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,direction=1,separation_angle=0):
     """
         get the date when conjunction of given two planets occur
         @param p1: planet1 index (0=Sun..8=Kethu)
@@ -2500,156 +2857,105 @@ def next_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,direction=1,s
         @param panchanga_start_date: Date struct (y,m,d)
         @param direction: 1= next conjunction -1 previous conjunction
         @param separation_angle - angle by which the planets to each other
-        @return: Julian day of conjunction   
+        @return: Julian day of conjunction, planet1 longitude, planet2 longitude   
     """
-    _planet_speeds = [361]+[abs(psi[3]) for p,psi in planets_speed_info(jd, panchanga_place).items()]
-    p1_speed = _planet_speeds[0] if p1=='L' else _planet_speeds[p1+1]
-    p2_speed = _planet_speeds[0] if p2=='L' else _planet_speeds[p2+1]
-    increment_days = increment_speed_factor/p1_speed if p1_speed > p2_speed else increment_speed_factor/p2_speed
-    increment_days *= direction
-    _DEBUG_ = False
     if (p1==7 and p2==8) or (p1==8 and p2==7):
         warnings.warn("Rahu and Ketu do not conjoin ever. Program returns error")
         return None
-    #increment_days=1.0/24.0/60.0*direction if p1 in ['L'] or p2 in ['L'] else 1*direction
-    long_diff_check = 0.5# if p1 in ['L'] or p2 in ['L'] else 1.0
-    max_days_to_search = 1000000
-    cur_jd = jd# utils.julian_day_number(panchanga_start_date, (0,0,0))
-    cur_jd_utc = cur_jd - panchanga_place.timezone/24.0
-    search_counter = 1
-    while search_counter < max_days_to_search:
-        cur_jd += increment_days
-        cur_jd_utc = cur_jd - panchanga_place.timezone/24.0
-        if p1==8:
-            p1_long = (ketu(sidereal_longitude(cur_jd_utc, planet_list[7])))
-        elif p1==const._ascendant_symbol:
-            sla = ascendant(cur_jd, panchanga_place); p1_long = (sla[0]*30+sla[1])
-        else:
-            p1_long = (sidereal_longitude(cur_jd_utc, planet_list[p1]))
-        if p2==8:
-            p2_long = (ketu(sidereal_longitude(cur_jd_utc, planet_list[7])))
-        elif p2==const._ascendant_symbol:
-            sla = ascendant(cur_jd, panchanga_place); p2_long = (sla[0]*30+sla[1])
-        else:
-            p2_long = (sidereal_longitude(cur_jd_utc, planet_list[p2]))
-        long_diff = (360+p1_long - p2_long - separation_angle)%360
-        if _DEBUG_: print(search_counter,p1,p1_long,p2,p2_long,long_diff,long_diff_check,utils.jd_to_gregorian(cur_jd))
-        if long_diff<long_diff_check:
-            if _DEBUG_: print(long_diff,'<',long_diff_check)
-            #ret = __next_conjunction_of_planet_pair(p1,p2,panchanga_place,cur_jd,direction,separation_angle)
-            jd_list = [cur_jd+t*increment_days for t in range(-10,10)]
-            long_diff_list = []
-            for jdt in jd_list:
-                if p1==8:
-                    p1_long = (ketu(sidereal_longitude(jdt-panchanga_place.timezone/24, planet_list[7])))
-                elif p1==const._ascendant_symbol:
-                    sla = ascendant(jdt, panchanga_place); p1_long = (sla[0]*30+sla[1])
-                else:
-                    p1_long = (sidereal_longitude(jdt-panchanga_place.timezone/24, planet_list[p1]))
-                if p2==8:
-                    p2_long = (ketu(sidereal_longitude(jdt-panchanga_place.timezone/24, planet_list[7])))
-                elif p2==const._ascendant_symbol:
-                    sla = ascendant(jdt, panchanga_place); p2_long = (sla[0]*30+sla[1])
-                else:
-                    p2_long = (sidereal_longitude(jdt-panchanga_place.timezone/24, planet_list[p2]))
-                long_diff = (360+p1_long-p2_long-separation_angle)%360
-                long_diff_list.append(long_diff)
-            """ TODO: For separation Angle > 180 Lagrange may not work """
-            try:
-                if _DEBUG_: print('Lagrange method of fine tuning')
-                if _DEBUG_: print(jd_list,'\n',long_diff_list)
-                conj_jd = utils.inverse_lagrange(jd_list, long_diff_list, 0.0)
-                if p1==8:
-                    p1_long = (ketu(sidereal_longitude(conj_jd-panchanga_place.timezone/24, planet_list[7])))
-                elif p1==const._ascendant_symbol:
-                    sla = ascendant(conj_jd, panchanga_place); p1_long = (sla[0]*30+sla[1])
-                else:
-                    p1_long = (sidereal_longitude(conj_jd-panchanga_place.timezone/24, planet_list[p1]))
-                if p2==8:
-                    p2_long = (ketu(sidereal_longitude(conj_jd-panchanga_place.timezone/24, planet_list[7])))
-                elif p2==const._ascendant_symbol:
-                    sla = ascendant(conj_jd, panchanga_place); p2_long = (sla[0]*30+sla[1])
-                else:
-                    p2_long = (sidereal_longitude(conj_jd-panchanga_place.timezone/24, planet_list[p2]))
-                if conj_jd is not None:
-                    if _DEBUG_: print(p1,p2,utils.jd_to_gregorian(conj_jd),p1_long,p2_long)
-                    return conj_jd, p1_long, p2_long
-            except:
-                if _DEBUG_: print('Normal method of fine tuning - since Lagrange failed')
-                if _DEBUG_: print(search_counter,p1,p1_long,p2,p2_long,long_diff,long_diff_check,utils.jd_to_gregorian(cur_jd))
-                ret = __next_conjunction_of_planet_pair(cur_jd,panchanga_place,p1,p2,direction,separation_angle)
-                if ret is not None:
-                    return ret
-                
-        search_counter += 1
-    print('Could not find planetary conjunctions for sep angle',separation_angle,' Try increasing search range')
-    return None
-def __previous_conjunction_of_planet_pair(p1,p2,panchanga_place:Place,start_jd,separation_angle=0):
-    return __next_conjunction_of_planet_pair(p1, p2, panchanga_place, start_jd, direction=-1,separation_angle=separation_angle)
-def previous_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,separation_angle=0,increment_speed_factor=0.25):
-    return next_conjunction_of_planet_pair(jd, panchanga_place, p1, p2, direction=-1, separation_angle=separation_angle,
-                                           increment_speed_factor=increment_speed_factor)
-def previous_planet_entry_date(planet,jd,place,increment_days=0.01,precision=0.1,raasi=None):
-    return next_planet_entry_date(planet,jd,place,direction=-1,increment_days=increment_days,precision=precision,raasi=raasi)
-def previous_ascendant_entry_date(jd,place,increment_days=0.01,precision=0.1,raasi=None,divisional_chart_factor=1):
-    return next_ascendant_entry_date(jd, place, direction=-1, increment_days=increment_days, precision=precision, raasi=raasi,divisional_chart_factor=divisional_chart_factor)
+    p1_long_func = _planet_longitude_function(p1, panchanga_place)
+    p2_long_func = _planet_longitude_function(p2, panchanga_place)
+    max_speed = _planet_max_daily_speed(p1, panchanga_place)+_planet_max_daily_speed(p2, panchanga_place)
+    return _next_separation_angle_date(lambda jd: (p1_long_func(jd),p2_long_func(jd)), jd, separation_angle,
+                                       direction=direction, max_speed=max_speed)
+def previous_conjunction_of_planet_pair(jd,panchanga_place:Place,p1,p2,separation_angle=0):
+    return next_conjunction_of_planet_pair(jd, panchanga_place, p1, p2, direction=-1, separation_angle=separation_angle)
+""" Panchanga elements tracked by iter_transitions:
+    kind: (phase function of UT julian day, number of elements in 360 degrees, upper bound of phase speed degrees/day) """
+_panchanga_element_phases = {
+    'tithi': (lambda jd: lunar_longitude(jd)-solar_longitude(jd), 30, 17.0),
+    'karana': (lambda jd: lunar_longitude(jd)-solar_longitude(jd), 60, 17.0),
+    'yoga': (lambda jd: lunar_longitude(jd)+solar_longitude(jd), 27, 18.2),
+    'nakshatra': (lunar_longitude, 27, 17.0),
+    'raasi': (lunar_longitude, 12, 17.0),
+    }
+Transition = struct('Transition', ['kind', 'index', 'start_jd', 'end_jd'])
+def _iter_element_transitions(kind,start_jd,end_jd,place):
+    phase_func,element_count,max_speed = _panchanga_element_phases[kind]
+    one_element = 360.0/element_count
+    tz = place.timezone/24.0
+    jd_utc = start_jd - tz
+    index = int((phase_func(jd_utc)%360)//one_element)%element_count
+    element_start = _next_longitude_crossing(phase_func, jd_utc, index*one_element, direction=-1, max_speed=max_speed)
+    while element_start is not None and element_start+tz < end_jd:
+        element_end = _next_longitude_crossing(phase_func, element_start, ((index+1)%element_count)*one_element,
+                                               direction=1, max_speed=max_speed)
+        if element_end is None:
+            return
+        yield Transition(kind, index+1, element_start+tz, element_end+tz)
+        index = (index+1)%element_count; element_start = element_end
+def iter_transitions(start_jd,end_jd,place,kinds=('tithi','nakshatra','yoga','karana','raasi')):
+    """
+        Generator of panchanga element changes between two julian days
+        Only the element boundaries are solved (with the event solver) - there is no day by day sunrise/interpolation
+        @param start_jd: Julian day (local time) to start from
+        @param end_jd: Julian day (local time) to stop at
+        @param place: Place struct ('place',latitude,longitude,timezone)
+        @param kinds: panchanga elements to track. Any of 'tithi','nakshatra','yoga','karana','raasi'
+            raasi is the moon sign
+        @return: yields Transition(kind,index,start_jd,end_jd) in the order of start_jd
+            index is 1-based (tithi 1..30, nakshatra 1..27, yoga 1..27, karana 1..60, raasi 1..12)
+            start_jd and end_jd are julian days (local time) of the start/end of the element
+            First element of each kind is the one running at start_jd (its start_jd is before start_jd)
+    """
+    unknown_kinds = set(kinds)-set(_panchanga_element_phases)
+    if unknown_kinds:
+        raise ValueError('Unsupported panchanga element(s) '+str(sorted(unknown_kinds))+
+                         '. Supported:'+str(list(_panchanga_element_phases)))
+    yield from heapq.merge(*[_iter_element_transitions(kind, start_jd, end_jd, place) for kind in kinds],
+                           key=operator.attrgetter('start_jd'))
+def previous_planet_entry_date(planet,jd,place,precision=0.1,raasi=None):
+    return next_planet_entry_date(planet,jd,place,direction=-1,precision=precision,raasi=raasi)
+def previous_ascendant_entry_date(jd,place,precision=0.1,raasi=None,divisional_chart_factor=1):
+    return next_ascendant_entry_date(jd, place, direction=-1, precision=precision, raasi=raasi,divisional_chart_factor=divisional_chart_factor)
 def next_ascendant_entry_date(jd,place,direction=1,precision=1.0,raasi=None,divisional_chart_factor=1):
     """
         get the date when the ascendant enters a zodiac
         @param panchanga_date: Date struct (y,m,d)
         @param panchanga_place: Place struct ('place',latitude,longitude,timezone)
         @param direction: 1= next entry, -1 previous entry
-        @param precision: precision in degrees within which longitude entry whould be (default: 1.0 degrees)
+        @param precision: entries within precision degrees before jd are also returned (default: 1.0 degrees)
         @param raasi: raasi at which planet should enter. 
             If raasi==None: gives entry to next constellation
             If raasi is specified [1..12] gives entry to specified constellation/raasi
-        @return Julian day number of planet entry into zodiac
+        @return Julian day number of planet entry into zodiac (ValueError if the entry is not found)
     """
-    _DEBUG_ = False
-    increment_days = 1.0/24.0/60.0/divisional_chart_factor # For moon/lagna increment days in minutes
+    def _ascendant_longitude(jd):
+        sla = ascendant(jd, place); return (sla[0]*30+sla[1])*divisional_chart_factor%360
     sla = ascendant(jd, place); sl = sla[0]*30+sla[1]
     if raasi==None:
         multiple = (((sl*divisional_chart_factor//30)+1)%12)*30
         if direction==-1: multiple = (sl*divisional_chart_factor//30)%12*30
     else: 
         multiple = (raasi-1)*30
-    if _DEBUG_: print(utils.jd_to_gregorian(jd),'sla',sla,'multiple',multiple,'precision',precision)
-    while True:
-        if sl < (multiple+precision) and sl>(multiple-precision):
-            break
-        jd += increment_days*direction
-        sla = ascendant(jd, place); sl = (sla[0]*30+sla[1])*divisional_chart_factor%360
-        if _DEBUG_: print('sl',sl,utils.jd_to_gregorian(jd),'multiple',multiple)
-    offsets = [t*increment_days for t in range(-10,10)] 
-    asc_longs = []
-    for t in offsets:
-        sla = ascendant(jd+t, place); sl = (sla[0]*30+sla[1])*divisional_chart_factor%360
-        asc_longs.append(sl)
-    if _DEBUG_: print(offsets,asc_longs,multiple)
-    asc_hour = utils.inverse_lagrange(offsets, asc_longs, multiple) # Do not move % 360 above
-    #asc_hour /= divisional_chart_factor
-    jd += asc_hour
-    sla = ascendant(jd, place); asc_long = (sla[0]*30+sla[1])*divisional_chart_factor%360
-    if _DEBUG_: print('JD',utils.jd_to_gregorian(jd),'asc long',asc_long)
-    return jd,asc_long
-def next_planet_entry_date(planet,jd,place,direction=1,increment_days=0.01,precision=0.1,raasi=None):
+    jd = _longitude_crossing(_ascendant_longitude, jd, multiple, direction=direction, precision=precision,
+                             max_speed=_ascendant_max_daily_speed(place.latitude, divisional_chart_factor))
+    return jd,_ascendant_longitude(jd)
+def next_planet_entry_date(planet,jd,place,direction=1,precision=0.1,raasi=None):
     """
         get the date when a planet enters a zodiac
         @param planet: planet index (0=Sun..8=Kethu)
         @param panchanga_date: Date struct (y,m,d)
         @param panchanga_place: Place struct ('place',latitude,longitude,timezone)
         @param direction: 1= next entry, -1 previous entry
-        @param increment_days: incremental steps in days algorithm to check for entry (Default=1 day)
-        @param precision: precision in degrees within which longitude entry whould be (default: 0.1 degrees)
+        @param precision: entries within precision degrees before jd are also returned (default: 0.1 degrees)
         @param raasi: raasi at which planet should enter. 
             If raasi==None: gives entry to next constellation
             If raasi is specified [1..12] gives entry to specified constellation/raasi
-        @return Julian day number of planet entry into zodiac
+        @return Julian day number of planet entry into zodiac (ValueError if the entry is not found)
     """
     if planet == const._ascendant_symbol:
         return next_ascendant_entry_date(jd, place, direction=direction, precision=1.0, raasi=raasi)
-    pl = planet_list[planet] if isinstance(planet,int) else const._ascendant_symbol
-    if pl==const._ascendant_symbol or pl==const._MOON: increment_days = 1.0/24.0/60.0 # For moon/lagna increment days in minutes
+    pl = planet_list[planet]
     if pl==const._KETU:
         raghu_raasi = (raasi-1+6)%12+1 if raasi!=None else raasi
         ret = next_planet_entry_date(7, jd, place,direction=direction,raasi=raghu_raasi)
@@ -2657,10 +2963,7 @@ def next_planet_entry_date(planet,jd,place,direction=1,increment_days=0.01,preci
         return ret[0],p_long
     " get current raasi of planet = t_month "
     jd_utc = jd - place.timezone/24.0
-    if planet==const._ascendant_symbol:
-        sla = ascendant(jd, place); sl = sla[0]*30+sla[1]
-    else:
-        sl = sidereal_longitude(jd_utc,pl)
+    sl = sidereal_longitude(jd_utc,pl)
     if raasi==None:
         multiple = (((sl//30)+1)%12)*30
         if direction==-1: multiple = (sl//30)%12*30
@@ -2670,35 +2973,11 @@ def next_planet_entry_date(planet,jd,place,direction=1,increment_days=0.01,preci
                 multiple = ((sl//30+1)%12*30)%360
     else: 
         multiple = (raasi-1)*30
-    while True:
-        if sl < (multiple+precision) and sl>(multiple-precision):
-            break
-        jd += increment_days*direction; jd_utc = jd - place.timezone/24.0
-        if planet==const._ascendant_symbol:
-            sla = ascendant(jd, place); sl = sla[0]*30+sla[1]
-        else:
-            sl = sidereal_longitude(jd_utc,pl)
-    sank_date = jd_to_gregorian(jd_utc)
-    sank_sunrise = sunrise(jd_utc,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    planet_longs = []
-    for t in offsets:
-        if planet==const._ascendant_symbol:
-            sla = ascendant(sank_sunrise+t, place); sl = sla[0]*30+sla[1]
-        else:
-            sl = sidereal_longitude(sank_sunrise+t,pl)
-        planet_longs.append(sl)
-    planet_hour = utils.inverse_lagrange(offsets, planet_longs, multiple) # Do not move % 360 above
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    planet_hour1 = (sank_sunrise + planet_hour - sank_jd_utc)*24+place.timezone
-    sank_jd_utc += planet_hour1/24.0
-    if planet==const._ascendant_symbol:
-        sla = ascendant(sank_jd_utc-place.timezone/24, place); planet_long = sla[0]*30+sla[1]
-    else:
-        planet_long = sidereal_longitude(sank_jd_utc-place.timezone/24,pl)
-    y,m,d,fh = jd_to_gregorian(sank_jd_utc); sank_date = Date(y,m,d); planet_hour1 = fh
-    return sank_jd_utc,planet_long
+    entry_jd_utc = _longitude_crossing(lambda t: sidereal_longitude(t,pl), jd_utc, multiple, direction=direction,
+                                       max_speed=_max_daily_speeds.get(pl,_max_daily_speeds[const._MOON]),
+                                       precision=precision)
+    planet_long = sidereal_longitude(entry_jd_utc,pl)
+    return entry_jd_utc+place.timezone/24.0,planet_long
 def next_planet_retrograde_change_date(planet,panchanga_date,place,increment_days=1,direction=1):
     """
         get the date when a retrograde planet changes its direction
@@ -2711,7 +2990,8 @@ def next_planet_retrograde_change_date(planet,panchanga_date,place,increment_day
     """
     def _get_planet_longitude_sign(planet,jd):
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | _rise_flags
-        set_ayanamsa_mode(_ayanamsa_mode,_ayanamsa_value,jd)
+        setting = get_ayanamsa_setting()
+        set_ayanamsa_mode(setting.mode,setting.value,jd)
         longi,_ = swe.calc_ut(jd, pl, flags = flags)
         sl_sign = 1
         if longi[3] < 0: sl_sign = -1
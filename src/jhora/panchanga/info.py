@@ -5,8 +5,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 from jhora.panchanga import drik, vratha, pancha_paksha
 from jhora import utils, const
 
-def get_panchangam_resources_basic(jd,place):
+def get_panchangam_resources_basic(jd,place,day_panchanga=None):
+    """
+        @param day_panchanga: drik.DayPanchanga of jd/place. If None drik.day_panchanga(jd,place) is used
+    """
     results_dict = {}
+    dp = drik.day_panchanga(jd, place) if day_panchanga is None else day_panchanga
     year, month, day,birth_time_hrs = utils.jd_to_gregorian(jd)
     key = utils.resource_strings['place_str']+': '; value = place.Place; place_str1 = value
     _lat = utils.to_dms(float(place.latitude),is_lat_long='lat')
@@ -15,7 +19,7 @@ def get_panchangam_resources_basic(jd,place):
     value += place_str2
     results_dict[key] = value
     key = utils.resource_strings['vaaram_str']+': '
-    value = utils.DAYS_LIST[drik.vaara(jd)]
+    value = dp.vaara_name
     results_dict[key] = value
     date_str1 = str(year)+','+str(month)+','+str(day)
     date_str2 = str(day)+'-'+utils.MONTH_SHORT_LIST_EN[month-1]+'-'+str(year)
@@ -25,7 +29,7 @@ def get_panchangam_resources_basic(jd,place):
     keys = [utils.resource_strings['solar_str']+' '+utils.resource_strings['year_str']+'/'+utils.resource_strings['month_str'],utils.resource_strings['lunar_year_month_str'],utils.resource_strings['lunar_year_month_str']]
     _calendar_type_str = ['',' ('+utils.resource_strings['amantha_str']+')',' ('+utils.resource_strings['purnimantha_str']+')']
     for _calendar_type in range(3):
-        _month,_day,_year,adhik_maasa,nija_maasa = drik.vedic_date(jd, place, calendar_type=_calendar_type)
+        _month,_day,_year,adhik_maasa,nija_maasa = dp.vedic_date(calendar_type=_calendar_type)
         adhik_maasa_str = ''; nija_month_str = ''
         if adhik_maasa: adhik_maasa_str = utils.resource_strings['adhika_maasa_str']
         if nija_maasa: nija_month_str = utils.resource_strings['nija_month_str']
@@ -49,14 +53,14 @@ def get_panchangam_resources_basic(jd,place):
     value = drik.moonset(jd, place)[1]
     results_dict[key] = value        
     #"""
-    _festival_list = vratha.get_festivals_of_the_day(jd,place)
+    _festival_list = vratha.get_festivals_of_the_day(jd,place,day_panchanga=dp)
     if len(_festival_list)>0:
         key = utils.resource_strings['todays_festivals_str']; value = ''
         for row in _festival_list:
             value += row['Festival_en']+'\n'
         results_dict[key] = value
     key = utils.resource_strings['nakshatra_str']
-    nak = drik.nakshatra(jd,place)
+    nak = dp.nakshatra
     frac_left = 100*utils.get_fraction(nak[2], nak[3], birth_time_hrs)
     frac_str = ' ('+"{0:.2f}".format(frac_left)+'% ' + utils.resource_strings['balance_str']+' )'
     value = utils.NAKSHATRA_LIST[nak[0]-1]+' '+  \
@@ -79,7 +83,7 @@ def get_panchangam_resources_basic(jd,place):
         _next_rasi = (rasi[0])%12+1
         value = utils.RAASI_LIST[_next_rasi-1]+' '+utils.to_dms(rasi[1])+ ' ' + utils.resource_strings['starts_at_str']
         results_dict[key] = value
-    key = utils.resource_strings['tithi_str']; _tithi = drik.tithi(jd, place)
+    key = utils.resource_strings['tithi_str']; _tithi = dp.tithi
     frac_left = 100*utils.get_fraction(_tithi[1], _tithi[2], birth_time_hrs)
     frac_str = ' ('+"{0:.2f}".format(frac_left)+'% ' + utils.resource_strings['balance_str']+' )'
     _paksha = 0
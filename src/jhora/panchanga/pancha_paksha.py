@@ -22,9 +22,11 @@
     Module for Pancha Paksha Sastra
 """
 
-import pandas as pd
+import numpy as np
+from collections import namedtuple as struct
+from functools import lru_cache
 from jhora import utils, const
-from jhora.panchanga import drik, pancha_paksha
+from jhora.panchanga import drik
 
 PP_DB_FILE = const.ROOT_DIR+ '/data/pancha_pakshi_db.csv'
 IMAGE_PATH = const._IMAGES_PATH + const._sep
@@ -65,41 +67,87 @@ def _get_paksha(jd,place):
     return 1 if _tithi <= 15 else 2
 def _get_birth_bird_from_nakshathra(birth_star,_paksha):
     return pancha_pakshi_stars_birds_paksha[birth_star-1][_paksha-1]
+_PP_BIRD_COUNT = 5; _PP_WEEKDAY_COUNT = 7; _PP_PAKSHA_COUNT = 2
+@lru_cache(maxsize=None)
+def _load_pancha_pakshi_table(file_path=PP_DB_FILE):
+    """
+        Load pancha pakshi db once into an array indexed by [nak_bird_index, weekday_index, paksha_index]
+        Each [bird, weekday, paksha] slice has the rows of that combination in the order of the db file
+        NOTE: float array as duration_factor and power_factor columns are fractional
+    """
+    pp_db = np.loadtxt(file_path, delimiter=',', skiprows=1, encoding='utf-8-sig',
+                       usecols=range(_LAST_COL_FOR_READING+1), ndmin=2)
+    key = (pp_db[:,_NAK_BIRD_INDEX]*_PP_WEEKDAY_COUNT + pp_db[:,_WEEK_DAY_INDEX])*_PP_PAKSHA_COUNT + pp_db[:,_PAKSHA_INDEX]
+    pp_db = pp_db[np.argsort(key, kind='stable')]
+    pp_table = pp_db.reshape(_PP_BIRD_COUNT,_PP_WEEKDAY_COUNT,_PP_PAKSHA_COUNT,-1,pp_db.shape[-1])
+    pp_table.flags.writeable = False
+    return pp_table
 def get_matching_pancha_pakshi_data_from_db(bird_index,weekday_index,paksha_index):
-    pp_db = pd.read_csv(PP_DB_FILE,index_col=None, encoding='utf-8',usecols=range(_LAST_COL_FOR_READING+1))
-    search_criteria = (
-        (pp_db.iloc[:,_NAK_BIRD_INDEX] == bird_index - 1) &
-        (pp_db.iloc[:,_WEEK_DAY_INDEX] == weekday_index - 1) &
-        (pp_db.iloc[:,_PAKSHA_INDEX] == paksha_index - 1)
-    )
-    search_results = pp_db[search_criteria]
-    result_list = search_results.values.tolist()
-    return result_list
-def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_bird_index=None):
+    """
+        @param bird_index: nakshathra bird 1..5
+        @param weekday_index: 1..7 (1=Sunday)
+        @param paksha_index: 1=Sukla 2=Krishna
+        @return: rows of pancha pakshi db for the combination as list of lists
+    """
+    return _load_pancha_pakshi_table()[bird_index-1,weekday_index-1,paksha_index-1].tolist()
+""" 
+    start_jd, end_jd: local julian day of start/end of the period
+    data: pancha pakshi db row of the period (see _WEEK_DAY_INDEX... _BHARANA_PAKSHI)
+    sub_periods: list of PanchaPakshiPeriod (with empty sub_periods) of sub birds/activities of the main period
+"""
+PanchaPakshiPeriod = struct('PanchaPakshiPeriod',['start_jd','end_jd','data','sub_periods'])
+def get_pancha_pakshi_periods(dob=None,tob=None,place=None,nakshathra_bird_index=None,number_of_days=1):
+    """
+        Numeric pancha pakshi periods (without any formatting) for number_of_days starting from the sunrise
+        on or before the given date/time
+        @param dob: drik.Date
+        @param tob: (hour,minute,second)
+        @param place: drik.Place
+        @param nakshathra_bird_index: 1..5 (see _get_birth_bird_from_nakshathra)
+        @param number_of_days: number of days (sunrise to next sunrise) to return periods for. Default=1
+        @return: list of PanchaPakshiPeriod - 5 day time and 5 night time main periods for each day
+    """
     jd = utils.julian_day_number(dob,tob)
     sunrise_jd = drik.sunrise(jd, place)[-1]
     if jd < sunrise_jd:
         jd -= 1
-        sunrise_jd = drik.sunrise(jd, place)[-1]
-    weekday_index = drik.vaara(jd)+1
-    paksha_index = pancha_paksha._get_paksha(jd, place)
-    day_length = drik.day_length(jd, place)
-    night_length = drik.night_length(jd, place)
-    day_inc = day_length/5.0; night_inc = night_length/5.0
-    result_list = pancha_paksha.get_matching_pancha_pakshi_data_from_db(nakshathra_bird_index,weekday_index,paksha_index)
+    periods = []
+    for day in range(number_of_days):
+        day_jd = jd + day
+        time_from_jd = drik.sunrise(day_jd, place)[-1]
+        weekday_index = drik.vaara(day_jd)+1
+        paksha_index = _get_paksha(day_jd, place)
+        day_inc = drik.day_length(day_jd, place)/5.0/24; night_inc = drik.night_length(day_jd, place)/5.0/24
+        result_list = get_matching_pancha_pakshi_data_from_db(nakshathra_bird_index,weekday_index,paksha_index)
+        for row in range(0,len(result_list),5):
+            time_inc = day_inc if result_list[row][_DAYNIGHT_INDEX]==0 else night_inc
+            main_from_jd = time_from_jd; main_to_jd = time_from_jd + time_inc
+            sub_periods = []
+            for irow in range(row,row+5):
+                sub_data = result_list[irow]
+                time_inc = day_inc if sub_data[_DAYNIGHT_INDEX]==0 else night_inc
+                time_to_jd = time_from_jd + time_inc*sub_data[_DURATION_FACTOR]
+                sub_periods.append(PanchaPakshiPeriod(time_from_jd,time_to_jd,sub_data,[]))
+                time_from_jd = time_to_jd
+            periods.append(PanchaPakshiPeriod(main_from_jd,main_to_jd,result_list[row],sub_periods))
+    return periods
+def _pancha_pakshi_time_str(jd):
+    by,bm,bd,bfh = utils.jd_to_gregorian(jd)
+    return str(by)+'-'+'{:02d}'.format(bm)+'-'+'{:02d}'.format(bd)+' '+utils.to_dms(bfh,use_24hour_format=True)
+def format_pancha_pakshi_periods(periods):
+    """
+        Convert periods from get_pancha_pakshi_periods into display strings/images
+        @return: headers,top_level_list,child_level_list, parent_level_labels
+    """
     headers = ['starts_at','ends_at','duration','main_bird','main_activity','sub_bird','sub_activity','relation',
                'power','effect','rating']
     headers = [utils.resource_strings[h+'_str'] for h in headers]
     top_level_list = []; child_level_list = []; parent_level_labels = []
-    time_from_jd = sunrise_jd
-    for row in range(0,len(result_list),5):
-        wdi,pi,dni,mbi,mai,sbi,sai,df,reli,pf,efi,rtng,ppi,bpi = result_list[row]
-        time_inc = day_inc/24 if dni==0 else night_inc/24
-        time_to_jd = time_from_jd + time_inc
-        by,bm,bd,bfh = utils.jd_to_gregorian(time_from_jd)
-        time_from = str(by)+'-'+'{:02d}'.format(bm)+'-'+'{:02d}'.format(bd)+' '+utils.to_dms(bfh,use_24hour_format=True)
-        by,bm,bd,bfh = utils.jd_to_gregorian(time_to_jd)
-        time_to = str(by)+'-'+'{:02d}'.format(bm)+'-'+'{:02d}'.format(bd)+' '+utils.to_dms(bfh,use_24hour_format=True)
+    for period in periods:
+        wdi,pi,dni,mbi,mai,sbi,sai,df,reli,pf,efi,rtng,ppi,bpi = period.data
+        time_inc = period.end_jd - period.start_jd
+        time_from = _pancha_pakshi_time_str(period.start_jd)
+        time_to = _pancha_pakshi_time_str(period.end_jd)
         time_from1 = ('day_sun.png',time_from) if dni==0 else ('moon_with_star.png',time_from)
         duration = str(round(time_inc*24,2))+' '+utils.resource_strings['hours_str']
         main_bird = utils.resource_strings[pancha_pakshi_birds[int(mbi)]+'_str']
@@ -122,16 +170,12 @@ def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_
                     sub_bird,sub_act,rel,pf,eff,rtng]
         top_level_list.append(tlist)
         clist = []
-        for irow in range(row,row+5):
-            wdi,pi,dni,mbi,mai,sbi,sai,df,reli,pf,efi,rtng,ppi,bpi = result_list[irow]
-            time_inc = day_inc/24 if dni==0 else night_inc/24
-            time_to_jd = time_from_jd + time_inc*df
-            by,bm,bd,bfh = utils.jd_to_gregorian(time_from_jd)
-            time_from = str(by)+'-'+'{:02d}'.format(bm)+'-'+'{:02d}'.format(bd)+' '+utils.to_dms(bfh,use_24hour_format=True)
-            by,bm,bd,bfh = utils.jd_to_gregorian(time_to_jd)
-            time_to = str(by)+'-'+'{:02d}'.format(bm)+'-'+'{:02d}'.format(bd)+' '+utils.to_dms(bfh,use_24hour_format=True)
+        for sub_period in period.sub_periods:
+            wdi,pi,dni,mbi,mai,sbi,sai,df,reli,pf,efi,rtng,ppi,bpi = sub_period.data
+            time_from = _pancha_pakshi_time_str(sub_period.start_jd)
+            time_to = _pancha_pakshi_time_str(sub_period.end_jd)
             time_from1 = ('day_sun.png',time_from) if dni==0 else ('moon_with_star.png',time_from)
-            duration = str(round(df*time_inc*24*60))+' '+utils.resource_strings['minutes_str']
+            duration = str(round((sub_period.end_jd-sub_period.start_jd)*24*60))+' '+utils.resource_strings['minutes_str']
             sub_bird = utils.resource_strings[pancha_pakshi_birds[int(sbi)]+'_str']
             sub_bird_image = pancha_pakshi_images[int(sbi)]
             sub_act = utils.resource_strings[pancha_pakshi_activities[int(sai)]+'_str']
@@ -142,16 +186,11 @@ def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_
             cll = [time_from1,time_to,duration,(main_bird_image,main_bird),(main_act_image,main_act,main_act_color),
                    (sub_bird_image,sub_bird),(sub_act_image,sub_act,sub_act_color),rel,pf,eff,rtng]
             clist.append(cll)
-            time_from_jd = time_to_jd
-        time_from_jd = time_to_jd
         child_level_list.append(clist)
-    """
-    print("headers = ",headers)
-    print("parent_level_list = ",top_level_list)
-    print("child_level_list = ",child_level_list)
-    print("parent_level_labels = ",parent_level_labels)
-    """
     return headers,top_level_list,child_level_list, parent_level_labels
+def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_bird_index=None):
+    periods = get_pancha_pakshi_periods(dob, tob, place, nakshathra_bird_index)
+    return format_pancha_pakshi_periods(periods)
 if __name__ == "__main__":
     utils.set_language('ta')
     #_create_pancha_paksha_db(); exit()
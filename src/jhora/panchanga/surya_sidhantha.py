@@ -171,11 +171,12 @@ def ascendant(jd, place:drik.Place, sun_long):
     asc_long = (ud * 60. - sun_long_rem_vinadi)/place_rising_durations[sun_long_raasi]*30.0
     asc_rasi = int(asc_long / 30)
     asc_coordinates = asc_long % 30 
-    if const._TROPICAL_MODE:
+    ayanamsa_setting = drik.get_ayanamsa_setting()
+    if ayanamsa_setting.tropical:
         flags = swe.FLG_SWIEPH
     else:
         flags = swe.FLG_SIDEREAL
-        drik.set_ayanamsa_mode(drik._ayanamsa_mode,drik._ayanamsa_value,jd) # needed for swe.houses_ex()
+        drik.set_ayanamsa_mode(ayanamsa_setting.mode,ayanamsa_setting.value,jd) # needed for swe.houses_ex()
     nak_no,paadha_no,_ = drik.nakshatra_pada(asc_long)
     return [const._ascendant_symbol,[asc_rasi,asc_coordinates]]#,nak_no,paadha_no]
 def _mandaphala_planet_new(jd,planet):
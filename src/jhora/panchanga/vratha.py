@@ -22,11 +22,13 @@
 # Ref: https://vedanshcraft.com/en-us/blogs/news/types-of-ekadashi
 
 from itertools import combinations
+from collections import namedtuple as struct
+import numpy as np
 from jhora.panchanga import drik as panchanga
 from jhora.horoscope.chart import charts
 from jhora import utils, const
 import swisseph as swe
-import datetime
+import datetime, math
 """
     TODO: Convert all return values [(Date,start_time,end_time,tag),...] 
     Note: end_time is optional but last item should be tag which contains descrption of the vratha
@@ -168,109 +170,72 @@ def pradosham_dates(panchanga_place,panchanga_start_date,panchanga_end_date=None
         if panchanga_end_date is None :
             return special_vratha_dates
     return special_vratha_dates
-def tithi_dates(panchanga_place,panchanga_start_date,panchanga_end_date=None,tithi_index_list=None,tag_t=''):
-    """ TODO For Amavasya select Date that has amavasya spreads in the afternoon """ 
-    jd = utils.julian_day_number(panchanga_start_date, (6.5,0,0))
-    sunrise_hours = panchanga.sunrise(jd,panchanga_place)[0]+0.5
-    res = utils.resource_strings
-    if tag_t != '': tag_t = ' / '+ res[tag_t+'_str']
+def _panchanga_element_dates(panchanga_place,panchanga_start_date,panchanga_end_date,element_kind,element_index_list,
+                             date_at_midnight=False):
+    """
+        Find dates of panchanga element (tithi/nakshatra/yoga) whose index is in element_index_list
+        Element start/end times are taken from drik.iter_transitions (no day by day panchanga calculations)
+        @param element_kind: 'tithi','nakshatra','yoga','karana' or 'raasi'
+        @param date_at_midnight: False - element is reported on the date on which it starts
+                True - element is reported on the date whose 00:00 hours it spans (date of start if it spans no midnight)
+        @return: [(date,start_hours,end_hours,element_index),...]
+            start/end hours are w.r.t. 00:00 of the date (negative = previous day, > 24 = next day)
+            If panchanga_end_date is None only the first date within 365 days is returned
+    """
     _start_date = panchanga.Date(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day)
     if panchanga_end_date is None :
         _end_date = utils.next_panchanga_day(_start_date, 365)
     else:
         _end_date = panchanga.Date(panchanga_end_date.year,panchanga_end_date.month,panchanga_end_date.day)
-    cur_date = _start_date
-    cur_jd = swe.julday(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day,sunrise_hours)
-    end_jd = swe.julday(_end_date.year,_end_date.month,_end_date.day,sunrise_hours)
+    start_jd = swe.julday(_start_date.year,_start_date.month,_start_date.day,0.0)
+    end_jd = swe.julday(_end_date.year,_end_date.month,_end_date.day,0.0)
+    element_dates = []
+    for transition in panchanga.iter_transitions(start_jd, end_jd, panchanga_place, kinds=(element_kind,)):
+        if transition.index not in element_index_list:
+            continue
+        date_jd = max(transition.start_jd,start_jd)
+        if date_at_midnight:
+            next_midnight_jd = math.ceil(date_jd-0.5)+0.5
+            if next_midnight_jd < transition.end_jd: date_jd = next_midnight_jd
+        if date_jd >= end_jd:
+            continue
+        day_start_jd = math.floor(date_jd+0.5)-0.5
+        element_date = panchanga.jd_to_gregorian(day_start_jd)[0:3]
+        element_dates.append((element_date,(transition.start_jd-day_start_jd)*24,(transition.end_jd-day_start_jd)*24,
+                              transition.index))
+        if panchanga_end_date is None :
+            break
+    return element_dates
+def tithi_dates(panchanga_place,panchanga_start_date,panchanga_end_date=None,tithi_index_list=None,tag_t=''):
+    """ TODO For Amavasya select Date that has amavasya spreads in the afternoon """ 
+    res = utils.resource_strings
+    if tag_t != '': tag_t = ' / '+ res[tag_t+'_str']
     special_vratha_dates = []
-    skip_days = 14
-    if len(tithi_index_list) > 1:
-        skip_days = 1
-    while cur_jd < end_jd:
-        cur_tithi = panchanga.tithi(cur_jd, panchanga_place)
-        cur_date = panchanga.jd_to_gregorian(cur_jd)[0:3]
-        if cur_tithi[0] in tithi_index_list:
-            #print('cur tithi',cur_date,cur_tithi,len(cur_tithi))
-            starts_at = cur_tithi[1]
-            ends_at = cur_tithi[2]
-            paksha = 0 if cur_tithi[0]<=15 else 1
-            tag = utils.PAKSHA_LIST[paksha]+' / '+utils.TITHI_LIST[cur_tithi[0]-1]
-            if tag_t not in tag: tag += tag_t
-            special_vratha_dates.append((cur_date,starts_at,ends_at,tag))
-            if panchanga_end_date is None :
-                return special_vratha_dates
-            cur_jd += skip_days
-        elif len(cur_tithi) > 3 and cur_tithi[3] in tithi_index_list:
-            #print('cur tithi',cur_date,cur_tithi,len(cur_tithi))        
-            starts_at = cur_tithi[4]
-            ends_at = cur_tithi[5]
-            paksha = 0 if cur_tithi[3]<=15 else 1
-            tag = utils.PAKSHA_LIST[paksha]+' / '+utils.TITHI_LIST[cur_tithi[3]-1]
-            if tag_t not in tag: tag += tag_t
-            special_vratha_dates.append((cur_date,starts_at,ends_at,tag))
-            if panchanga_end_date is None :
-                return special_vratha_dates
-            cur_jd += skip_days
-        cur_jd += 1 
+    for cur_date,starts_at,ends_at,tithi_no in _panchanga_element_dates(panchanga_place, panchanga_start_date,
+                                                    panchanga_end_date, 'tithi', tithi_index_list):
+        paksha = 0 if tithi_no<=15 else 1
+        tag = utils.PAKSHA_LIST[paksha]+' / '+utils.TITHI_LIST[tithi_no-1]
+        if tag_t not in tag: tag += tag_t
+        special_vratha_dates.append((cur_date,starts_at,ends_at,tag))
     return special_vratha_dates
 def nakshathra_dates(panchanga_place,panchanga_start_date,panchanga_end_date=None,nakshathra_index_list=None):
-    res = utils.resource_strings
-    _start_date = panchanga.Date(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day)
-    if panchanga_end_date is None :
-        _end_date = utils.next_panchanga_day(_start_date, 365)
-    else:
-        _end_date = panchanga.Date(panchanga_end_date.year,panchanga_end_date.month,panchanga_end_date.day)
-    cur_date = _start_date
-    cur_jd = swe.julday(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day,0.0)
-    end_jd = swe.julday(_end_date.year,_end_date.month,_end_date.day,0.0)
     special_vratha_dates = []
-    skip_days = 26
-    if len(nakshathra_index_list) > 1:
-        skip_days = 1
-    while cur_jd < end_jd:
-        current_nakshathra = panchanga.nakshatra(cur_jd, panchanga_place)
-        cur_date = panchanga.jd_to_gregorian(cur_jd)[0:3]
-        if current_nakshathra[0] in nakshathra_index_list and cur_date not in special_vratha_dates:
-            starts_at = current_nakshathra[1]
-            ends_at = current_nakshathra[2]
-            tag = utils.NAKSHATRA_LIST[current_nakshathra[0]-1]
-            special_vratha_dates.append((cur_date,starts_at,ends_at,tag))
-            if ends_at < 0:
-                days = int(abs(ends_at)//24)+1
-                new_ends_at = abs(ends_at)%24
-                new_cur_date = utils.previous_panchanga_day(panchanga.Date(cur_date[0],cur_date[1],cur_date[2]), minus_days=days)
-                special_vratha_dates[-1]= (new_cur_date,starts_at,new_ends_at,tag)
-            if panchanga_end_date is None :
-                return special_vratha_dates
-            cur_jd += skip_days
-        cur_jd += 1 
+    for cur_date,starts_at,ends_at,nak_no in _panchanga_element_dates(panchanga_place, panchanga_start_date,
+                                                    panchanga_end_date, 'nakshatra', nakshathra_index_list,
+                                                    date_at_midnight=True):
+        tag = utils.NAKSHATRA_LIST[nak_no-1]
+        special_vratha_dates.append((cur_date,starts_at,ends_at,tag))
     return special_vratha_dates
 def yoga_dates(panchanga_place,panchanga_start_date,panchanga_end_date=None,yoga_index_list=None,tag_y=''):
     res = utils.resource_strings
     if tag_y != '': tag_y = ' / '+ res[tag_y+'_str']
-    _start_date = panchanga.Date(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day)
-    if panchanga_end_date is None :
-        _end_date = utils.next_panchanga_day(_start_date, 365)
-    else:
-        _end_date = panchanga.Date(panchanga_end_date.year,panchanga_end_date.month,panchanga_end_date.day)
-    cur_date = _start_date
-    cur_jd = swe.julday(panchanga_start_date.year,panchanga_start_date.month,panchanga_start_date.day,0.0)
-    end_jd = swe.julday(_end_date.year,_end_date.month,_end_date.day,0.0)
     special_vratha_dates = []
-    skip_days = 26
-    if len(yoga_index_list) > 0:
-        skip_days = 1
-    while cur_jd < end_jd:
-        cur_yoga = panchanga.yogam(cur_jd, panchanga_place)
-        cur_date = panchanga.jd_to_gregorian(cur_jd)[0:3]
-        if cur_yoga[0] in yoga_index_list:
-            ends_at = cur_yoga[1]; tag = utils.YOGAM_LIST[cur_yoga[0]-1] +' '+res['yogam_str']
-            if tag_y not in tag: tag += tag_y
-            special_vratha_dates.append((cur_date,ends_at,tag))
-            if panchanga_end_date is None :
-                return special_vratha_dates
-            cur_jd += skip_days
-        cur_jd += 1 
+    for cur_date,starts_at,_,yoga_no in _panchanga_element_dates(panchanga_place, panchanga_start_date,
+                                                    panchanga_end_date, 'yoga', yoga_index_list,
+                                                    date_at_midnight=True):
+        tag = utils.YOGAM_LIST[yoga_no-1] +' '+res['yogam_str']
+        if tag_y not in tag: tag += tag_y
+        special_vratha_dates.append((cur_date,starts_at,tag))
     return special_vratha_dates
 def _get_planets_in_conjunction(planet_positions,minimum_separation_longitude):
     """ Exlcude Lagnam, Sun, Moon, Rahu and Ketu  planet_positions[3:8] """
@@ -310,16 +275,20 @@ def conjunctions(panchanga_place,panchanga_start_date,panchanga_end_date,minimum
     cur_jd = utils.julian_day_number(panchanga_start_date, (0,0,0))
     end_jd = utils.julian_day_number(panchanga_end_date, (0,0,0))
     special_vratha_dates = []
-    while cur_jd < end_jd:
+    jds = np.arange(cur_jd, end_jd, 1.0)
+    planet_longitudes,_ = panchanga.planetary_positions_batch(jds, panchanga_place)
+    ascendant_longitudes = panchanga.ascendant_batch(jds, panchanga_place)
+    for cur_jd,asc_long,planet_longs in zip(jds,ascendant_longitudes,planet_longitudes):
         cur_date = panchanga.jd_to_gregorian(cur_jd)[0:3] # Ignore time
-        planet_positions = charts.divisional_chart(cur_jd, panchanga_place)
+        asc_rasi = int(asc_long/30)
+        planet_positions = [[const._ascendant_symbol,(asc_rasi,asc_long-asc_rasi*30)]] + \
+                    [[p,panchanga.dasavarga_from_long(float(p_long))] for p,p_long in enumerate(planet_longs)]
         if planets_in_same_house:
             result_local = _get_planets_in_conjunction_same_house(planet_positions,minimum_separation_longitude)
         else:
             result_local = _get_planets_in_conjunction(planet_positions,minimum_separation_longitude)
         if result_local:
             special_vratha_dates.append((cur_date,result_local))
-        cur_jd += 1 
     return utils.flatten_list(special_vratha_dates)
 def _get_conjunction_time_1(jd,place,p1,p2):
     tz = place.timezone
@@ -623,23 +592,27 @@ def tithi_pravesha(birth_date:panchanga.Date=None,birth_time:tuple=None,birth_pl
     current_date_start = utils.previous_panchanga_day(current_date_start, plus_or_minus_duration_in_days)
     current_date_end = utils.next_panchanga_day(current_date_start, 2*plus_or_minus_duration_in_days)
     #print(current_date_start,current_date_end)
-    jd = utils.julian_day_number(birth_date, birth_time); _,_,_,birth_time_hrs = utils.jd_to_gregorian(jd)
+    jd = utils.julian_day_number(birth_date, birth_time)
     t = panchanga.tithi(jd, birth_place); tm = panchanga.tamil_solar_month_and_date(birth_date, birth_place)
-    t_frac = utils.get_fraction(t[1], t[2], birth_time_hrs)
-    #print('tithi',(t[0],utils.to_dms(t[1]),utils.to_dms(t[2]),t_frac),'tamil month/day',tm)
+    """ Tithi pravesha is the time at which moon-sun phase returns to its value at birth """
+    tithi_phase,_,tithi_phase_speed = panchanga._panchanga_element_phases['tithi']
+    _tz = birth_place.timezone/24.0
+    birth_phase = tithi_phase(jd-_tz)%360
+    #print('tithi',t,'birth phase',birth_phase,'tamil month/day',tm)
     sr = search(birth_place, current_date_start, current_date_end, tithi_index=t[0], tamil_month_index=tm[0]+1)
     tp = []
     for s_result in sr:
         #print('search result',s_result)
         s_date = s_result[0]; s_start = s_result[1]; s_end=s_result[2]; s_desc=s_result[3]
-        t_len = s_end - s_start
-        if s_start > 23.99:
-            t_len += 24
-        t_time = s_end - t_frac*t_len
+        s_date_jd = swe.julday(s_date[0],s_date[1],s_date[2],0.0)
+        tp_jd_utc = panchanga._next_longitude_crossing(tithi_phase, s_date_jd+s_start/24-_tz, birth_phase,
+                                                       direction=1, max_speed=tithi_phase_speed)
+        if tp_jd_utc is None: continue # birth phase not reached from this search result
+        t_time = (tp_jd_utc+_tz-s_date_jd)*24
         tp.append((s_date,t_time,s_end,s_desc))
     return tp
 
-import csv
+import csv, bisect
 
 # Global variable to store festival data
 festival_data = []
@@ -650,69 +623,218 @@ def load_festival_data(file_path=const._FESTIVAL_FILE):
     with open(file_path, mode='r', encoding='utf-8-sig') as file:
         reader = csv.DictReader(file)
         festival_data = [row for row in reader]
-def _get_criteria_for_the_day(jd,place,use_purnimanta_system=None):
-    y,m,d,_ = utils.jd_to_gregorian(jd); date_in = panchanga.Date(y,m,d)
-    _tithi_returned = panchanga.tithi(jd, place)
-    _tithis = [_tithi_returned[0],_tithi_returned[3]] if len(_tithi_returned)>3 else [_tithi_returned[0]]
-    _naks = panchanga.nakshatra(jd, place)
-    _nak_ids = [_naks[0],_naks[3]] if len(_naks)>3 else [_naks[0]]
-    tm = None; td = None; adhik_maasa = None; _vaara = panchanga.vaara(jd)+1
-    day_id = panchanga.vaara(jd)
+def _get_criteria_for_the_day(jd,place,use_purnimanta_system=None,day_panchanga=None):
+    """
+        @param day_panchanga: drik.DayPanchanga of jd/place. If None drik.day_panchanga(jd,place) is used
+    """
+    dp = panchanga.day_panchanga(jd, place) if day_panchanga is None else day_panchanga
+    _tithis = [dp.tithi[0],dp.tithi[3]] if len(dp.tithi)>3 else [dp.tithi[0]]
+    _nak_ids = [dp.nakshatra[0],dp.nakshatra[3]] if len(dp.nakshatra)>3 else [dp.nakshatra[0]]
+    adhik_maasa = None
     if use_purnimanta_system is None:
-        tm,td = panchanga.tamil_solar_month_and_date(date_in, place)
+        tm,td = dp.solar_month,dp.solar_day
     else:
-        tm,td,_,adhik_maasa,_ = panchanga.lunar_month_date(jd,place,
-                                                use_purnimanta_system=use_purnimanta_system)
+        tm,td,_,adhik_maasa,_ = dp.vedic_date(calendar_type=2 if use_purnimanta_system else 1)
         tm -= 1
     criteria = {
         'Tithi': _tithis,
         'Nakshatra': _nak_ids,
         'tamil_month': tm+1,
         'tamil_day': td,
-        'vaara':day_id+1,
+        'vaara':dp.vaara+1,
         'adhik_maasa':adhik_maasa,
     }
     return criteria
+""" Festival table columns that are compared against the criteria of the day """
+_festival_criteria_keys = ['Tithi','Nakshatra','tamil_month','tamil_day','vaara','adhik_maasa']
+""" 
+    festival_data compiled to rules. conditions: ((criteria_key, value),...) of non-empty columns.
+    Rules are indexed by (calendar_type,tithi) and by (calendar_type,nakshatra) (if rule has no tithi)
+    Rules with neither tithi nor nakshatra are in others[calendar_type]. Rows that have non-numeric values never match
+"""
+FestivalRule = struct('FestivalRule',['order','calendar_type','conditions','name_casefold','row'])
+FestivalRuleIndex = struct('FestivalRuleIndex',['source','rules','by_tithi','by_nakshatra','others'])
+_festival_rule_index = None
+def _compile_festival_rules():
+    """ Compile festival_data once (again only if festival_data is reloaded) """
+    global _festival_rule_index
+    if len(festival_data) == 0: load_festival_data(const._FESTIVAL_FILE)
+    if _festival_rule_index is not None and _festival_rule_index.source is festival_data:
+        return _festival_rule_index
+    rules = []; by_tithi = {}; by_nakshatra = {}; others = {}
+    for row in festival_data:
+        try:
+            calendar_type = int(row['calendar_type'])
+            conditions = tuple((key,float(row[key])) for key in _festival_criteria_keys if row.get(key))
+        except (ValueError, TypeError, KeyError):
+            continue
+        if calendar_type not in (0,1,2):
+            continue
+        rule = FestivalRule(len(rules),calendar_type,conditions,row['Festival_en'].casefold(),row)
+        rules.append(rule)
+        condition_values = dict(conditions)
+        if 'Tithi' in condition_values:
+            by_tithi.setdefault((calendar_type,condition_values['Tithi']),[]).append(rule.order)
+        elif 'Nakshatra' in condition_values:
+            by_nakshatra.setdefault((calendar_type,condition_values['Nakshatra']),[]).append(rule.order)
+        else:
+            others.setdefault(calendar_type,[]).append(rule.order)
+    _festival_rule_index = FestivalRuleIndex(festival_data,rules,by_tithi,by_nakshatra,others)
+    return _festival_rule_index
+def _festival_rule_matches(rule,criteria):
+    for key,value in rule.conditions:
+        day_value = criteria[key]
+        if isinstance(day_value,list):
+            if value not in day_value: return False
+        elif day_value is None or value != day_value:
+            return False
+    return True
+def _get_matching_festival_rules(criteria_list,festival_name_contains=None):
+    """
+        @param criteria_list: [criteria of solar, amantha, purnimantha calendars] as from _get_criteria_for_the_day
+            Criteria values can also be lists of possible values
+        @return: matching FestivalRules in festival_data order
+    """
+    rule_index = _compile_festival_rules()
+    candidates = set()
+    for calendar_type,criteria in enumerate(criteria_list):
+        for tithi_no in criteria['Tithi']:
+            candidates.update(rule_index.by_tithi.get((calendar_type,tithi_no),[]))
+        for nak_no in criteria['Nakshatra']:
+            candidates.update(rule_index.by_nakshatra.get((calendar_type,nak_no),[]))
+        candidates.update(rule_index.others.get(calendar_type,[]))
+    name_contains = None if festival_name_contains is None else festival_name_contains.casefold()
+    matching_rules = []
+    for order in sorted(candidates):
+        rule = rule_index.rules[order]
+        if name_contains is not None and name_contains not in rule.name_casefold:
+            continue
+        if _festival_rule_matches(rule, criteria_list[rule.calendar_type]):
+            matching_rules.append(rule)
+    return matching_rules
+""" Margin (days) around tithi end at midnight within which the day criteria is not certain (approximate end times) """
+_festival_boundary_margin = 0.1
+""" Margin (days) around tithi/nakshatra change at the time of the day and margin (degrees) of moon from a sign
+    boundary at new moon within which the day criteria is not certain """
+_festival_instant_margin = 0.001; _festival_new_moon_sign_margin = 0.25
+def _get_festival_criteria_between_the_dates(start_jd,end_jd,place):
+    """
+        Criteria (as _get_criteria_for_the_day) of days from start_jd to end_jd (same time each day)
+        computed from tithi/nakshatra transitions, new moons and sunset solar longitudes over the whole range
+        instead of day panchanga of each day.
+        @return: yields (jd, certain_criteria_list, possible_criteria_list)
+            Values that are not certain (close to a boundary) are left out of certain_criteria_list
+            and possible_criteria_list has all their possible values.
+            possible_criteria_list is None if the criteria of the day is certain
+    """
+    tz = place.timezone/24.0
+    tithis = list(panchanga.iter_transitions(start_jd-33, end_jd+33, place, kinds=('tithi',)))
+    tithi_starts = [t.start_jd for t in tithis]
+    new_moons = [t.start_jd for t in tithis if t.index==1]
+    naks = list(panchanga.iter_transitions(start_jd-1, end_jd+1, place, kinds=('nakshatra',)))
+    nak_starts = [t.start_jd for t in naks]
+    def _element_at(transitions,starts,jd,element_count):
+        """ @return: element at jd, possible indices at jd """
+        element = transitions[bisect.bisect_right(starts, jd)-1]
+        if min(jd-element.start_jd,element.end_jd-jd) < _festival_instant_margin:
+            return element, [(element.index-2)%element_count+1,element.index,element.index%element_count+1]
+        return element, [element.index]
+    new_moon_signs = {}
+    def _new_moon_signs(new_moon_jd):
+        """ possible moon signs (0..11) at new moon - as in lunar_month_date """
+        if new_moon_jd not in new_moon_signs:
+            moon_long = panchanga.lunar_longitude(new_moon_jd-tz)
+            new_moon_signs[new_moon_jd] = {int(((moon_long+d)%360)//30) for d in
+                                           [0.0,-_festival_new_moon_sign_margin,_festival_new_moon_sign_margin]}
+        return new_moon_signs[new_moon_jd]
+    sunset_solar_longitudes = {}
+    def _sunset_solar_longitude(jd):
+        """ as in tamil_solar_month_and_date_new (base_time=0, use_utc=True) """
+        if jd not in sunset_solar_longitudes:
+            sunset_solar_longitudes[jd] = panchanga.solar_longitude(panchanga.sunset(jd, place)[2]-tz)
+        return sunset_solar_longitudes[jd]
+    _solar_month_starts = lambda jd: 0 < _sunset_solar_longitude(jd)%30 < 1
+    solar_day = None
+    jd = start_jd
+    while jd <= end_jd:
+        """ Tithi now and next tithi if it starts before midnight """
+        tithi_now, tithi_possible = _element_at(tithis, tithi_starts, jd, 30)
+        uncertain = len(tithi_possible) > 1
+        tithi_certain = [] if uncertain else [tithi_now.index]
+        next_midnight = math.floor(jd-0.5)+1.5
+        next_tithi = tithi_possible[-1]%30+1
+        if tithi_now.end_jd < next_midnight+_festival_boundary_margin:
+            tithi_possible.append(next_tithi)
+            if tithi_now.end_jd < next_midnight-_festival_boundary_margin:
+                tithi_certain.append(next_tithi)
+            else:
+                uncertain = True
+        """ Nakshatra now """
+        _, nak_possible = _element_at(naks, nak_starts, jd, 27)
+        nak_certain = [] if len(nak_possible) > 1 else nak_possible
+        uncertain = uncertain or len(nak_possible) > 1
+        """ Solar month and day """
+        if const.tamil_month_method==3:
+            solar_month = int(_sunset_solar_longitude(jd)/30)
+            if solar_day is None:
+                solar_day = 1
+                while not _solar_month_starts(jd-solar_day+1): solar_day += 1
+            else:
+                solar_day = 1 if _solar_month_starts(jd) else solar_day+1
+        else:
+            solar_month,solar_day = panchanga.tamil_solar_month_and_date(panchanga.Date(*utils.jd_to_gregorian(jd)[:3]), place)
+        certain_criteria = {'Tithi':tithi_certain,'Nakshatra':nak_certain,'tamil_month':solar_month+1,
+                            'tamil_day':solar_day,'vaara':panchanga.vaara(jd)+1,'adhik_maasa':None}
+        possible_criteria = dict(certain_criteria,Tithi=tithi_possible,Nakshatra=nak_possible)
+        certain_criteria_list = [certain_criteria]; possible_criteria_list = [possible_criteria]
+        """ Lunar month and day - from tithi at sunrise and moon signs at new moons before and after sunrise """
+        sunrise_jd = panchanga.sunrise(jd, place)[2]
+        _, sunrise_tithis = _element_at(tithis, tithi_starts, sunrise_jd, 30)
+        k = bisect.bisect_right(new_moons, sunrise_jd)
+        this_signs = _new_moon_signs(new_moons[k-1]); next_signs = _new_moon_signs(new_moons[k])
+        for use_purnimanta_system in [False,True]:
+            lunar_dates = set()
+            for ti in sunrise_tithis:
+                for this_solar_month in this_signs:
+                    for next_solar_month in next_signs:
+                        _lunar_month = (this_solar_month+1)%12; lunar_day = ti
+                        if use_purnimanta_system:
+                            if lunar_day > 15: _lunar_month = (_lunar_month+1)%12
+                            lunar_day = (lunar_day - 16)%30 + 1
+                        lunar_dates.add((_lunar_month+1,lunar_day,this_solar_month==next_solar_month))
+            uncertain = uncertain or len(lunar_dates) > 1
+            lunar_certain = dict(certain_criteria); lunar_possible = dict(possible_criteria)
+            for key,values in zip(['tamil_month','tamil_day','adhik_maasa'],zip(*lunar_dates)):
+                values = sorted(set(values))
+                lunar_certain[key] = values[0] if len(values)==1 else []
+                lunar_possible[key] = values[0] if len(values)==1 else values
+            certain_criteria_list.append(lunar_certain); possible_criteria_list.append(lunar_possible)
+        yield jd, certain_criteria_list, (possible_criteria_list if uncertain else None)
+        jd += 1
 def get_festivals_between_the_dates(start_date:panchanga.Date, end_date:panchanga.Date, place:panchanga.Place,
                                     festival_name_contains=None):
-    #global festival_data
-    #if len(festival_data) == 0: load_festival_data(const._FESTIVAL_FILE)
+    """
+        Festivals of each day between the dates (both inclusive)
+        Criteria of the days come from panchanga transitions of the whole date range (_get_festival_criteria_between_the_dates)
+        Day panchanga is computed only for days where a festival may or may not occur (close to a panchanga boundary)
+        @return: [((year,month,day,hours),[festival rows]),...] one entry for each day
+    """
     start_jd = utils.julian_day_number(start_date, (12,0,0))
     end_jd = utils.julian_day_number(end_date, (12,0,0))
     matching_festivals = []
-    while start_jd <= end_jd:
-        mfd = get_festivals_of_the_day(start_jd, place,festival_name_contains=festival_name_contains)
-        matching_festivals.append((utils.jd_to_gregorian(start_jd),mfd))
-        start_jd += 1
-    return matching_festivals
-def get_festivals_of_the_day(jd,place,festival_name_contains=None):
-    global festival_data
-    if len(festival_data) == 0: load_festival_data(const._FESTIVAL_FILE)
-    matching_festivals = []
-    criteria_list = [_get_criteria_for_the_day(jd, place, use_purnimanta_system=c) for c in [None,False,True]]
-    check_rows = festival_data if festival_name_contains is None \
-        else [row for row in festival_data if festival_name_contains.casefold() in row['Festival_en'].casefold()]
-    for row in check_rows:#festival_data:
-        criteria = criteria_list[int(row['calendar_type'])]
-        #print(row['Festival_name'],utils.jd_to_gregorian(jd),criteria)
-        match = True
-        for key, value in criteria.items():
-            if row.get(key):
-                try:
-                    # Convert both to float for comparison (handles empty strings gracefully)
-                    if isinstance(value,list):
-                        match = match and any([float(row[key]) ==float(v) for v in value])# == float(value)
-                    else:
-                        match = match and float(row[key]) == float(value)
-                    if festival_name_contains is not None:
-                        match = match and festival_name_contains.casefold() in row['Festival_en'].casefold()
-                        #print(row['Festival_en'],festival_name_contains,match)
-                except:
-                    match = False
-                    break
-        if match:
-            matching_festivals.append(row)
+    for jd,certain_criteria_list,possible_criteria_list in _get_festival_criteria_between_the_dates(start_jd, end_jd, place):
+        festival_rules = _get_matching_festival_rules(certain_criteria_list, festival_name_contains)
+        if possible_criteria_list is not None and \
+                festival_rules != _get_matching_festival_rules(possible_criteria_list, festival_name_contains):
+            mfd = get_festivals_of_the_day(jd, place, festival_name_contains=festival_name_contains)
+        else:
+            mfd = [rule.row for rule in festival_rules]
+        matching_festivals.append((utils.jd_to_gregorian(jd),mfd))
     return matching_festivals
+def get_festivals_of_the_day(jd,place,festival_name_contains=None,day_panchanga=None):
+    dp = panchanga.day_panchanga(jd, place) if day_panchanga is None else day_panchanga
+    criteria_list = [_get_criteria_for_the_day(jd, place, use_purnimanta_system=c, day_panchanga=dp) for c in [None,False,True]]
+    return [rule.row for rule in _get_matching_festival_rules(criteria_list, festival_name_contains)]
 # Function to get festival row based on input parameters
 def get_festival(tithi=None, nakshatra=None, tamil_month=None, tamil_day=None,vaara=None,adhik_maasa=None):
     """
@@ -926,9 +926,41 @@ def vimsottari_tests():
     _vimsottari_test_7()
     _vimsottari_test_8()
     _vimsottari_test_9()
+    _vimsottari_timeline_test()
+    _tribhagi_repeat_tests()
     """ TODO: SOMEHOW WITHOUT below return FULL TEST FAILS THOUGH vimsottari_tests() alone passes """
     return
     _vimsottari_test_11()
+def _tribhagi_repeat_tests():
+    from jhora.horoscope.dhasa.graha import vimsottari, ashtottari, yoga_vimsottari
+    chapter = 'Tribhagi variation repeat tests'
+    dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,IN',13.0389, 80.2619, +5.5)
+    jd = utils.julian_day_number(dob,tob)
+    dhasa_functions = {'vimsottari':lambda t: vimsottari.get_vimsottari_dhasa_bhukthi(jd, place, use_tribhagi_variation=t),
+                       'ashtottari':lambda t: ashtottari.get_ashtottari_dhasa_bhukthi(jd, place, use_tribhagi_variation=t),
+                       'yoga vimsottari':lambda t: yoga_vimsottari.get_dhasa_bhukthi(jd, place, use_tribhagi_variation=t)}
+    for dhasa,dhasa_function in dhasa_functions.items():
+        normal = dhasa_function(False); tribhagi = dhasa_function(True)
+        test_example(chapter,tribhagi,dhasa_function(True),dhasa,'tribhagi called again')
+        test_example(chapter,normal,dhasa_function(False),dhasa,'normal after tribhagi')
+    test_example(chapter,{8: 7, 5: 20, 0: 6, 1: 10, 2: 7, 7: 18, 4: 16, 6: 19, 3: 17},const.vimsottari_dict)
+def _vimsottari_timeline_test():
+    from jhora.horoscope.dhasa.graha import vimsottari
+    chapter = 'Vimsottari timeline tests'
+    dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,IN',13.0389, 80.2619, +5.5)
+    jd = utils.julian_day_number(dob,tob)
+    timeline = vimsottari.vimsottari_dhasa_timeline(jd, place)
+    _,exp = vimsottari.get_vimsottari_dhasa_bhukthi(jd, place)
+    test_example(chapter+' dhasa bhukthi list',exp,timeline.to_list(depth=2))
+    mahadashas = vimsottari.vimsottari_mahadasa(jd, place)
+    for years in range(5,100,15):
+        jd_at = jd + years*vimsottari.year_duration
+        i,j,antara = vimsottari.compute_vimsottari_antara_from(jd_at, mahadashas)
+        exp = (i,j,vimsottari._where_occurs(jd_at, antara))
+        test_example(chapter+' running dhasa/bhukthi/antara',exp,timeline.lords_at(jd_at,depth=3),'years',years)
+        periods = timeline.periods_at(jd_at, depth=5)
+        test_example(chapter+' sookshma/prana within antara',True,
+                     all(periods[l-1][1]<=periods[l][1]<=jd_at<periods[l][2]<=periods[l-1][2]+1e-6 for l in range(1,5)))
 def _vimsottari_test_10():
     from jhora.horoscope.dhasa.graha import vimsottari
     chapter = 'Vimsottari tests'
@@ -4463,15 +4495,30 @@ def tithi_pravesha_tests():
     sr = vratha.tithi_pravesha(birth_date=p_date,birth_time=tob,birth_place=place,year_number=2024)
     tp_date = sr[0][0] ; tp_time = utils.to_dms(sr[0][1]) ; tp_desc = sr[0][-1]
     test_example(chapter, (2024,11,27), tp_date)
-    expected_tp_time = '11:22:05 AM'# '11:21:59 AM'#'11:25:56 AM'
+    expected_tp_time = '11:21:48 AM'#'11:22:05 AM'# '11:21:59 AM'#'11:25:56 AM'
     test_example(chapter,expected_tp_time,tp_time)
     #test_example(chapter,'Kaarthigai Krishna Dhuvadhasi',tp_desc)
     c_year = 2023
     sr = vratha.tithi_pravesha(birth_date=p_date,birth_time=tob,birth_place=place,year_number=c_year)
     tp_date = sr[0][0] ; tp_time = utils.to_dms(sr[0][1]) ; tp_desc = sr[0][-1]
     test_example(chapter, (2023,12,9), tp_date)
-    expected_tp_time = '13:38:14 PM'#'13:38:04 PM' # '13:37:02 PM'
+    expected_tp_time = '13:36:21 PM'#'13:38:14 PM'#'13:38:04 PM' # '13:37:02 PM'
     test_example(chapter,expected_tp_time,tp_time)
+def festival_range_tests():
+    """ Festivals from the range search should be same as festivals of each day """
+    chapter = 'Festivals between the dates test'
+    place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    for start_date,end_date,desc in [((2024,12,15),(2025,1,20),'over year end'),((2023,7,10),(2023,8,25),'adhika maasa')]:
+        festivals = vratha.get_festivals_between_the_dates(drik.Date(*start_date), drik.Date(*end_date), place)
+        test_example(chapter+' '+desc+' first/last day',[start_date,end_date],[festivals[0][0][:3],festivals[-1][0][:3]])
+        adhik_maasa_days = 0
+        for (y,m,d,_),rows in festivals:
+            jd = utils.julian_day_number((y,m,d),(12,0,0))
+            exp = [row['Festival_en'] for row in vratha.get_festivals_of_the_day(jd, place)]
+            test_example(chapter+' '+desc,exp,[row['Festival_en'] for row in rows],(y,m,d))
+            adhik_maasa_days += drik.day_panchanga(jd, place).vedic_date(calendar_type=1)[3]
+        if desc == 'adhika maasa':
+            test_example(chapter+' range has adhika maasa days',True,adhik_maasa_days > 0)
 def planet_transit_tests():
     chapter = 'Planet Transit '
     dcf = 1; dob = (1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
@@ -4482,7 +4529,7 @@ def planet_transit_tests():
     expected_results = [[(1996,12,15),'17:38:13 PM','240° 0’ 0"',8,'17:38:10 PM'],[(1996,12,9),'03:46:39 AM','210° 0’ 0"',7,'03:46:39 AM'],
                         [(1996,12,17),'17:37:35 PM','150° 0’ 0"',5,'17:37:27 PM'],[(1997,2,5),'01:17:28 AM','270° 0’ 0"',9,'01:17:26 AM'],
                         [(1996,12,26),'07:08:27 AM','270° 0’ 0"',9,'07:08:12 AM'],[(1996,12,12),'11:44:47 AM','210° 0’ 0"',7,'11:44:44 AM'],
-                        [(1998,4,17),'11:40:07 AM','360° 0’ 0"',0,'11:39:41 AM'],[(1997,6,24),'14:21:37 PM','150° 0’ 0"',5,'14:22:40 PM'],
+                        [(1998,4,17),'11:40:07 AM','0° 0’ 0"',0,'11:39:41 AM'],[(1997,6,24),'14:21:37 PM','150° 0’ 0"',5,'14:22:40 PM'],
                         [(1997,6,24),'14:21:37 PM','330° 0’ 0"',11,'14:22:40 PM']]
     for planet in range(9):
         p_str = "Next transit of "+utils.PLANET_NAMES[planet]
@@ -4514,13 +4561,13 @@ def planet_transit_tests():
     exercise = "Entry to specific rasi "
     exp_results = {0: {1: [((1997, 4, 13), '22:42:10 PM'), ((1996, 4, 13), '16:35:29 PM')], 2: [((1997, 5, 14), '19:37:59 PM'), ((1996, 5, 14), '13:30:14 PM')], 3: [((1997, 6, 15), '02:17:42 AM'), ((1996, 6, 14), '20:08:52 PM')], 4: [((1997, 7, 16), '13:12:18 PM'), ((1996, 7, 16), '07:02:33 AM')], 5: [((1997, 8, 16), '21:36:52 PM'), ((1996, 8, 16), '15:26:34 PM')], 6: [((1997, 9, 16), '21:32:20 PM'), ((1996, 9, 16), '15:21:37 PM')], 7: [((1997, 10, 17), '09:28:58 AM'), ((1996, 10, 17), '03:17:07 AM')], 8: [((1997, 11, 16), '09:16:41 AM'), ((1996, 11, 16), '03:02:36 AM')], 9: [((1996, 12, 15), '17:38:13 PM'), ((1995, 12, 16), '11:35:10 AM')], 10: [((1997, 1, 14), '04:19:20 AM'), ((1996, 1, 14), '22:15:18 PM')], 11: [((1997, 2, 12), '17:16:54 PM'), ((1996, 2, 13), '11:11:54 AM')], 12: [((1997, 3, 14), '14:09:54 PM'), ((1996, 3, 14), '08:04:04 AM')]}, 
                    1: {1: [((1996, 12, 19), '16:31:11 PM'), ((1996, 11, 22), '10:44:21 AM')], 2: [((1996, 12, 21), '23:16:27 PM'), ((1996, 11, 24), '16:30:37 PM')], 3: [((1996, 12, 24), '07:50:15 AM'), ((1996, 11, 27), '00:18:17 AM')], 4: [((1996, 12, 26), '18:20:18 PM'), ((1996, 11, 29), '10:39:34 AM')], 5: [((1996, 12, 29), '06:39:56 AM'), ((1996, 12, 1), '23:06:44 PM')], 6: [((1996, 12, 31), '19:36:03 PM'), ((1996, 12, 4), '11:38:54 AM')], 7: [((1997, 1, 3), '06:46:03 AM'), ((1996, 12, 6), '21:39:25 PM')], 8: [((1996, 12, 9), '03:46:39 AM'), ((1996, 11, 11), '18:08:36 PM')], 9: [((1996, 12, 11), '06:32:45 AM'), ((1996, 11, 13), '21:45:29 PM')], 10: [((1996, 12, 13), '07:38:24 AM'), ((1996, 11, 16), '00:19:21 AM')], 11: [((1996, 12, 15), '08:54:37 AM'), ((1996, 11, 18), '02:58:23 AM')], 12: [((1996, 12, 17), '11:41:54 AM'), ((1996, 11, 20), '06:20:53 AM')]}, 
-                   2: {1: [((1998, 4, 5), '00:54:59 AM'), ((1996, 4, 24), '18:41:06 PM')], 2: [((1998, 5, 15), '18:03:16 PM'), ((1996, 6, 4), '05:24:24 AM')], 3: [((1998, 6, 27), '12:36:52 PM'), ((1996, 7, 16), '20:49:43 PM')], 4: [((1998, 8, 11), '12:06:25 PM'), ((1996, 8, 31), '06:28:45 AM')], 5: [((1998, 9, 27), '17:23:29 PM'), ((1996, 10, 19), '13:41:23 PM')], 6: [((1996, 12, 17), '17:37:35 PM'), ((1995, 7, 10), '21:44:27 PM')], 7: [((1997, 8, 4), '07:51:28 AM'), ((1995, 8, 29), '00:42:52 AM')], 8: [((1997, 9, 20), '05:01:59 AM'), ((1995, 10, 12), '08:35:42 AM')], 9: [((1997, 11, 1), '04:26:54 AM'), ((1995, 11, 22), '13:42:32 PM')], 10: [((1997, 12, 10), '13:44:34 PM'), ((1995, 12, 31), '17:52:36 PM')], 11: [((1998, 1, 17), '18:54:20 PM'), ((1996, 2, 7), '21:01:04 PM')], 12: [((1998, 2, 24), '23:03:20 PM'), ((1996, 3, 16), '22:06:55 PM')]}, 
-                   3: {1: [((1997, 3, 28), '19:42:38 PM'), ((1996, 4, 5), '06:54:39 AM')], 2: [((1997, 6, 5), '11:48:45 AM'), ((1996, 6, 7), '16:13:46 PM')], 3: [((1997, 6, 21), '05:52:11 AM'), ((1996, 6, 29), '10:23:45 AM')], 4: [((1997, 7, 5), '06:48:53 AM'), ((1996, 7, 13), '16:29:45 PM')], 5: [((1997, 7, 22), '17:00:52 PM'), ((1996, 7, 29), '04:25:17 AM')], 6: [((1997, 9, 29), '00:04:22 AM'), ((1996, 10, 4), '18:10:34 PM')], 7: [((1997, 10, 16), '00:29:51 AM'), ((1996, 10, 23), '14:24:39 PM')], 8: [((1997, 11, 3), '20:13:15 PM'), ((1996, 11, 10), '22:52:48 PM')], 9: [((1997, 11, 25), '04:26:36 AM'), ((1996, 11, 30), '13:41:10 PM')], 10: [((1997, 2, 5), '01:17:28 AM'), ((1996, 2, 9), '05:11:13 AM')], 11: [((1997, 2, 24), '18:15:05 PM'), ((1996, 3, 3), '19:09:13 PM')], 12: [((1997, 3, 13), '06:20:21 AM'), ((1996, 3, 21), '07:53:10 AM')]}, 
+                   2: {1: [((1998, 4, 5), '00:56:33 AM'), ((1996, 4, 24), '18:41:05 PM')], 2: [((1998, 5, 15), '18:03:16 PM'), ((1996, 6, 4), '05:24:24 AM')], 3: [((1998, 6, 27), '12:36:52 PM'), ((1996, 7, 16), '20:49:43 PM')], 4: [((1998, 8, 11), '12:06:25 PM'), ((1996, 8, 31), '06:28:45 AM')], 5: [((1998, 9, 27), '17:23:29 PM'), ((1996, 10, 19), '13:41:23 PM')], 6: [((1996, 12, 17), '17:37:35 PM'), ((1995, 7, 10), '21:44:27 PM')], 7: [((1997, 8, 4), '07:51:28 AM'), ((1995, 8, 29), '00:42:52 AM')], 8: [((1997, 9, 20), '05:01:59 AM'), ((1995, 10, 12), '08:35:42 AM')], 9: [((1997, 11, 1), '04:26:54 AM'), ((1995, 11, 22), '13:42:32 PM')], 10: [((1997, 12, 10), '13:44:34 PM'), ((1995, 12, 31), '17:52:36 PM')], 11: [((1998, 1, 17), '18:54:20 PM'), ((1996, 2, 7), '21:01:04 PM')], 12: [((1998, 2, 24), '23:03:20 PM'), ((1996, 3, 16), '22:06:55 PM')]}, 
+                   3: {1: [((1997, 3, 28), '19:42:31 PM'), ((1996, 4, 5), '06:54:39 AM')], 2: [((1997, 6, 5), '11:48:44 AM'), ((1996, 6, 7), '16:13:46 PM')], 3: [((1997, 6, 21), '05:52:11 AM'), ((1996, 6, 29), '10:23:45 AM')], 4: [((1997, 7, 5), '06:48:53 AM'), ((1996, 7, 13), '16:29:45 PM')], 5: [((1997, 7, 22), '17:00:52 PM'), ((1996, 7, 29), '04:25:17 AM')], 6: [((1997, 9, 29), '00:04:22 AM'), ((1996, 10, 4), '18:10:34 PM')], 7: [((1997, 10, 16), '00:29:51 AM'), ((1996, 10, 23), '14:24:39 PM')], 8: [((1997, 11, 3), '20:13:15 PM'), ((1996, 11, 10), '22:52:48 PM')], 9: [((1997, 11, 25), '04:26:36 AM'), ((1996, 11, 30), '13:41:10 PM')], 10: [((1997, 2, 5), '01:17:28 AM'), ((1996, 2, 9), '05:11:13 AM')], 11: [((1997, 2, 24), '18:15:05 PM'), ((1996, 3, 3), '19:09:13 PM')], 12: [((1997, 3, 13), '06:20:21 AM'), ((1996, 3, 21), '07:53:10 AM')]}, 
                    4: {1: [((1999, 5, 26), '15:43:55 PM'), ((1988, 2, 3), '01:52:00 AM')], 2: [((2000, 6, 2), '18:12:29 PM'), ((1988, 6, 19), '22:16:53 PM')], 3: [((2001, 6, 16), '06:35:20 AM'), ((1989, 7, 2), '04:48:35 AM')], 4: [((2002, 7, 5), '11:30:09 AM'), ((1990, 7, 20), '22:51:07 PM')], 5: [((2003, 7, 30), '11:03:33 AM'), ((1991, 8, 14), '14:45:51 PM')], 6: [((2004, 8, 27), '22:45:35 PM'), ((1992, 9, 11), '17:54:36 PM')], 7: [((2005, 9, 28), '04:41:51 AM'), ((1993, 10, 12), '17:35:21 PM')], 8: [((2006, 10, 27), '21:26:38 PM'), ((1994, 11, 11), '11:23:40 AM')], 9: [((2007, 11, 22), '04:12:29 AM'), ((1995, 12, 7), '06:04:36 AM')], 10: [((1996, 12, 26), '07:08:27 AM'), ((1985, 1, 10), '13:45:55 PM')], 11: [((1998, 1, 8), '15:03:03 PM'), ((1986, 1, 25), '06:11:36 AM')], 12: [((1998, 5, 26), '03:34:14 AM'), ((1987, 2, 3), '00:20:49 AM')]}, 
-                   5: {1: [((1997, 4, 11), '15:08:35 PM'), ((1996, 2, 29), '19:23:33 PM')], 2: [((1997, 5, 5), '22:06:36 PM'), ((1996, 3, 28), '14:05:46 PM')], 3: [((1997, 5, 30), '08:24:28 AM'), ((1996, 7, 30), '15:59:18 PM')], 4: [((1997, 6, 23), '22:00:40 PM'), ((1996, 9, 1), '13:04:37 PM')], 5: [((1997, 7, 18), '15:39:10 PM'), ((1996, 9, 28), '23:25:03 PM')], 6: [((1997, 8, 12), '15:20:07 PM'), ((1996, 10, 24), '13:47:36 PM')], 7: [((1997, 9, 7), '00:33:47 AM'), ((1996, 11, 18), '06:18:39 AM')], 8: [((1996, 12, 12), '11:44:47 AM'), ((1995, 10, 29), '16:00:57 PM')], 9: [((1997, 1, 5), '12:16:00 PM'), ((1995, 11, 22), '18:57:34 PM')], 10: [((1997, 1, 29), '11:14:26 AM'), ((1995, 12, 16), '23:24:18 PM')], 11: [((1997, 2, 22), '10:32:10 AM'), ((1996, 1, 10), '08:03:44 AM')], 12: [((1997, 3, 18), '11:28:51 AM'), ((1996, 2, 4), '02:49:58 AM')]}, 
-                   6: {1: [((1998, 4, 17), '11:40:07 AM'), ((1969, 3, 7), '14:07:15 PM')], 2: [((2000, 6, 6), '23:34:39 PM'), ((1971, 4, 28), '08:59:08 AM')], 3: [((2002, 7, 23), '06:47:53 AM'), ((1973, 6, 10), '17:56:30 PM')], 4: [((2004, 9, 6), '03:13:41 AM'), ((1975, 7, 23), '15:17:52 PM')], 5: [((2006, 11, 1), '05:55:32 AM'), ((1906, 12, 5), '15:56:32 PM')], 6: [((2009, 9, 9), '22:34:07 PM'), ((1980, 7, 27), '08:05:16 AM')], 7: [((2011, 11, 15), '08:44:25 AM'), ((1982, 10, 6), '05:01:28 AM')], 8: [((2014, 11, 2), '19:24:10 PM'), ((1985, 9, 17), '03:44:18 AM')], 9: [((2017, 1, 26), '18:01:45 PM'), ((1987, 12, 17), '01:20:28 AM')], 10: [((2020, 1, 24), '08:24:53 AM'), ((1990, 12, 14), '23:38:09 PM')], 11: [((2022, 4, 29), '06:29:37 AM'), ((1993, 11, 10), '03:56:55 AM')], 12: [((2025, 3, 29), '20:17:12 PM'), ((1996, 2, 16), '16:53:11 PM')]}, 
-                   7: {1: [((2005, 3, 25), '05:07:48 AM'), ((1986, 8, 18), '17:42:01 PM')], 2: [((2003, 9, 6), '02:10:30 AM'), ((1985, 1, 29), '14:45:01 PM')], 3: [((2002, 2, 16), '23:13:15 PM'), ((1983, 7, 13), '11:48:03 AM')], 4: [((2000, 7, 30), '20:16:01 PM'), ((1981, 12, 24), '08:51:07 AM')], 5: [((1999, 1, 11), '17:18:48 PM'), ((1980, 6, 6), '05:54:11 AM')], 6: [((1997, 6, 24), '14:21:37 PM'), ((1978, 11, 18), '02:57:17 AM')], 7: [((2014, 7, 12), '22:51:57 PM'), ((1995, 12, 6), '11:24:28 AM')], 8: [((2012, 12, 23), '19:54:32 PM'), ((1994, 5, 19), '08:27:20 AM')], 9: [((2011, 6, 6), '16:57:09 PM'), ((1992, 10, 30), '05:30:14 AM')], 10: [((2009, 11, 17), '13:59:46 PM'), ((1991, 4, 13), '02:33:09 AM')], 11: [((2008, 4, 30), '11:02:25 AM'), ((1989, 9, 23), '23:36:05 PM')], 12: [((2006, 10, 12), '08:05:06 AM'), ((1988, 3, 6), '20:39:03 PM')]},
-                   8: {7: [((2005, 3, 25), '05:07:48 AM'), ((1986, 8, 18), '17:42:01 PM')], 8: [((2003, 9, 6), '02:10:30 AM'), ((1985, 1, 29), '14:45:01 PM')], 9: [((2002, 2, 16), '23:13:15 PM'), ((1983, 7, 13), '11:48:03 AM')], 10: [((2000, 7, 30), '20:16:01 PM'), ((1981, 12, 24), '08:51:07 AM')], 11: [((1999, 1, 11), '17:18:48 PM'), ((1980, 6, 6), '05:54:11 AM')], 12: [((1997, 6, 24), '14:21:37 PM'), ((1978, 11, 18), '02:57:17 AM')], 1: [((2014, 7, 12), '22:51:57 PM'), ((1995, 12, 6), '11:24:28 AM')], 2: [((2012, 12, 23), '19:54:32 PM'), ((1994, 5, 19), '08:27:20 AM')], 3: [((2011, 6, 6), '16:57:09 PM'), ((1992, 10, 30), '05:30:14 AM')], 4: [((2009, 11, 17), '13:59:46 PM'), ((1991, 4, 13), '02:33:09 AM')], 5: [((2008, 4, 30), '11:02:25 AM'), ((1989, 9, 23), '23:36:05 PM')], 6: [((2006, 10, 12), '08:05:06 AM'), ((1988, 3, 6), '20:39:03 PM')]}
+                   5: {1: [((1997, 4, 11), '15:08:35 PM'), ((1996, 2, 29), '19:23:32 PM')], 2: [((1997, 5, 5), '22:06:36 PM'), ((1996, 3, 28), '14:05:46 PM')], 3: [((1997, 5, 30), '08:24:28 AM'), ((1996, 7, 30), '15:59:18 PM')], 4: [((1997, 6, 23), '22:00:40 PM'), ((1996, 9, 1), '13:04:37 PM')], 5: [((1997, 7, 18), '15:39:10 PM'), ((1996, 9, 28), '23:25:03 PM')], 6: [((1997, 8, 12), '15:20:07 PM'), ((1996, 10, 24), '13:47:36 PM')], 7: [((1997, 9, 7), '00:33:47 AM'), ((1996, 11, 18), '06:18:39 AM')], 8: [((1996, 12, 12), '11:44:47 AM'), ((1995, 10, 29), '16:00:57 PM')], 9: [((1997, 1, 5), '12:16:00 PM'), ((1995, 11, 22), '18:57:34 PM')], 10: [((1997, 1, 29), '11:14:26 AM'), ((1995, 12, 16), '23:24:18 PM')], 11: [((1997, 2, 22), '10:32:10 AM'), ((1996, 1, 10), '08:03:44 AM')], 12: [((1997, 3, 18), '11:28:51 AM'), ((1996, 2, 4), '02:49:58 AM')]}, 
+                   6: {1: [((1998, 4, 17), '11:40:07 AM'), ((1969, 3, 7), '14:07:15 PM')], 2: [((2000, 6, 6), '23:34:39 PM'), ((1971, 4, 28), '08:59:08 AM')], 3: [((2002, 7, 23), '06:47:53 AM'), ((1973, 6, 10), '17:56:30 PM')], 4: [((2004, 9, 6), '03:13:41 AM'), ((1975, 7, 23), '15:17:52 PM')], 5: [((2006, 11, 1), '05:55:33 AM'), ((1977, 9, 7), '09:51:20 AM')], 6: [((2009, 9, 9), '22:34:07 PM'), ((1980, 7, 27), '08:05:16 AM')], 7: [((2011, 11, 15), '08:44:25 AM'), ((1982, 10, 6), '05:01:28 AM')], 8: [((2014, 11, 2), '19:24:10 PM'), ((1985, 9, 17), '03:44:18 AM')], 9: [((2017, 1, 26), '18:01:45 PM'), ((1987, 12, 17), '01:20:28 AM')], 10: [((2020, 1, 24), '08:24:53 AM'), ((1990, 12, 14), '23:38:09 PM')], 11: [((2022, 4, 29), '06:29:37 AM'), ((1993, 11, 10), '03:46:35 AM')], 12: [((2025, 3, 29), '20:17:12 PM'), ((1996, 2, 16), '16:53:11 PM')]}, 
+                   7: {1: [((2005, 3, 25), '05:07:48 AM'), ((1986, 8, 18), '17:42:01 PM')], 2: [((2003, 9, 6), '02:10:30 AM'), ((1985, 1, 29), '14:45:01 PM')], 3: [((2002, 2, 16), '23:13:15 PM'), ((1983, 7, 13), '11:48:03 AM')], 4: [((2000, 7, 30), '20:16:01 PM'), ((1981, 12, 24), '08:51:06 AM')], 5: [((1999, 1, 11), '17:18:48 PM'), ((1980, 6, 6), '05:54:11 AM')], 6: [((1997, 6, 24), '14:21:37 PM'), ((1978, 11, 18), '02:57:17 AM')], 7: [((2014, 7, 12), '22:51:57 PM'), ((1995, 12, 6), '11:24:28 AM')], 8: [((2012, 12, 23), '19:54:32 PM'), ((1994, 5, 19), '08:27:20 AM')], 9: [((2011, 6, 6), '16:57:09 PM'), ((1992, 10, 30), '05:30:14 AM')], 10: [((2009, 11, 17), '13:59:46 PM'), ((1991, 4, 13), '02:33:09 AM')], 11: [((2008, 4, 30), '11:02:25 AM'), ((1989, 9, 23), '23:36:05 PM')], 12: [((2006, 10, 12), '08:05:06 AM'), ((1988, 3, 6), '20:39:03 PM')]},
+                   8: {7: [((2005, 3, 25), '05:07:48 AM'), ((1986, 8, 18), '17:42:01 PM')], 8: [((2003, 9, 6), '02:10:30 AM'), ((1985, 1, 29), '14:45:01 PM')], 9: [((2002, 2, 16), '23:13:15 PM'), ((1983, 7, 13), '11:48:03 AM')], 10: [((2000, 7, 30), '20:16:01 PM'), ((1981, 12, 24), '08:51:06 AM')], 11: [((1999, 1, 11), '17:18:48 PM'), ((1980, 6, 6), '05:54:11 AM')], 12: [((1997, 6, 24), '14:21:37 PM'), ((1978, 11, 18), '02:57:17 AM')], 1: [((2014, 7, 12), '22:51:57 PM'), ((1995, 12, 6), '11:24:28 AM')], 2: [((2012, 12, 23), '19:54:32 PM'), ((1994, 5, 19), '08:27:20 AM')], 3: [((2011, 6, 6), '16:57:09 PM'), ((1992, 10, 30), '05:30:14 AM')], 4: [((2009, 11, 17), '13:59:46 PM'), ((1991, 4, 13), '02:33:09 AM')], 5: [((2008, 4, 30), '11:02:25 AM'), ((1989, 9, 23), '23:36:05 PM')], 6: [((2006, 10, 12), '08:05:06 AM'), ((1988, 3, 6), '20:39:03 PM')]}
                 }
 
     for planet in range(9):
@@ -4533,6 +4580,15 @@ def planet_transit_tests():
             y,m,d,fh = utils.jd_to_gregorian(pd)
             act_result = ((y,m,d),utils.to_dms(fh,as_string=True))
             test_example(chapter+exercise,exp_results[planet][raasi][1],act_result,utils.PLANET_NAMES[planet]+' entering '+utils.RAASI_LIST[raasi-1],'before current date',start_date)
+    """ Longitude that is never crossed - entry/sankranti functions get ValueError instead of None """
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            drik._longitude_crossing(lambda jd: 10.0, jd, 100.0, max_speed=1.0)
+            test_example(chapter+'longitude not crossed',ValueError,None)
+        except ValueError:
+            test_example(chapter+'longitude not crossed',ValueError,ValueError)
 def conjunction_tests():
     chapter = 'Planetary Conjunctions - Different Angles'
     dcf = 1; dob = (1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
@@ -4542,7 +4598,7 @@ def conjunction_tests():
                         [(2001, 10, 10), '11:44:29 AM', '80° 55’ 54"', '50° 55’ 54"'], 
                         [(2003, 1, 11), '21:52:15 PM', '139° 17’ 27"', '79° 17’ 27"'], 
                         [(2005, 17, 12), '09:52:01 AM', '196° 48’ 11"', '106° 48’ 11"'], 
-                        [(2007, 17, 3), '03:16:22 AM', '235° 11’ 45"', '115° 11’ 46"'], 
+                        [(2007, 17, 3), '03:16:46 AM', '235° 11’ 45"', '115° 11’ 45"'], 
                         [(2009, 22, 3), '21:22:11 PM', '293° 18’ 14"', '143° 18’ 14"'], 
                         [(2010, 23, 5), '10:20:18 AM', '333° 52’ 26"', '153° 52’ 26"'], 
                         [(2012, 17, 5), '03:16:52 AM', '29° 56’ 46"', '179° 56’ 46"'], 
@@ -4561,16 +4617,16 @@ def conjunction_tests_1():
     chapter = 'Planetary Conjunctions (Next) '
     dcf = 1; dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
     jd = utils.julian_day_number(dob, tob)
-    exp_results = [['', [(1996, 12, 8), '06:23:06 AM', '232° 24’ 15"'], [(1996, 12, 8), '03:46:32 AM', '196° 25’ 33"'], [(1996, 12, 8), '00:19:37 AM', '145° 47’ 58"'], [(1996, 12, 8), '07:45:07 AM', '251° 9’ 35"'], [(1996, 12, 8), '08:47:38 AM', '266° 1’ 32"'], [(1996, 12, 8), '04:21:34 AM', '204° 38’ 20"'], [(1996, 12, 7), '13:05:31 PM', '336° 48’ 29"'], [(1996, 12, 8), '01:18:59 AM', '160° 31’ 16"'], [(1996, 12, 7), '13:17:50 PM', '340° 32’ 52"']], 
-[[(1996, 12, 8), '06:23:06 AM', '232° 24’ 15"'], '', [(1996, 12, 10), '22:26:53 PM', '235° 7’ 3"'], [(1998, 5, 13), '01:44:18 AM', '28° 4’ 9"'], [(1997, 1, 2), '06:44:50 AM', '257° 52’ 12"'], [(1997, 1, 19), '18:41:58 PM', '275° 42’ 5"'], [(1997, 4, 2), '18:37:22 PM', '349° 1’ 5"'], [(1997, 3, 31), '03:52:41 AM', '346° 26’ 18"'], [(1997, 9, 12), '13:07:37 PM', '145° 45’ 48"'], [(1997, 3, 19), '17:55:09 PM', '335° 7’ 57"']], 
+    exp_results = [['', [(1996, 12, 8), '06:23:06 AM', '232° 24’ 15"'], [(1996, 12, 8), '03:46:32 AM', '196° 25’ 33"'], [(1996, 12, 8), '00:19:37 AM', '145° 47’ 58"'], [(1996, 12, 8), '07:45:07 AM', '251° 9’ 35"'], [(1996, 12, 8), '08:47:38 AM', '266° 1’ 33"'], [(1996, 12, 8), '04:21:34 AM', '204° 38’ 20"'], [(1996, 12, 7), '13:05:31 PM', '336° 48’ 29"'], [(1996, 12, 8), '01:18:59 AM', '160° 31’ 16"'], [(1996, 12, 7), '13:17:50 PM', '340° 32’ 52"']], 
+[[(1996, 12, 8), '06:23:06 AM', '232° 24’ 15"'], '', [(1996, 12, 10), '22:26:53 PM', '235° 7’ 3"'], [(1998, 5, 13), '01:44:18 AM', '28° 4’ 9"'], [(1997, 1, 2), '06:44:50 AM', '257° 52’ 12"'], [(1997, 1, 19), '18:41:58 PM', '275° 42’ 5"'], [(1997, 4, 2), '18:37:20 PM', '349° 1’ 5"'], [(1997, 3, 31), '03:52:41 AM', '346° 26’ 18"'], [(1997, 9, 12), '13:07:37 PM', '145° 45’ 48"'], [(1997, 3, 19), '17:55:09 PM', '335° 7’ 57"']], 
 [[(1996, 12, 8), '03:46:32 AM', '196° 25’ 33"'], [(1996, 12, 10), '22:26:53 PM', '235° 7’ 3"'], '', [(1997, 1, 1), '06:32:00 AM', '155° 26’ 17"'], [(1996, 12, 12), '09:40:38 AM', '256° 31’ 42"'], [(1996, 12, 13), '02:50:16 AM', '267° 3’ 12"'], [(1996, 12, 8), '19:47:49 PM', '205° 26’ 20"'], [(1996, 12, 17), '23:48:13 PM', '336° 58’ 47"'], [(1997, 1, 1), '14:05:44 PM', '159° 13’ 16"'], [(1996, 12, 18), '05:02:51 AM', '339° 58’ 59"']], 
-[[(1996, 12, 8), '00:19:36 AM', '145° 47’ 58"'], [(1998, 5, 13), '01:44:23 AM', '28° 4’ 9"'], [(1997, 1, 1), '06:32:00 AM', '155° 26’ 17"'], '', [(1998, 3, 11), '08:16:06 AM', '341° 9’ 29"'], [(1998, 1, 21), '09:31:41 AM', '302° 50’ 51"'], [(1997, 10, 26), '17:19:20 PM', '235° 57’ 40"'], [(1998, 4, 2), '12:52:34 PM', '358° 6’ 39"'], [(1997, 1, 12), '04:00:51 AM', '158° 39’ 38"'], [(1998, 2, 9), '09:41:14 AM', '317° 49’ 20"']], 
+[[(1996, 12, 8), '00:19:37 AM', '145° 47’ 58"'], [(1998, 5, 13), '01:44:18 AM', '28° 4’ 9"'], [(1997, 1, 1), '06:32:00 AM', '155° 26’ 17"'], '', [(1998, 3, 11), '08:16:06 AM', '341° 9’ 29"'], [(1998, 1, 21), '09:31:41 AM', '302° 50’ 51"'], [(1997, 10, 26), '17:19:21 PM', '235° 57’ 40"'], [(1998, 4, 2), '12:52:34 PM', '358° 6’ 39"'], [(1997, 1, 12), '04:00:51 AM', '158° 39’ 38"'], [(1998, 2, 9), '09:41:14 AM', '317° 49’ 20"']], 
 [[(1996, 12, 8), '07:45:07 AM', '251° 9’ 35"'], [(1997, 1, 2), '06:44:50 AM', '257° 52’ 12"'], [(1996, 12, 12), '09:40:38 AM', '256° 31’ 42"'], [(1998, 3, 11), '08:16:06 AM', '341° 9’ 29"'], '', [(1997, 2, 12), '23:48:43 PM', '281° 21’ 15"'], [(1997, 1, 12), '19:47:37 PM', '249° 9’ 26"'], [(1997, 3, 20), '21:39:52 PM', '345° 9’ 19"'], [(1997, 9, 26), '03:32:57 AM', '145° 2’ 33"'], [(1997, 3, 15), '23:16:09 PM', '335° 19’ 57"']], 
 [[(1996, 12, 8), '08:47:38 AM', '266° 1’ 33"'], [(1997, 1, 19), '18:41:58 PM', '275° 42’ 5"'], [(1996, 12, 13), '02:50:16 AM', '267° 3’ 12"'], [(1998, 1, 21), '09:31:41 AM', '302° 50’ 51"'], [(1997, 2, 12), '23:48:43 PM', '281° 21’ 15"'], '', [(1997, 2, 6), '07:13:01 AM', '279° 48’ 31"'], [(2000, 5, 28), '21:24:56 PM', '28° 52’ 11"'], [(2001, 8, 2), '14:27:43 PM', '70° 30’ 42"'], [(1998, 3, 17), '08:36:12 AM', '315° 55’ 1"']], 
-[[(1996, 12, 8), '04:21:34 AM', '204° 38’ 20"'], [(1997, 4, 2), '18:37:20 PM', '349° 1’ 5"'], [(1996, 12, 8), '19:47:49 PM', '205° 26’ 20"'], [(1997, 10, 26), '17:19:21 PM', '235° 57’ 40"'], [(1997, 1, 12), '19:47:36 PM', '249° 9’ 26"'], [(1997, 2, 6), '07:13:01 AM', '279° 48’ 31"'], '', [(1997, 3, 31), '18:12:02 PM', '346° 30’ 47"'], [(1997, 8, 10), '13:18:00 PM', '147° 30’ 42"'], [(1997, 3, 22), '11:38:46 AM', '334° 59’ 14"']], 
-[[(1996, 12, 7), '13:05:31 PM', '336° 48’ 29"'], [(1997, 3, 31), '03:52:41 AM', '346° 26’ 18"'], [(1996, 12, 17), '23:48:13 PM', '336° 58’ 47"'], [(1998, 4, 2), '12:52:34 PM', '358° 6’ 39"'], [(1997, 3, 20), '21:39:52 PM', '345° 9’ 19"'], [(2000, 5, 28), '21:24:56 PM', '28° 52’ 11"'], [(1997, 3, 31), '18:12:02 PM', '346° 30’ 47"'], '', [(2002, 6, 6), '16:40:06 PM', '54° 11’ 8"'], [(1997, 1, 16), '03:40:55 AM', '338° 26’ 45"']], 
-[[(1996, 12, 8), '01:18:59 AM', '160° 31’ 16"'], [(1997, 9, 12), '13:07:37 PM', '145° 45’ 48"'], [(1997, 1, 1), '14:05:44 PM', '159° 13’ 16"'], [(1997, 1, 12), '04:00:51 AM', '158° 39’ 38"'], [(1997, 9, 26), '03:32:57 AM', '145° 2’ 33"'], [(2001, 8, 2), '14:27:43 PM', '70° 30’ 42"'], [(1997, 8, 10), '13:18:00 PM', '147° 30’ 42"'], [(2002, 6, 6), '16:39:25 PM', '54° 11’ 7"'], '', ''], 
-[[(1996, 12, 7), '13:17:50 PM', '340° 32’ 52"'], [(1997, 3, 19), '17:55:09 PM', '335° 7’ 57"'], [(1996, 12, 18), '05:02:51 AM', '339° 58’ 59"'], [(1998, 2, 9), '09:41:14 AM', '317° 49’ 20"'], [(1997, 3, 15), '23:16:09 PM', '335° 19’ 57"'], [(1998, 3, 17), '08:36:12 AM', '315° 55’ 1"'], [(1997, 3, 22), '11:38:46 AM', '334° 59’ 14"'], [(1997, 1, 15), '18:06:35 PM', '338° 28’ 14"'], '', '']]
+[[(1996, 12, 8), '04:21:34 AM', '204° 38’ 20"'], [(1997, 4, 2), '18:37:20 PM', '349° 1’ 5"'], [(1996, 12, 8), '19:47:49 PM', '205° 26’ 20"'], [(1997, 10, 26), '17:19:21 PM', '235° 57’ 40"'], [(1997, 1, 12), '19:47:37 PM', '249° 9’ 26"'], [(1997, 2, 6), '07:13:01 AM', '279° 48’ 31"'], '', [(1997, 3, 31), '18:12:02 PM', '346° 30’ 47"'], [(1997, 8, 10), '13:18:00 PM', '147° 30’ 42"'], [(1997, 3, 22), '11:38:46 AM', '334° 59’ 14"']], 
+[[(1996, 12, 7), '13:05:31 PM', '336° 48’ 29"'], [(1997, 3, 31), '03:52:41 AM', '346° 26’ 18"'], [(1996, 12, 17), '23:48:13 PM', '336° 58’ 47"'], [(1998, 4, 2), '12:52:34 PM', '358° 6’ 39"'], [(1997, 3, 20), '21:39:52 PM', '345° 9’ 19"'], [(2000, 5, 28), '21:24:56 PM', '28° 52’ 11"'], [(1997, 3, 31), '18:12:02 PM', '346° 30’ 47"'], '', [(2002, 6, 6), '16:38:57 PM', '54° 11’ 7"'], [(1997, 1, 16), '04:20:28 AM', '338° 26’ 52"']], 
+[[(1996, 12, 8), '01:18:59 AM', '160° 31’ 16"'], [(1997, 9, 12), '13:07:37 PM', '145° 45’ 48"'], [(1997, 1, 1), '14:05:44 PM', '159° 13’ 16"'], [(1997, 1, 12), '04:00:51 AM', '158° 39’ 38"'], [(1997, 9, 26), '03:32:57 AM', '145° 2’ 33"'], [(2001, 8, 2), '14:27:43 PM', '70° 30’ 42"'], [(1997, 8, 10), '13:18:00 PM', '147° 30’ 42"'], [(2002, 6, 6), '16:38:57 PM', '54° 11’ 7"'], '', ''], 
+[[(1996, 12, 7), '13:17:50 PM', '340° 32’ 52"'], [(1997, 3, 19), '17:55:09 PM', '335° 7’ 57"'], [(1996, 12, 18), '05:02:51 AM', '339° 58’ 59"'], [(1998, 2, 9), '09:41:14 AM', '317° 49’ 20"'], [(1997, 3, 15), '23:16:09 PM', '335° 19’ 57"'], [(1998, 3, 17), '08:36:12 AM', '315° 55’ 1"'], [(1997, 3, 22), '11:38:46 AM', '334° 59’ 14"'], [(1997, 1, 16), '04:20:28 AM', '338° 26’ 52"'], '', '']]
     #import time
     #total_cpu = 0
     for r,p1 in enumerate(['L']+[*range(9)]):
@@ -4594,16 +4650,16 @@ def conjunction_tests_2():
     chapter = 'Planetary Conjunctions (Previous)'
     dcf = 1; dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
     jd = utils.julian_day_number(dob, tob)
-    exp_results = [['', [(1996, 12, 7), '06:22:33 AM', '231° 23’ 16"'], [(1996, 12, 7), '02:53:35 AM', '182° 48’ 30"'], [(1996, 12, 7), '00:21:42 AM', '145° 20’ 45"'], [(1996, 12, 7), '07:43:04 AM', '249° 46’ 15"'], [(1996, 12, 7), '08:50:41 AM', '265° 48’ 47"'], [(1996, 12, 7), '04:20:09 AM', '203° 23’ 40"'], [(1996, 12, 6), '13:09:26 PM', '336° 48’ 7"'], [(1996, 12, 7), '01:23:07 AM', '160° 34’ 27"'], [(1996, 12, 6), '13:21:56 PM', '340° 36’ 2"']], 
-[[(1996, 12, 7), '06:22:33 AM', '231° 23’ 16"'], '', [(1996, 11, 11), '09:46:46 AM', '205° 14’ 51"'], [(1996, 3, 4), '20:05:35 PM', '320° 30’ 33"'], [(1996, 11, 2), '05:07:25 AM', '196° 1’ 15"'], [(1995, 12, 19), '03:17:31 AM', '242° 42’ 7"'], [(1996, 6, 10), '21:42:33 PM', '56° 14’ 22"'], [(1996, 3, 18), '00:36:50 AM', '333° 40’ 30"'], [(1996, 10, 1), '01:36:02 AM', '164° 7’ 27"'], [(1996, 4, 7), '01:44:10 AM', '353° 30’ 12"']], 
+    exp_results = [['', [(1996, 12, 7), '06:22:33 AM', '231° 23’ 16"'], [(1996, 12, 7), '02:53:35 AM', '182° 48’ 31"'], [(1996, 12, 7), '00:21:42 AM', '145° 20’ 47"'], [(1996, 12, 7), '07:43:04 AM', '249° 46’ 14"'], [(1996, 12, 7), '08:50:41 AM', '265° 48’ 46"'], [(1996, 12, 7), '04:20:09 AM', '203° 23’ 40"'], [(1996, 12, 6), '13:09:26 PM', '336° 48’ 7"'], [(1996, 12, 7), '01:23:07 AM', '160° 34’ 27"'], [(1996, 12, 6), '13:21:56 PM', '340° 36’ 2"']], 
+[[(1996, 12, 7), '06:22:33 AM', '231° 23’ 16"'], '', [(1996, 11, 11), '09:46:46 AM', '205° 14’ 51"'], [(1996, 3, 4), '20:05:34 PM', '320° 30’ 33"'], [(1996, 11, 2), '05:07:25 AM', '196° 1’ 15"'], [(1995, 12, 19), '03:17:31 AM', '242° 42’ 7"'], [(1996, 6, 10), '21:42:33 PM', '56° 14’ 22"'], [(1996, 3, 18), '00:36:50 AM', '333° 40’ 30"'], [(1996, 10, 1), '01:36:02 AM', '164° 7’ 27"'], [(1996, 4, 7), '01:44:10 AM', '353° 30’ 12"']], 
 [[(1996, 12, 7), '02:53:35 AM', '182° 48’ 31"'], [(1996, 11, 11), '09:46:46 AM', '205° 14’ 51"'], '', [(1996, 12, 3), '23:33:40 PM', '143° 56’ 49"'], [(1996, 11, 11), '20:38:10 PM', '211° 25’ 24"'], [(1996, 11, 15), '09:55:03 AM', '261° 26’ 3"'], [(1996, 11, 8), '13:54:52 PM', '168° 8’ 31"'], [(1996, 11, 20), '18:22:34 PM', '336° 56’ 39"'], [(1996, 12, 5), '08:40:12 AM', '160° 39’ 50"'], [(1996, 11, 21), '02:09:31 AM', '341° 25’ 13"']], 
 [[(1996, 12, 7), '00:21:42 AM', '145° 20’ 47"'], [(1996, 3, 4), '20:05:34 PM', '320° 30’ 33"'], [(1996, 12, 3), '23:33:40 PM', '143° 56’ 49"'], '', [(1996, 6, 16), '00:49:58 AM', '38° 28’ 54"'], [(1995, 11, 16), '09:08:19 AM', '235° 22’ 42"'], [(1996, 9, 3), '13:11:58 PM', '92° 5’ 10"'], [(1996, 3, 22), '07:10:39 AM', '334° 12’ 19"'], [(1995, 9, 5), '11:54:36 AM', '184° 52’ 27"'], [(1996, 4, 15), '15:50:22 PM', '353° 2’ 54"']], 
 [[(1996, 12, 7), '07:43:04 AM', '249° 46’ 14"'], [(1996, 11, 2), '05:07:25 AM', '196° 1’ 15"'], [(1996, 11, 11), '20:38:10 PM', '211° 25’ 24"'], [(1996, 6, 16), '00:49:58 AM', '38° 28’ 54"'], '', [(1995, 12, 8), '13:22:51 PM', '240° 17’ 43"'], [(1996, 6, 23), '14:40:46 PM', '49° 31’ 56"'], [(1996, 3, 23), '14:47:53 PM', '334° 22’ 7"'], [(1996, 10, 13), '21:22:55 PM', '163° 26’ 40"'], [(1996, 4, 2), '06:06:57 AM', '353° 45’ 31"']], 
 [[(1996, 12, 7), '08:50:41 AM', '265° 48’ 46"'], [(1995, 12, 19), '03:17:31 AM', '242° 42’ 7"'], [(1996, 11, 15), '09:55:03 AM', '261° 26’ 3"'], [(1995, 11, 16), '09:08:19 AM', '235° 22’ 42"'], [(1995, 12, 8), '13:22:51 PM', '240° 17’ 43"'], '', [(1995, 11, 19), '15:19:42 PM', '236° 4’ 58"'], [(1981, 7, 24), '09:35:04 AM', '161° 20’ 31"'], [(1994, 10, 7), '10:36:39 AM', '202° 31’ 24"'], [(1990, 9, 12), '08:03:03 AM', '101° 16’ 31"']], 
-[[(1996, 12, 7), '04:20:09 AM', '203° 23’ 40"'], [(1996, 6, 10), '21:42:33 PM', '56° 14’ 22"'], [(1996, 11, 8), '13:54:52 PM', '168° 8’ 31"'], [(1996, 9, 3), '13:11:57 PM', '92° 5’ 10"'], [(1996, 6, 23), '14:40:46 PM', '49° 31’ 56"'], [(1995, 11, 19), '15:19:42 PM', '236° 4’ 58"'], '', [(1996, 2, 2), '20:00:44 PM', '328° 27’ 56"'], [(1996, 11, 3), '19:21:56 PM', '162° 20’ 10"'], [(1996, 2, 26), '00:30:46 AM', '355° 40’ 43"']], 
-[[(1996, 12, 6), '13:09:26 PM', '336° 48’ 7"'], [(1996, 3, 18), '00:36:50 AM', '333° 40’ 30"'], [(1996, 11, 20), '18:22:34 PM', '336° 56’ 39"'], [(1996, 3, 22), '07:10:39 AM', '334° 12’ 19"'], [(1996, 3, 23), '14:47:53 PM', '334° 22’ 7"'], [(1981, 7, 24), '09:35:04 AM', '161° 20’ 31"'], [(1996, 2, 2), '20:00:44 PM', '328° 27’ 56"'], '', [(1991, 1, 21), '11:21:42 AM', '274° 19’ 33"'], [(1985, 1, 4), '00:51:29 AM', '211° 21’ 19"']], 
-[[(1996, 12, 7), '01:23:07 AM', '160° 34’ 27"'], [(1996, 10, 1), '01:36:02 AM', '164° 7’ 27"'], [(1996, 12, 5), '08:40:12 AM', '160° 39’ 50"'], [(1995, 9, 5), '11:54:36 AM', '184° 52’ 27"'], [(1996, 10, 13), '21:22:55 PM', '163° 26’ 40"'], [(1994, 10, 7), '10:36:39 AM', '202° 31’ 24"'], [(1996, 11, 3), '19:21:56 PM', '162° 20’ 10"'], [(1979, 7, 17), '06:58:09 AM', '137° 13’ 12"'], '', ''], 
-[[(1996, 12, 6), '13:21:56 PM', '340° 36’ 2"'], [(1996, 4, 7), '01:44:10 AM', '353° 30’ 12"'], [(1996, 11, 21), '02:09:31 AM', '341° 25’ 13"'], [(1996, 4, 15), '15:50:22 PM', '353° 2’ 54"'], [(1996, 4, 2), '06:06:57 AM', '353° 45’ 31"'], [(1990, 9, 12), '08:03:03 AM', '101° 16’ 31"'], [(1996, 2, 26), '00:30:46 AM', '355° 40’ 43"'], [(1985, 1, 4), '00:55:13 AM', '211° 21’ 19"'], '', '']]
+[[(1996, 12, 7), '04:20:09 AM', '203° 23’ 40"'], [(1996, 6, 10), '21:42:33 PM', '56° 14’ 22"'], [(1996, 11, 8), '13:54:52 PM', '168° 8’ 31"'], [(1996, 9, 3), '13:11:58 PM', '92° 5’ 10"'], [(1996, 6, 23), '14:40:46 PM', '49° 31’ 56"'], [(1995, 11, 19), '15:19:42 PM', '236° 4’ 58"'], '', [(1996, 2, 2), '20:00:44 PM', '328° 27’ 56"'], [(1996, 11, 3), '19:21:56 PM', '162° 20’ 10"'], [(1996, 2, 26), '00:30:46 AM', '355° 40’ 43"']], 
+[[(1996, 12, 6), '13:09:26 PM', '336° 48’ 7"'], [(1996, 3, 18), '00:36:50 AM', '333° 40’ 30"'], [(1996, 11, 20), '18:22:34 PM', '336° 56’ 39"'], [(1996, 3, 22), '07:10:39 AM', '334° 12’ 19"'], [(1996, 3, 23), '14:47:53 PM', '334° 22’ 7"'], [(1981, 7, 24), '09:35:04 AM', '161° 20’ 31"'], [(1996, 2, 2), '20:00:44 PM', '328° 27’ 56"'], '', [(1991, 1, 21), '11:22:08 AM', '274° 19’ 33"'], [(1985, 1, 4), '00:54:19 AM', '211° 21’ 19"']], 
+[[(1996, 12, 7), '01:23:07 AM', '160° 34’ 27"'], [(1996, 10, 1), '01:36:02 AM', '164° 7’ 27"'], [(1996, 12, 5), '08:40:12 AM', '160° 39’ 50"'], [(1995, 9, 5), '11:54:36 AM', '184° 52’ 27"'], [(1996, 10, 13), '21:22:55 PM', '163° 26’ 40"'], [(1994, 10, 7), '10:36:39 AM', '202° 31’ 24"'], [(1996, 11, 3), '19:21:56 PM', '162° 20’ 10"'], [(1991, 1, 21), '11:22:08 AM', '274° 19’ 33"'], '', ''], 
+[[(1996, 12, 6), '13:21:56 PM', '340° 36’ 2"'], [(1996, 4, 7), '01:44:10 AM', '353° 30’ 12"'], [(1996, 11, 21), '02:09:31 AM', '341° 25’ 13"'], [(1996, 4, 15), '15:50:22 PM', '353° 2’ 54"'], [(1996, 4, 2), '06:06:57 AM', '353° 45’ 31"'], [(1990, 9, 12), '08:03:03 AM', '101° 16’ 31"'], [(1996, 2, 26), '00:30:46 AM', '355° 40’ 43"'], [(1985, 1, 4), '00:54:19 AM', '211° 21’ 19"'], '', '']]
     for r,p1 in enumerate(['L']+[*range(9)]):
         pstr1 = utils.resource_strings['ascendant_str'] if p1=='L' else utils.PLANET_NAMES[p1]
         for c,p2 in enumerate(['L']+[*range(9)]):
@@ -4795,6 +4851,189 @@ def ayanamsa_tests():
         test_example("Ayanamsa Tests - "+ayan,utils.to_dms(ayan_values[ayan],is_lat_long='plong',round_seconds_to_digits=2),
                      utils.to_dms(long,is_lat_long='plong',round_seconds_to_digits=2))
     drik.set_ayanamsa_mode(set_ayanamsa_mode) # RESET AYANAMSA
+def ayanamsa_setting_tests():
+    """ Context local ayanamsa - charts with different ayanamsa computed concurrently in threads """
+    from concurrent.futures import ThreadPoolExecutor
+    dob = (1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    jd = utils.julian_day_number(dob, tob)
+    global_ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
+    def _rasi_chart(ayanamsa_mode):
+        with drik.ayanamsa_setting(ayanamsa_mode):
+            return charts.rasi_chart(jd, place, ayanamsa_mode=ayanamsa_mode), drik.get_ayanamsa_value(jd)
+    ayanamsa_modes = ['LAHIRI','KP','RAMAN','TRUE_CITRA','FAGAN','YUKTESHWAR']
+    exp = {ayan:_rasi_chart(ayan) for ayan in ayanamsa_modes}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        act = list(executor.map(_rasi_chart, ayanamsa_modes*4))
+    for ayan,result in zip(ayanamsa_modes*4,act):
+        test_example("Ayanamsa Setting Tests - "+ayan,exp[ayan],result)
+    test_example("Ayanamsa Setting Tests - global mode unchanged",global_ayanamsa_mode,const._DEFAULT_AYANAMSA_MODE)
+    """ Chart functions called without ayanamsa_mode use the scoped ayanamsa """
+    def _charts(ayanamsa_mode=None):
+        return [charts.rasi_chart(jd, place, ayanamsa_mode=ayanamsa_mode),
+                charts.divisional_chart(jd, place, ayanamsa_mode=ayanamsa_mode, divisional_chart_factor=9),
+                charts.bhava_chart_houses(jd, place, ayanamsa_mode=ayanamsa_mode),
+                charts.vimsopaka_shadvarga_of_planets(jd, place, ayanamsa_mode=ayanamsa_mode),
+                drik.sree_lagna(jd, place, ayanamsa_mode=ayanamsa_mode)]
+    with drik.ayanamsa_setting():
+        exp = _charts('KP'); lahiri = _charts('LAHIRI')
+    with drik.ayanamsa_setting('KP'):
+        act = _charts()
+        mode_after = drik.get_ayanamsa_mode()
+    test_example("Ayanamsa Setting Tests - charts in scope",exp,act)
+    test_example("Ayanamsa Setting Tests - KP chart differs from LAHIRI",True,exp[0] != lahiri[0])
+    test_example("Ayanamsa Setting Tests - scope mode kept by charts",'KP',mode_after)
+    test_example("Ayanamsa Setting Tests - global mode unchanged",global_ayanamsa_mode,const._DEFAULT_AYANAMSA_MODE)
+    """ Day panchanga memo is keyed on the full ayanamsa setting (including tropical mode) """
+    jd = utils.julian_day_number((2024,6,1), (10,0,0)); date = drik.Date(2024,6,1)
+    with drik.ayanamsa_setting():
+        sidereal = drik.day_panchanga(jd, place)
+        sidereal_exp = (tuple(drik.nakshatra(jd, place)),tuple(drik.tamil_solar_month_and_date(date, place)))
+        with drik.ayanamsa_setting(tropical_mode=True):
+            tropical = drik.day_panchanga(jd, place)
+            tropical_exp = (tuple(drik.nakshatra(jd, place)),tuple(drik.tamil_solar_month_and_date(date, place)))
+    test_example("Ayanamsa Setting Tests - day panchanga sidereal",sidereal_exp,
+                 (sidereal.nakshatra,(sidereal.solar_month,sidereal.solar_day)))
+    test_example("Ayanamsa Setting Tests - day panchanga tropical",tropical_exp,
+                 (tropical.nakshatra,(tropical.solar_month,tropical.solar_day)))
+def planetary_positions_batch_tests():
+    place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    jd = utils.julian_day_number((1996,12,7), (10,34,0))
+    jds = [jd + h/24.0 for h in range(0,24*10,7)]
+    longitudes, speeds = drik.planetary_positions_batch(jds, place)
+    ascendants = drik.ascendant_batch(jds, place)
+    for i,jd_i in enumerate(jds):
+        exp = [(c,round(l,6)) for _,l,c in drik.planetary_positions(jd_i, place)]
+        act = [(int(long/30),round(long%30,6)) for long in longitudes[i].tolist()]
+        test_example("Planetary positions batch test",exp,act,'jd',jd_i)
+        asc = drik.ascendant(jd_i, place)
+        test_example("Ascendant batch test",(asc[0],round(asc[1],6)),(int(ascendants[i]/30),round(float(ascendants[i])%30,6)),'jd',jd_i)
+    exp = [round(sp[3],3) for sp in drik.planets_speed_info(jds[0], place).values()]
+    test_example("Planetary speeds batch test",exp,[round(sp,3) for sp in speeds[0].tolist()])
+def sunrise_table_cache_tests():
+    import swisseph as swe, tempfile
+    import numpy as np
+    chapter = 'Sunrise table cache tests'
+    place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    jds = [utils.julian_day_number((2024,m,d),(10,0,0)) for m,d in [(1,1),(2,29),(6,15),(12,31)]]+\
+            [utils.julian_day_number((2025,1,1),(10,0,0))]
+    previous_cache_info = drik.sunrise_table_cache_info()
+    exp = [(drik.sunrise(jd, place),drik.sunset(jd, place)) for jd in jds]
+    with drik.sunrise_table_cache(maxsize=2):
+        test_example(chapter+' enabled',(0,2,None),drik.sunrise_table_cache_info())
+        test_example(chapter+' sunrise/sunset same as without cache',exp,[(drik.sunrise(jd, place),drik.sunset(jd, place)) for jd in jds])
+        """ Table values are same as swe.rise_trans """
+        for jd in jds[:2]:
+            jd_utc = utils.gregorian_to_jd(drik.Date(*utils.jd_to_gregorian(jd)[:3]))
+            for rise_or_set in [swe.CALC_RISE,swe.CALC_SET]:
+                exp_jd = swe.rise_trans(jd_utc - place.timezone/24, swe.SUN, geopos=(place.longitude, place.latitude,0.0),
+                                        rsmi = drik._rise_flags + rise_or_set)[1][0]
+                test_example(chapter+' rise_trans',exp_jd,drik._sun_rise_set_jd(jd_utc, place, rise_or_set),rise_or_set)
+        """ Days of the same block are served from the table """
+        rise_set_jds,_ = drik._sunrise_table(place, 2024)
+        filled_rows = int((~np.isnan(rise_set_jds[:,0])).sum())
+        drik.sunrise(jds[0]+1, place); drik.sunset(jds[0]+2, place)
+        test_example(chapter+' cache hit',(True,filled_rows),(drik._sunrise_table(place, 2024)[0] is rise_set_jds,
+                                                         int((~np.isnan(rise_set_jds[:,0])).sum())))
+        """ Bounded - least recently used table is dropped """
+        drik.sunrise(utils.julian_day_number((2023,6,1),(10,0,0)), place)
+        test_example(chapter+' size bound',2,drik.sunrise_table_cache_info()[0])
+        test_example(chapter+' least recently used table dropped',False,
+                     drik._sunrise_table_key(place, 2025) in drik._sunrise_table_cache)
+    test_example(chapter+' previous state restored',previous_cache_info,drik.sunrise_table_cache_info())
+    with tempfile.TemporaryDirectory() as cache_folder:
+        with drik.sunrise_table_cache(cache_folder=cache_folder):
+            drik.sunrise(jds[2], place)
+        with drik.sunrise_table_cache(cache_folder=cache_folder):
+            rise_set_jds,_ = drik._sunrise_table(place, 2024)
+            test_example(chapter+' table loaded from cache folder',True,not np.isnan(rise_set_jds[166,0]))
+            test_example(chapter+' sunrise from cache folder',exp[2][0],drik.sunrise(jds[2], place))
+def calendar_data_tests():
+    from jhora.panchanga import calendar_data
+    chapter = 'Calendar data service tests'
+    place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    year,month = 2024,12
+    service = calendar_data.CalendarDataService(maxsize=3)
+    future = service.month_future(year, month, place)
+    cm = future.result()
+    test_example(chapter+' first/last day',[drik.Date(2024,11,30),drik.Date(2025,1,1)],[cm.days[0].date,cm.days[-1].date])
+    test_example(chapter+' start vaara',drik.vaara(cm.days[0].jd),cm.start_vaara)
+    for day in cm.days[::5]:
+        jd = day.jd
+        exp = [tuple(drik.tithi(jd, place)),tuple(drik.nakshatra(jd, place)),drik.sunrise(jd, place)[0],drik.sunset(jd, place)[0],
+               [row['Festival_en'] for row in vratha.get_festivals_of_the_day(jd, place)]]
+        act = [day.day_panchanga.tithi,day.day_panchanga.nakshatra,day.sunrise,day.sunset,[row['Festival_en'] for row in day.festivals]]
+        test_example(chapter,exp,act,day.date)
+    test_example(chapter+' cached month',True,service.month_future(year, month, place).result() is cm)
+    prefetched = [f.result() for f in service.prefetch(year, month, place)]
+    test_example(chapter+' prefetch adjacent months',[(2025,1),(2024,11)],[(m.year,m.month) for m in prefetched])
+    test_example(chapter+' adjacent month over year end',(2025,1),calendar_data.adjacent_month(2024,12))
+    with drik.ayanamsa_setting('KP'):
+        test_example(chapter+' cache keyed by ayanamsa',None,service.cached_month(year, month, place))
+        service.get_month(2025, 2, place)
+    test_example(chapter+' bounded cache',(3,3,0),service.cache_info())
+    test_example(chapter+' least recently used month dropped',None,service.cached_month(year, month, place))
+    service.shutdown()
+    """ Worker is busy with the month asked for - so prefetched months are still queued when next month is asked for """
+    service = calendar_data.CalendarDataService()
+    month_future = service.month_future(2023, 6, place)
+    next_month_future,previous_month_future = service.prefetch(2023, 6, place)
+    test_example(chapter+' prefetched month asked for is not cancelled',True,
+                 service.month_future(2023, 7, place) is next_month_future)
+    test_example(chapter+' stale prefetch cancelled',[False,True],[next_month_future.cancelled(),previous_month_future.cancelled()])
+    test_example(chapter+' month asked for after prefetch',(2023,7),(next_month_future.result().year,next_month_future.result().month))
+    test_example(chapter+' cancelled prefetch not in cache',None,service.cached_month(2023, 5, place))
+    month_future.result()
+    test_example(chapter+' no months being computed',0,service.cache_info()[2])
+    service.shutdown()
+    """ Shutdown cancels months not yet started - month being computed is completed """
+    service = calendar_data.CalendarDataService()
+    month_future = service.month_future(2023, 9, place)
+    prefetch_futures = service.prefetch(2023, 9, place)
+    service.shutdown(wait=True)
+    test_example(chapter+' shutdown',[False,True,True],[month_future.cancelled()]+[f.cancelled() for f in prefetch_futures])
+    test_example(chapter+' month computed before shutdown',(2023,9),(month_future.result().year,month_future.result().month))
+def json_resource_cache_tests():
+    from jhora.horoscope.chart import yoga, raja_yoga
+    chapter = 'JSON resource cache tests'
+    msgs = utils.get_json_resource('yoga','en')
+    test_example(chapter+' shared - not copied',True,utils.get_json_resource('yoga','en') is msgs)
+    try:
+        msgs['test_yoga'] = ()
+        test_example(chapter+' read only',TypeError,None)
+    except TypeError:
+        test_example(chapter+' read only',TypeError,TypeError)
+    """ Results of repeated calls should be same (resource strings not modified by the callers) """
+    dob = (1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    jd = utils.julian_day_number(dob, tob)
+    for func in [yoga.get_yoga_details, raja_yoga.get_raja_yoga_details]:
+        exp = func(jd, place, divisional_chart_factor=1)
+        test_example(chapter+' repeated call',exp,func(jd, place, divisional_chart_factor=1),func.__name__)
+""" Seconds for import jhora.horoscope.main in a fresh process (median of runs). Override on slow machines
+    with environment variable JHORA_IMPORT_TIME_BUDGET """
+_import_time_budget = 0.5; _import_time_runs = 5
+def import_time_budget_tests():
+    """ Geocoding/network modules should be imported only on first use (not by import jhora.horoscope.main) """
+    import subprocess, sys, json, os, statistics
+    budget = float(os.environ.get('JHORA_IMPORT_TIME_BUDGET',_import_time_budget))
+    script = "import sys, time; _s = time.perf_counter(); import jhora.horoscope.main; "+\
+             "_e = time.perf_counter()-_s; import json; "+\
+             "print(json.dumps([_e,[m for m in ['geocoder','requests','geopy','timezonefinder','pytz'] if m in sys.modules]]))"
+    import_times = []
+    for _ in range(_import_time_runs):
+        result = subprocess.run([sys.executable,'-c',script],capture_output=True,text=True)
+        try:
+            elapsed,deferred_modules_loaded = json.loads(result.stdout.strip().splitlines()[-1])
+        except (IndexError,ValueError):
+            elapsed = deferred_modules_loaded = None
+        if result.returncode != 0 or elapsed is None:
+            test_example("Import time budget test - import jhora.horoscope.main",True,False,'returncode',result.returncode,
+                         *result.stderr.strip().splitlines()[-1:])
+            return
+        import_times.append(elapsed)
+    test_example("Import time budget test - deferred modules not loaded",[],deferred_modules_loaded)
+    median_import_time = statistics.median(import_times)
+    test_example("Import time budget test - median import time within budget",True,median_import_time <= budget,
+                 'median',round(median_import_time,3),'budget',budget)
 def div_chart_16_test():
     exercise = "Chart-2 / D-16"
     dcf = 16; dob = (2000,4,9); tob = (17,55,0); place = drik.Place('unknown',42+30/60,-71-12/60,-5.0)
@@ -6263,6 +6502,114 @@ def shadbala_BVRamanBook_tests():
         compare_lists_within_tolerance(chapter+shb_categories[row],exp[row],shb[row],tolerance=1.5)
     print('resetting ayanamsa back to',previous_default_ayanamsa_mode)
     const._DEFAULT_AYANAMSA_MODE = previous_default_ayanamsa_mode
+def shadbala_context_tests():
+    dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    jd = utils.julian_day_number(dob, tob)
+    exp = strength.shad_bala(jd, place)
+    exp_bb = strength.bhava_bala(jd, place)
+    context = strength.ShadBalaContext(jd, place)
+    sb = strength.shad_bala_array(jd, place, context=context)
+    for f,field in enumerate(strength.shad_bala_fields):
+        test_example('Shad bala array - '+field,exp[f],sb[field].tolist())
+    act = strength.bhava_bala(jd, place, context=context, shad_bala_total=sb.total.tolist())
+    test_example('Bhava bala with shad bala context',exp_bb,act)
+    bb = strength.bhava_bala_array(jd, place, context=context)
+    for f,field in enumerate(strength.bhava_bala_fields[-3:]):
+        test_example('Bhava bala array - '+field,exp_bb[f],bb[field].tolist())
+    exp = [strength._sthana_bala(jd, place),strength._dig_bala(jd, place),strength._drik_bala(jd, place)]
+    act = [strength._sthana_bala(jd, place,context=context),strength._dig_bala(jd, place,context=context),
+           strength._drik_bala(jd, place,context=context)]
+    test_example('Shad bala context - sthana/dig/drik bala',exp,act)
+    """ Context with its own ayanamsa mode does not change the ayanamsa mode of the caller """
+    ayanamsa_mode = drik.get_ayanamsa_mode()
+    kp_mode = 'KP' if ayanamsa_mode != 'KP' else 'LAHIRI'
+    with drik.ayanamsa_setting(kp_mode):
+        exp = [strength.shad_bala(jd, place),strength.bhava_bala(jd, place)]
+    context = strength.ShadBalaContext(jd, place, kp_mode)
+    act = [strength.shad_bala(jd, place, context=context),strength.bhava_bala(jd, place, context=context),
+           context.bhaava_madhya, context.declinations]
+    test_example('Shad bala context - ayanamsa mode of the context',exp,act[:2],kp_mode)
+    test_example('Shad bala context - caller ayanamsa mode unchanged',ayanamsa_mode,drik.get_ayanamsa_mode())
+def horoscope_sections_tests():
+    from jhora.horoscope import main
+    chapter = 'Horoscope sections tests'
+    dob = drik.Date(1996,12,7); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    ayanamsa_mode = 'KP'
+    with drik.ayanamsa_setting():
+        _horoscope = lambda: main.Horoscope(latitude=place.latitude,longitude=place.longitude,timezone_offset=place.timezone,
+                                            date_in=dob,birth_time='10:34:00',ayanamsa_mode=ayanamsa_mode)
+        h_eager = _horoscope(); h_lazy = _horoscope()
+    """ Eager - all charts computed by get_horoscope_information """
+    with drik.ayanamsa_setting():
+        info_eager,charts_eager,asc_houses_eager = h_eager.get_horoscope_information()
+        calendar_info_eager = h_eager.get_calendar_information()
+    """ Lazy - only the sections asked for (and those they depend on) - computed under a different caller ayanamsa """
+    sections = ['calendar_info','D1','D9']
+    computed_sections = sorted(sections+['planet_positions','retrograde_planets'])
+    with drik.ayanamsa_setting('LAHIRI'):
+        test_example(chapter+' compute returns horoscope',True,h_lazy.compute(sections) is h_lazy)
+        test_example(chapter+' warm up computes only the sections asked for',computed_sections,sorted(h_lazy._sections.keys()))
+        test_example(chapter+' caller ayanamsa unchanged','LAHIRI',drik.get_ayanamsa_mode())
+        info_lazy,charts_lazy,asc_houses_lazy = h_lazy.get_horoscope_information(divisional_chart_factors=[1,9])
+    test_example(chapter+' warmed up sections not computed again',computed_sections,sorted(h_lazy._sections.keys()))
+    test_example(chapter+' calendar info',calendar_info_eager,h_lazy.calendar_info,ayanamsa_mode)
+    test_example(chapter+' horoscope info',{k:info_eager[k] for k in info_lazy},info_lazy,ayanamsa_mode)
+    for chart_counter,dcf in enumerate(const.division_chart_factors):
+        exp = (charts_eager[chart_counter],asc_houses_eager[chart_counter]) if dcf in [1,9] else \
+                (['' for _ in range(len(utils.RAASI_LIST))],-1)
+        test_example(chapter+' chart',exp,(charts_lazy[chart_counter],asc_houses_lazy[chart_counter]),'D'+str(dcf))
+    try:
+        h_lazy.compute(['D9','D1000'])
+        test_example(chapter+' unknown section rejected',ValueError,None)
+    except ValueError:
+        test_example(chapter+' unknown section rejected',ValueError,ValueError)
+def all_dhasas_tests():
+    from jhora.horoscope import main
+    from jhora.horoscope.dhasa import all_dhasas
+    from jhora.horoscope.dhasa.graha import yogini
+    from jhora.horoscope.dhasa.raasi import narayana, varnada
+    chapter = 'All dhasas batch tests'
+    dob = drik.Date(1996,12,7); tob = (10,34,0); place = drik.Place('Chennai,India',13.0878,80.2785,5.5)
+    context = all_dhasas.DhasaContext(dob, tob, place)
+    types = ['vimsottari','yogini','ashtottari','yoga_vimsottari','narayana','varnada','kalachakra']
+    timelines = all_dhasas.compute_all_dhasas(context, types=types, depth=2)
+    test_example(chapter+' types',types,list(timelines.keys()))
+    """ Compare with the dhasa/bhukthi of the Horoscope """
+    with drik.ayanamsa_setting():
+        h = main.Horoscope(latitude=place.latitude,longitude=place.longitude,timezone_offset=place.timezone,
+                           date_in=dob,birth_time='10:34:00',ayanamsa_mode=drik.get_ayanamsa_mode())
+        horoscope_dhasas = {'vimsottari':h._get_vimsottari_dhasa_bhukthi(dob, tob, place),
+                            'yogini':h._get_yogini_dhasa_bhukthi(dob, tob, place),
+                            'ashtottari':h._get_ashtottari_dhasa_bhukthi(dob, tob, place),
+                            'yoga_vimsottari':h._get_yoga_vimsottari_dhasa_bhukthi(dob, tob, place),
+                            'narayana':h._get_narayana_dhasa(dob, tob, place),
+                            'varnada':h._get_varnada_dhasa(dob, tob, place),
+                            'kalachakra':h._get_kalachakra_dhasa(dob, tob, place)}
+    for dhasa_type in types:
+        names = utils.RAASI_LIST if dhasa_type in all_dhasas.rasi_dhasa_types else utils.PLANET_NAMES
+        act = [(names[d]+'-'+names[b],start) for d,b,start in timelines[dhasa_type].to_list(depth=2)]
+        test_example(chapter,horoscope_dhasas[dhasa_type],act,dhasa_type)
+    """ varnada has dhasas of zero duration - bhukthis of each dhasa should still be its own """
+    vd = varnada.get_dhasa_antardhasa(dob, tob, place)
+    exp = [row[1] for row in vd if row[0]==7]
+    act = timelines['varnada'].sub_timeline(list(timelines['varnada'].lords).index(7)).lords.tolist()
+    test_example(chapter+' varnada bhukthis of zero duration dhasa',exp,act)
+    yd = yogini.get_dhasa_bhukthi(dob, tob, place, start_as_julian_day=True)
+    for years in range(5,60,10):
+        jd_at = context.jd + years*const.sidereal_year
+        exp = next(tuple(row[:2]) for row in reversed(yd) if row[2] <= jd_at)
+        test_example(chapter+' yogini running dhasa/bhukthi',exp,timelines['yogini'].lords_at(jd_at),'years',years)
+    exp = yd[-1][2] + yd[-1][3]*const.sidereal_year
+    test_example(chapter+' yogini end of last dhasa',round(exp,6),round(float(timelines['yogini'].end_jds[-1]),6))
+    test_example(chapter+' ashtottari last dhasa is open ended',float('inf'),float(timelines['ashtottari'].end_jds[-1]))
+    maha = all_dhasas.compute_all_dhasas(context, types=['narayana'], depth=1)['narayana']
+    exp = [list(row[:2]) for row in narayana.narayana_dhasa_for_rasi_chart(dob, tob, place, include_antardhasa=False)]
+    test_example(chapter+' maha dhasas only',exp,maha.to_list())
+    try:
+        all_dhasas.compute_all_dhasas(context, types=['vimsottari','unknown'])
+        test_example(chapter+' unknown dhasa type',ValueError,None)
+    except ValueError:
+        test_example(chapter+' unknown dhasa type',ValueError,ValueError)
 def shadbala_test():
     previous_default_ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
     print('for shadbala test setting ayanamsa to RAMAN from',previous_default_ayanamsa_mode)
@@ -6423,6 +6770,7 @@ def all_unit_tests():
     sarpa_dosha_tests()
     manglik_dosha_tests()
     tithi_pravesha_tests()
+    festival_range_tests()
     conjunction_tests()
     conjunction_tests_1()
     conjunction_tests_2()
@@ -6441,7 +6789,16 @@ def all_unit_tests():
     lattha_test()
     kshaya_maasa_tests()
     shadbala_VPJainBook_tests()
+    shadbala_context_tests()
+    horoscope_sections_tests()
+    all_dhasas_tests()
     #shadbala_BVRamanBook_tests()
+    ayanamsa_setting_tests()
+    planetary_positions_batch_tests()
+    sunrise_table_cache_tests()
+    calendar_data_tests()
+    json_resource_cache_tests()
+    import_time_budget_tests()
     
     if _failed_tests > 0:
         _failed_tests_str = '\nFailed Tests '+_failed_tests_str
@@ -178,7 +178,7 @@ class ConjunctionDialog(QDialog):
         panchanga_place = self.Place
         direction = 1 if self._after_before_combo.currentIndex()==0 else -1
         start_jd = self._current_date_jd + direction* (1/(24*60*60))
-        ret = drik.next_conjunction_of_planet_pair(self._current_date_jd,panchanga_place, self._planet1, self._planet2, direction=direction,separation_angle=self._separation_angle)
+        ret = drik.next_conjunction_of_planet_pair(start_jd,panchanga_place, self._planet1, self._planet2, direction=direction,separation_angle=self._separation_angle)
         self._separation_angle_index = self._sep_angle_combo.currentIndex()
         if ret==None: #Error text fixec in V3.8.1
             self._results_text.setText('Could not find planetary conjunctions for sep angle '+str(self._separation_angle)+'  Try increasing search range')
@@ -30,7 +30,7 @@ from PyQt6.QtWidgets import QStyledItemDelegate, QWidget, QVBoxLayout, QHBoxLayo
                             QGridLayout, QLayout, QLabel, QSizePolicy, QLineEdit, QCompleter, QComboBox, \
                             QPushButton, QSpinBox, QCheckBox, QApplication, QDoubleSpinBox, QHeaderView, \
                             QListWidgetItem,QMessageBox, QFileDialog, QButtonGroup, QRadioButton, QStackedWidget, \
-                            QTreeWidget
+                            QTreeWidget, QProgressBar
 from PyQt6.QtGui import QFont, QFontMetrics
 from PyQt6.QtCore import Qt
 from _datetime import datetime, timedelta, timezone
@@ -38,7 +38,7 @@ import img2pdf
 from PIL import Image
 import numpy as np
 from jhora import const, utils
-from jhora.panchanga import drik, pancha_paksha, vratha
+from jhora.panchanga import drik, pancha_paksha, vratha, info
 from jhora.horoscope import main
 from jhora.horoscope.prediction import general
 from jhora.horoscope.match import compatibility
@@ -251,6 +251,51 @@ _tab_count = len(_tab_names)
 available_chart_types = {'south_indian':SouthIndianChart,'north_indian':NorthIndianChart,'east_indian':EastIndianChart,
                          'western':WesternChart,'sudarsana_chakra':SudarsanaChakraChart}
 available_languages = const.available_languages
+def _run_horoscope_steps(steps,progress=None,is_cancelled=None):
+    """
+        @param steps: [(step,function),...]
+        @param progress: function(percent,step) called before each step
+        @param is_cancelled: function returning True to stop before the next step
+        @return: {step:function()} or None if cancelled
+    """
+    results = {}
+    for s,(step,function) in enumerate(steps):
+        if is_cancelled is not None and is_cancelled(): return None
+        if progress is not None: progress(int(100*s/len(steps)),step)
+        results[step] = function()
+    return results
+class _HoroscopeWorkerSignals(QtCore.QObject):
+    """ First argument of the signals is the generation of the computation (see _HoroscopeWorker) """
+    progress = QtCore.pyqtSignal(int,int,str) # generation, percent, step
+    finished = QtCore.pyqtSignal(int,object) # generation, {step:result}
+    error = QtCore.pyqtSignal(int,str) # generation, error message
+class _HoroscopeWorker(QtCore.QRunnable):
+    """
+        Runs the horoscope computation steps in a QThreadPool thread so that the UI does not freeze
+        @param generation: number of the compute_horoscope call. Results of older calls are ignored by the UI
+        @param steps: [(step,function),...] - see _run_horoscope_steps
+        @param ayanamsa: drik.AyanamsaSetting of the horoscope. Scoped to the worker thread
+        @param jd: Julian day number of the horoscope (for SENTHIL / SUNDAR_SS ayanamsa modes)
+    """
+    def __init__(self,generation,steps,ayanamsa,jd):
+        super().__init__()
+        self.generation = generation; self.steps = steps; self.ayanamsa = ayanamsa; self.jd = jd
+        self.signals = _HoroscopeWorkerSignals()
+        self._cancelled = False
+    def cancel(self):
+        """ Stop before the next step. finished signal is not emitted """
+        self._cancelled = True
+    def run(self):
+        try:
+            with drik.ayanamsa_setting(self.ayanamsa.mode,self.ayanamsa.value,jd=self.jd,
+                                       tropical_mode=self.ayanamsa.tropical):
+                results = _run_horoscope_steps(self.steps,
+                                progress=lambda percent,step: self.signals.progress.emit(self.generation,percent,step),
+                                is_cancelled=lambda: self._cancelled)
+            if results is not None and not self._cancelled:
+                self.signals.finished.emit(self.generation,results)
+        except Exception as e:
+            self.signals.error.emit(self.generation,str(e))
 class AlignDelegate(QStyledItemDelegate):
     def initStyleOption(self, option, index):
         super(AlignDelegate, self).initStyleOption(option, index)
@@ -285,6 +330,10 @@ class ChartTabbed(QWidget):
         """
         super().__init__()
         self._horo = None
+        """ compute_horoscope runs in _HoroscopeWorker and the tabs are filled one at a time from the event loop """
+        self._horoscope_generation = 0; self._horoscope_worker = None; self._pending_horoscope = None
+        self._tab_fill_generation = 0; self._pending_tab_updates = []; self._tab_update_count = 0
+        self._panchangam_info = None # (key,info.get_panchangam_resources) - see _get_panchangam_info
         self.use_world_city_database = use_world_city_database
         self.use_internet_for_location_check = use_internet_for_location_check
         self._chart_type = chart_type if chart_type.lower() in const.available_chart_types else 'south_indian'
@@ -308,6 +357,11 @@ class ChartTabbed(QWidget):
         self._create_row_2_and_3_ui()
         if self._show_compatibility:
             self._create_comp_ui()
+        """ Changing the birth details stops the horoscope computation of the earlier details """
+        for line_edit in [self._place_text,self._lat_text,self._long_text,self._tz_text,self._dob_text,self._tob_text]:
+            line_edit.textEdited.connect(lambda _: self._cancel_horoscope_computation())
+        for combo in [self._ayanamsa_combo,self._chart_type_combo]:
+            combo.activated.connect(lambda _: self._cancel_horoscope_computation())
         self._init_tab_widget_ui()
         current_date_str,current_time_str = datetime.now().strftime('%Y,%m,%d;%H:%M:%S').split(';')
         if date_of_birth is None:
@@ -1075,7 +1129,12 @@ class ChartTabbed(QWidget):
             self.tabWidget.setTabText(tab_start+db_tab,_tabname)
         return _db_tables
     def _init_panchanga_tab_widgets(self,tab_index):
-        self.panchanga_info_dialog = PanchangaInfoDialog(language=self._language,
+        jd = place = panchangam_info = None
+        if self._panchangam_info is not None: # Already computed for the chart - no need to compute for now
+            (jd,place,_,_),panchangam_info = self._panchangam_info
+            place = drik.Place(*place)
+        self.panchanga_info_dialog = PanchangaInfoDialog(language=self._language,jd=jd,place=place,
+                                                         panchangam_info=panchangam_info,
                                                          info_label1_font_size=_info_label1_font_size,
                                                          info_label2_font_size=_info_label2_font_size,
                                                          info_label3_font_size=_info_label3_font_size,
@@ -1442,6 +1501,7 @@ class ChartTabbed(QWidget):
         self.horo_tabs[tab_index+c].setLayout(v_layout)
         self._current_kundali_chart_index = 0
         self._kundali_method_index = 1
+        self._kundali_chart_options_str = ''
         self._kundali_varga_dict = utils.get_varga_option_dict()
         self._kundali_mixed_dict_1 = self._kundali_varga_dict
         self._kundali_mixed_dict_2 = self._kundali_varga_dict
@@ -2467,6 +2527,11 @@ class ChartTabbed(QWidget):
         self._compute_button.clicked.connect(lambda: self.compute_horoscope(calculation_type=self._calculation_type))
         self._compute_button.setToolTip('Click to update the chart information based on selections made')
         self._row3_h_layout.addWidget(self._compute_button)
+        self._compute_progress = QProgressBar()
+        self._compute_progress.setRange(0,100)
+        self._compute_progress.setToolTip('Progress of chart computation')
+        self._compute_progress.setVisible(False)
+        self._row3_h_layout.addWidget(self._compute_progress)
         self._save_image_button = QPushButton("Save as PDF")
         self._save_image_button.setFont(QtGui.QFont("Arial Bold",8))
         self._save_image_button.clicked.connect(lambda : self.save_as_pdf(pdf_file_name=None))
@@ -3099,10 +3164,13 @@ class ChartTabbed(QWidget):
             self._dhasa_varga_combo.adjustSize()
             self._dhasa_varga_combo.setCurrentIndex(self._current_dhasa_varga_index)
             self._dhasa_options_button.setText(self._dhasa_combo.currentText()+' '+self.resources['options_str'])
-    def compute_horoscope(self, calculation_type='drik'):
+    def compute_horoscope(self, calculation_type='drik', background=True):
         """
             Compute the horoscope based on details entered
             if details missing - error is displayed            
+            @param background: True (default) - compute in a background thread and fill the tabs (visible tab first)
+                without freezing the UI. Computation is cancelled if birth details are changed before it completes
+                False - compute and fill all the tabs before returning (e.g. to call save_as_pdf right after)
         """
         #start_time = datetime.now()
         if not self._validate_ui():
@@ -3164,73 +3232,118 @@ class ChartTabbed(QWidget):
         """ reset birth_date again based on self._date_of_birth and self._time_of_birth from pravesha functions """
         year,month,day = self._date_of_birth.split(",")
         birth_date = drik.Date(int(year),int(month),int(day))
-        self._chart_type = list(available_chart_types)[self._chart_type_combo.currentIndex()]
-        ' set the chart type and reset widgets'
-        self._recreate_chart_tab_widgets()
-        self._western_chart = False
-        if 'west' in self._chart_type.lower():
-            self._western_chart = True
-            self.tabNames = _tab_names[:_chart_tab_end]
+        chart_type = list(available_chart_types)[self._chart_type_combo.currentIndex()]
         if self._place_name.strip() != '' and abs(self._latitude) > 0.0 and abs(self._longitude) > 0.0 and abs(self._time_zone) > 0.0:
-            self._horo= main.Horoscope(place_with_country_code=self._place_name,latitude=self._latitude,longitude=self._longitude,timezone_offset=self._time_zone,
+            horo= main.Horoscope(place_with_country_code=self._place_name,latitude=self._latitude,longitude=self._longitude,timezone_offset=self._time_zone,
                                        date_in=birth_date,birth_time=self._time_of_birth,ayanamsa_mode=self._ayanamsa_mode,
                                        ayanamsa_value=self._ayanamsa_value,calculation_type=calculation_type,
                                        years=self._years,months=self._months,sixty_hours=self._60hrs,
                                        pravesha_type=self._pravesha_combo.currentIndex(),bhava_madhya_method=self._bhaava_madhya_method,
                                        language=available_languages[self._language])
         else:
-            self._horo= main.Horoscope(place_with_country_code=self._place_name,date_in=birth_date,birth_time=self._time_of_birth,
+            horo= main.Horoscope(place_with_country_code=self._place_name,date_in=birth_date,birth_time=self._time_of_birth,
                                        ayanamsa_mode=self._ayanamsa_mode,ayanamsa_value=self._ayanamsa_value,calculation_type=calculation_type,
                                        years=self._years,months=self._months,sixty_hours=self._60hrs,
                                        pravesha_type=self._pravesha_combo.currentIndex(),bhava_madhya_method=self._bhaava_madhya_method,
                                        language=available_languages[self._language])
-        self._calendar_info = self._horo.calendar_info
+        self._cancel_horoscope_computation()
+        generation = self._horoscope_generation
+        self._current_kundali_chart_index = self._kundali_chart_combo.currentIndex()
+        place = drik.Place(self._place_name,float(self._latitude),float(self._longitude),float(self._time_zone))
+        self._pending_horoscope = (horo,chart_type,self._panchangam_info_key(horo.julian_day, place))
+        steps = self._horoscope_computation_steps(horo, 'west' in chart_type.lower(), place)
+        if not background:
+            self._horoscope_computed(generation, _run_horoscope_steps(steps), fill_in_background=False)
+            return
+        self._horoscope_worker = _HoroscopeWorker(generation, steps, drik.get_ayanamsa_setting(), horo.julian_day)
+        self._horoscope_worker.signals.progress.connect(self._horoscope_progress)
+        self._horoscope_worker.signals.finished.connect(self._horoscope_computed)
+        self._horoscope_worker.signals.error.connect(self._horoscope_failed)
+        self._show_compute_progress(0, '')
+        QtCore.QThreadPool.globalInstance().start(self._horoscope_worker)
+    def _horoscope_computation_steps(self,horo,western_chart,place):
+        """
+            Horoscope information computed in _HoroscopeWorker before the tabs are filled
+            @param place: drik.Place for the panchanga information (see _fill_panchangam_info)
+            @return: [(step,function),...] See _horoscope_computed for how the results are used
+        """
+        chart_index = self._current_kundali_chart_index; chart_method = self._kundali_method_index
+        varnada_method = self._varnada_method_index
+        base_rasi = self._kundali_varga_dict[self._kundali_custom_varga][2]
+        count_from_end_of_sign = self._kundali_varga_dict[self._kundali_custom_varga][3]
+        steps = [('calendar_info',lambda: horo.calendar_info),
+                 ('panchangam_info',lambda: info.get_panchangam_resources(horo.julian_day, place)),
+                 ('kundali',lambda: horo.get_horoscope_information_for_chart(chart_index,chart_method=chart_method,
+                                                        varnada_method=varnada_method,base_rasi=base_rasi,
+                                                        count_from_end_of_sign=count_from_end_of_sign))]
+        if western_chart: return steps
+        """ TODO: Should we change dob,tob to birth date/time here """
+        dob = horo.Date; tob = horo.birth_time; place = horo.Place
+        dcf = const.division_chart_factors[self._current_dhasa_varga_index]
+        years = self._years; months = self._months; sixty_hours = self._60hrs
+        steps += [('graha_dhasa',lambda: {tab_str:getattr(horo,'_get_'+tab_str+'_dhasa_bhukthi')(dob, tob, place)
+                                          for tab_str in _graha_dhasa_dict}),
+                  ('rasi_dhasa',lambda: {tab_str:getattr(horo,'_get_'+tab_str+'_dhasa')(dob, tob, place,divisional_chart_factor=dcf)
+                                         for tab_str in _rasi_dhasa_dict}),
+                  ('annual_dhasa',lambda: horo._get_annual_dhasa_bhukthi(divisional_chart_factor=dcf)),
+                  ('arudha_padhas',lambda: horo._get_arudha_padhas(dob, tob, place, divisional_chart_factor=1,
+                                                                    years=years,months=months,sixty_hours=sixty_hours)),
+                  ('vimsopaka_bala',lambda: horo._get_vimsopaka_bala(dob, tob, place)),
+                  ('vaiseshikamsa_bala',lambda: horo._get_vaiseshikamsa_bala(dob, tob, place)),
+                  ('other_bala',lambda: horo._get_other_bala(dob, tob, place)),
+                  ('shad_bala',lambda: horo._get_shad_bala(dob, tob, place)),
+                  ('bhava_bala',lambda: horo._get_bhava_bala(dob, tob, place))]
+        return steps
+    def _horoscope_computed(self,generation,results,fill_in_background=True):
+        """ Show the horoscope computed by compute_horoscope. Ignored if compute_horoscope was called again or cancelled """
+        if generation != self._horoscope_generation or results is None: return
+        self._horoscope_worker = None
+        self._horo,self._chart_type,panchangam_info_key = self._pending_horoscope
+        self._pending_horoscope = None
+        self._panchangam_info = (panchangam_info_key,results['panchangam_info'])
+        ' set the chart type and reset widgets'
+        self._recreate_chart_tab_widgets()
+        self._calendar_info = results['calendar_info']
         self.resources = self._horo.cal_key_list
-        self._kundali_info,self._kundali_chart,self._kundali_ascendant_house = \
-            self._horo.get_horoscope_information_for_chart(self._current_kundali_chart_index, 
-                                                           chart_method=self._kundali_method_index,
-                                                           varnada_method=self._varnada_method_index,
-                                                           base_rasi=self._kundali_varga_dict[self._kundali_custom_varga][2],
-                                                           count_from_end_of_sign=self._kundali_varga_dict[self._kundali_custom_varga][3])
+        self._kundali_info,self._kundali_chart,self._kundali_ascendant_house = results['kundali']
         if not self._western_chart:
-            """ TODO: Should we change dob,tob to birth date/time here """
-            dob = self._horo.Date
-            tob = self._horo.birth_time
-            dcf = const.division_chart_factors[self._current_dhasa_varga_index]
-            #dob = self._dob_text.text().split(','); dob = drik.Date(dob[0],dob[1],dob[2])
-            #tob = self._tob_text.text().split(':')
-            place = self._horo.Place
             for tab_str,tab_values in _graha_dhasa_dict.items():
-                option_str = ''#self._dhasa_bhukthi_options_str
-                #if option_str.strip() != '': option_str = ','+option_str
-                func_str = 'self._horo._get_'+tab_str+'_dhasa_bhukthi'
-                arg_str = 'dob, tob, place'#,divisional_chart_factor='+str(dcf)
-                eval_str = func_str+'('+arg_str+option_str+')'
-                #print(self._dhasa_bhukthi_options_str,'compute_horoscope',eval_str)
-                retval = eval(eval_str)
-                tab_values[7] = retval
-            r = 0
+                tab_values[7] = results['graha_dhasa'][tab_str]
             for tab_str,tab_values in _rasi_dhasa_dict.items():
-                retval = eval('self._horo._get_'+tab_str+'_dhasa(dob, tob, place,divisional_chart_factor='+str(dcf)+')')
-                tab_values[7] = retval
-            _db_info = self._horo._get_annual_dhasa_bhukthi(divisional_chart_factor=dcf)
-            r = 0
-            for tab_str,tab_values in _annual_dhasa_dict.items():
-                tab_values[7] = _db_info[r]
-                r+=1
-            self._horo._get_arudha_padhas(dob, tob, place, divisional_chart_factor=1,
-                                          years=self._years,months=self._months,sixty_hours=self._60hrs)
-            self._vimsopaka_bala_info = self._horo._get_vimsopaka_bala(dob, tob, place)
-            self._vaiseshikamsa_bala_info = self._horo._get_vaiseshikamsa_bala(dob, tob, place)
-            self._other_bala_info = self._horo._get_other_bala(dob, tob, place)
-            self._shad_bala_info = self._horo._get_shad_bala(dob, tob, place)
-            self._bhava_bala_info = self._horo._get_bhava_bala(dob, tob, place)
+                tab_values[7] = results['rasi_dhasa'][tab_str]
+            for r,tab_values in enumerate(_annual_dhasa_dict.values()):
+                tab_values[7] = results['annual_dhasa'][r]
+            self._vimsopaka_bala_info = results['vimsopaka_bala']
+            self._vaiseshikamsa_bala_info = results['vaiseshikamsa_bala']
+            self._other_bala_info = results['other_bala']
+            self._shad_bala_info = results['shad_bala']
+            self._bhava_bala_info = results['bhava_bala']
+        """ Chart tab is filled by _update_chart_ui_with_info - not when the combo is refilled for the language """
+        self._kundali_chart_combo.blockSignals(True)
         self._update_main_window_label_and_tooltips()
-        self._update_chart_ui_with_info()
+        self._kundali_chart_combo.blockSignals(False)
+        self._update_chart_ui_with_info(fill_in_background=fill_in_background)
         self.resize(self.minimumSizeHint())
         self.tabWidget.setFocus()
-        #end_time = datetime.now()
-        #print('Elapsed time - compute_horoscope',end_time-start_time,'seconds')
+    def _horoscope_progress(self,generation,percent,step):
+        if generation == self._horoscope_generation:
+            self._show_compute_progress(percent, step)
+    def _horoscope_failed(self,generation,error_message):
+        if generation != self._horoscope_generation: return
+        self._horoscope_worker = None
+        self._compute_progress.setVisible(False)
+        print('compute_horoscope: An error occurred:',error_message)
+    def _cancel_horoscope_computation(self):
+        """ Stop the horoscope computation running in the background (if any). Its results are not shown """
+        self._horoscope_generation += 1
+        if self._horoscope_worker is not None:
+            self._horoscope_worker.cancel()
+            self._horoscope_worker = None
+            self._compute_progress.setVisible(False)
+    def _show_compute_progress(self,percent,step):
+        self._compute_progress.setFormat(step.replace('_',' ')+' %p%')
+        self._compute_progress.setValue(percent)
+        self._compute_progress.setVisible(True)
     def _recreate_chart_tab_widgets(self):
         self._current_kundali_chart_index = self._kundali_chart_combo.currentIndex()
         self._v_layout.removeWidget(self.tabWidget)
@@ -3240,7 +3353,9 @@ class ChartTabbed(QWidget):
         self.tabWidget = None
         self._init_tab_widget_ui()
         self.tabWidget.setCurrentIndex(current_tab)
+        self._kundali_chart_combo.blockSignals(True) # chart is filled by _update_chart_ui_with_info
         self._kundali_chart_combo.setCurrentIndex(self._current_kundali_chart_index)
+        self._kundali_chart_combo.blockSignals(False)
     def _fill_panchangam_info(self, info_str,format_str):
         jd = self._horo.julian_day
         place = drik.Place(self._place_name,float(self._latitude),float(self._longitude),float(self._time_zone))
@@ -3257,8 +3372,17 @@ class ChartTabbed(QWidget):
         self._long_chart_text = utils.to_dms(self._longitude,is_lat_long='long')
         self._timezone_text = '(GMT '+str(self._tz_text.text())+')'
         self.panchanga_info_dialog.set_language(self._language)
-        self.panchanga_info_dialog.update_panchangam_info(jd, place,ayanamsa_mode=self._ayanamsa_mode)
+        self.panchanga_info_dialog.update_panchangam_info(jd, place,ayanamsa_mode=self._ayanamsa_mode,
+                                                          panchangam_info=self._get_panchangam_info(jd, place))
         return 
+    def _panchangam_info_key(self,jd,place):
+        return (jd,tuple(place),self._ayanamsa_mode,self._language)
+    def _get_panchangam_info(self,jd,place):
+        """ info.get_panchangam_resources(jd,place) - computed again only if jd/place/ayanamsa/language changed """
+        key = self._panchangam_info_key(jd, place)
+        if self._panchangam_info is None or self._panchangam_info[0] != key:
+            self._panchangam_info = (key,info.get_panchangam_resources(jd, place))
+        return self._panchangam_info[1]
     def _convert_1d_chart_with_planet_names(self,chart_1d_list): #To be used for Sudarsana Chakra data as input
         result = []
         retrograde_planets = chart_1d_list[-1]
@@ -5266,41 +5390,87 @@ class ChartTabbed(QWidget):
             results_table.resizeColumnToContents(c)
         for r in range(14):
             results_table.resizeRowToContents(r)
-    def _update_chart_ui_with_info(self):
-        self._update_bhava_chart_information()
-        self._update_pps_tab_information()
+    def _update_chart_ui_with_info(self,fill_in_background=False):
+        """
+            Fill the tabs with the computed horoscope information
+            @param fill_in_background: False - fill all the tabs now
+                True - fill panchanga and chart tabs now and the other tabs one at a time from the event loop
+                    (visible tab first - see _fill_next_tab)
+        """
         # Update Panchanga and Bhava tab names here
         for t in range(_tabcount_before_chart_tab):
             self.tabWidget.setTabText(t,self.resources[_tab_names[t]])
         self._current_kundali_chart_index = self._kundali_chart_combo.currentIndex()
+        """ Chart tab first - it also fills panchanga information used by the other tabs """
         self._update_tab_chart_information(chart_index=self._current_kundali_chart_index,chart_method=self._kundali_method_index)
-        _chart_tab_name = self._kundali_chart_combo.currentText()
-        #self.tabWidget.setTabText(_tabcount_before_chart_tab,_chart_tab_name)
-        if not self._western_chart:
-            self._update_kpinfo_information(chart_index=self._current_kpinfo_chart_index,chart_method=self._kpinfo_method_index)
-            self._update_chakra_tab_information(chart_index=self._current_chakra_chart_index,chart_method=self._chakra_method_index)
-            self._update_amsa_ruler_tab_information(self._current_amsa_chart_index,self._amsa_method_index)
-            self._update_sphuta_tab_information(chart_index=self._current_sphuta_chart_index,method_index=self._sphuta_method_index)
-            self._update_saham_table_information(self._current_saham_chart_index,self._saham_method_index)
-            self._update_drishti_table_information(self._current_drishti_chart_index,self._drishti_method_index)
-            self._update_graha_arudha_tab_information(self._current_arudha_chart_index,self._arudha_method_index)
-            self._update_vimsopaka_bala_tab_information()
-            self._update_vaiseshikamsa_bala_tab_information()
-            self._update_other_bala_tab_information()
-            self._update_shad_bala_table_information()
-            self._update_bhava_bala_table_information()
-            self._update_dhasa_bhukthi_tab_information()
+        tab_updates = self._tab_update_functions()
+        if not fill_in_background:
+            for _,_,tab_update in tab_updates:
+                tab_update()
+            self.update()
+            return
+        self._tab_fill_generation += 1
+        self._pending_tab_updates = tab_updates; self._tab_update_count = len(tab_updates)
+        self._fill_next_tab(self._tab_fill_generation)
+    def _tab_update_functions(self):
+        """ @return: [(first tab index,last tab index,update function),...] of the tabs other than panchanga and chart """
+        updates = [(_tabcount_before_chart_tab-2,_tabcount_before_chart_tab-2,self._update_bhava_chart_information),
+                   (_tabcount_before_chart_tab-1,_tabcount_before_chart_tab-1,self._update_pps_tab_information)]
+        if self._western_chart: return updates
+        def _update_ashtaka_varga_tab():
             self._current_ashtaka_chart_index = self._ashtaka_chart_combo.currentIndex()
             self._update_ashtaka_varga_tab_information(self._current_ashtaka_chart_index,self._ashtaka_method_index)
-            self._update_argala_table_information(self._current_argala_chart_index,self._argala_method_index)
-            self._update_shodhaya_table_information(self._current_shodhaya_chart_index,self._shodhaya_method_index)
-            self._update_yoga_tab_information()
-            self._update_dosha_tab_information()
+        def _update_compatibility_tab():
             self._show_compatibility = self._gender_combo.currentIndex() in [0,1]
             if  self._show_compatibility:
                 self._update_compatibility_tab_information()
-            self._update_prediction_tab_information()
-        self.update()
+        updates += [(_kpinfo_tab_start,_kpinfo_tab_end,
+                     lambda: self._update_kpinfo_information(chart_index=self._current_kpinfo_chart_index,chart_method=self._kpinfo_method_index)),
+                    (_chakra_tab_start,_chakra_tab_end,
+                     lambda: self._update_chakra_tab_information(chart_index=self._current_chakra_chart_index,chart_method=self._chakra_method_index)),
+                    (_amsa_ruler_tab_start,_amsa_ruler_tab_end,
+                     lambda: self._update_amsa_ruler_tab_information(self._current_amsa_chart_index,self._amsa_method_index)),
+                    (_sphuta_tab_start,_sphuta_tab_end,
+                     lambda: self._update_sphuta_tab_information(chart_index=self._current_sphuta_chart_index,method_index=self._sphuta_method_index)),
+                    (_saham_tab_start,_saham_tab_end,
+                     lambda: self._update_saham_table_information(self._current_saham_chart_index,self._saham_method_index)),
+                    (_drishti_tab_start,_drishti_tab_end,
+                     lambda: self._update_drishti_table_information(self._current_drishti_chart_index,self._drishti_method_index)),
+                    (_graha_arudha_tab_start,_graha_arudha_tab_end,
+                     lambda: self._update_graha_arudha_tab_information(self._current_arudha_chart_index,self._arudha_method_index)),
+                    (_vimsopaka_bala_tab_start,_vimsopaka_bala_tab_end,self._update_vimsopaka_bala_tab_information),
+                    (_vaiseshikamsa_bala_tab_start,_vaiseshikamsa_bala_tab_end,self._update_vaiseshikamsa_bala_tab_information),
+                    (_other_bala_tab_start,_other_bala_tab_end,self._update_other_bala_tab_information),
+                    (_shad_bala_tab_start,_shad_bala_tab_end,self._update_shad_bala_table_information),
+                    (_bhava_bala_tab_start,_bhava_bala_tab_end,self._update_bhava_bala_table_information),
+                    (_dhasa_bhukthi_tab_index,_dhasa_bhukthi_tab_index,self._update_dhasa_bhukthi_tab_information),
+                    (_ashtaka_varga_tab_start,_ashtaka_varga_tab_end,_update_ashtaka_varga_tab),
+                    (_argala_tab_start,_argala_tab_end,
+                     lambda: self._update_argala_table_information(self._current_argala_chart_index,self._argala_method_index)),
+                    (_shodhaya_tab_start,_shodhaya_tab_end,
+                     lambda: self._update_shodhaya_table_information(self._current_shodhaya_chart_index,self._shodhaya_method_index)),
+                    (_yoga_tab_start,_yoga_tab_end,self._update_yoga_tab_information),
+                    (_dosha_tab_start,_dosha_tab_end,self._update_dosha_tab_information),
+                    (_compatibility_tab_start,_compatibility_tab_start,_update_compatibility_tab),
+                    (_prediction_tab_start,_prediction_tab_start,self._update_prediction_tab_information)]
+        return updates
+    def _fill_next_tab(self,generation):
+        """
+            Fill one of the pending tabs - the visible tab if it is pending - and queue the rest to the event loop
+            Stops if the tabs of a newer horoscope are being filled (generation changed)
+        """
+        if generation != self._tab_fill_generation: return
+        if not self._pending_tab_updates:
+            self._compute_progress.setVisible(self._horoscope_worker is not None)
+            self.update()
+            return
+        current_tab = self.tabWidget.currentIndex()
+        t = next((t for t,(first,last,_) in enumerate(self._pending_tab_updates) if first <= current_tab <= last),0)
+        _,_,tab_update = self._pending_tab_updates.pop(t)
+        if self._horoscope_worker is None:
+            self._show_compute_progress(int(100*(1-len(self._pending_tab_updates)/self._tab_update_count)),'')
+        QtCore.QTimer.singleShot(0,lambda: self._fill_next_tab(generation))
+        tab_update()
     def _reset_place_text_size(self):
         pt = 'Chennai'#self._place_text.text().split(',')[0]
         f = QFont("",0)
@@ -116,12 +116,14 @@ class PanchangaInfoDialog(QWidget):
     def __init__(self,language = 'English',jd=None,place:drik.Place=None,ayanamsa_mode=None,
                  info_label1_font_size=_info_label1_font_size, info_label2_font_size=_info_label2_font_size,
                  info_label3_font_size=_info_label3_font_size,
-                 info_label_height=_info_label1_height, info_labels_have_scroll=_INFO_LABEL_HAS_SCROLL):
+                 info_label_height=_info_label1_height, info_labels_have_scroll=_INFO_LABEL_HAS_SCROLL,
+                 panchangam_info=None):
         """
             @param jd: Julian Day Number
             @param place_of_birth: tuple in the format ('place_name',latitude_float,longitude_float,timezone_hrs_float)
                                     e.g. ('Chennai, India',13.0878,80.2785,5.5)
             @param language: One of 'English','Hindi','Tamil','Telugu','Kannada'; Default:English
+            @param panchangam_info: info.get_panchangam_resources(jd,place) if already computed. Default: compute it
         """
         super().__init__()
         self.start_jd = jd; self.place = place
@@ -144,7 +146,7 @@ class PanchangaInfoDialog(QWidget):
                 print('setting values from loc')
                 self.place= drik.Place(loc[0],loc[1],loc[2],loc[3])
         self.initUI()
-        self.update_panchangam_info(self.start_jd,self.place)
+        self.update_panchangam_info(self.start_jd,self.place,panchangam_info=panchangam_info)
     def set_language(self,language):
         self._language = language; utils.set_language(available_languages[language])
         self.res = utils.resource_strings
@@ -190,7 +192,8 @@ class PanchangaInfoDialog(QWidget):
         self.setLayout(h_layout)
         self.setWindowTitle(self.res['panchangam_str'])
         self.move(50,50)
-    def update_panchangam_info(self,jd=None,place:drik.Place=None,ayanamsa_mode=None):
+    def update_panchangam_info(self,jd=None,place:drik.Place=None,ayanamsa_mode=None,panchangam_info=None):
+        """ panchangam_info: info.get_panchangam_resources(jd,place) if already computed. Default: compute it """
         try:
             if jd is not None: self.start_jd = jd
             if place is not None: self.place = place
@@ -203,7 +206,7 @@ class PanchangaInfoDialog(QWidget):
             self._info_label3.setStyleSheet("border: 1px solid black;"+' font-size:'+str(self._info_label3_font_size)+'pt')
             sep_str = '<br>'
             format_str = _KEY_VALUE_FORMAT_; header = _HEADER_FORMAT_
-            results_dict = info.get_panchangam_resources(jd, place)
+            results_dict = info.get_panchangam_resources(jd, place) if panchangam_info is None else panchangam_info
             info_str = ''.join([header.format(k) if v.strip()=='' else format_str.format(k,v) for k,v in results_dict.items()])
             info_list = info_str.split(sep_str)
             info_list = [ele for ele in info_list if ele.strip() != '']
@@ -3,7 +3,7 @@ import datetime
 from PyQt6.QtWidgets import (QApplication, QWidget, QGridLayout, QPushButton, QCompleter, QMessageBox,
                             QLineEdit, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QDialog, QToolTip)
 from PyQt6.QtCore import Qt, QRect, pyqtSignal, QPoint, pyqtSlot, QSize
-from jhora.panchanga import drik, pancha_paksha, vratha
+from jhora.panchanga import drik, pancha_paksha, vratha, calendar_data
 from jhora import utils, const
 from PyQt6.QtGui import QFont, QFontMetrics, QPainter, QColor, QPen, QPixmap, QIcon, QKeyEvent
 from jhora.ui.panchangam import PanchangaInfoDialog
@@ -211,6 +211,7 @@ class CustomLabel(QLabel):
         self.clicked.emit()
 
 class VedicCalendar(QWidget):
+    _month_computed = pyqtSignal(int)
     def __init__(self,start_date:drik.Date=None,place:drik.Place=None, language='ta',use_purnimanta_system=None,
                  use_world_city_database=const.check_database_for_world_cities,
                  use_internet_for_location_check=const.use_internet_for_location_check):
@@ -230,6 +231,9 @@ class VedicCalendar(QWidget):
         self.setWindowTitle(self.res['calendar_str']+' '+const._APP_VERSION)
         self.setWindowIcon(QIcon(const._IMAGE_ICON_PATH))
         self.col_min = 0; self.row_min = 0; self.col_max = 6; self.row_max = 6
+        self._calendar_data = calendar_data.CalendarDataService()
+        self._calendar_generation = 0; self._month_future = None; self._selected_date = None
+        self._month_computed.connect(self._on_month_computed)
         self.initUI()
         self.setFocus()
 
@@ -318,7 +322,7 @@ class VedicCalendar(QWidget):
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(0)
         self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.cells = []; self.jd = []
+        self.cells = []; self.jd = []; self._day_records = []
 
         headers = ['<b><span style="color:'+_HEADER_COLOR+';">'+str(h)+'</span></b>' for h in utils.DAYS_SHORT_NAMES]
         self.day_labels = ['' for _ in utils.DAYS_SHORT_NAMES]
@@ -339,7 +343,7 @@ class VedicCalendar(QWidget):
                 cell.clicked.connect(lambda r=row, c=col: self.cell_clicked(r, c))
                 self.grid_layout.addWidget(cell, row, col)
                 week.append(cell); jd_week.append(None)
-            self.cells.append(week); self.jd.append(jd_week)
+            self.cells.append(week); self.jd.append(jd_week); self._day_records.append([None]*7)
 
         v_layout.addLayout(self.grid_layout)
         h_layout.addLayout(v_layout)
@@ -378,6 +382,10 @@ class VedicCalendar(QWidget):
         except Exception as e:
             tb = sys.exc_info()[2]
             print(f"VedicCalendar:keyEventPressed: - An error occurred: {e}",'line number',tb.tb_lineno)
+    def closeEvent(self, *args, **kwargs):
+        self._calendar_generation += 1 # months still being computed are not displayed
+        self._calendar_data.shutdown()
+        return QWidget.closeEvent(self, *args, **kwargs)
     @pyqtSlot(str,float,object)
     def _on_show_more_link_clicked(self, link,jd, place):
         if link == "show_more":
@@ -460,10 +468,11 @@ class VedicCalendar(QWidget):
         self._resize_place_text_size()
 
     def _get_days_panchanga_info(self,row,col):
-        jd = self.jd[row][col]
-        if jd is not None:
-            place = self.start_place; y,m,d,_ = utils.jd_to_gregorian(jd); date_in = drik.Date(y,m,d)
-            _tithi_returned = drik.tithi(jd, place); _tit = _tithi_returned[0]
+        day = self._day_records[row][col]
+        if day is not None:
+            jd = day.jd; y,m,d,_ = utils.jd_to_gregorian(jd)
+            dp = day.day_panchanga
+            _tithi_returned = dp.tithi; _tit = _tithi_returned[0]
             if _tit in _tithi_icons:
                 _tithi_icon = _tithi_icons[_tit]
             elif len(_tithi_returned) > 3 and _tithi_returned[3] in _tithi_icons:
@@ -473,20 +482,18 @@ class VedicCalendar(QWidget):
             _tithi = utils.TITHI_SHORT_LIST[_tit-1]
             _paksha = 0 if _tit<=15 else  1
             kp_icon = _shukla_paksha_icon if _paksha==0 else  _krishna_paksha_icon
-            _srise = utils.to_dms(drik.sunrise(jd, place)[0],round_to_minutes=True).strip()
-            _sset = utils.to_dms(drik.sunset(jd, place)[0],round_to_minutes=True).strip()
-            _naks = drik.nakshatra(jd, place); _nak_id = _naks[0]
+            _srise = utils.to_dms(day.sunrise,round_to_minutes=True).strip()
+            _sset = utils.to_dms(day.sunset,round_to_minutes=True).strip()
+            _naks = dp.nakshatra; _nak_id = _naks[0]
             _nak = utils.NAKSHATRA_SHORT_LIST[_nak_id-1]
             _lang = const.available_languages[self._language]
-            tm = None; td = None; adhik_maasa = None; _vaara = drik.vaara(jd)+1
+            tm = None; td = None; adhik_maasa = None
             if self._use_purnimanta_system is None:
-                tm,td = drik.tamil_solar_month_and_date(date_in, place)
+                tm,td = dp.solar_month,dp.solar_day
                 spl_month_text = utils.MONTH_LIST[tm]+' '+str(td)
-                _samvatsara = drik.samvatsara(date_in, place, zodiac=0)
-                year_str = utils.YEAR_LIST[_samvatsara]
+                year_str = utils.YEAR_LIST[dp.solar_year]
             else:
-                tm,td,_lunar_year,adhik_maasa,nija_maasa = drik.lunar_month_date(jd,place,
-                                                        use_purnimanta_system=self._use_purnimanta_system)
+                tm,td,_lunar_year,adhik_maasa,nija_maasa = dp.vedic_date(calendar_type=2 if self._use_purnimanta_system else 1)
                 tm -= 1
                 adhik_maasa_str = ''; 
                 if adhik_maasa:
@@ -498,7 +505,7 @@ class VedicCalendar(QWidget):
                 spl_month_text = utils.MONTH_LIST[tm]+' '+ adhik_maasa_str+nija_month_str+' '+str(td)
                 year_str = utils.YEAR_LIST[_lunar_year]
         calendar_type = 0 if self._use_purnimanta_system==None else (2 if self._use_purnimanta_system else 1)
-        _festival_list = vratha.get_festivals_of_the_day(jd,place)
+        _festival_list = day.festivals
         fest_icon = ''; fest_ttip = ''
         fest_list = []
         if len(_festival_list) >0:
@@ -533,7 +540,7 @@ class VedicCalendar(QWidget):
             'top_right': (_sunrise_icon, _srise, self.res['sunrise_str']+' '+str(_srise)),
             'bottom_right': (_sunset_icon, _sset, self.res['sunset_str']+' '+str(_sset))
         }
-        header_text = year_str+' '+str(y)+' '+ utils.MONTH_LIST_EN[m-1]+' '+str(d)+' '+utils.DAYS_LIST[drik.vaara(jd)]+' '+\
+        header_text = year_str+' '+str(y)+' '+ utils.MONTH_LIST_EN[m-1]+' '+str(d)+' '+dp.vaara_name+' '+\
                       spl_month_text+' '+ utils.PAKSHA_LIST[_paksha]+' ' + \
                       utils.TITHI_LIST[_tit-1]
         return _panchanga_dict, header_text
@@ -566,6 +573,10 @@ class VedicCalendar(QWidget):
     
         self.computeCalendar()
     def computeCalendar(self):
+        """
+            Day records of the month are computed by the calendar data service on its worker thread
+            Calendar is filled when they are ready (at once if the month is in the cache)
+        """
         try:
             self._update_resources()
             date_str = self.date_text.text()
@@ -575,60 +586,69 @@ class VedicCalendar(QWidget):
             timezone = float(self._tz_text.text())
             self.start_place = drik.Place(place_name, latitude, longitude, timezone)
             year, month, day = utils.get_year_month_day_from_date_format(date_str)#map(int,date_str.split(","))#
-            selected_date = drik.Date(year,month,day)
-            _jd = utils.julian_day_number((year, month, 1), (10, 0, 0))
-            sunrise_hours = drik.sunrise(_jd,self.start_place)[0]
-            _jd = utils.julian_day_number((year, month, 1), (sunrise_hours, 0, 0))
-            first_day = drik.Date(year, month, 1)
-            previous_month_end = utils.previous_panchanga_day(first_day, minus_days=1)
-            if month == 12:
-                last_day = 31
-                next_month_start = drik.Date(year+1,1,1)
+            self._selected_date = drik.Date(year,month,day)
+            self._calendar_generation += 1; generation = self._calendar_generation
+            self._month_future = self._calendar_data.month_future(year, month, self.start_place)
+            if self._month_future.done():
+                self._on_month_computed(generation)
             else:
-                last_day = utils.next_panchanga_day(drik.Date(year,(month+1)%13,1), -1)
-                next_month_start = utils.next_panchanga_day(last_day, add_days=1)
-                last_day = last_day.day
-            _jd -= 1; current_date = previous_month_end
-            start_day = drik.vaara(_jd)
-            reached_end_of_month = False
-            [self.cells[row][col].setVisible(False) for col in range(7) for row in range(7)]
-            for row in range(7):
-                for col in range(7):
-                    cell = self.cells[row][col]
-                    cell.clear()
-                    if reached_end_of_month:
-                        break
-                    if row * 7 + col >= start_day:
-                        _year,_month,_day,_ = utils.jd_to_gregorian(_jd)
-                        sunrise_hours = drik.sunrise(_jd,self.start_place)[0]
-                        _jd = utils.julian_day_number((_year, _month, _day), (sunrise_hours, 0, 0))
-                        self.jd[row][col]=_jd; self.row_max = row
-                        cell.setVisible(True)
-                        panchanga_dict,_ = self._get_days_panchanga_info(row,col)
-                        if panchanga_dict is not None: cell.set_texts(panchanga_dict)
-                        _cell_style = "border: "+str(_cell_border_line_thickness)+"px solid "+_cell_border_line_color+"; "
-                        if current_date == selected_date:
-                            _cell_style += f"background-color: {input_day_color}"
-                            self.selected_cell = (row+1,col)
-                        elif current_date == previous_month_end:
-                            _cell_style += f"background-color: {previous_month_color}"
-                            self.previous_month_cell = (row,col)
-                        elif current_date == next_month_start:
-                            _cell_style += f"background-color: {next_month_color}"
-                            self.next_month_cell = (row,col)
-                        else:
-                            _cell_style += f"background-color: {default_color}"
-                        cell.setStyleSheet(_cell_style)
-                            
-                        reached_end_of_month = (current_date == next_month_start)
-                        current_date = utils.next_panchanga_day(current_date, add_days=1)
-                        _jd += 1
-            if self.selected_cell is not None:
-                self.cell_clicked(self.selected_cell[0], self.selected_cell[1])
+                self._month_future.add_done_callback(lambda _,generation=generation: self._emit_month_computed(generation))
+        except Exception as e:
+            import traceback
+            tb = traceback.format_exc()
+            print(f"VedicCalendar:computeCalendar: An error occurred:\n{tb}")
+    def _emit_month_computed(self,generation):
+        """ Called on the calendar data worker thread - signal is delivered on the GUI thread """
+        try:
+            self._month_computed.emit(generation)
+        except RuntimeError: # Calendar closed before the month was computed
+            pass
+    def _on_month_computed(self,generation):
+        if generation != self._calendar_generation:
+            return # Date/place changed while this month was being computed
+        try:
+            calendar_month = self._month_future.result()
+            self._fill_calendar(calendar_month)
+            self._calendar_data.prefetch(calendar_month.year, calendar_month.month, calendar_month.place)
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
             print(f"VedicCalendar:computeCalendar: An error occurred:\n{tb}")
+    def _fill_calendar(self,calendar_month):
+        selected_date = self._selected_date
+        previous_month_end = calendar_month.days[0].date; next_month_start = calendar_month.days[-1].date
+        start_day = calendar_month.start_vaara
+        reached_end_of_month = False
+        [self.cells[row][col].setVisible(False) for col in range(7) for row in range(7)]
+        for row in range(7):
+            for col in range(7):
+                cell = self.cells[row][col]
+                cell.clear()
+                if reached_end_of_month:
+                    break
+                if row * 7 + col >= start_day:
+                    day = calendar_month.days[row*7+col-start_day]; current_date = day.date
+                    self.jd[row][col]=day.jd; self._day_records[row][col] = day; self.row_max = row
+                    cell.setVisible(True)
+                    panchanga_dict,_ = self._get_days_panchanga_info(row,col)
+                    if panchanga_dict is not None: cell.set_texts(panchanga_dict)
+                    _cell_style = "border: "+str(_cell_border_line_thickness)+"px solid "+_cell_border_line_color+"; "
+                    if current_date == selected_date:
+                        _cell_style += f"background-color: {input_day_color}"
+                        self.selected_cell = (row+1,col)
+                    elif current_date == previous_month_end:
+                        _cell_style += f"background-color: {previous_month_color}"
+                        self.previous_month_cell = (row,col)
+                    elif current_date == next_month_start:
+                        _cell_style += f"background-color: {next_month_color}"
+                        self.next_month_cell = (row,col)
+                    else:
+                        _cell_style += f"background-color: {default_color}"
+                    cell.setStyleSheet(_cell_style)
+                        
+                    reached_end_of_month = (current_date == next_month_start)
+        if self.selected_cell is not None:
+            self.cell_clicked(self.selected_cell[0], self.selected_cell[1])
 
     def cell_clicked(self,row,col):
         try:
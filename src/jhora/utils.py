@@ -22,17 +22,13 @@
     utils module
     contains common functions used by various PyJHora modules
 """
-import os
+import os, sys
+from types import MappingProxyType
 import codecs
 import warnings
-import geocoder
-import requests
-from pytz import timezone, utc
-from timezonefinder import TimezoneFinder
 import csv
 import numpy as np
 import swisseph as swe
-from geopy.geocoders import Nominatim
 from jhora import const
 from jhora.panchanga import drik as drig_panchanga
 import json
@@ -40,16 +36,113 @@ import datetime
 from dateutil import relativedelta
 
 world_cities_dict = {}
+""" Columnar arrays of the world cities database (loaded once) - see _get_world_cities_index() """
+_world_cities_index = None
+_world_cities_index_file = None
 google_maps_url = "https://www.google.cl/maps/place/"#+' time zone'
+def _load_world_cities_index(csv_file):
+    countries = []; cities = []; tz_names = []; latitudes = []; longitudes = []; tz_hours = []
+    with open(csv_file, 'r', encoding='ISO-8859-1') as file:
+        for row in csv.reader(file):
+            row = (row + ['']*6)[:6]
+            countries.append(row[0]); cities.append(row[1]); tz_names.append(row[4])
+            for values, value in zip((latitudes,longitudes,tz_hours),(row[2],row[3],row[5])):
+                try:
+                    values.append(float(value))
+                except ValueError:
+                    values.append(np.nan)
+    keys = np.array([city.lower() for city in cities], dtype=object)
+    sorted_rows = np.argsort(keys, kind='stable')
+    return {'country':np.array(countries,dtype=object),'city':np.array(cities,dtype=object),
+            'latitude':np.array(latitudes),'longitude':np.array(longitudes),
+            'tz_name':np.array(tz_names,dtype=object),'tz_hours':np.array(tz_hours),
+            'sorted_keys':keys[sorted_rows],'sorted_rows':sorted_rows,
+            'city_dict':{key:idx for idx,key in enumerate(keys)},
+            'city_country_dict':{(key,country.strip().lower()):idx
+                                 for idx,(key,country) in enumerate(zip(keys,countries))}}
+def _get_world_cities_index():
+    """ Load const._world_city_csv_file into columnar arrays once per process """
+    global _world_cities_index, _world_cities_index_file
+    if _world_cities_index is None or _world_cities_index_file != const._world_city_csv_file:
+        _world_cities_index = _load_world_cities_index(const._world_city_csv_file)
+        _world_cities_index_file = const._world_city_csv_file
+    return _world_cities_index
+def _world_city_row(index, row):
+    return [index['country'][row], index['city'][row], float(index['latitude'][row]),
+            float(index['longitude'][row]), index['tz_name'][row], float(index['tz_hours'][row])]
 def use_database_for_world_cities(enable_database=False):
     global world_cities_dict
     if enable_database:
-        with open(const._world_city_csv_file, 'r', encoding='ISO-8859-1') as file:
-            world_cities_dict = {row[1].lower(): idx for idx, row in enumerate(csv.reader(file))}
+        world_cities_dict = _get_world_cities_index()['city_dict']
         const.check_database_for_world_cities = True
     else:
         world_cities_dict = {}
         const.check_database_for_world_cities = False
+def get_world_city(city_name):
+    """
+        Exact (case insensitive) lookup of a city in the world cities database
+        @param city_name: City name. Example: 'Chennai' or 'Chennai,India'
+        @return: [country,city,latitude,longitude,timezone name,timezone hours] or None if not found
+    """
+    index = _get_world_cities_index()
+    name = city_name.strip().lower()
+    row = index['city_dict'].get(name)
+    if row is None and ',' in name:
+        _city,_country = name.rsplit(',',1)
+        row = index['city_country_dict'].get((_city.strip(),_country.strip()))
+    return None if row is None else _world_city_row(index, row)
+def search_world_cities(query, max_results=10, fuzzy_cutoff=0.75):
+    """
+        Search world cities database by city name prefix. Falls back to fuzzy match if no city has the prefix
+        @param query: City name or part of it. Optionally followed by ,country. Example: 'Chen', 'New York,United'
+        @param max_results: maximum number of matches returned
+        @param fuzzy_cutoff: similarity (0..1) required for fuzzy matches
+        @return: list of [country,city,latitude,longitude,timezone name,timezone hours]
+    """
+    import difflib
+    index = _get_world_cities_index()
+    query = query.strip().lower()
+    country = ''
+    if ',' in query:
+        query,country = [q.strip() for q in query.rsplit(',',1)]
+    if not query:
+        return []
+    sorted_keys = index['sorted_keys']; sorted_rows = index['sorted_rows']
+    start = np.searchsorted(sorted_keys, query, side='left')
+    rows = []
+    for pos in range(start, len(sorted_keys)):
+        if not sorted_keys[pos].startswith(query):
+            break
+        row = sorted_rows[pos]
+        if index['country'][row].strip().lower().startswith(country):
+            rows.append(row)
+            if len(rows) >= max_results:
+                break
+    if not rows:
+        for key in difflib.get_close_matches(query, index['city_dict'].keys(), n=max_results, cutoff=fuzzy_cutoff):
+            pos = np.searchsorted(sorted_keys, key, side='left')
+            while pos < len(sorted_keys) and sorted_keys[pos] == key and len(rows) < max_results:
+                row = sorted_rows[pos]
+                if index['country'][row].strip().lower().startswith(country):
+                    rows.append(row)
+                pos += 1
+    return [_world_city_row(index, row) for row in rows]
+def nearest_world_city(latitude, longitude):
+    """
+        Find the city in world cities database closest to given latitude/longitude
+        @param latitude: latitude in degrees (+ve north)
+        @param longitude: longitude in degrees (+ve east)
+        @return: ([country,city,latitude,longitude,timezone name,timezone hours], distance in km) or None
+    """
+    index = _get_world_cities_index()
+    lat1 = np.radians(latitude); lat2 = np.radians(index['latitude'])
+    dlat = lat2 - lat1; dlong = np.radians(index['longitude'] - longitude)
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlong/2)**2
+    distances = 2 * 6371.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    if np.all(np.isnan(distances)):
+        return None
+    row = int(np.nanargmin(distances))
+    return _world_city_row(index, row), float(distances[row])
 
 sort_tuple = lambda tup,tup_index,reverse=False: sorted(tup,key = lambda x: x[tup_index],reverse=reverse)
 
@@ -59,15 +152,21 @@ def save_location_to_database_old(location_data):
     _world_city_db_df.loc[len(_world_city_db_df.index)] = location_data
     _world_city_db_df.to_csv(const._world_city_csv_file,mode='w',header=None,index=False)#,quoting=None)
 def save_location_to_database(location_data):
-    global world_cities_dict
+    global _world_cities_index
     print('writing ',location_data,' to ',const._world_city_csv_file)
     with open(const._world_city_csv_file, mode='a', newline='', encoding='ISO-8859-1') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(location_data)
-    world_cities_dict[location_data[1]] = len(world_cities_dict)
+    if _world_cities_index is not None and _world_cities_index_file == const._world_city_csv_file:
+        # Rebuild the index so that the new row is searchable. world_cities_dict keeps pointing to city_dict
+        city_dict = _world_cities_index['city_dict']
+        _world_cities_index = _load_world_cities_index(const._world_city_csv_file)
+        city_dict.clear(); city_dict.update(_world_cities_index['city_dict'])
+        _world_cities_index['city_dict'] = city_dict
 " Flatten a list of lists "
 flatten_list = lambda list: [item for sublist in list for item in sublist]
 def _get_place_from_ipinfo():
+    import requests
     url = 'http://ipinfo.io/json'
     response = requests.get(url)
     data = json.loads(response.text)
@@ -85,6 +184,7 @@ def get_place_from_user_ip_address():
     g = ''
     try:
         print("Trying to get using IP Address of the user")
+        import geocoder
         g = geocoder.ip('me') #ipinfo('me')
         #print('g',g,g.city,g.country,g.latlng)
         if g is None or g=='':
@@ -119,6 +219,7 @@ def get_elevation(lat = None, long = None):
     query = const._open_elevation_api_url(lat,long) 
     
     # Request with a timeout for slow responses
+    import requests
     r = requests.get(query, timeout = 20)
 
     # Only get the json response in case of 200 or 201
@@ -168,21 +269,17 @@ def get_location(place_name=None):
             return result
     ' first check if lat/long in world cities db'
     place_index = world_cities_dict.get(place_name.lower())
+    if place_index is None and world_cities_dict and ',' in place_name:
+        _city,_country = place_name.lower().rsplit(',',1)
+        place_index = _get_world_cities_index()['city_country_dict'].get((_city.strip(),_country.strip()))
     #print('place_name,place_name_1,place_index',place_name,place_index)
     if place_index is not None and place_index>=0:
         place_found = True
         #print(place_name,'in the database',place_index)
-        with open(const._world_city_csv_file, encoding='ISO-8859-1') as csvfile:
-            reader = csv.reader(csvfile)
-            for idx, row in enumerate(reader):
-                if idx == place_index:
-                    city = row[1]
-                    _latitude = round(float(row[2]), 4)
-                    _longitude = round(float(row[3]), 4)
-                    _time_zone = round(float(row[5]), 2)
-                    result = [city, _latitude, _longitude, _time_zone]
-                    #print("RESULT:",result)
-                    return result
+        _,city,_latitude,_longitude,_,_time_zone = _world_city_row(_get_world_cities_index(), place_index)
+        result = [city, round(_latitude, 4), round(_longitude, 4), round(_time_zone, 2)]
+        #print("RESULT:",result)
+        return result
     else:
         print(place_name,'not in '+const._world_city_csv_file+'.Trying to get from Google')
         result = _scrap_google_map_for_latlongtz_from_city_with_country(place_name)
@@ -232,6 +329,7 @@ def scrap_google_map_for_latlongtz_from_city_with_country(city_with_country):
             Example: Chennai, India
         @return [city,latitude,longitude,time_zone_offset]
     """
+    import requests
     url = google_maps_url+city_with_country
     resp=requests.request(method="GET",url=url)
     r = requests.get(url)
@@ -258,6 +356,7 @@ def get_location_using_nominatim(place_with_country_code):
         @return [city,latitude,longitude,time_zone_offset]
     """
     #[city,latitude,longitude,tz_offset]=''
+    from geopy.geocoders import Nominatim
     geolocator = Nominatim(user_agent="Astro") #,format_string="%s, Bangalore")
     while True:
         try:
@@ -278,6 +377,7 @@ def get_location_using_nominatim(place_with_country_code):
 def _scrap_google_map_for_latlongtz_from_city_with_country(city_with_country):
     url = "https://www.google.cl/maps/place/"+city_with_country#+' time zone'
     try:
+        import requests
         resp=requests.request(method="GET",url=url)
         r = requests.get(url)
         txt = r.text
@@ -313,6 +413,8 @@ def get_place_timezone_offset(latitude, longitude):
         @return [city,latitude,longitude,time_zone_offset]
     """
     try:
+        from pytz import timezone, utc
+        from timezonefinder import TimezoneFinder
         tf = TimezoneFinder()
         today = datetime.datetime.now()
         tz_target = timezone(tf.timezone_at(lng=longitude, lat=latitude))
@@ -374,18 +476,84 @@ def get_house_planet_list_from_planet_positions(planet_positions):
     return h_to_p
 def set_ephemeris_data_path(data_path=const._ephe_path):
     swe.set_ephe_path(data_path)
+""" 
+    Process-wide cache of language resources keyed by (resource_type, language)
+    Each file is read once. set_language drops the entries of the other languages
+    unless preload_language_resources was called (server deployments).
+"""
+_resource_cache = {}
+_json_resource_file_prefixes = {'yoga':const._DEFAULT_YOGA_JSON_FILE_PREFIX,
+                                'raja_yoga':const._DEFAULT_RAJA_YOGA_JSON_FILE_PREFIX,
+                                'dosha':const._DEFAULT_DOSHA_JSON_FILE_PREFIX,
+                                'prediction':const._DEFAULT_PREDICTION_JSON_FILE_PREFIX,
+                                'amsa':'amsa_rulers_'}
+_all_languages_preloaded = False
+def _cached_resource(resource_type,language):
+    key = (resource_type,language)
+    if key not in _resource_cache:
+        if resource_type == 'msg_strings':
+            _resource_cache[key] = _read_resource_messages_from_file(
+                        const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+language+'.txt')
+        elif resource_type == 'list_values':
+            _resource_cache[key] = _parse_resource_lists_file(
+                        const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_LIST_STR+language+'.txt')
+        else:
+            json_file = const._LANGUAGE_PATH+_json_resource_file_prefixes[resource_type]+language+'.json'
+            with open(json_file,"r",encoding="utf-8") as f:
+                _resource_cache[key] = _read_only(json.load(f))
+    return _resource_cache[key]
+def _read_only(value):
+    """ JSON value with dictionaries as read only mappings and lists as tuples """
+    if isinstance(value,dict):
+        return MappingProxyType({k:_read_only(v) for k,v in value.items()})
+    if isinstance(value,list):
+        return tuple(_read_only(v) for v in value)
+    return value
+def get_json_resource(resource_type,language='en'):
+    """
+        Get language resource from <resource_type>_msgs_<lang>.json (loaded once per process)
+        @param resource_type: 'yoga', 'raja_yoga', 'dosha', 'prediction' or 'amsa'
+        @param language: Two letter language code. en, hi, ka, ta, te
+        @return json strings from the resource file as read only mapping (shared by all callers - not copied)
+            Nested dictionaries are read only mappings and lists are tuples
+    """
+    return _cached_resource(resource_type, language)
+def clear_resource_cache(keep_language=None):
+    """
+        Drop cached language resources so that they are read again from the resource files
+        @param keep_language: None => drop all. Or two letter language code whose resources are kept
+    """
+    global _all_languages_preloaded
+    for key in list(_resource_cache.keys()):
+        if key[1] != keep_language:
+            _resource_cache.pop(key,None)
+    _all_languages_preloaded = False
+def preload_language_resources(languages=None):
+    """
+        Read resources of all languages at startup (for server deployments serving many languages)
+        Preloaded resources are kept when set_language changes the language
+        @param languages: list of two letter language codes. None => const.available_languages
+    """
+    global _all_languages_preloaded
+    if languages is None:
+        languages = const.available_languages.values()
+    resource_types = ['msg_strings','list_values']+list(_json_resource_file_prefixes.keys())
+    for language in languages:
+        for resource_type in resource_types:
+            _cached_resource(resource_type, language)
+    _all_languages_preloaded = True
 def set_language(language=const._DEFAULT_LANGUAGE):
     global resource_strings
     #print('language',language)
     if language in const.available_languages.values():
         #print('default language set to',language)
+        if language != const._DEFAULT_LANGUAGE and not _all_languages_preloaded:
+            clear_resource_cache(keep_language=language)
         const._DEFAULT_LANGUAGE = language
-        language_list_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_LIST_STR+language+'.txt'
-        #print('language_list_file',language_list_file)
-        language_message_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+language+'.txt'
-        
-        get_resource_lists(language_list_file)
-        resource_strings = get_resource_messages(language_message_file=language_message_file)
+        module = sys.modules[__name__]
+        for var_name,var_value in _cached_resource('list_values', language).items():
+            setattr(module, var_name, var_value[:])
+        resource_strings = dict(_cached_resource('msg_strings', language))
 def _read_resource_messages_from_file(message_file):
     if not os.path.exists(message_file):
         print('Error: List Types File:'+message_file+' does not exist. Script aborted.')
@@ -411,14 +579,21 @@ def get_resource_messages(language_message_file=const._LANGUAGE_PATH + const._DE
     """
     res = _read_resource_messages_from_file(language_message_file)
     return res
-resource_strings = get_resource_messages(const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+const._DEFAULT_LANGUAGE+'.txt')
-def _read_resource_lists_from_file(language_list_file):
-    import sys,os
-    module = sys.modules[__name__]
+def _get_resource_strings():
+    """ resource_strings of const._DEFAULT_LANGUAGE are read on first access (not at import) """
+    global resource_strings
+    if 'resource_strings' not in globals():
+        resource_strings = dict(_cached_resource('msg_strings', const._DEFAULT_LANGUAGE))
+    return resource_strings
+def __getattr__(name):
+    if name == 'resource_strings':
+        return _get_resource_strings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def _parse_resource_lists_file(language_list_file):
     file_path = language_list_file
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
-    #print('_read_resource_lists_from_file')
+    resource_lists = {}
     with open(file_path, 'r',encoding='utf-8') as file: # V4.5.0
         for line in file:
             line = line.strip()
@@ -426,10 +601,12 @@ def _read_resource_lists_from_file(language_list_file):
                 continue
             elif "=" in line:
                 var_name, var_value = line.split("=")
-                var_name = var_name.strip()
-                var_value = var_value.split(',')
-                setattr(module, var_name, var_value)
-                #print('length of',var_name,len(var_value))
+                resource_lists[var_name.strip()] = var_value.split(',')
+    return resource_lists
+def _read_resource_lists_from_file(language_list_file):
+    module = sys.modules[__name__]
+    for var_name,var_value in _parse_resource_lists_file(language_list_file).items():
+        setattr(module, var_name, var_value)
 def get_resource_lists(language_list_file=const._LANGUAGE_PATH + const._DEFAULT_LANGUAGE_LIST_STR + const._DEFAULT_LANGUAGE + '.txt'):
     """
         Retrieve resource list from language specific resource list file
@@ -599,7 +776,7 @@ norm180 = lambda angle: (angle - 360) if angle >= 180 else angle;
 norm360 = lambda angle: angle % 360
 
 def _function(point):
-    swe.set_sid_mode(swe.SIDM_USER, point, 0.0)
+    drig_panchanga._set_swe_sid_mode(swe.SIDM_USER, point, 0.0)
     #swe.set_sid_mode(swe.SIDM_LAHIRI)
     # Place Revati at 359°50'
     #fval = norm180(swe.fixstar_ut("Revati", point, flag = swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0]) - ((359 + 49/60 + 59/3600) - 360)
@@ -644,6 +821,59 @@ def inverse_lagrange(x, y, ya):
     total += numer * x[i] / denom
 
   return total
+def brent_root(func, a, b, tolerance=1.0e-8, max_iterations=100, fa=None, fb=None):
+    """
+        Find x in [a,b] such that func(x) = 0 using Brent's method (bisection + secant + inverse quadratic)
+        func(a) and func(b) must have opposite signs
+        @param func: function of one variable
+        @param a: one end of the bracket
+        @param b: other end of the bracket
+        @param tolerance: required accuracy of x
+        @param max_iterations: maximum number of func evaluations. Best estimate is returned if exceeded
+        @param fa: func(a) if already known
+        @param fb: func(b) if already known
+        @return: x at which func(x) = 0 (within tolerance)
+    """
+    fa = func(a) if fa is None else fa
+    fb = func(b) if fb is None else fb
+    if fa == 0: return a
+    if fb == 0: return b
+    if fa * fb > 0:
+        raise ValueError('brent_root: root is not bracketed by ['+str(a)+','+str(b)+']')
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2.0 * sys.float_info.epsilon * abs(b) + 0.5 * tolerance
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            return b
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c: # secant
+                p = 2.0 * xm * s; q = 1.0 - s
+            else: # inverse quadratic interpolation
+                q = fa / fc; r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0: q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d; d = p / q
+            else: # bisection
+                d = xm; e = d
+        else:
+            d = xm; e = d
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else (tol1 if xm > 0 else -tol1)
+        fb = func(b)
+    warnings.warn('brent_root did not converge in '+str(max_iterations)+' iterations. Best estimate returned')
+    return b
 def newton_polynomial(x_data, y_data, x):
     """
     x_data: data points at x
@@ -1223,9 +1453,8 @@ def trim_info_list_lines(info_lines: list[str], skip_lines: int) -> list[str]:
 
     return trimmed_lines
 def get_varga_option_dict():
-    global resource_strings
     """ dict: {dcf:(method_count,method_index,base_rasi_index,count_from_end_of_sign)}"""
-    _varga_option_dict = {}; _res = resource_strings
+    _varga_option_dict = {}; _res = _get_resource_strings()
     if const.TREAT_STANDARD_CHART_AS_CUSTOM:
         _varga_option_dict[1] = (None,None,None,None)
         for dcf in range(2,const.MAX_DHASAVARGA_FACTOR+1):                
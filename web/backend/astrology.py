@@ -1,8 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
-from typing import Dict, Optional, List
+from typing import Awaitable, Callable, Dict, Optional, List
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
 import sys
 import os
+import time
+
+from config import settings
 
 # Add parent directory to path to import jhora
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -19,339 +26,374 @@ except ImportError as e:
     print(f"PyJHora import error: {e}")
     PYJHORA_AVAILABLE = False
 
+# Bump when the layout or the values of compute_chart_core() output change so stale cache entries are not reused
+CHART_CACHE_VERSION = 2
+
+# Planet name mapping (PyJHora convention: 0=Sun, 1=Moon, 2=Mars, 3=Mercury, 4=Jupiter, 5=Venus, 6=Saturn, 7=Rahu, 8=Ketu)
+PLANET_NAMES = {
+    0: "Sun", 1: "Moon", 2: "Mars", 3: "Mercury",
+    4: "Jupiter", 5: "Venus", 6: "Saturn", 7: "Rahu", 8: "Ketu"
+}
+
+# Zodiac sign names
+ZODIAC_NAMES = [
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+]
+
+# Nakshatra names
+NAKSHATRA_NAMES = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+]
+
+
+def normalize_birth_details(dob: str, tob: str, lat: Optional[float] = None,
+                            lon: Optional[float] = None, tz: Optional[float] = None):
+    """
+    Parse birth details and apply the defaults used by all calculations
+    Returns ((year, month, day), (hour, minute, second), lat, lon, tz)
+    """
+    year, month, day = map(int, dob.split("-"))
+    time_parts = tob.split(":")
+    hour = int(time_parts[0])
+    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+    second = int(time_parts[2]) if len(time_parts) > 2 else 0
+
+    # Default location if not provided
+    if not lat or not lon:
+        lat, lon = 13.0827, 80.2707  # Chennai default
+
+    tz = tz or 5.5  # IST default
+
+    return (year, month, day), (hour, minute, second), round(float(lat), 6), round(float(lon), 6), round(float(tz), 4)
+
+
+def chart_cache_key(dob: str, tob: str, lat: Optional[float] = None, lon: Optional[float] = None,
+                    tz: Optional[float] = None, ayanamsa: Optional[str] = None, **options) -> str:
+    """Canonical hash of the normalized birth details, ayanamsa and calculation options"""
+    date, time_of_birth, lat, lon, tz = normalize_birth_details(dob, tob, lat, lon, tz)
+    payload = {
+        "version": CHART_CACHE_VERSION,
+        "date": date, "time": time_of_birth,
+        "lat": lat, "lon": lon, "tz": tz,
+        "ayanamsa": ayanamsa,
+        "options": options
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _nakshatra_from_longitude(longitude):
+    """Calculate nakshatra and pada from absolute longitude"""
+    # Each nakshatra is 13°20' (13.333333°)
+    nakshatra_span = 360.0 / 27.0
+    nakshatra_index = int(longitude / nakshatra_span)
+    pada_span = nakshatra_span / 4.0
+    pada = int((longitude % nakshatra_span) / pada_span) + 1
+    return nakshatra_index, pada
+
+
 class AstrologyCompute:
     """Core astrology calculations using PyJHora"""
 
     @staticmethod
-    def calculate_birth_chart(dob: str, tob: str, place: str,
-                             lat: Optional[float] = None, lon: Optional[float] = None,
-                             tz: Optional[float] = None) -> Dict:
-        """Calculate birth chart with planetary positions"""
+    def compute_chart_core(dob: str, tob: str, lat: Optional[float] = None, lon: Optional[float] = None,
+                           tz: Optional[float] = None, ayanamsa: Optional[str] = None) -> Dict:
+        """
+        Run the PyJHora calculations shared by the birth chart, horoscope and dhasa views.
+        Result holds only lists and numbers so it can be returned from the compute pool and stored in MongoDB.
+        """
         if not PYJHORA_AVAILABLE:
             return {"error": "PyJHora not available"}
 
         try:
-            # Parse date/time
-            year, month, day = map(int, dob.split("-"))
-            time_parts = tob.split(":")
-            hour = int(time_parts[0])
-            minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-
-            # Default location if not provided
-            if not lat or not lon:
-                lat, lon = 13.0827, 80.2707  # Chennai default
-
-            tz_offset = tz or 5.5  # IST default
+            (year, month, day), (hour, minute, second), lat, lon, tz_offset = \
+                normalize_birth_details(dob, tob, lat, lon, tz)
 
             # Calculate JD
-            jd = swe.julday(year, month, day, hour + minute/60)
+            jd = swe.julday(year, month, day, hour + minute/60.0 + second/3600.0)
 
             # Create Place object
-            place_obj = drik.Place(place, lat, lon, tz_offset)
+            place_obj = drik.Place("birth_place", lat, lon, tz_offset)
 
-            # Calculate D1 (Rasi) chart
-            d1_chart = charts.rasi_chart(jd, place_obj)
+            with drik.ayanamsa_setting(ayanamsa):
+                # Calculate D1 (Rasi) and D9 (Navamsa) charts
+                d1_chart = charts.rasi_chart(jd, place_obj, ayanamsa_mode=ayanamsa)
+                d9_chart = charts.divisional_chart(jd, place_obj, ayanamsa_mode=ayanamsa, divisional_chart_factor=9)
 
-            # Calculate D9 (Navamsa) chart
-            d9_chart = charts.divisional_chart(jd, place_obj, divisional_chart_factor=9)
+                # Get Mahadasha using PyJHora's built-in function
+                mahadashas = vimsottari.vimsottari_mahadasa(jd, place_obj)
 
-            # Get ascendant from D1 chart (first element)
-            ascendant = d1_chart[0][1]  # [planet_name, (rasi, degrees)]
+                # Get nakshatra for reference
+                nakshatra_index = drik.nakshatra(jd, place_obj)[0]
 
-            # Planet name mapping (PyJHora convention: 0=Sun, 1=Moon, 2=Mars, 3=Mercury, 4=Jupiter, 5=Venus, 6=Saturn, 7=Rahu, 8=Ketu)
-            planet_names = {
-                0: "Sun", 1: "Moon", 2: "Mars", 3: "Mercury",
-                4: "Jupiter", 5: "Venus", 6: "Saturn", 7: "Rahu", 8: "Ketu"
-            }
+                # Sort mahadashas by start date to get chronological order
+                lords_list = [lord for lord, _ in sorted(mahadashas.items(), key=lambda x: x[1])]
+                dashas = []
+                for i, lord in enumerate(lords_list):
+                    start_jd = mahadashas[lord]
 
-            # Zodiac sign names
-            zodiac_names = [
-                "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-            ]
-
-            # Nakshatra names
-            nakshatra_names = [
-                "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-                "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-                "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-                "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
-                "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-            ]
-
-            # Helper function to get nakshatra from longitude
-            def get_nakshatra_from_longitude(longitude):
-                """Calculate nakshatra and pada from absolute longitude"""
-                # Each nakshatra is 13°20' (13.333333°)
-                nakshatra_span = 360.0 / 27.0
-                nakshatra_index = int(longitude / nakshatra_span)
-                pada_span = nakshatra_span / 4.0
-                pada = int((longitude % nakshatra_span) / pada_span) + 1
-                return nakshatra_index, pada
-
-            # Calculate nakshatra for ascendant
-            ascendant_longitude = ascendant[0] * 30.0 + ascendant[1]
-            ascendant_nakshatra_idx, ascendant_pada = get_nakshatra_from_longitude(ascendant_longitude)
-
-            # Format planetary positions for D1 with nakshatras
-            d1_planets = {}
-            for planet_index, (rasi, degrees) in d1_chart[1:]:  # Skip ascendant at index 0
-                planet_name = planet_names.get(planet_index, f"Planet_{planet_index}")
-                # Calculate absolute longitude
-                absolute_longitude = rasi * 30.0 + degrees
-                nakshatra_idx, pada = get_nakshatra_from_longitude(absolute_longitude)
-
-                d1_planets[planet_name] = {
-                    "rasi": rasi,
-                    "degrees": round(degrees, 2),
-                    "sign_name": zodiac_names[rasi],
-                    "nakshatra": nakshatra_names[nakshatra_idx],
-                    "nakshatra_pada": pada,
-                    "absolute_longitude": round(absolute_longitude, 2)
-                }
-
-            # Format planetary positions for D9
-            d9_planets = {}
-            for planet_index, (rasi, degrees) in d9_chart[1:]:
-                planet_name = planet_names.get(planet_index, f"Planet_{planet_index}")
-                d9_planets[planet_name] = {
-                    "rasi": rasi,
-                    "degrees": round(degrees, 2),
-                    "sign_name": zodiac_names[rasi]
-                }
-
-            # Format for frontend chart component (expects 'house' which is 1-based instead of 'rasi' which is 0-based)
-            planets_for_chart = {}
-            for planet_index, (rasi, degrees) in d1_chart[1:]:
-                planet_name = planet_names.get(planet_index, f"Planet_{planet_index}")
-                planets_for_chart[planet_name] = {
-                    "house": rasi + 1,  # Convert from 0-based rasi to 1-based house
-                    "degrees": round(degrees, 2),
-                    "sign_name": zodiac_names[rasi]
-                }
+                    # Get end date from next dasha start
+                    if i + 1 < len(lords_list):
+                        end_jd = mahadashas[lords_list[i + 1]]
+                    else:
+                        # Last dasha - add the duration
+                        end_jd = start_jd + vimsottari.vimsottari_dict[lord] * vimsottari.year_duration
+
+                    # Calculate bhuktis (sub-periods) using PyJHora
+                    bhuktis = vimsottari._vimsottari_bhukti(lord, start_jd)
+                    bhukti_lords = list(bhuktis.keys())
+                    bhukti_periods = []
+                    for j, bhukti_lord in enumerate(bhukti_lords):
+                        bhukti_end_jd = bhuktis[bhukti_lords[j + 1]] if j + 1 < len(bhukti_lords) else end_jd
+                        bhukti_periods.append([bhukti_lord, bhuktis[bhukti_lord], bhukti_end_jd])
+                    dashas.append([lord, start_jd, end_jd, bhukti_periods])
 
             return {
-                "status": "success",
-                "dob": dob,
-                "tob": tob,
-                "place": place,
-                "ascendant": {
-                    "rasi": ascendant[0],
-                    "degrees": round(ascendant[1], 2),
-                    "sign_name": zodiac_names[ascendant[0]],
-                    "nakshatra": nakshatra_names[ascendant_nakshatra_idx],
-                    "nakshatra_pada": ascendant_pada,
-                    "absolute_longitude": round(ascendant_longitude, 2)
-                },
-                "lagna": {
-                    "house": ascendant[0] + 1,  # Convert from 0-based to 1-based for frontend
-                    "degrees": round(ascendant[1], 2),
-                    "sign_name": zodiac_names[ascendant[0]],
-                    "nakshatra": nakshatra_names[ascendant_nakshatra_idx],
-                    "nakshatra_pada": ascendant_pada
-                },
-                "planets": planets_for_chart,  # For frontend chart component
-                "d1_chart": d1_planets,
-                "d9_chart": d9_planets,
-                "d1_houses": [[p[1][0]] for p in d1_chart],  # House-wise planet placement
-                "d9_houses": [[p[1][0]] for p in d9_chart]
+                "jd": jd,
+                "d1_chart": [[p, [h[0], h[1]]] for p, h in d1_chart],
+                "d9_chart": [[p, [h[0], h[1]]] for p, h in d9_chart],
+                "vimsottari": dashas,
+                "nakshatra_index": nakshatra_index
             }
 
         except Exception as e:
-            print(f"Birth chart calculation error: {str(e)}")
+            print(f"Chart calculation error: {str(e)}")
             import traceback
             traceback.print_exc()
             return {"error": str(e), "status": "failed"}
 
-    # Alias for backwards compatibility
-    get_birth_chart = calculate_birth_chart
-
     @staticmethod
-    def get_dashas(dob: str, tob: str, place: str, dhasa_type: str = "vimsottari",
-                lat: Optional[float] = None, lon: Optional[float] = None, tz: Optional[float] = None) -> Dict:
-        """
-        Calculate Dasha periods (life periods) using PyJHora's accurate calculations
-        """
-        if not PYJHORA_AVAILABLE:
-            return {"error": "PyJHora not available"}
-
-        try:
-            from datetime import datetime
-
-            # Parse date/time
-            year, month, day = map(int, dob.split("-"))
-            time_parts = tob.split(":")
-            hour = int(time_parts[0])
-            minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-            second = int(time_parts[2]) if len(time_parts) > 2 else 0
-
-            # Default location if not provided
-            if not lat or not lon:
-                lat, lon = 13.0827, 80.2707  # Chennai default
-
-            tz_offset = tz or 5.5  # IST default
-
-            # Calculate JD
-            jd = swe.julday(year, month, day, hour + minute/60.0 + second/3600.0)
-
-            # Create Place object
-            place_obj = drik.Place(place, lat, lon, tz_offset)
-
-            # Get Mahadasha using PyJHora's built-in function
-            mahadashas = vimsottari.vimsottari_mahadasa(jd, place_obj)
-
-            # Planet name mapping (PyJHora standard indexing)
-            # 0=Sun, 1=Moon, 2=Mars, 3=Mercury, 4=Jupiter, 5=Venus, 6=Saturn, 7=Rahu, 8=Ketu
-            planet_names = {
-                0: "Sun",
-                1: "Moon",
-                2: "Mars",
-                3: "Mercury",
-                4: "Jupiter",
-                5: "Venus",
-                6: "Saturn",
-                7: "Rahu",
-                8: "Ketu"
+    def birth_chart_from_core(core: Dict, dob: str, tob: str, place: str) -> Dict:
+        """Birth chart response built from compute_chart_core() output"""
+        if "error" in core:
+            return core
+        d1_chart = core["d1_chart"]
+        d9_chart = core["d9_chart"]
+
+        # Get ascendant from D1 chart (first element)
+        ascendant = d1_chart[0][1]  # [planet_name, (rasi, degrees)]
+
+        # Calculate nakshatra for ascendant
+        ascendant_longitude = ascendant[0] * 30.0 + ascendant[1]
+        ascendant_nakshatra_idx, ascendant_pada = _nakshatra_from_longitude(ascendant_longitude)
+
+        # Format planetary positions for D1 with nakshatras
+        d1_planets = {}
+        for planet_index, (rasi, degrees) in d1_chart[1:]:  # Skip ascendant at index 0
+            planet_name = PLANET_NAMES.get(planet_index, f"Planet_{planet_index}")
+            # Calculate absolute longitude
+            absolute_longitude = rasi * 30.0 + degrees
+            nakshatra_idx, pada = _nakshatra_from_longitude(absolute_longitude)
+
+            d1_planets[planet_name] = {
+                "rasi": rasi,
+                "degrees": round(degrees, 2),
+                "sign_name": ZODIAC_NAMES[rasi],
+                "nakshatra": NAKSHATRA_NAMES[nakshatra_idx],
+                "nakshatra_pada": pada,
+                "absolute_longitude": round(absolute_longitude, 2)
             }
 
-            # Sort mahadashas by start date to get chronological order
-            sorted_mahadashas = sorted(mahadashas.items(), key=lambda x: x[1])
-
-            # Convert to list with dates
-            dasha_periods = []
-            lords_list = [lord for lord, _ in sorted_mahadashas]
+        # Format planetary positions for D9
+        d9_planets = {}
+        for planet_index, (rasi, degrees) in d9_chart[1:]:
+            planet_name = PLANET_NAMES.get(planet_index, f"Planet_{planet_index}")
+            d9_planets[planet_name] = {
+                "rasi": rasi,
+                "degrees": round(degrees, 2),
+                "sign_name": ZODIAC_NAMES[rasi]
+            }
 
-            for i, lord in enumerate(lords_list):
-                start_jd = mahadashas[lord]
+        # Format for frontend chart component (expects 'house' which is 1-based instead of 'rasi' which is 0-based)
+        planets_for_chart = {}
+        for planet_index, (rasi, degrees) in d1_chart[1:]:
+            planet_name = PLANET_NAMES.get(planet_index, f"Planet_{planet_index}")
+            planets_for_chart[planet_name] = {
+                "house": rasi + 1,  # Convert from 0-based rasi to 1-based house
+                "degrees": round(degrees, 2),
+                "sign_name": ZODIAC_NAMES[rasi]
+            }
 
-                # Get end date from next dasha start
-                if i + 1 < len(lords_list):
-                    next_lord = lords_list[i + 1]
-                    end_jd = mahadashas[next_lord]
-                else:
-                    # Last dasha - add the duration
-                    duration_years = vimsottari.vimsottari_dict[lord]
-                    end_jd = start_jd + duration_years * vimsottari.year_duration
+        return {
+            "status": "success",
+            "dob": dob,
+            "tob": tob,
+            "place": place,
+            "ascendant": {
+                "rasi": ascendant[0],
+                "degrees": round(ascendant[1], 2),
+                "sign_name": ZODIAC_NAMES[ascendant[0]],
+                "nakshatra": NAKSHATRA_NAMES[ascendant_nakshatra_idx],
+                "nakshatra_pada": ascendant_pada,
+                "absolute_longitude": round(ascendant_longitude, 2)
+            },
+            "lagna": {
+                "house": ascendant[0] + 1,  # Convert from 0-based to 1-based for frontend
+                "degrees": round(ascendant[1], 2),
+                "sign_name": ZODIAC_NAMES[ascendant[0]],
+                "nakshatra": NAKSHATRA_NAMES[ascendant_nakshatra_idx],
+                "nakshatra_pada": ascendant_pada
+            },
+            "planets": planets_for_chart,  # For frontend chart component
+            "d1_chart": d1_planets,
+            "d9_chart": d9_planets,
+            "d1_houses": [[p[1][0]] for p in d1_chart],  # House-wise planet placement
+            "d9_houses": [[p[1][0]] for p in d9_chart]
+        }
 
-                # Convert JD to datetime
-                start_date_parts = utils.jd_to_gregorian(start_jd)
-                start_date = datetime(start_date_parts[0], start_date_parts[1], start_date_parts[2])
+    @staticmethod
+    def horoscope_from_core(core: Dict, dob: str, tob: str, place: str) -> Dict:
+        """Chart summary (lagna, moon sign, sun sign, planet positions) used for predictions"""
+        birth_chart = AstrologyCompute.birth_chart_from_core(core, dob, tob, place)
+        if "error" in birth_chart:
+            return birth_chart
+        d1_planets = birth_chart["d1_chart"]
+
+        def _sign(planet):
+            data = d1_planets.get(planet, {})
+            return {
+                "sign_name": data.get("sign_name", "Unknown"),
+                "rasi": data.get("rasi", 0),
+                "nakshatra": data.get("nakshatra", "Unknown"),
+                "nakshatra_pada": data.get("nakshatra_pada", 0)
+            }
 
-                end_date_parts = utils.jd_to_gregorian(end_jd)
-                end_date = datetime(end_date_parts[0], end_date_parts[1], end_date_parts[2])
+        return {
+            "status": "success",
+            "birth_details": {"dob": dob, "tob": tob, "place": place},
+            "lagna": birth_chart["lagna"],
+            "moon_sign": _sign("Moon"),
+            "sun_sign": _sign("Sun"),
+            "planetary_positions": d1_planets,
+            "navamsa_positions": birth_chart["d9_chart"]
+        }
 
-                duration_years = (end_jd - start_jd) / vimsottari.year_duration
+    @staticmethod
+    def dashas_from_core(core: Dict, dob: str, tob: str, place: str, dhasa_type: str = "vimsottari") -> Dict:
+        """
+        Dasha response built from compute_chart_core() output.
+        Current/next dasha depend on today's date and are therefore evaluated here and not cached
+        """
+        if "error" in core:
+            return core
+        from datetime import datetime
+
+        def _to_date(jd):
+            date_parts = utils.jd_to_gregorian(jd)
+            return datetime(date_parts[0], date_parts[1], date_parts[2])
+
+        # Convert to list with dates
+        dasha_periods = []
+        for i, (lord, start_jd, end_jd, bhukti_periods) in enumerate(core["vimsottari"]):
+            sub_periods = []
+            for j, (bhukti_lord, bhukti_start_jd, bhukti_end_jd) in enumerate(bhukti_periods):
+                bhukti_duration_years = (bhukti_end_jd - bhukti_start_jd) / vimsottari.year_duration
+                sub_periods.append({
+                    "lord": PLANET_NAMES.get(bhukti_lord, str(bhukti_lord)),
+                    "duration_months": round(bhukti_duration_years * 12, 1),
+                    "start_date": _to_date(bhukti_start_jd).strftime("%Y-%m-%d"),
+                    "end_date": _to_date(bhukti_end_jd).strftime("%Y-%m-%d"),
+                    "order": j + 1
+                })
 
-                # Calculate bhuktis (sub-periods) using PyJHora
-                bhuktis = vimsottari._vimsottari_bhukti(lord, start_jd)
-                sub_periods = []
-                bhukti_lords = list(bhuktis.keys())
+            dasha_periods.append({
+                "lord": PLANET_NAMES.get(lord, str(lord)),
+                "duration_years": round((end_jd - start_jd) / vimsottari.year_duration, 2),
+                "start_date": _to_date(start_jd).strftime("%Y-%m-%d"),
+                "end_date": _to_date(end_jd).strftime("%Y-%m-%d"),
+                "sub_periods": sub_periods,
+                "order": i + 1
+            })
+
+        # Find current dasha and next dasha
+        current_datetime = datetime.now()
+        current_dasha = None
+        next_dasha = None
+        current_bhukthi_periods = []
+
+        for i, dasha in enumerate(dasha_periods):
+            dasha_start = datetime.strptime(dasha["start_date"], "%Y-%m-%d")
+            dasha_end = datetime.strptime(dasha["end_date"], "%Y-%m-%d")
+
+            if dasha_start <= current_datetime <= dasha_end:
+                current_dasha = dasha
+                current_bhukthi_periods = dasha["sub_periods"]
+                if i + 1 < len(dasha_periods):
+                    next_dasha = dasha_periods[i + 1]
+                break
+
+        # Prepare response
+        response = {
+            "status": "success",
+            "dob": dob,
+            "tob": tob,
+            "place": place,
+            "dhasa_type": dhasa_type,
+            "current_nakshatra_index": core["nakshatra_index"],
+            "dasha_sequence": dasha_periods,
+            "total_cycle_years": 120,
+            "note": "Vimsottari Dasha cycle is 120 years. Calculations based on PyJHora."
+        }
+
+        # Add current dasha if found
+        if current_dasha:
+            response["current_dasha"] = {
+                "lord": current_dasha["lord"],
+                "duration_years": current_dasha["duration_years"],
+                "start_date": current_dasha["start_date"],
+                "end_date": current_dasha["end_date"],
+                "description": f"You are currently in {current_dasha['lord']} Dasha"
+            }
+            response["current_bhukthi"] = {
+                "description": f"Sub-periods within {current_dasha['lord']} Dasha",
+                "periods": current_bhukthi_periods
+            }
 
-                for j, bhukti_lord in enumerate(bhukti_lords):
-                    bhukti_start_jd = bhuktis[bhukti_lord]
+        # Add next dasha if found
+        if next_dasha:
+            response["next_dasha"] = {
+                "lord": next_dasha["lord"],
+                "duration_years": next_dasha["duration_years"],
+                "start_date": next_dasha["start_date"],
+                "end_date": next_dasha["end_date"],
+                "description": f"After current dasha, {next_dasha['lord']} Dasha begins"
+            }
 
-                    # Get bhukti end date
-                    if j + 1 < len(bhukti_lords):
-                        bhukti_end_jd = bhuktis[bhukti_lords[j + 1]]
-                    else:
-                        bhukti_end_jd = end_jd
-
-                    bhukti_start_parts = utils.jd_to_gregorian(bhukti_start_jd)
-                    bhukti_start_date = datetime(bhukti_start_parts[0], bhukti_start_parts[1], bhukti_start_parts[2])
-
-                    bhukti_end_parts = utils.jd_to_gregorian(bhukti_end_jd)
-                    bhukti_end_date = datetime(bhukti_end_parts[0], bhukti_end_parts[1], bhukti_end_parts[2])
-
-                    bhukti_duration_years = (bhukti_end_jd - bhukti_start_jd) / vimsottari.year_duration
-
-                    sub_periods.append({
-                        "lord": planet_names.get(bhukti_lord, str(bhukti_lord)),
-                        "duration_months": round(bhukti_duration_years * 12, 1),
-                        "start_date": bhukti_start_date.strftime("%Y-%m-%d"),
-                        "end_date": bhukti_end_date.strftime("%Y-%m-%d"),
-                        "order": j + 1
-                    })
-
-                dasha_periods.append({
-                    "lord": planet_names.get(lord, str(lord)),
-                    "duration_years": round(duration_years, 2),
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "sub_periods": sub_periods,
-                    "order": i + 1
-                })
+        return response
 
-            # Find current dasha and next dasha
-            current_datetime = datetime.now()
-            current_dasha = None
-            next_dasha = None
-            current_bhukthi_periods = []
-
-            for i, dasha in enumerate(dasha_periods):
-                dasha_start = datetime.strptime(dasha["start_date"], "%Y-%m-%d")
-                dasha_end = datetime.strptime(dasha["end_date"], "%Y-%m-%d")
-
-                if dasha_start <= current_datetime <= dasha_end:
-                    current_dasha = dasha
-                    current_bhukthi_periods = dasha["sub_periods"]
-                    if i + 1 < len(dasha_periods):
-                        next_dasha = dasha_periods[i + 1]
-                    break
-
-            # Get nakshatra for reference
-            nakshatra_data = drik.nakshatra(jd, place_obj)
-            nakshatra_index = nakshatra_data[0]
-
-            # Prepare response
-            response = {
-                "status": "success",
-                "dob": dob,
-                "tob": tob,
-                "place": place,
-                "dhasa_type": dhasa_type,
-                "current_nakshatra_index": nakshatra_index,
-                "dasha_sequence": dasha_periods,
-                "total_cycle_years": 120,
-                "note": "Vimsottari Dasha cycle is 120 years. Calculations based on PyJHora."
-            }
+    @staticmethod
+    def calculate_birth_chart(dob: str, tob: str, place: str,
+                             lat: Optional[float] = None, lon: Optional[float] = None,
+                             tz: Optional[float] = None) -> Dict:
+        """Calculate birth chart with planetary positions"""
+        core = AstrologyCompute.compute_chart_core(dob, tob, lat, lon, tz)
+        return AstrologyCompute.birth_chart_from_core(core, dob, tob, place)
 
-            # Add current dasha if found
-            if current_dasha:
-                response["current_dasha"] = {
-                    "lord": current_dasha["lord"],
-                    "duration_years": current_dasha["duration_years"],
-                    "start_date": current_dasha["start_date"],
-                    "end_date": current_dasha["end_date"],
-                    "description": f"You are currently in {current_dasha['lord']} Dasha"
-                }
-                response["current_bhukthi"] = {
-                    "description": f"Sub-periods within {current_dasha['lord']} Dasha",
-                    "periods": current_bhukthi_periods
-                }
-
-            # Add next dasha if found
-            if next_dasha:
-                response["next_dasha"] = {
-                    "lord": next_dasha["lord"],
-                    "duration_years": next_dasha["duration_years"],
-                    "start_date": next_dasha["start_date"],
-                    "end_date": next_dasha["end_date"],
-                    "description": f"After current dasha, {next_dasha['lord']} Dasha begins"
-                }
-
-            return response
+    # Alias for backwards compatibility
+    get_birth_chart = calculate_birth_chart
 
-        except Exception as e:
-            print(f"Dasha calculation error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return {"error": str(e), "status": "failed"}
+    @staticmethod
+    def get_dashas(dob: str, tob: str, place: str, dhasa_type: str = "vimsottari",
+                lat: Optional[float] = None, lon: Optional[float] = None, tz: Optional[float] = None) -> Dict:
+        """
+        Calculate Dasha periods (life periods) using PyJHora's accurate calculations
+        """
+        core = AstrologyCompute.compute_chart_core(dob, tob, lat, lon, tz)
+        return AstrologyCompute.dashas_from_core(core, dob, tob, place, dhasa_type)
 
-    # Add placeholder methods for other required functions
     @staticmethod
-    def get_horoscope_predictions(*args, **kwargs):
-        return {"error": "Not implemented yet"}
+    def get_horoscope_predictions(dob: str, tob: str, place: str,
+                                  lat: Optional[float] = None, lon: Optional[float] = None,
+                                  tz: Optional[float] = None) -> Dict:
+        """Chart summary used for horoscope predictions"""
+        core = AstrologyCompute.compute_chart_core(dob, tob, lat, lon, tz)
+        return AstrologyCompute.horoscope_from_core(core, dob, tob, place)
 
+    # Add placeholder methods for other required functions
     @staticmethod
     def get_doshas(*args, **kwargs):
         return {"error": "Not implemented yet"}
@@ -369,5 +411,144 @@ class AstrologyCompute:
         return {"error": "Not implemented yet"}
 
     @staticmethod
-    def search_location(*args, **kwargs):
-        return {"error": "Not implemented yet"}
+    def search_location(query: str) -> List:
+        """
+        Resolve a place name to [place, latitude, longitude, timezone].
+        The world cities index is checked first; internet geocoding is used only for unknown places
+        """
+        if not PYJHORA_AVAILABLE:
+            return []
+        try:
+            city = utils.get_world_city(query)
+        except OSError:  # world cities database not installed
+            city = None
+        if city:
+            country, city_name, latitude, longitude, _, tz_hours = city
+            return [f"{city_name}, {country}", round(latitude, 4), round(longitude, 4), round(tz_hours, 2)]
+        return utils.get_location(query)
+
+    @staticmethod
+    def suggest_locations(query: str, max_results: int = 10) -> List[Dict]:
+        """Prefix/fuzzy matches from the world cities index for location autocomplete"""
+        if not PYJHORA_AVAILABLE:
+            return []
+        try:
+            matches = utils.search_world_cities(query, max_results=max_results)
+        except OSError:  # world cities database not installed
+            return []
+        return [{"place": f"{city}, {country}", "latitude": round(latitude, 4),
+                 "longitude": round(longitude, 4), "timezone": round(tz_hours, 2)}
+                for country, city, latitude, longitude, _, tz_hours in matches]
+
+
+class ChartCache:
+    """
+    Cache of compute_chart_core() results keyed by chart_cache_key().
+    First tier is an in-process LRU with TTL, second (optional) tier is the MongoDB chart_cache collection.
+    Concurrent requests for the same chart wait for a single calculation.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, use_mongo: bool = False):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.use_mongo = use_mongo
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, core)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, core = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return core
+
+    def put(self, key: str, core: Dict):
+        if self.max_entries == 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, core)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "mongo": self.use_mongo,
+            "hits": self.hits,
+            "mongo_hits": self.mongo_hits,
+            "misses": self.misses,
+        }
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Return the cached chart for key, otherwise await compute() and cache its result unless it is an error"""
+        core = self.get(key)
+        if core is not None:
+            self.hits += 1
+            return core
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the exception as retrieved when nobody else was waiting for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending[key] = future
+        try:
+            core = None
+            if self.use_mongo:
+                from database import load_cached_chart
+                core = await load_cached_chart(key)
+                if core is not None:
+                    self.mongo_hits += 1
+            if core is None:
+                self.misses += 1
+                core = await compute()
+                if self.use_mongo and "error" not in core:
+                    from database import store_cached_chart
+                    await store_cached_chart(key, core)
+            if "error" not in core:
+                self.put(key, core)
+            future.set_result(core)
+            return core
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._pending[key]
+
+    async def get_core(self, run: Callable[..., Awaitable[Dict]], dob: str, tob: str,
+                       lat: Optional[float] = None, lon: Optional[float] = None,
+                       tz: Optional[float] = None) -> Dict:
+        """
+        Cached compute_chart_core() for the given birth details
+        @param run: coroutine function that executes AstrologyCompute.compute_chart_core, e.g. compute_pool.run
+        """
+        ayanamsa = drik.get_ayanamsa_mode() if PYJHORA_AVAILABLE else None
+        compute = lambda: run(AstrologyCompute.compute_chart_core, dob, tob, lat, lon, tz, ayanamsa)
+        try:
+            key = chart_cache_key(dob, tob, lat, lon, tz, ayanamsa=ayanamsa)
+        except (ValueError, TypeError):
+            # Malformed birth details: let compute_chart_core report the error, there is nothing to cache
+            return await compute()
+        return await self.get_or_compute(key, compute)
+
+
+chart_cache = ChartCache(max_entries=settings.CHART_CACHE_SIZE,
+                         ttl_seconds=settings.CHART_CACHE_TTL_SECONDS,
+                         use_mongo=settings.CHART_CACHE_MONGO)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Process pool for the CPU-bound PyJHora calls made by the API routes.
+
+Swiss Ephemeris calculations hold the GIL, so running them directly inside
+`async def` routes blocks the event loop. The pool runs them in worker processes.
+Concurrency, queue depth and per-request timeout come from config.settings.
+"""
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+
+from config import settings
+
+
+class ComputePoolBusy(HTTPException):
+    """Raised when the number of queued requests exceeds COMPUTE_MAX_QUEUE"""
+    def __init__(self):
+        super().__init__(status_code=503, detail="Server busy, please retry",
+                         headers={"Retry-After": "5"})
+
+
+class ComputeTimeout(HTTPException):
+    """Raised when a calculation takes longer than COMPUTE_TIMEOUT_SECONDS"""
+    def __init__(self, timeout: float):
+        super().__init__(status_code=504, detail=f"Calculation timed out after {timeout:g} seconds")
+
+
+def _init_worker(language: str):
+    """Worker initializer: set ephemeris path, load language resources and touch the ephemeris files"""
+    from astrology import PYJHORA_AVAILABLE
+    if not PYJHORA_AVAILABLE:
+        return
+    from jhora import utils
+    from jhora.panchanga import drik
+    utils.set_ephemeris_data_path()
+    utils.set_language(language)
+    drik.planetary_positions(utils.julian_day_number((2000, 1, 1), (12, 0, 0)), drik.Place('warmup', 13.0, 80.0, 5.5))
+
+
+def _warmup():
+    return True
+
+
+class ComputePool:
+    """Bounded process pool. Use `await compute_pool.run(func, *args, **kwargs)` from async routes"""
+
+    def __init__(self, workers: int, max_queue: int, timeout: float, language: str = "en"):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.language = language
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that already runs the event loop and mongo client threads is unsafe
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(self.language,))
+
+    async def start(self):
+        """Create the pool and pre-warm every worker so the first requests do not pay the start up cost"""
+        self._executor = self._create_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self._executor, _warmup) for _ in range(self.workers)])
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self._in_flight,
+            "max_queue": self.max_queue,
+            "timeout_seconds": self.timeout,
+        }
+
+    def _release(self, _future):
+        self._in_flight -= 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) in a worker process.
+        func must be a module level function or a static method (picklable) and return a picklable result.
+        Raises ComputePoolBusy (503) if the queue is full and ComputeTimeout (504) on timeout.
+        """
+        if self._in_flight >= self.workers + self.max_queue:
+            raise ComputePoolBusy()
+        if self._executor is None:
+            self._executor = self._create_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS). Replace the pool and retry once
+            self.shutdown()
+            self._executor = self._create_executor()
+            future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        self._in_flight += 1
+        # The slot is released when the worker finishes, not when the request gives up,
+        # so a timed out calculation still counts against the queue limit while it runs.
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise ComputeTimeout(self.timeout)
+
+
+compute_pool = ComputePool(workers=settings.COMPUTE_WORKERS,
+                           max_queue=settings.COMPUTE_MAX_QUEUE,
+                           timeout=settings.COMPUTE_TIMEOUT_SECONDS)
@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -13,6 +14,16 @@ class Settings(BaseSettings):
     
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
 
+    # Process pool for PyJHora calculations
+    COMPUTE_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)
+    COMPUTE_MAX_QUEUE: int = 32
+    COMPUTE_TIMEOUT_SECONDS: float = 60.0
+
+    # Cache of computed charts keyed by normalized birth details
+    CHART_CACHE_SIZE: int = 512
+    CHART_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    CHART_CACHE_MONGO: bool = True
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -27,6 +27,38 @@ async def close_mongo_connection():
         mongodb_client.close()
         print("Disconnected from MongoDB")
 
+# Chart cache (second tier of astrology.ChartCache)
+CHART_CACHE_COLLECTION = "chart_cache"
+
+async def ensure_chart_cache_index(ttl_seconds: int):
+    """Create the TTL index that expires cached charts"""
+    if database is None:
+        return
+    try:
+        await database[CHART_CACHE_COLLECTION].create_index("created_at", expireAfterSeconds=int(ttl_seconds))
+    except Exception as e:
+        print(f"Chart cache index creation failed: {str(e)}")
+
+async def load_cached_chart(key: str) -> Optional[dict]:
+    """Return cached chart data for key or None. Cache failures never fail the request."""
+    if database is None:
+        return None
+    try:
+        doc = await database[CHART_CACHE_COLLECTION].find_one({"_id": key})
+    except Exception as e:
+        print(f"Chart cache read failed: {str(e)}")
+        return None
+    return doc["data"] if doc else None
+
+async def store_cached_chart(key: str, data: dict):
+    if database is None:
+        return
+    try:
+        await database[CHART_CACHE_COLLECTION].replace_one(
+            {"_id": key}, {"_id": key, "data": data, "created_at": datetime.utcnow()}, upsert=True)
+    except Exception as e:
+        print(f"Chart cache write failed: {str(e)}")
+
 def get_database():
     """Get database instance, ensuring it's initialized"""
     if database is None:
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -7,10 +8,11 @@ from typing import Optional
 from pydantic import BaseModel
 
 from config import settings
-from database import connect_to_mongo, close_mongo_connection
+from database import connect_to_mongo, close_mongo_connection, ensure_chart_cache_index
 from auth import create_access_token, decode_token, get_password_hash, verify_password, Token
 from database import User, BirthDetails, ChartData, Prediction
-from astrology import AstrologyCompute
+from astrology import AstrologyCompute, PYJHORA_AVAILABLE, chart_cache
+from compute_pool import compute_pool
 from qwen_predictor import QwenPredictor
 from llm_service import llm_service, LLMProvider
 
@@ -39,8 +41,12 @@ class PredictionRequest(BaseModel):
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    if settings.CHART_CACHE_MONGO:
+        await ensure_chart_cache_index(settings.CHART_CACHE_TTL_SECONDS)
+    await compute_pool.start()
     yield
     # Shutdown
+    compute_pool.shutdown()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -61,6 +67,11 @@ app.add_middleware(
 
 security = HTTPBearer()
 
+async def chart_core(dob: str, tob: str, lat: Optional[float] = None,
+                     lon: Optional[float] = None, tz: Optional[float] = None) -> dict:
+    """Cached chart calculation shared by the birth chart, horoscope and dhasa routes"""
+    return await chart_cache.get_core(compute_pool.run, dob, tob, lat, lon, tz)
+
 # ============= AUTH ROUTES =============
 
 @app.post("/api/auth/register", response_model=Token)
@@ -144,14 +155,12 @@ async def calculate_birth_chart(
     try:
         from database import database
         
-        chart = AstrologyCompute.get_birth_chart(
-            dob=birth_details.dob,
-            tob=birth_details.tob,
-            place=birth_details.place,
+        core = await chart_core(birth_details.dob, birth_details.tob,
             lat=birth_details.latitude,
             lon=birth_details.longitude,
             tz=5.5
         )
+        chart = AstrologyCompute.birth_chart_from_core(core, birth_details.dob, birth_details.tob, birth_details.place)
         
         charts_collection = database["charts"]
         chart_doc = {
@@ -165,6 +174,8 @@ async def calculate_birth_chart(
         chart["_id"] = str(result.inserted_id)
         
         return chart
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -186,6 +197,8 @@ async def get_birth_chart(chart_id: str, current_user: str = Depends(get_current
         
         chart["_id"] = str(chart["_id"])
         return chart
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -197,14 +210,12 @@ async def get_horoscope(
 ):
     """Get horoscope predictions"""
     try:
-        chart_data = AstrologyCompute.get_horoscope_predictions(
-            dob=birth_details.dob,
-            tob=birth_details.tob,
-            place=birth_details.place,
+        core = await chart_core(birth_details.dob, birth_details.tob,
             lat=birth_details.latitude,
             lon=birth_details.longitude,
             tz=birth_details.timezone
         )
+        chart_data = AstrologyCompute.horoscope_from_core(core, birth_details.dob, birth_details.tob, birth_details.place)
 
         if use_qwen and settings.USE_QWEN:
             qwen_prediction = await QwenPredictor.generate_horoscope_prediction(chart_data)
@@ -214,6 +225,8 @@ async def get_horoscope(
             chart_data["ai_prediction"] = generate_basic_predictions(chart_data)
 
         return chart_data
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -269,7 +282,7 @@ async def get_doshas(
 ):
     """Get doshas"""
     try:
-        doshas = AstrologyCompute.get_doshas(
+        doshas = await compute_pool.run(AstrologyCompute.get_doshas,
             dob=birth_details.dob,
             tob=birth_details.tob,
             place=birth_details.place,
@@ -278,6 +291,8 @@ async def get_doshas(
             tz=birth_details.timezone
         )
         return doshas
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -288,7 +303,7 @@ async def get_yogas(
 ):
     """Get yogas"""
     try:
-        yogas = AstrologyCompute.get_yogas(
+        yogas = await compute_pool.run(AstrologyCompute.get_yogas,
             dob=birth_details.dob,
             tob=birth_details.tob,
             place=birth_details.place,
@@ -297,6 +312,8 @@ async def get_yogas(
             tz=birth_details.timezone
         )
         return yogas
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -308,16 +325,16 @@ async def get_dhasa(
 ):
     """Get Dasha periods"""
     try:
-        dhasa = AstrologyCompute.get_dashas(
-            dob=birth_details.dob,
-            tob=birth_details.tob,
-            place=birth_details.place,
+        core = await chart_core(birth_details.dob, birth_details.tob,
             lat=birth_details.latitude,
             lon=birth_details.longitude,
-            tz=birth_details.timezone,
-            dhasa_type=dhasa_type
+            tz=birth_details.timezone
         )
+        dhasa = AstrologyCompute.dashas_from_core(core, birth_details.dob, birth_details.tob,
+                                                  birth_details.place, dhasa_type)
         return dhasa
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -329,7 +346,7 @@ async def get_transits(
 ):
     """Get current transits"""
     try:
-        transits = AstrologyCompute.get_transits(
+        transits = await compute_pool.run(AstrologyCompute.get_transits,
             dob=birth_details.dob,
             tob=birth_details.tob,
             place=birth_details.place,
@@ -339,6 +356,8 @@ async def get_transits(
             current_date=current_date
         )
         return transits
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -361,7 +380,7 @@ async def get_compatibility(
 ):
     """Calculate compatibility"""
     try:
-        compatibility = AstrologyCompute.get_compatibility(
+        compatibility = await compute_pool.run(AstrologyCompute.get_compatibility,
             male_dob=male_dob,
             male_tob=male_tob,
             male_place=male_place,
@@ -376,20 +395,20 @@ async def get_compatibility(
         )
 
         if use_qwen and settings.USE_QWEN:
-            chart1 = AstrologyCompute.get_horoscope_predictions(
-                male_dob, male_tob, male_place,
-                lat=male_latitude, lon=male_longitude, tz=male_timezone
-            )
-            chart2 = AstrologyCompute.get_horoscope_predictions(
-                female_dob, female_tob, female_place,
-                lat=female_latitude, lon=female_longitude, tz=female_timezone
+            core1, core2 = await asyncio.gather(
+                chart_core(male_dob, male_tob, lat=male_latitude, lon=male_longitude, tz=male_timezone),
+                chart_core(female_dob, female_tob, lat=female_latitude, lon=female_longitude, tz=female_timezone)
             )
+            chart1 = AstrologyCompute.horoscope_from_core(core1, male_dob, male_tob, male_place)
+            chart2 = AstrologyCompute.horoscope_from_core(core2, female_dob, female_tob, female_place)
             qwen_analysis = await QwenPredictor.generate_compatibility_prediction(
                 chart1, chart2, compatibility.get("total_score", 0)
             )
             compatibility["ai_analysis"] = qwen_analysis
         
         return compatibility
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -410,6 +429,8 @@ async def get_user_profile(current_user: str = Depends(get_current_user)):
         user["_id"] = str(user.get("_id", ""))
         del user["hashed_password"]
         return user
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -426,6 +447,8 @@ async def get_user_charts(current_user: str = Depends(get_current_user)):
             chart["_id"] = str(chart.get("_id", ""))
         
         return {"charts": charts}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -438,25 +461,15 @@ async def ask_question(
 ):
     """Ask a question about the birth chart using AI"""
     try:
-        # Calculate birth chart
-        birth_chart = AstrologyCompute.calculate_birth_chart(
-            dob=request.birth_details.dob,
-            tob=request.birth_details.tob,
-            place=request.birth_details.place,
-            lat=request.birth_details.latitude,
-            lon=request.birth_details.longitude,
-            tz=request.birth_details.timezone or 5.5
-        )
-
-        # Calculate Dashas
-        dashas = AstrologyCompute.get_dashas(
-            dob=request.birth_details.dob,
-            tob=request.birth_details.tob,
-            place=request.birth_details.place,
-            lat=request.birth_details.latitude,
-            lon=request.birth_details.longitude,
-            tz=request.birth_details.timezone or 5.5
+        # Birth chart and Dashas are both derived from one chart calculation
+        details = request.birth_details
+        core = await chart_core(details.dob, details.tob,
+            lat=details.latitude,
+            lon=details.longitude,
+            tz=details.timezone or 5.5
         )
+        birth_chart = AstrologyCompute.birth_chart_from_core(core, details.dob, details.tob, details.place)
+        dashas = AstrologyCompute.dashas_from_core(core, details.dob, details.tob, details.place)
 
         # Combine chart data for LLM
         moon_data = birth_chart.get("d1_chart", {}).get("Moon", {})
@@ -511,6 +524,8 @@ async def ask_question(
                 "sun_sign": chart_data.get("sun_sign", {})
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -522,14 +537,13 @@ async def generate_prediction(
     """Generate AI-powered predictions"""
     try:
         # Get full chart data
-        chart_data = AstrologyCompute.get_horoscope_predictions(
-            dob=request.birth_details.dob,
-            tob=request.birth_details.tob,
-            place=request.birth_details.place,
+        core = await chart_core(request.birth_details.dob, request.birth_details.tob,
             lat=request.birth_details.latitude,
             lon=request.birth_details.longitude,
             tz=5.5
         )
+        chart_data = AstrologyCompute.horoscope_from_core(core, request.birth_details.dob,
+                                                          request.birth_details.tob, request.birth_details.place)
 
         # Validate LLM provider
         try:
@@ -550,6 +564,8 @@ async def generate_prediction(
             "provider": request.llm_provider,
             "chart_data": chart_data
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -562,39 +578,36 @@ async def analyze_compatibility(
 ):
     """Get detailed compatibility analysis with AI"""
     try:
-        # Calculate compatibility score
-        compatibility = AstrologyCompute.get_compatibility(
-            male_dob=male_details.dob,
-            male_tob=male_details.tob,
-            male_place=male_details.place,
-            female_dob=female_details.dob,
-            female_tob=female_details.tob,
-            female_place=female_details.place,
-            male_lat=male_details.latitude,
-            male_lon=male_details.longitude,
-            female_lat=female_details.latitude,
-            female_lon=female_details.longitude,
-            tz=5.5
-        )
-
-        # Get chart data for both
-        male_chart = AstrologyCompute.get_horoscope_predictions(
-            dob=male_details.dob,
-            tob=male_details.tob,
-            place=male_details.place,
-            lat=male_details.latitude,
-            lon=male_details.longitude,
-            tz=5.5
-        )
-
-        female_chart = AstrologyCompute.get_horoscope_predictions(
-            dob=female_details.dob,
-            tob=female_details.tob,
-            place=female_details.place,
-            lat=female_details.latitude,
-            lon=female_details.longitude,
-            tz=5.5
+        # Calculate compatibility score and chart data for both in parallel
+        compatibility, male_core, female_core = await asyncio.gather(
+            compute_pool.run(AstrologyCompute.get_compatibility,
+                male_dob=male_details.dob,
+                male_tob=male_details.tob,
+                male_place=male_details.place,
+                female_dob=female_details.dob,
+                female_tob=female_details.tob,
+                female_place=female_details.place,
+                male_lat=male_details.latitude,
+                male_lon=male_details.longitude,
+                female_lat=female_details.latitude,
+                female_lon=female_details.longitude,
+                tz=5.5
+            ),
+            chart_core(male_details.dob, male_details.tob,
+                lat=male_details.latitude,
+                lon=male_details.longitude,
+                tz=5.5
+            ),
+            chart_core(female_details.dob, female_details.tob,
+                lat=female_details.latitude,
+                lon=female_details.longitude,
+                tz=5.5
+            )
         )
+        male_chart = AstrologyCompute.horoscope_from_core(male_core, male_details.dob,
+                                                          male_details.tob, male_details.place)
+        female_chart = AstrologyCompute.horoscope_from_core(female_core, female_details.dob,
+                                                            female_details.tob, female_details.place)
 
         # Validate LLM provider
         try:
@@ -615,6 +628,8 @@ async def analyze_compatibility(
             "ai_analysis": ai_analysis,
             "provider": llm_provider
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -635,20 +650,28 @@ async def search_location(req: LocationSearchRequest):
     - "London, UK"
     """
     try:
-        result = AstrologyCompute.search_location(req.query)
+        # Geocoding of unknown places is network I/O - run it in a thread, not in the compute pool
+        result, suggestions = await asyncio.gather(
+            asyncio.to_thread(AstrologyCompute.search_location, req.query),
+            asyncio.to_thread(AstrologyCompute.suggest_locations, req.query)
+        )
         if result:
             return {
                 "success": True,
                 "place": result[0],
                 "latitude": result[1],
                 "longitude": result[2],
-                "timezone": result[3]
+                "timezone": result[3],
+                "suggestions": suggestions
             }
         else:
             return {
                 "success": False,
-                "message": f"Location '{req.query}' not found. Try format: 'City, Country' (e.g., 'Mumbai, India')"
+                "message": f"Location '{req.query}' not found. Try format: 'City, Country' (e.g., 'Mumbai, India')",
+                "suggestions": suggestions
             }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Location search error: {str(e)}")
 
@@ -692,6 +715,8 @@ async def save_profile(req: SaveProfileRequest, current_user: str = Depends(get_
             "profile_id": str(result.inserted_id),
             "message": f"Profile '{req.profile_name}' saved successfully"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -716,6 +741,8 @@ async def list_profiles(current_user: str = Depends(get_current_user)):
             "success": True,
             "profiles": profiles
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -740,6 +767,8 @@ async def delete_profile(profile_id: str, current_user: str = Depends(get_curren
             raise HTTPException(status_code=404, detail="Profile not found")
 
         return {"success": True, "message": "Profile deleted"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -750,8 +779,10 @@ async def health_check():
     """Health check"""
     return {
         "status": "healthy",
-        "pyjhora_available": AstrologyCompute.PYJHORA_AVAILABLE,
-        "qwen_enabled": settings.USE_QWEN
+        "pyjhora_available": PYJHORA_AVAILABLE,
+        "qwen_enabled": settings.USE_QWEN,
+        "compute_pool": compute_pool.stats(),
+        "chart_cache": chart_cache.stats()
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Run from web/backend: python -m unittest test_astrology """
+import asyncio
+import unittest
+
+from astrology import AstrologyCompute, ChartCache, drik, charts
+
+_dob = "1996-12-07"; _tob = "10:34"; _lat = 13.0878; _lon = 80.2785; _tz = 5.5
+
+
+async def _run(func, *args):
+    return func(*args)
+
+
+class ChartAyanamsaTests(unittest.TestCase):
+    def test_non_lahiri_ayanamsa_changes_charts(self):
+        lahiri = AstrologyCompute.compute_chart_core(_dob, _tob, _lat, _lon, _tz, "LAHIRI")
+        kp = AstrologyCompute.compute_chart_core(_dob, _tob, _lat, _lon, _tz, "KP")
+        self.assertNotEqual(lahiri["d1_chart"], kp["d1_chart"])
+        self.assertNotEqual(lahiri["d9_chart"], kp["d9_chart"])
+        place = drik.Place("birth_place", _lat, _lon, _tz)
+        with drik.ayanamsa_setting():
+            expected = charts.rasi_chart(kp["jd"], place, ayanamsa_mode="KP")
+        self.assertEqual([[p, [h[0], h[1]]] for p, h in expected], kp["d1_chart"])
+
+    def test_cache_keeps_ayanamsa_results_apart(self):
+        cache = ChartCache(max_entries=8, ttl_seconds=60)
+
+        async def get_core(ayanamsa):
+            with drik.ayanamsa_setting(ayanamsa):
+                return await cache.get_core(_run, _dob, _tob, _lat, _lon, _tz)
+        lahiri = asyncio.run(get_core("LAHIRI"))
+        kp = asyncio.run(get_core("KP"))
+        self.assertNotEqual(lahiri["d1_chart"], kp["d1_chart"])
+        self.assertEqual(kp, AstrologyCompute.compute_chart_core(_dob, _tob, _lat, _lon, _tz, "KP"))
+        self.assertEqual(kp, asyncio.run(get_core("KP")))
+        self.assertEqual(1, cache.hits)
+
+
+if __name__ == "__main__":
+    unittest.main()